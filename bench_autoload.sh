@@ -0,0 +1,42 @@
+#!/usr/bin/env bash
+# Compare start-up time of a generated script with many functions when
+# compiled as one monolithic script, as autoloadable functions, and as
+# zcompiled autoloadable functions. Only one function is called per run.
+#
+# Usage: ./bench_autoload.sh [number of functions] [runs]
+
+cd "$(dirname "$0")"
+
+FUNCS=${1:-500}
+RUNS=${2:-200}
+OUT=$(mktemp -d)
+trap 'rm -rf "$OUT"' EXIT
+
+src=""
+calls=""
+for ((i = 0; i < FUNCS; i++)); do
+    src+="local function f$i(n) local a = n; if a < 10 then echo(a) else echo(\"big\") end return a end "
+    calls+="f$i(1) "
+done
+# reference every function so none is dropped as unused, but only call f0
+src+="local never = 0; if never == 1 then $calls end f0(1)"
+
+python3 main.py "$src" > "$OUT/mono.zsh" || exit 1
+python3 main.py --autoload "$OUT/autoload" "$src" > /dev/null || exit 1
+python3 main.py --autoload "$OUT/zwc" --zcompile "$src" > /dev/null || exit 1
+
+run() {
+    local start end
+    start=$(date +%s.%N)
+    for ((r = 0; r < RUNS; r++)); do
+        zsh -f "$1" > /dev/null
+    done
+    end=$(date +%s.%N)
+    printf '%-10s %8.2f ms/run\n' "$2" \
+        "$(echo "($end - $start) * 1000 / $RUNS" | bc -l)"
+}
+
+echo "$FUNCS functions, $RUNS runs each"
+run "$OUT/mono.zsh" monolithic
+run "$OUT/autoload/main.zsh" autoload
+run "$OUT/zwc/main.zsh" zcompile
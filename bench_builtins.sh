@@ -0,0 +1,53 @@
+#!/usr/bin/env bash
+# Count the processes forked by a string-heavy script when its string and
+# math functions come from the Lua library, which compiles to parameter
+# expansions and builtins, against the same work done by calling external
+# commands. Needs strace to count forks.
+#
+# Usage: ./bench_builtins.sh [iterations] [runs]
+
+cd "$(dirname "$0")"
+
+ITERATIONS=${1:-100}
+RUNS=${2:-20}
+OUT=$(mktemp -d)
+trap 'rm -rf "$OUT"' EXIT
+
+commands='local s = "hello world" '
+library='local s = "hello world" '
+for ((i = 0; i < ITERATIONS; i++)); do
+    commands+='local t = expr("substr", s, 1, 5) '
+    commands+='local u = awk("BEGIN { print toupper(ARGV[1]) }", t) '
+    commands+='local n = expr("length", t) '
+    commands+='local h = expr(n, "/", 2) '
+    commands+='echo(u, n, h) '
+    library+='local t = string.sub(s, 1, 5) '
+    library+='local u = string.upper(t) '
+    library+='local n = string.len(t) '
+    library+='local h = math.floor(n / 2) '
+    library+='print(u, tostring(n), h) '
+done
+
+python3 main.py "$commands" > "$OUT/commands.zsh" || exit 1
+python3 main.py "$library" > "$OUT/library.zsh" || exit 1
+
+forks() {
+    strace -f -qq -e trace=fork,vfork,clone,clone3 -o "$OUT/trace" \
+        zsh -f "$1" > /dev/null
+    grep -cE '^[0-9]+ +(fork|vfork|clone|clone3)\(' "$OUT/trace"
+}
+
+run() {
+    local start end
+    start=$(date +%s.%N)
+    for ((r = 0; r < RUNS; r++)); do
+        zsh -f "$1" > /dev/null
+    done
+    end=$(date +%s.%N)
+    printf '%-10s %6d forks %10.2f ms/run\n' "$2" "$(forks "$1")" \
+        "$(echo "($end - $start) * 1000 / $RUNS" | bc -l)"
+}
+
+echo "$ITERATIONS iterations, $RUNS runs each"
+run "$OUT/commands.zsh" commands
+run "$OUT/library.zsh" library
@@ -0,0 +1,32 @@
+#!/usr/bin/env bash
+# Check that a self-recursive tail call runs as a loop: a function recursing
+# DEPTH levels deep, far past zsh's FUNCNEST limit, has to return its
+# result.
+#
+# Usage: ./check_tail_calls.sh [depth]
+
+cd "$(dirname "$0")"
+
+RED='\033[0;31m'
+GREEN='\033[0;32m'
+NC='\033[0m' # No Color
+
+DEPTH=${1:-100000}
+src="local function count(n, acc)
+  if n == 0 then
+    return acc
+  end
+  return count(math.floor(n - 1), math.floor(acc + 1))
+end
+echo(count($DEPTH, 0))"
+
+status=0
+out=$(zsh -fc "$(python3 main.py "$src")" 2>&1)
+if [ "$out" = "$DEPTH" ]; then
+    echo -e "${GREEN}OK: $DEPTH calls deep${NC}"
+else
+    echo -e "${RED}Expected $DEPTH, got: ${out:0:200}${NC}"
+    status=1
+fi
+
+exit $status
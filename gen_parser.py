@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Generate the standalone LALR parser in utils/lua_parser.py from the
+grammar in utils/grammar.py. Only this script needs lark installed."""
+from argparse import ArgumentParser
+import hashlib
+import io
+from utils.grammar import LARK_GRAMMAR
+
+OUT = "utils/lua_parser.py"
+
+
+def grammar_hash() -> str:
+    """Identify the grammar a parser was generated from."""
+    return hashlib.sha256(LARK_GRAMMAR.encode()).hexdigest()
+
+
+def generate() -> str:
+    """Return the source of the standalone parser."""
+    import lark
+    from lark.tools.standalone import gen_standalone
+    out = io.StringIO()
+    out.write(f"# Generated from utils/grammar.py by gen_parser.py\n"
+              f"GRAMMAR_HASH = {grammar_hash()!r}\n")
+    gen_standalone(lark.Lark(LARK_GRAMMAR, start="chunk", parser="lalr"),
+                   out=out)
+    return out.getvalue()
+
+
+def main() -> int:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("-o", "--out", default=OUT,
+                        help=f"Where to write the parser (default {OUT}).")
+    args = parser.parse_args()
+    with open(args.out, "w") as f:
+        f.write(generate())
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
-from utils import ast, parser, errors
 from argparse import ArgumentParser, BooleanOptionalAction
+import json
 import logging
 import sys
-import lark
 
 
 def setup_logger(verbosity):
@@ -39,39 +38,170 @@ def setup_logger(verbosity):
 
 def arg_parser() -> ArgumentParser:
     parser = ArgumentParser()
-    parser.add_argument("text", help="Input to the compiler.")
+    parser.add_argument("text", nargs="?", help="Input to the compiler.")
     parser.add_argument('-v', '--verbose', action='count', default=0,
                         help="Increase verbosity (can be used multiple times)")
     parser.add_argument("--whitespace", action=BooleanOptionalAction)
     parser.add_argument("-t", "--tree", action=BooleanOptionalAction,
                         help="Print the parsed AST.")
+    parser.add_argument("--json", action=BooleanOptionalAction,
+                        help="Print the output and all errors as JSON.")
+    parser.add_argument("--project", action=BooleanOptionalAction,
+                        help="Treat the input as the entry file of a "
+                        "project and compile it and every module it "
+                        "requires.")
+    parser.add_argument("--stream", action=BooleanOptionalAction,
+                        help="Treat the input as a file ('-' for standard "
+                        "input) compiled a few statements at a time, "
+                        "writing the output as it goes.")
+    parser.add_argument("-o", "--out-dir", default="build",
+                        help="Output directory for --project.")
+    parser.add_argument("-j", "--jobs", type=int,
+                        help="Number of processes used by --project.")
+    parser.add_argument("--autoload", metavar="DIR",
+                        help="Write the output to DIR as an entry script "
+                        "plus one autoloadable file per function.")
+    parser.add_argument("--zcompile", action=BooleanOptionalAction,
+                        help="With --autoload, compile the function files "
+                        "to wordcode using zsh.")
+    parser.add_argument("--minify", action=BooleanOptionalAction,
+                        help="Emit compact instead of readable code.")
+    parser.add_argument("--pure", metavar="CMD", action="append", default=[],
+                        help="Treat the output of CMD as depending only on "
+                        "its arguments, allowing calls to it to be hoisted "
+                        "out of loops (can be used multiple times).")
+    parser.add_argument("-O", dest="opt_level", type=int, default=1,
+                        choices=range(3),
+                        help="Optimization level: 0 runs no passes, 1 "
+                        "(default) removes dead assignments and hoists "
+                        "loop invariants, 2 also propagates constants.")
+    parser.add_argument("--time-passes", action=BooleanOptionalAction,
+                        help="Print the time spent in each pass to stderr.")
+    parser.add_argument("--instrument", nargs="?", const="functions",
+                        choices=("functions", "loops"),
+                        help="Make the output count and time the calls of "
+                        "every function (and with 'loops', every loop), "
+                        "writing them to $LUA_PROFILE.<pid> on exit; see "
+                        "profile_report.py.")
+    parser.add_argument("--parallelize", action=BooleanOptionalAction,
+                        help="Run consecutive commands that don't depend on "
+                        "each other's variables as background jobs. Only "
+                        "use this when they don't depend on each other in "
+                        "other ways, e.g. through files, and don't read "
+                        "standard input.")
+    parser.add_argument("--eager-path", action=BooleanOptionalAction,
+                        help="Scan every PATH directory up front instead of "
+                        "resolving commands on demand.")
+    parser.add_argument("--path-snapshot", metavar="FILE",
+                        help="Take the known commands from a snapshot "
+                        "instead of $PATH.")
+    parser.add_argument("--write-path-snapshot", metavar="FILE",
+                        help="Write the commands on $PATH to a snapshot "
+                        "and exit.")
     return parser
 
 
+def build_project(args, options) -> int:
+    from utils.project import Project
+    project = Project(args.text, args.out_dir, options, args.jobs)
+    ok = project.build()
+    for name in project.compiled:
+        logging.info(f"compiled {name}")
+    for name in project.skipped:
+        logging.info(f"up to date {name}")
+    if args.json:
+        print(json.dumps({"ok": ok, "compiled": project.compiled,
+                          "skipped": project.skipped,
+                          "errors": [e.to_dict() for e in project.errors]},
+                         indent=2))
+    else:
+        for err in project.errors:
+            print(err)
+    return 0 if ok else 1
+
+
+def compile_stream(args, options) -> int:
+    from utils.stream import compile_stream, mapped
+    try:
+        with mapped(args.text) as source:
+            errors = compile_stream(source, sys.stdout, options)
+    except (OSError, UnicodeDecodeError) as e:
+        print(f"Could not read {args.text}: {e}", file=sys.stderr)
+        return 1
+    for err in errors:
+        err.file = args.text
+        print(err, file=sys.stderr)
+    return 0 if not errors else 1
+
+
 def main() -> int:
-    args = arg_parser().parse_args()
+    parser = arg_parser()
+    args = parser.parse_args()
     setup_logger(args.verbose)
-    lark_ast = None
-    lark_parser = parser.PARSER
-    try:
-        lark_ast = lark_parser.parse(args.text)
-        if args.tree:
-            print(lark_ast.pretty())
-    except lark.exceptions.LarkError as e:
-        print(f"Lexing/Parsing error: {e}")
-        exit(1)
-    assert lark_ast is not None
-    # generator = code_gen.CodeGenerator(ast)
-    my_ast = ast.ast_from_lark(lark_ast)
-    my_ast.update_symbols()
-    try:
-        my_ast.gen()
-        unused = my_ast.get_unused_symbols()
-        my_ast.clean_up(unused)
-        print(my_ast.gen())
-    except errors.GenerationError as e:
-        print(e)
+    if args.write_path_snapshot:
+        if args.text is not None:
+            parser.error("--write-path-snapshot doesn't take an input")
+        from utils.lib import write_path_snapshot
+        try:
+            write_path_snapshot(args.write_path_snapshot)
+        except OSError as e:
+            print(f"Could not write {args.write_path_snapshot}: {e}",
+                  file=sys.stderr)
+            return 1
+        return 0
+    if args.text is None:
+        parser.error("the following arguments are required: text")
+    # imported here so that `--help` and argument errors don't pay for
+    # loading the parser and the compiler
+    from utils.compiler import Compiler, Options
+    from utils.lib import load_path_snapshot
+    bins = None
+    if args.path_snapshot:
+        try:
+            bins = load_path_snapshot(args.path_snapshot)
+        except (OSError, ValueError) as e:
+            print(f"Could not read {args.path_snapshot}: {e}",
+                  file=sys.stderr)
+            return 1
+    options = Options(bins, eager_path=bool(args.eager_path),
+                      autoload=bool(args.autoload),
+                      minify=bool(args.minify), pure=args.pure,
+                      opt_level=args.opt_level, instrument=args.instrument,
+                      parallelize=bool(args.parallelize))
+    if args.project:
+        if args.autoload:
+            parser.error("--project can't be combined with --autoload")
+        return build_project(args, options)
+    if args.stream:
+        if args.autoload or args.json or args.tree or args.instrument:
+            parser.error("--stream can't be combined with --autoload, "
+                         "--json, --tree or --instrument")
+        return compile_stream(args, options)
+    if args.autoload and args.json:
+        parser.error("--autoload can't be combined with --json")
+    result = Compiler(options).compile(args.text)
+    if args.time_passes:
+        for name, seconds in result.timings:
+            print(f"{name:<12}{seconds * 1000:8.3f} ms", file=sys.stderr)
+    if args.tree and result.tree is not None:
+        print(result.tree.pretty())
+    if args.json:
+        print(json.dumps(result.to_dict(), indent=2))
+        return 0 if result.ok else 1
+    if not result.ok:
+        print(result.error)
         exit(1)
+    if args.autoload:
+        import subprocess
+        from utils.autoload import write_autoload
+        try:
+            print(write_autoload(result, args.autoload,
+                                 zcompile=bool(args.zcompile)))
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"Could not write {args.autoload}: {e}")
+            return 1
+        return 0
+    print(result.output)
     return 0
 
 
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Aggregate the profiles written by scripts compiled with --instrument
+into a table of the functions and loops taking the most time."""
+from argparse import ArgumentParser
+import glob
+import os
+import sys
+from utils.instrument import aggregate, table
+
+
+def main() -> int:
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument("dumps", nargs="*",
+                        help="Profile dumps, one per run; defaults to "
+                        "$LUA_PROFILE.* (or $TMPDIR/lua-profile.*).")
+    parser.add_argument("-n", "--limit", type=int,
+                        help="Show only the LIMIT slowest entries.")
+    args = parser.parse_args()
+    dumps = args.dumps
+    if not dumps:
+        prefix = os.environ.get("LUA_PROFILE") or os.path.join(
+            os.environ.get("TMPDIR", "/tmp"), "lua-profile")
+        dumps = sorted(glob.glob(glob.escape(prefix) + ".*"))
+    if not dumps:
+        print("No profile dumps found", file=sys.stderr)
+        return 1
+    runs = []
+    try:
+        for path in dumps:
+            with open(path) as f:
+                runs.append(f.readlines())
+    except OSError as e:
+        print(f"Could not read {e.filename}: {e.strerror}", file=sys.stderr)
+        return 1
+    print(table(aggregate(runs), args.limit))
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
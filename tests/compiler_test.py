@@ -0,0 +1,58 @@
+import asyncio
+import os
+import sys
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.compiler import Compiler, Options  # noqa: E402
+
+SOURCES = [
+    "a = 3; echo(a)",
+    "local a = 3; if a < 10 then echo(a) else echo(\"nope\") end",
+    "local function a(n) ls(n); return n end echo(a(\"hello\"))",
+    "local i = 0; while i < 3 do local b = basename(i); i = b end",
+    "local a = 3; local a = a + 1; echo(a)",
+    "a = 2; b = 3; a = a 和 b",  # a syntax error
+    "echo(undefined_name)",  # a name error
+]
+
+COMPILES = 1000  # per test
+
+
+def summary(result):
+    return (result.output, [str(e) for e in result.errors])
+
+
+class CompilerConcurrencyTest(unittest.TestCase):
+    """A shared Compiler must give the same results however its compiles
+    interleave."""
+
+    def setUp(self):
+        self.compiler = Compiler(Options(["echo", "ls", "basename"],
+                                         pure=["basename"]))
+        self.expected = [summary(self.compiler.compile(s)) for s in SOURCES]
+
+    def sources(self):
+        return [SOURCES[i % len(SOURCES)] for i in range(COMPILES)]
+
+    def check(self, results):
+        self.assertEqual(len(results), COMPILES)
+        for i, result in enumerate(results):
+            self.assertEqual(summary(result),
+                             self.expected[i % len(SOURCES)])
+
+    def test_threads(self):
+        with ThreadPoolExecutor(16) as pool:
+            self.check(list(pool.map(self.compiler.compile, self.sources())))
+
+    def test_asyncio(self):
+        async def run():
+            return await asyncio.gather(
+                *(self.compiler.compile_async(s) for s in self.sources()))
+        self.check(asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import ast  # noqa: E402
+from utils.compiler import Compiler, Options  # noqa: E402
+from utils.dataflow import DataFlow  # noqa: E402
+
+
+def analyze(source):
+    compiler = Compiler(Options(["echo"]))
+    root = compiler.build(compiler.parse(source))
+    return DataFlow(root), root.get_only(ast.BlockNode).child_nodes()
+
+
+class DataFlowTest(unittest.TestCase):
+    def test_overwritten_store_is_dead(self):
+        flow, stats = analyze("a = 1\na = 2\necho(a)")
+        self.assertEqual(flow.dead_statements(), [stats[0]])
+        (use,) = [u for u in flow.uses.values() if u.name == "a"]
+        self.assertEqual([d.stat for d in use.defs], [stats[1]])
+
+    def test_both_arms_reach(self):
+        flow, stats = analyze("if b then a = 1 else a = 2 end\necho(a)")
+        (use,) = [u for u in flow.uses.values() if u.name == "a"]
+        self.assertEqual(len(use.defs), 2)
+        self.assertEqual(flow.dead_statements(), [])
+
+    def test_liveness(self):
+        flow, stats = analyze("a = 1\nb = a\na = 2\necho(a, b)")
+        self.assertEqual([flow.live_in[s] for s in stats],
+                         [{"echo"}, {"echo", "a"}, {"echo", "b"},
+                          {"echo", "a", "b"}])
+        self.assertEqual(flow.live_out[stats[1]], {"echo", "b"})
+
+    def test_liveness_around_loop(self):
+        flow, stats = analyze("i = 0\nwhile i < 3 do i = i+1 end\n"
+                              "echo(n)")
+        self.assertEqual(flow.live_in[stats[1]], {"echo", "i", "n"})
+        self.assertEqual(flow.live_out[stats[1]], {"echo", "n"})
+        self.assertEqual(flow.live_in[stats[0]], {"echo", "n"})
+
+if __name__ == "__main__":
+    unittest.main()
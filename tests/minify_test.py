@@ -0,0 +1,69 @@
+import os
+import shutil
+import subprocess
+import sys
+import unittest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from utils import ir  # noqa: E402
+from utils.code_gen import Emitter  # noqa: E402
+from utils.compiler import Compiler, Options  # noqa: E402
+
+NESTED = """local function f(n)
+  while n < 10 do
+    if n > 5 then
+      echo(n)
+    end
+    n = n+1
+  end
+end
+f(1)
+"""
+
+
+def compile(source, minify, bins=("echo",)):
+    return Compiler(Options(bins, minify=minify)).compile(source)
+
+
+def run(script):
+    return subprocess.run(["zsh", "-fc", script], capture_output=True,
+                          text=True, timeout=60)
+
+
+class MinifyTest(unittest.TestCase):
+    def test_no_indentation(self):
+        readable, minified = (compile(NESTED, m) for m in (False, True))
+        self.assertTrue(readable.ok and minified.ok)
+        self.assertTrue(any(line.startswith(" ")
+                            for line in readable.output.split("\n")))
+        for line in minified.output.split("\n"):
+            self.assertEqual(line, line.lstrip())
+            self.assertNotEqual(line, "")
+
+    def test_escaped_braces_kept(self):
+        block = ir.Block()
+        block.append(ir.RAW, (r"echo \${x} ${y} ${z}_1 ${w[1]}",))
+        self.assertEqual(Emitter(minify=True).emit(block),
+                         r"echo \${x} $y ${z}_1 ${w[1]}")
+
+    @unittest.skipIf(shutil.which("zsh") is None, "needs zsh")
+    def test_sample_inputs_behave_the_same(self):
+        with open(os.path.join(ROOT, "sample_inputs.txt")) as f:
+            lines = [line.strip() for line in f if line.strip()]
+        # names are looked up on PATH, as when running main.py
+        for line in lines:
+            readable = compile(line, False, None)
+            if not readable.ok:
+                continue
+            with self.subTest(line):
+                minified = compile(line, True, None)
+                self.assertTrue(minified.ok, minified.error)
+                expected, actual = run(readable.output), run(minified.output)
+                self.assertEqual((actual.stdout, actual.stderr),
+                                 (expected.stdout, expected.stderr))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,36 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.compiler import Compiler, Options  # noqa: E402
+
+
+def compile(source):
+    result = Compiler(Options(["date", "echo", "uname"],
+                              parallelize=True)).compile(source)
+    assert result.ok, result.error
+    return result.output
+
+
+class ParallelizeTest(unittest.TestCase):
+    def test_binaries_run_as_jobs(self):
+        out = compile("local x = date(); local y = uname(); echo(x, y)")
+        self.assertIn("date  > $__lua_par_dir/1 &", out)
+        self.assertIn("uname  > $__lua_par_dir/2 &", out)
+
+    def test_library_calls_stay_inline(self):
+        out = compile('local a = "1"; local b = "2"; local x = tostring(a); '
+                      'local y = tostring(b); echo(x, y)')
+        self.assertNotIn("__lua_par", out)
+        self.assertIn("x=${a}", out)
+
+    def test_unknown_names_arent_binaries(self):
+        result = Compiler(Options(["echo"], parallelize=True)).compile(
+            "local x = nope(); local y = nada(); echo(x, y)")
+        self.assertNotIn("__lua_par", result.output)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.parser import Token, UnexpectedToken, get_parser  # noqa: E402
+
+
+def shape(node):
+    """Render a tree as nested tuples of rule names and token values."""
+    if isinstance(node, Token):
+        return node.value
+    return (node.data, *[shape(c) for c in node.children])
+
+
+def exp(text):
+    tree = get_parser().parse(f"x = {text}")
+    explist = tree.children[0].children[0].children[1]
+    return shape(explist.children[0])
+
+
+class ParserTest(unittest.TestCase):
+    def test_precedence(self):
+        self.assertEqual(exp("1 + 2 * 3"),
+                         ("exp", ("exp", "1"), ("binop", "+"),
+                          ("exp", ("exp", "2"), ("binop", "*"),
+                           ("exp", "3"))))
+
+    def test_right_associative(self):
+        a, b, c = (("exp", ("prefixexp", ("var", n))) for n in "abc")
+        self.assertEqual(exp("a .. b .. c"),
+                         ("exp", a, ("binop", ".."),
+                          ("exp", b, ("binop", ".."), c)))
+        self.assertEqual(exp("-a ^ 2"),
+                         ("exp", ("unop", "-"),
+                          ("exp", a, ("binop", "^"), ("exp", "2"))))
+
+    def test_call_continues_over_parenthesis(self):
+        # as in Lua, `f() (g)()` is one call of f's result, not two calls
+        stats = get_parser().parse("f() (g)()").children[0].children
+        self.assertEqual(len(stats), 1)
+
+    def test_vararg_parameters(self):
+        tree = get_parser().parse("function f(a, b, ...) end")
+        self.assertEqual(list(tree.find_data("namelist"))[0].children,
+                         ["a", "b"])
+
+    def test_end_of_input(self):
+        with self.assertRaises(UnexpectedToken) as e:
+            get_parser().parse("if a then")
+        self.assertEqual(e.exception.token.type, "$END")
+
+    def test_generated_parser_is_up_to_date(self):
+        from gen_parser import grammar_hash
+        from utils import lua_parser
+        self.assertEqual(lua_parser.GRAMMAR_HASH, grammar_hash(),
+                         "run gen_parser.py after editing the grammar")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.preprocess import split_statements  # noqa: E402
+
+
+def pieces(text):
+    return [str(p) for p in split_statements(text)]
+
+
+class SplitStatementsTest(unittest.TestCase):
+    def test_arithmetic_stays_in_one_statement(self):
+        self.assertEqual(pieces("x = 1-y"), ["x = 1-y"])
+        self.assertEqual(pieces("a = 2+b; c = 3"), ["a = 2+b;", "c = 3"])
+
+    def test_exponents(self):
+        self.assertEqual(pieces("a = 1e-3 b = 0x1p+4 c = 2"),
+                         ["a = 1e-3 ", "b = 0x1p+4 ", "c = 2"])
+
+    def test_labels(self):
+        self.assertEqual(pieces("a = 1 ::lbl:: goto lbl"),
+                         ["a = 1 ", "::lbl:: ", "goto lbl"])
+
+
+if __name__ == "__main__":
+    unittest.main()
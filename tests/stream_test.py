@@ -0,0 +1,47 @@
+import io
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.compiler import Compiler, Options  # noqa: E402
+from utils.stream import compile_stream, mapped  # noqa: E402
+
+SOURCE = """a = 1
+b = 2+a
+local function f(n)
+  if n > 0 then
+    return n-1
+  end
+  return n
+end
+c = 3-b; echo(f(c))
+while a < 10 do a = a+1 end
+echo(a, b)
+"""
+
+
+class CompileStreamTest(unittest.TestCase):
+    """Streaming must give the same output as compiling the whole file,
+    wherever the chunk boundaries fall."""
+
+    def test_tiny_chunks(self):
+        options = Options(["echo"])
+        whole = Compiler(options).compile(SOURCE, keep_exports=True)
+        self.assertTrue(whole.ok, whole.error)
+        with tempfile.NamedTemporaryFile("w", suffix=".lua") as f:
+            f.write(SOURCE)
+            f.flush()
+            for size in (1, 8, 40):
+                out = io.StringIO()
+                with mapped(f.name) as source:
+                    errors = compile_stream(source, out, options,
+                                            chunk_size=size)
+                self.assertEqual([str(e) for e in errors], [])
+                self.assertEqual(out.getvalue(), whole.output + "\n")
+
+
+if __name__ == "__main__":
+    unittest.main()
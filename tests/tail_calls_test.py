@@ -0,0 +1,45 @@
+import os
+import shutil
+import subprocess
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.compiler import Compiler, Options  # noqa: E402
+
+DEPTH = 100000
+SOURCE = f"""local function count(n, acc)
+  if n == 0 then
+    return acc
+  end
+  return count(math.floor(n - 1), math.floor(acc + 1))
+end
+echo(count({DEPTH}, 0))
+"""
+
+
+def compile(source):
+    result = Compiler(Options(["echo"])).compile(source)
+    assert result.ok, result.error
+    return result.output
+
+
+class TailCallsTest(unittest.TestCase):
+    def test_self_call_becomes_loop(self):
+        lines = [line.strip() for line in compile(SOURCE).split("\n")]
+        loop = lines.index("while true; do")
+        self.assertTrue(lines[loop + 5].startswith("set -- "), lines)
+        self.assertEqual(lines[loop + 8:loop + 10], ["continue", "done"])
+        self.assertNotIn("$(count", "\n".join(lines[:loop + 10]))
+
+    @unittest.skipIf(shutil.which("zsh") is None, "needs zsh")
+    def test_deep_recursion(self):
+        # far past zsh's FUNCNEST limit, and a subshell per level before
+        out = subprocess.run(["zsh", "-fc", compile(SOURCE)],
+                             capture_output=True, text=True, timeout=120)
+        self.assertEqual(out.stdout.strip(), str(DEPTH), out.stderr[:200])
+
+
+if __name__ == "__main__":
+    unittest.main()
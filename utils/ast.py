@@ -1,15 +1,8 @@
-import lark
-from functools import lru_cache
-from .ast_base import ASTNode
-from .symbols import Symbol
-from .errors import UnknownVariableError
-
-
-INDENT = "  "
-
-
-def indent(text: str, level: int) -> str:
-    return INDENT * level + ("\n" + INDENT * level).join(text.split("\n"))
+from typing import Optional
+from .ast_base import ASTNode, node_cache
+from .builtins import LIBRARY, Builtin
+from .errors import UnknownVariableError, UnsupportedError
+from .parser import Token, Tree
 
 
 class AttribNode(ASTNode):
@@ -21,18 +14,21 @@ class ForInNode(ASTNode):
 
 
 class VarNode(ASTNode):
+    # literal value the name is known to hold here, see `passes.const_prop`
+    constant: Optional[str] = None
+
     def gen(self):
+        if self.constant is not None and not self.assign:
+            return self.constant
         # NAME
-        if isinstance(self.children[0], lark.Token):
+        if isinstance(self.children[0], Token):
             name = self.children[0].value
             sym = self.lookup(name)
             if not sym:
                 if not self.assign:
-                    raise UnknownVariableError(name, self)
-                else:
-                    return name
+                    self.report(UnknownVariableError(name, self))
+                return name
             else:
-                self.use(sym)
                 if (sym.type == "function") or self.assign:
                     return name
                 else:
@@ -64,30 +60,12 @@ class FuncnameStar3Node(ASTNode):
 
 
 class BlockNode(ASTNode):
-    def gen(self):
-        return "\n".join(map(lambda n: n.gen(), self.children))
-
     def get_type(self):
         return self.get_only(RetstatNode).get_type()
 
-    def filter_unused_stat(self, node: ASTNode, s: Symbol) -> bool:
-        if not isinstance(node, StatNode):
-            return True
-        if s not in node.get_symbols():
-            return True
-        return False
-
-    def clean_up(self, unused):
-        for u in unused:
-            self.children = list(filter(
-                lambda x: self.filter_unused_stat(x, u), self.children))
-        super().clean_up(unused)
-
 
 class ChunkNode(ASTNode):
-    def gen(self):
-        prelim = "\n".join(map(lambda n: n.gen(), self.children))
-        return '\n'.join(line for line in prelim.splitlines() if line.strip())
+    pass
 
 
 # Labels and GOTOs are unsupported in zsh
@@ -96,8 +74,7 @@ class LabelNode(ASTNode):
 
 
 class FuncbodyNode(ASTNode):
-    def gen(self):
-        return self.get_only(BlockNode).gen()
+    pass
 
 
 class VarlistStar4Node(ASTNode):
@@ -109,7 +86,7 @@ class ExpNode(ASTNode):
         if len(self.children) < 1:
             return ""
         first = self.children[0]
-        if isinstance(first, lark.Token):
+        if isinstance(first, Token):
             if first.value == "nil":
                 return "\"\""
             elif first.value == "false":
@@ -127,7 +104,7 @@ class ExpNode(ASTNode):
 
     def get_type(self):
         first = self.children[0]
-        if isinstance(first, lark.Token):
+        if isinstance(first, Token):
             if first.value == "nil":
                 return "string"
             elif first.value == "false":
@@ -144,37 +121,52 @@ class ExpNode(ASTNode):
 
 
 class StatNode(ASTNode):
-    def gen(self) -> str:
-        if len(self.children) < 1:
-            return ""
-        first = self.children[0]
-        if first.is_a(SemicolonNode):
-            return "\n"
-        elif first.is_a(BreakNode):
-            return "break"
-        elif first.is_a(GotoNode):  # not supported
-            return "goto"
-        elif first.is_a(DoNode):
-            return "do\n" + indent(self.children[1].gen(), 1) + \
-                "\ndone"
-        elif first.is_a(WhileNode):
-            return "while [[ " + self.children[1].gen() + " ]]; do\n" + \
-                indent(self.children[2].gen(), 1) + "\ndone"
-        elif first.is_a(RepeatNode):
-            return "while ! ((" + self.children[1].gen() + "))\ndo\n" + \
-                indent(self.children[2].gen(), 1) + "\ndone"
-        elif first.is_a(VarlistNode):
-            var = self.get_only(VarlistNode)
-            exp = self.get_only(ExplistNode)
-            var.set_recursive('assign', True)
-            return var.gen() + "=\"" + exp.gen() + '"'  # safe
-        elif first.is_a(FunctioncallNode):
-            return first.gen()
-        else:
-            return first.gen()
-        return ""
-
-    @lru_cache
+    # invariant calls of a loop to compute before it, see `invariants`
+    hoisted_calls: tuple = ()
+
+    @node_cache
+    def invariants(self) -> list['FunctioncallNode']:
+        """Return the command substitutions in this loop that give the same
+        result on every iteration, marking each to be read from a temporary.
+
+        A call qualifies if it runs a command listed as pure and its
+        arguments only read variables the loop never assigns. Calls to
+        functions of the program could assign anything, so if the loop
+        makes any, only calls without variable arguments qualify.
+        """
+        if not self.pure:
+            return []
+        assigned = set()
+        calls_program = False
+        for node in self.walk():
+            if node.is_a(StatNode) and node is not self:
+                assigned.update(sym.name for sym in node.get_symbols())
+            if node.is_a(FunctioncallNode) and not (
+                    node.callee_is_binary() or node.builtin()):
+                calls_program = True
+        root = self.root()
+        found = []
+        for node in self.walk():
+            if not (node.is_a(FunctioncallNode) and node.parent
+                    and node.parent.is_a(PrefixexpNode)):
+                continue  # not captured
+            if node.hoisted or node.callee() not in self.pure \
+                    or not node.callee_is_binary():
+                continue
+            if any(n.is_a(FunctioncallNode) or n.is_a(FunctiondefNode)
+                   for n in node.children[1].walk()):
+                continue
+            reads = [n.children[0] for n in node.children[1].walk()
+                     if n.is_a(VarNode) and isinstance(n.children[0],
+                                                       Token)]
+            if reads and (calls_program or assigned.intersection(reads)):
+                continue
+            root.hoist_count += 1
+            node.hoisted = f"__inv{root.hoist_count}"
+            found.append(node)
+        return found
+
+    @node_cache
     def get_symbols(self):
         if self.has(LocalAssignNode):
             return self.get_only(LocalAssignNode).get_symbols()
@@ -207,6 +199,8 @@ class PrefixexpNode(ASTNode):
     def get_type(self):
         if (n := self.get(VarNode)):
             return n[0].get_type()
+        if (n := self.get(FunctioncallNode)):
+            return n[0].get_type()
         return "unknown"
 
 
@@ -215,21 +209,7 @@ class AttnamelistStar2Node(ASTNode):
 
 
 class IfStmtNode(ASTNode):
-    def gen(self) -> str:
-        cond = self.children[0].gen()
-        else_body = ""
-        if_body = indent(self.get_only(BlockNode).gen(), 1)
-        elif_body = "\n"
-        elifs = self.get(ElseifBlockNode)
-        if elifs:
-            for el_if in elifs:
-                elif_exp = el_if.get_only(ExpNode)
-                elif_body += "elif [[ " + elif_exp.gen() + " ]]; then\n"
-                elif_body += indent(el_if.gen(), 1) + "\n"
-        if len(self.children) > 2:
-            else_body = "else\n" + \
-                indent(self.get_only(ElseBlockNode).gen(), 1)
-        return f"if [[ {cond} ]]; then\n{if_body}{elif_body}{else_body}\nfi\n"
+    pass
 
 
 class FieldlistStar7Node(ASTNode):
@@ -241,9 +221,6 @@ class FieldNode(ASTNode):
 
 
 class RetstatNode(ASTNode):
-    def gen(self):
-        return "echo " + self.children[0].gen()
-
     def update_symbols(self):
         self.symbol_table.sequential = True
         super().update_symbols()
@@ -254,8 +231,7 @@ class AttnamelistNode(ASTNode):
 
 
 class ElseifBlockNode(ASTNode):
-    def gen(self):
-        return self.get_only(BlockNode).gen()
+    pass
 
 
 class FunctionDefNode(ASTNode):
@@ -272,8 +248,11 @@ class ArgsNode(ASTNode):
         else:
             if isinstance(self.children[0], TableconstructorNode):
                 return ""  # table constructor not supported
+            elif isinstance(self.children[0], Token):  # f "str"
+                return self.children[0].value
             else:
-                return self.children[0].gen()
+                # one word per argument, not one line
+                return " ".join(self.children[0].map_nodes(lambda n: n.gen()))
 
 
 class WhileNode(ASTNode):
@@ -308,40 +287,28 @@ class BlockStar0Node(ASTNode):
     pass
 
 
+def params(body: ASTNode) -> list:
+    """Return the parameter name tokens of a funcbody node."""
+    # the children goes funcbody -> parlist -> namelist
+    parslist = body.get(ParlistNode)
+    if not parslist or not parslist[0].children:
+        return []
+    return parslist[0].children[0].children
+
+
 class LocalFunctionNode(ASTNode):
-    def gen(self) -> str:
-        assert len(self.children) == 2
-        name, body = self.children
-        assert isinstance(name, lark.Token)
-        # the children goes funcbody -> parlist -> namelist
-        declaration = ""
-        parslist = body.get_only(ParlistNode)
-        if parslist:
-            pars = parslist.children[0].children
-            declaration = ""
-            for i in range(0, len(pars)):
-                par = pars[i]
-                assert isinstance(par, lark.Token)
-                declaration += f"{par.value}=${i + 1}\n"
-        declaration = indent(declaration, 1)
-        body_gen = indent(body.gen(), 1)
-        return f"function {name.value}() {{\n{declaration}\n{body_gen}\n}}\n"
-
-    @lru_cache
+    @node_cache
     def get_symbols(self):
         assert len(self.children) == 2
         name, _ = self.children
-        return [self.make_symbol(name, "function")]
+        return [self.make_symbol(name.value, "function")]
 
     def update_symbols(self):
-        syms = self.get_symbols()
+        # copy, so the parameters don't become symbols of the statement
+        syms = list(self.get_symbols())
         _, body = self.children
-        parslist = body.get_only(ParlistNode)
-        if parslist:
-            pars = parslist.children[0].children
-            for i in range(0, len(pars)):
-                par = pars[i]
-                syms += [self.make_symbol(par.value, "unknown")]
+        for par in params(body):
+            syms += [self.make_symbol(par.value, "unknown")]
         self.symbol_table.insert(syms)  # recursion possible
         super().update_symbols()
 
@@ -349,30 +316,22 @@ class LocalFunctionNode(ASTNode):
 # Anonymous function
 class FunctiondefNode(ASTNode):
     def gen(self):
+        # statements are only rendered through the IR
+        from . import code_gen, ir
         assert len(self.children) == 1
         body = self.children[0]
-        # the children goes funcbody -> parlist -> namelist
-        declaration = ""
-        parslist = body.get_only(ParlistNode)
-        if parslist:
-            pars = parslist.children[0].children
-            declaration = ""
-            for i in range(0, len(pars)):
-                par = pars[i]
-                assert isinstance(par, lark.Token)
-                declaration += f"{par.value}=${i}\n"
-        declaration = indent(declaration, 1)
-        body_gen = indent(body.gen(), 1)
-        return f"function {{\n{declaration}\n{body_gen}\n}}\n"
+        block = ir.lower(body.get_only(BlockNode))
+        if self.instrument:
+            from . import instrument
+            block = instrument.anonymous(block, self,
+                                         self.instrument == "loops")
+        lines = code_gen.Emitter(self.minify).function_body(
+            [par.value for par in params(body)], block)
+        return "function {\n" + "\n".join(lines) + "\n}\n"
 
 
 class LocalAssignNode(ASTNode):
-    def gen(self):
-        attr = self.get_only(AttnamelistNode)
-        exps = self.get_only(ExplistNode)
-        return attr.children[0].value + "=" + exps.gen()
-
-    @lru_cache
+    @node_cache
     def get_symbols(self):
         attr = self.get_only(AttnamelistNode)
         # exps = self.get_only(ExplistNode)
@@ -387,7 +346,7 @@ class UnopNode(ASTNode):
 
     def gen(self):
         c0 = self.children[0]
-        assert isinstance(c0, lark.Token)
+        assert isinstance(c0, Token)
         return self.__mapping.get(c0.value, c0.value)
 
 
@@ -405,8 +364,7 @@ class VarlistNode(ASTNode):
 
 
 class ElseBlockNode(ASTNode):
-    def gen(self):
-        return self.children[0].gen()
+    pass
 
 
 class TableconstructorNode(ASTNode):
@@ -423,16 +381,102 @@ class ExplistNode(ASTNode):
 
 
 class FunctioncallNode(ASTNode):
+    # temporary holding the result when hoisted out of a loop
+    hoisted: Optional[str] = None
+
+    def callee(self) -> Optional[str]:
+        """Return the called name, if the call is to a plain name."""
+        if len(self.children) != 2:
+            return None
+        var = self.children[0].children[0]
+        if var.is_a(VarNode) and isinstance(var.children[0], Token):
+            return var.children[0].value
+        return None
+
+    def qualified_name(self) -> Optional[str]:
+        """Return the called name, including the table it's looked up in
+        for calls like `string.sub(...)`."""
+        if (name := self.callee()) is not None:
+            return name
+        if len(self.children) != 2:
+            return None
+        var = self.children[0].children[0]
+        if not (var.is_a(VarNode) and len(var.children) == 2
+                and isinstance(var.children[1], Token)):
+            return None
+        table = var.children[0].children[0]
+        if table.is_a(VarNode) and isinstance(table.children[0], Token):
+            return table.children[0].value + "." + var.children[1].value
+        return None
+
+    def builtin(self) -> Optional[Builtin]:
+        """Return the library function called, unless the program defines
+        its own under that name."""
+        name = self.qualified_name()
+        if name not in LIBRARY:
+            return None
+        sym = self.lookup(name.split(".")[0])
+        if sym is not None and sym.source is not None:
+            return None
+        return LIBRARY[name]
+
+    def arguments(self) -> list[str]:
+        """Return the rendered arguments of the call."""
+        args = self.children[-1]
+        if args.has(ExplistNode):
+            return [e.gen() for e in args.get_only(ExplistNode).children]
+        if args.children and isinstance(args.children[0], Token):
+            return [args.children[0].value]  # f "str"
+        return []
+
+    def get_type(self):
+        if (lib := self.builtin()) is not None:
+            return lib.type
+        return super().get_type()
+
+    def gen_builtin(self, lib: Builtin) -> str:
+        args = self.arguments()
+        low, high = lib.arity
+        if not low <= len(args) <= high:
+            self.report(UnsupportedError(
+                f"call to {self.qualified_name()} with {len(args)} "
+                "arguments", self))
+            return ""
+        if lib.module:
+            root = self.root()
+            root.modules |= {lib.module}
+        res = lib.render(args)
+        if lib.kind == "command":
+            return "$(" + res + ")" if self.capture else res
+        return res if self.capture else ": " + res
+
+    def callee_is_binary(self) -> bool:
+        """Return whether the call runs a binary found on PATH, rather
+        than a function defined here or by another module."""
+        name = self.callee()
+        externals = self.root().symbol_table.externals
+        if name is None or externals is None:
+            return False
+        sym = externals.get(name)
+        return sym is not None and self.lookup(name) is sym
+
     def gen(self) -> str:
+        if self.hoisted and self.capture:
+            return "${" + self.hoisted + "}"
+        if (lib := self.builtin()) is not None:
+            return self.gen_builtin(lib)
         if len(self.children) == 2:
+            call = self.children[0].gen() + " " + self.children[1].gen()
+            if self.minify:
+                call = call.rstrip()
             if self.capture:  # want the result wrapped
-                return "$(" + self.children[0].gen() + " " + \
-                    self.children[1].gen() + ")"
+                return "$(" + call + ")"
             else:
-                return self.children[0].gen() + " " + \
-                    self.children[1].gen()
+                return call
         else:
-            return ""  # zsh does not support objects or methods
+            # zsh does not support objects or methods
+            self.report(UnsupportedError("method call", self))
+            return ""
 
 
 class IfStmtStar1Node(ASTNode):
@@ -460,7 +504,7 @@ class BinopNode(ASTNode):
 
     def gen(self):
         c0 = self.children[0]
-        assert isinstance(c0, lark.Token)
+        assert isinstance(c0, Token)
         return self.__mapping.get(c0.value, c0.value)
 
 
@@ -470,7 +514,7 @@ def snake_to_camel(name):
     return ''.join(word.capitalize() for word in words)
 
 
-def ast_from_lark(ast: lark.Tree) -> ASTNode:
+def ast_from_lark(ast: Tree) -> ASTNode:
     node_type = snake_to_camel(ast.data) + "Node"
     node = globals()[node_type]()
     assert isinstance(node, ASTNode)
@@ -478,7 +522,7 @@ def ast_from_lark(ast: lark.Tree) -> ASTNode:
     clen = len(ast.children)
     for i in range(clen):
         c = ast.children[i]
-        if isinstance(c, lark.Token):
+        if isinstance(c, Token):
             children += [c]
         else:
             cnode = ast_from_lark(c)
@@ -1,11 +1,31 @@
 from abc import ABC
-from typing import Any, List, Optional, Type, Callable, Union
+from typing import Any, Iterator, List, Optional, Type, Callable, Union
 from .symbols import Symbol, SymbolTable
-from functools import lru_cache
-from lark import Token
+from functools import wraps
+from .parser import Token
+
+
+def node_cache(f: Callable) -> Callable:
+    """Memoize a no-argument node method on the node itself.
+
+    Unlike `lru_cache`, the cache lives and dies with the tree it belongs to
+    instead of being shared by every compilation in the process.
+    """
+    @wraps(f)
+    def wrapper(self):
+        key = f.__name__
+        if key not in self._cache:
+            self._cache[key] = f(self)
+        return self._cache[key]
+    return wrapper
 
 
 class ASTNode(ABC):
+    # only kept on the root: loop invariants hoisted so far, see
+    # `StatNode.invariants`, and the zsh modules the output loads
+    hoist_count: int = 0
+    modules: frozenset[str] = frozenset()
+
     def __init__(self) -> None:
         self.name = ""
         self.symbol_table: SymbolTable = SymbolTable()
@@ -15,8 +35,13 @@ class ASTNode(ABC):
         self.i: int
         self.assign = False
         self.capture = False
+        self.minify = False
+        self.pure: frozenset[str] = frozenset()  # commands without effects
+        self.instrument: Optional[str] = None  # see `instrument.MODES`
         self.prev: Optional[Union[ASTNode, Token]] = None
         self.next: Optional[Union[ASTNode, Token]] = None
+        self._cache: dict[str, Any] = {}
+        self.diagnostics: Any = None
 
     def gen(self) -> str:
         """Default gen behavior: print rule name."""
@@ -26,6 +51,18 @@ class ASTNode(ABC):
         """Return all children that are ASTNodes."""
         return [c for c in self.children if isinstance(c, ASTNode)]
 
+    def walk(self) -> Iterator['ASTNode']:
+        """Yield this node and all AST nodes below it, parents first."""
+        yield self
+        for c in self.child_nodes():
+            yield from c.walk()
+
+    def root(self) -> 'ASTNode':
+        node = self
+        while node.parent:
+            node = node.parent
+        return node
+
     def get(self, t: Type) -> List['ASTNode']:
         """Return all children of a specific type."""
         if not self.children:
@@ -51,14 +88,26 @@ class ASTNode(ABC):
             return cnodes[0].get_type()
         return "string"
 
-    def use(self, sym: Symbol) -> None:
-        sym.use(self)
-
     def trace(self) -> str:
         if self.parent:
             return self.parent.trace() + " -> " + self.name
         return self.name
 
+    def position(self) -> Optional[tuple[int, int]]:
+        """Return the (line, column) of the first token under this node."""
+        for c in self.children:
+            if isinstance(c, Token) and c.line is not None:
+                return (c.line, c.column)
+            if isinstance(c, ASTNode) and (pos := c.position()):
+                return pos
+        return None
+
+    def report(self, err: Exception) -> None:
+        """Record an error if diagnostics are being collected, or raise it."""
+        if self.diagnostics is None:
+            raise err
+        self.diagnostics.report(err)
+
     def lookup(self, name: str) -> Optional[Symbol]:
         return self.symbol_table.lookup(name)
 
@@ -73,7 +122,7 @@ class ASTNode(ABC):
         """Return result of calling function on all AST children."""
         return list(map(f, self.child_nodes()))
 
-    @lru_cache
+    @node_cache
     def get_symbols(self) -> List['Symbol']:
         """Return the new symbols generated in this node."""
         return []
@@ -95,17 +144,3 @@ class ASTNode(ABC):
         sym = Symbol(name, type)
         sym.source = self
         return sym
-
-    def get_unused_symbols(self) -> List[Symbol]:
-        unused = []
-        for symbol in self.symbol_table.symbols.values():
-            if not symbol.used:
-                unused += [symbol]
-        # Recursively check child nodes' symbol tables
-        for child in self.child_nodes():
-            unused += child.get_unused_symbols()
-        return unused
-
-    def clean_up(self, unused: List[Symbol]):
-        for c in self.child_nodes():
-            c.clean_up(unused)
@@ -0,0 +1,41 @@
+import os
+import subprocess
+from .compiler import Result
+
+FUNCTIONS_DIR = "functions"
+
+
+def entry_script(result: Result) -> str:
+    """Return the script that makes the functions autoloadable and runs the
+    rest of the program."""
+    if not result.functions:
+        return result.output
+    names = " ".join(sorted(result.functions))
+    return f'fpath=("${{0:A:h}}/{FUNCTIONS_DIR}" $fpath)\n' + \
+        f"autoload -Uz {names}\n" + result.output
+
+
+def write_autoload(result: Result, out_dir: str, script: str = "main.zsh",
+                   zcompile: bool = False) -> str:
+    """Write the program as an entry script plus one autoloadable file per
+    top-level function, and return the path of the entry script.
+
+    zsh then only reads the functions a run actually calls. With
+    `zcompile`, each function file is also compiled to `.zwc` wordcode with
+    the local zsh, which autoload picks over the source when it's newer.
+    """
+    func_dir = os.path.join(out_dir, FUNCTIONS_DIR)
+    os.makedirs(func_dir, exist_ok=True)
+    files = []
+    for name, body in result.functions.items():
+        path = os.path.join(func_dir, name)
+        with open(path, "w") as f:
+            f.write(body + "\n")
+        files.append(path)
+    entry = os.path.join(out_dir, script)
+    with open(entry, "w") as f:
+        f.write(entry_script(result) + "\n")
+    if zcompile and files:
+        subprocess.run(["zsh", "-c", 'for f; do zcompile -Uz "$f"; done',
+                        "zsh", *files], check=True)
+    return entry
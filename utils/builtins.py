@@ -0,0 +1,89 @@
+import re
+from typing import Callable, Dict, List, Optional
+
+# a rendered word that expands a plain variable, see `subject`
+PLAIN_VAR = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+TAB = "$'\\t'"  # Lua's print separates its arguments with tabs
+
+
+class Builtin:
+    """A function of Lua's standard library that has an in-shell
+    translation, so calling it doesn't fork.
+
+    `render` gets the rendered arguments and returns either a word, for
+    `kind` "expansion", or a command for "command"; a command's output is
+    captured when its value is used.
+    """
+
+    def __init__(self, type: str, kind: str,
+                 render: Callable[[List[str]], str],
+                 arity: tuple[int, int] = (1, 1),
+                 module: Optional[str] = None):
+        self.type = type  # of the result, see `ASTNode.get_type`
+        self.kind = kind
+        self.render = render
+        self.arity = arity
+        self.module = module  # to load with zmodload before use
+
+
+def subject(word: str) -> str:
+    """Return what goes inside `${...}` to expand `word` again, so flags
+    and subscripts can be applied to it."""
+    if m := PLAIN_VAR.fullmatch(word):
+        return m.group(1)
+    if is_expansion(word):
+        return word  # zsh expands nested `${...}` in place of a name
+    return "${:-" + word + "}"
+
+
+def is_expansion(word: str) -> bool:
+    """Return whether `word` is exactly one `${...}` expansion."""
+    if not word.startswith("${"):
+        return False
+    depth = 0
+    for i, c in enumerate(word):
+        if c == "{" and word[i - 1] == "$":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if depth == 0:
+                return i == len(word) - 1
+    return False
+
+
+def string_sub(args: List[str]) -> str:
+    # zsh subscripts count from 1 and from the end when negative, like Lua
+    end = args[2] if len(args) > 2 else "-1"
+    return "${" + subject(args[0]) + "[" + args[1] + "," + end + "]}"
+
+
+def lua_print(args: List[str]) -> str:
+    if not args:
+        return "print"
+    return "print -r -- " + TAB.join(args)
+
+
+def math(f: str) -> Callable[[List[str]], str]:
+    return lambda args: f"$(( int({f}({args[0]})) ))"
+
+
+LIBRARY: Dict[str, Builtin] = {
+    "string.sub": Builtin("string", "expansion", string_sub, (2, 3)),
+    "string.len": Builtin("number", "expansion",
+                          lambda args: "${#" + subject(args[0]) + "}"),
+    "string.upper": Builtin("string", "expansion",
+                            lambda args: "${(U)" + subject(args[0]) + "}"),
+    "string.lower": Builtin("string", "expansion",
+                            lambda args: "${(L)" + subject(args[0]) + "}"),
+    # numbers and strings are both words to zsh already
+    "tostring": Builtin("string", "expansion", lambda args: args[0]),
+    "print": Builtin("unknown", "command", lua_print, (0, 255)),
+    "math.floor": Builtin("number", "expansion", math("floor"),
+                          module="zsh/mathfunc"),
+    "math.ceil": Builtin("number", "expansion", math("ceil"),
+                         module="zsh/mathfunc"),
+    "math.abs": Builtin("number", "expansion",
+                        lambda args: f"$(( abs({args[0]}) ))",
+                        module="zsh/mathfunc"),
+}
@@ -1,100 +1,166 @@
-import lark
-from . import ast_base
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+from . import ir
 
 INDENT = "  "
 
+# `${name}` where the braces change nothing: not escaped, and not followed
+# by something that would continue the name, subscript it or modify it
+REDUNDANT_BRACES = re.compile(r"(?<!\\)\$\{([A-Za-z_][A-Za-z0-9_]*)\}"
+                              r"(?![A-Za-z0-9_\[:])")
+# values that need no quoting on the right of an assignment
+SAFE_VALUE = re.compile(r"(?:[A-Za-z0-9_.,/:@%+-]|\$\{?[A-Za-z_]\w*\}?)*")
 
-def gen(n: ast_base.ASTNode) -> str:
-    return n.gen()
 
+class Emitter:
+    """Renders IR as zsh source.
 
-def indent(text: str, level: int) -> str:
-    return INDENT * level + ("\n" + INDENT * level).join(text.split("\n"))
+    Each opcode has an entry in `EMIT` returning the instruction's lines;
+    nested blocks are rendered through `nested`, which indents them unless
+    minifying.
+    """
 
+    def __init__(self, minify: bool = False):
+        self.minify = minify
 
-def gen_chunk(ast: ast_base.ASTNode) -> str:
-    return "\n".join(map(gen, ast.children))
+    def emit(self, block: ir.Block) -> str:
+        text = "\n".join(self.lines(block))
+        if self.minify:
+            text = REDUNDANT_BRACES.sub(r"$\1", text)
+        return text
 
+    def lines(self, block: ir.Block) -> List[str]:
+        res = []
+        for op, args, _ in block:
+            for line in EMIT[op](self, *args):
+                # Lua strings can't span lines, so this only drops the
+                # padding and blank lines from expressions
+                if line.strip():
+                    res.append(line.strip() if self.minify else line)
+        return res
 
-def gen_block(ast: ast_base.ASTNode) -> str:
-    return "\n".join(map(gen, ast.children))
+    def nested(self, block: ir.Block) -> List[str]:
+        if self.minify:
+            return self.lines(block)
+        return [INDENT + line for line in self.lines(block)]
 
+    def quote(self, value: str) -> str:
+        """Quote the value of an assignment, unless minifying and it's
+        safe without."""
+        if self.minify and value and SAFE_VALUE.fullmatch(value):
+            return value
+        return '"' + value + '"'  # safe
 
-def gen_stat(ast: ast_base.ASTNode) -> str:
-    return "\n".join(map(gen, ast.children))
+    def function_body(self, pars: List[str], block: ir.Block) -> List[str]:
+        declaration = [f"{par}=${i + 1}" for i, par in enumerate(pars)]
+        if self.minify and declaration:
+            # one command assigning every parameter
+            declaration = [" ".join(declaration)]
+        if not self.minify:
+            declaration = [INDENT + d for d in declaration]
+        return declaration + self.nested(block)
 
 
-def gen_local_function(ast: ast_base.ASTNode) -> str:
-    assert len(ast.children) == 2
-    name, body = ast.children
-    assert isinstance(name, lark.Token)
-    # the children goes funcbody -> parlist -> namelist
-    pars = body.children[0].children[0].children
-    declaration = ""
-    for i in range(0, len(pars)):
-        par = pars[i]
-        assert isinstance(par, lark.Token)
-        declaration += f"{par.value}=${i}\n"
-    declaration = indent(declaration, 1)
-    body_gen = indent(gen(body), 1)
-    return f"function {name.value}() {{\n{declaration}\n{body_gen}\n}}\n"
+def emit_raw(e: Emitter, text: str) -> List[str]:
+    return text.split("\n")
 
 
-def gen_funcbody(ast: ast_base.ASTNode) -> str:
-    # skip parlist
-    return "\n".join(map(gen, ast.children[1:]))
+def emit_assign(e: Emitter, name: str, value: str,
+                quoted: bool) -> List[str]:
+    return [name + "=" + (e.quote(value) if quoted else value)]
 
 
-def gen_if_stmt(ast: ast_base.ASTNode) -> str:
-    cond = gen(ast.children[0])
-    else_body = ""
-    if_body = indent(gen(ast.children[1]), 1)
-    if len(ast.children) > 2:
-        else_body = "else\n" + indent(gen(ast.children[2]), 1)
-    return f"if [[ {cond} ]]; then\n" + if_body + "\n" + else_body + "\nfi\n"
+def emit_call(e: Emitter, command: str) -> List[str]:
+    return command.split("\n")
 
 
-def gen_else_block(ast: ast_base.ASTNode) -> str:
-    return gen(ast.children[0])
+def emit_return(e: Emitter, value: str = "") -> List[str]:
+    if not value:
+        return ["return"]
+    return ("echo " + value).split("\n")
 
 
-def gen_retstat(ast: ast_base.ASTNode) -> str:
-    return "echo " + gen(ast.children[0])
+def emit_break(e: Emitter) -> List[str]:
+    return ["break"]
 
 
-def gen_explist(ast: ast_base.ASTNode) -> str:
-    return ", ".join([gen(c) for c in ast.children])
+def emit_if(e: Emitter, arms: List[Tuple[str, ir.Block]],
+            orelse: ir.Block) -> List[str]:
+    res = []
+    for i, (cond, block) in enumerate(arms):
+        res.append(("if" if i == 0 else "elif") + f" [[ {cond} ]]; then")
+        res += e.nested(block)
+    if orelse is not None:
+        res.append("else")
+        res += e.nested(orelse)
+    return res + ["fi"]
 
 
-def gen_prefixexp(ast: ast_base.ASTNode) -> str:
-    if len(ast.children) > 1:  # parens
-        return "(" + gen(ast.children[1]) + ")"
-    else:
-        return gen(ast.children[0])
+def emit_while(e: Emitter, cond: str, block: ir.Block) -> List[str]:
+    return [f"while [[ {cond} ]]; do"] + e.nested(block) + ["done"]
 
 
-def gen_functioncall(ast: ast_base.ASTNode) -> str:
-    return gen(ast.children[0]) + f"({gen(ast.children[1])})"
+def emit_repeat(e: Emitter, block: ir.Block, cond: str) -> List[str]:
+    # the body runs at least once, and the condition sees its locals
+    return ["while true; do"] + e.nested(block) + \
+        [("" if e.minify else INDENT) + f"[[ {cond} ]] && break", "done"]
+
 
+def emit_do(e: Emitter, block: ir.Block) -> List[str]:
+    return ["{"] + e.nested(block) + ["}"]
 
-def gen_args(ast: ast_base.ASTNode) -> str:
-    return gen(ast.children[0])
 
+def emit_function(e: Emitter, name: str, pars: List[str],
+                  block: ir.Block) -> List[str]:
+    return [f"function {name}() {{"] + e.function_body(pars, block) + ["}"]
 
-def gen_var(ast: ast_base.ASTNode) -> str:
-    assert isinstance(ast.children[0], lark.Token)
-    return ast.children[0].value
 
+def emit_always(e: Emitter, block: ir.Block,
+                cleanup: ir.Block) -> List[str]:
+    return ["{"] + e.nested(block) + ["} always {"] + e.nested(cleanup) + \
+        ["}"]
 
-def gen_exp(ast: ast_base.ASTNode) -> str:
-    if len(ast.children) > 1:
-        return " ".join([gen(c) for c in ast.children])
-    c = ast.children[0]
-    if isinstance(c, lark.Token):
-        return c.value
-    return gen(c)
+
+def emit_loop(e: Emitter, block: ir.Block) -> List[str]:
+    return ["while true; do"] + e.nested(block) + ["done"]
+
+
+def emit_continue(e: Emitter, levels: int) -> List[str]:
+    return ["continue" if levels == 1 else f"continue {levels}"]
 
 
-def gen_binop(ast: ast_base.ASTNode) -> str:
-    assert isinstance(ast.children[0], lark.Token)
-    return ast.children[0].value
+def emit_parallel(e: Emitter,
+                  jobs: List[Tuple[str, Optional[str]]]) -> List[str]:
+    # each job writes to its own file; outputs are shown and assigned in
+    # order once it's done, and the status of the last one is kept
+    res = ["__lua_par_pids=()"]
+    for i, (command, _) in enumerate(jobs, 1):
+        res += [f"{command} > $__lua_par_dir/{i} &", "__lua_par_pids+=($!)"]
+    for i, (_, target) in enumerate(jobs, 1):
+        res.append(f"wait $__lua_par_pids[{i}]")
+        last = i == len(jobs)
+        if last:
+            res.append("__lua_par_s=$?")
+        if target is None:
+            res.append(f'print -rn -- "$mapfile[$__lua_par_dir/{i}]"')
+        else:
+            res.append(f"{target}=$(<$__lua_par_dir/{i})")
+    return res + ["__lua_par_status $__lua_par_s"]
+
+
+EMIT: Dict[int, Callable[..., List[str]]] = {
+    ir.RAW: emit_raw,
+    ir.ASSIGN: emit_assign,
+    ir.CALL: emit_call,
+    ir.RETURN: emit_return,
+    ir.BREAK: emit_break,
+    ir.IF: emit_if,
+    ir.WHILE: emit_while,
+    ir.REPEAT: emit_repeat,
+    ir.DO: emit_do,
+    ir.FUNCTION: emit_function,
+    ir.ALWAYS: emit_always,
+    ir.LOOP: emit_loop,
+    ir.CONTINUE: emit_continue,
+    ir.PARALLEL: emit_parallel,
+}
@@ -0,0 +1,211 @@
+import asyncio
+import logging
+from typing import Iterable, List, Optional
+from . import ast, instrument, ir, parser, passes, preprocess
+from .ast_base import ASTNode
+from .code_gen import Emitter
+from .errors import Diagnostic, Diagnostics
+from .lib import PathResolver
+from .parser import LarkError, Tree, UnexpectedCharacters, UnexpectedToken
+from .symbols import ExternalSymbols, Symbol
+
+logger = logging.getLogger()
+
+
+class Options:
+    def __init__(self, bins: Optional[Iterable[str]] = None,
+                 eager_path: bool = False, autoload: bool = False,
+                 minify: bool = False, pure: Iterable[str] = (),
+                 opt_level: int = 1, instrument: Optional[str] = None,
+                 parallelize: bool = False):
+        # binaries treated as known commands; defaults to the ones on PATH,
+        # looked up lazily unless `eager_path` asks for a full scan
+        if bins is None:
+            bins = PathResolver(eager=eager_path)
+        self.bins: Iterable[str] = bins
+        # split top-level functions out of the output, see `Result.functions`
+        self.autoload = autoload
+        # emit compact code instead of readable code
+        self.minify = minify
+        # commands whose output only depends on their arguments, so calls
+        # to them can be hoisted out of loops
+        self.pure = frozenset(pure)
+        # which passes run, see `passes.PassManager`
+        self.opt_level = opt_level
+        # profile every function ("functions") or every function and loop
+        # ("loops") of the output, see `instrument`
+        self.instrument = instrument
+        # run consecutive independent commands as background jobs
+        self.parallelize = parallelize
+
+
+class Result:
+    def __init__(self, output: str = "",
+                 errors: Optional[List[Diagnostic]] = None,
+                 tree: Optional[Tree] = None,
+                 exports: Optional[dict[str, str]] = None):
+        self.output = output
+        self.errors: List[Diagnostic] = errors or []
+        self.tree = tree
+        # name -> type of every symbol defined at the top level
+        self.exports: dict[str, str] = exports or {}
+        # name -> body of top-level functions left out of `output`, when
+        # compiling with `Options.autoload`
+        self.functions: dict[str, str] = {}
+        # (pass, seconds) for every pass run, lowering and emission included
+        self.timings: List[tuple[str, float]] = []
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    @property
+    def error(self) -> Optional[str]:
+        if not self.errors:
+            return None
+        return "\n".join(map(str, self.errors))
+
+    def to_dict(self) -> dict:
+        return {"ok": self.ok, "output": self.output,
+                "errors": [e.to_dict() for e in self.errors]}
+
+
+def parse_diagnostic(e: LarkError, source: str,
+                     start: int = 0, end: Optional[int] = None) -> Diagnostic:
+    """Describe a parse error raised for `source[start:end]`."""
+    if end is None:
+        end = len(source)
+    if isinstance(e, UnexpectedCharacters):
+        msg = f"No terminal matches {e.char!r}"
+        pos = start + e.pos_in_stream
+    elif isinstance(e, UnexpectedToken) and e.token.type != "$END":
+        msg = f"Unexpected token {e.token!r}"
+        pos = start + e.token.start_pos
+    else:
+        msg = "Unexpected end of input"
+        pos = start + len(source[start:end].rstrip())
+    line = source.count("\n", 0, pos) + 1
+    column = pos - (source.rfind("\n", 0, pos) + 1) + 1
+    return Diagnostic("parse", f"Lexing/Parsing error: {msg}", line, column)
+
+
+class Compiler:
+    """Compiles source text to zsh.
+
+    All state touched while compiling -- the AST, its symbol tables and
+    cached symbols, and the symbols for binaries on PATH -- is created per
+    call to `compile`, so one instance can be shared between threads or
+    used from an asyncio event loop.
+    """
+
+    def __init__(self, options: Optional[Options] = None):
+        self.options = options or Options()
+
+    def parse(self, source: str) -> Tree:
+        return parser.get_parser().parse(source)
+
+    def build(self, tree: Tree,
+              externs: Optional[dict[str, str]] = None) -> ASTNode:
+        """Convert a parse tree into an AST with its symbols resolved.
+
+        `externs` maps names defined outside the source, e.g. by other
+        modules, to their types.
+        """
+        root = ast.ast_from_lark(tree)
+        root.symbol_table.externals = ExternalSymbols(self.options.bins)
+        for name, type in (externs or {}).items():
+            sym = Symbol(name, type)
+            sym.is_initialized = True
+            root.symbol_table.insert([sym])
+        root.update_symbols()
+        return root
+
+    def exports(self, root: ASTNode) -> List[Symbol]:
+        """Return the symbols defined by the top-level statements."""
+        block = root.get_only(ast.BlockNode)
+        return [sym for stat in block.get(ast.StatNode)
+                for sym in stat.get_symbols()]
+
+    def recover(self, source: str, diags: Diagnostics) -> Optional[Tree]:
+        """Parse what can be parsed after the whole source failed to.
+
+        The source is split at top-level statements; every statement that
+        doesn't parse on its own is reported and blanked out, and the rest
+        is parsed again so later passes can report their errors too.
+        """
+        recovered = source
+        for piece in preprocess.split_statements(source):
+            end = piece.start + len(piece.text)
+            try:
+                self.parse(piece.text)
+            except LarkError as e:
+                diags.add(parse_diagnostic(e, source, piece.start, end))
+                recovered = recovered[:piece.start] + \
+                    preprocess.blank(piece.text) + recovered[end:]
+        try:
+            return self.parse(recovered)
+        except LarkError:
+            return None
+
+    def compile(self, source: str, externs: Optional[dict[str, str]] = None,
+                keep_exports: bool = False) -> Result:
+        """Compile `source`, resolving `externs` as predefined symbols.
+
+        With `keep_exports`, top-level definitions are kept even if the
+        source never uses them, as when compiling a module for others.
+        """
+        diags = Diagnostics()
+        try:
+            tree = self.parse(source)
+        except LarkError as e:
+            tree = self.recover(source, diags)
+            if not diags:
+                diags.add(parse_diagnostic(e, source))
+            if tree is None:
+                return Result(errors=diags.sorted())
+        root = self.build(tree, externs)
+        root.set_recursive("diagnostics", diags)
+        root.set_recursive("minify", self.options.minify)
+        root.set_recursive("pure", self.options.pure)
+        root.set_recursive("instrument", self.options.instrument)
+        unit = passes.Unit(root, self.exports(root), keep_exports)
+        manager = passes.PassManager(
+            self.options.opt_level,
+            enable=["parallelize"] if self.options.parallelize else [])
+        manager.run(unit, "ast")
+        unit.timed("lower", lambda: setattr(unit, "ir", ir.lower(root)))
+        if diags:
+            return Result(errors=diags.sorted(), tree=tree)
+        manager.run(unit, "ir")
+        assert unit.ir is not None
+        if self.options.instrument:
+            loops = self.options.instrument == "loops"
+            unit.timed("instrument",
+                       lambda: instrument.instrument(unit.ir, loops))
+        emitter = Emitter(self.options.minify)
+        functions = self.split_functions(unit.ir, emitter) \
+            if self.options.autoload else {}
+        output: List[str] = []
+        unit.timed("emit", lambda: output.append(emitter.emit(unit.ir)))
+        result = Result(output[0], tree=tree,
+                        exports={sym.name: sym.type for sym in unit.exports})
+        result.functions = functions
+        result.timings = unit.timings
+        return result
+
+    def split_functions(self, block: ir.Block,
+                        emitter: Emitter) -> dict[str, str]:
+        """Remove top-level function definitions from the IR and return
+        their bodies by name."""
+        functions = {}
+        for op, args, _ in block:
+            if op == ir.FUNCTION:
+                name, pars, body = args
+                functions[name] = "\n".join(emitter.function_body(pars,
+                                                                   body))
+        block.keep(lambda op, args, node: op != ir.FUNCTION)
+        return functions
+
+    async def compile_async(self, source: str) -> Result:
+        """Compile in a worker thread without blocking the event loop."""
+        return await asyncio.to_thread(self.compile, source)
@@ -0,0 +1,380 @@
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from . import ast
+from .ast_base import ASTNode
+from .parser import Token
+
+
+class Def:
+    """One assignment of a name, by a statement or as a parameter."""
+
+    def __init__(self, name: str, stat: Optional[ASTNode] = None):
+        self.name = name
+        self.stat = stat  # the function's block for parameters
+        self.uses: List['Use'] = []
+        # assigned in a function without being local to it, so it's still
+        # visible once the function returns
+        self.escapes = False
+        # the value a global is left with when the program ends
+        self.final = False
+
+    def __repr__(self) -> str:
+        return f"Def({self.name})"
+
+
+class Use:
+    """One read of a name, with every definition that may reach it."""
+
+    def __init__(self, name: str, node: ASTNode):
+        self.name = name
+        self.node = node
+        self.defs: Set[Def] = set()
+
+
+# stands for "assigned before the function being analyzed was entered"
+OUTSIDE = Def("<outside>")
+
+State = Dict[str, Set[Def]]
+Live = Dict[ASTNode, Set[str]]  # names live before or after, by statement
+
+
+def merge(*states: State) -> State:
+    res: State = {}
+    for name in set().union(*states):
+        res[name] = set().union(*(s.get(name, {OUTSIDE}) for s in states))
+    return res
+
+
+def is_function(node: ASTNode) -> bool:
+    return node.is_a(ast.FunctiondefNode) or node.is_a(ast.LocalFunctionNode)
+
+
+def reads(node: ASTNode) -> Iterator[ASTNode]:
+    """Yield the VarNodes under `node` that read a plain name, without
+    entering nested functions."""
+    if is_function(node):
+        return
+    if node.is_a(ast.VarNode) and isinstance(node.children[0], Token):
+        yield node
+        return
+    for c in node.child_nodes():
+        yield from reads(c)
+
+
+def functions(node: ASTNode) -> Iterator[ASTNode]:
+    """Yield the bodies of the outermost functions defined under `node`."""
+    if is_function(node):
+        yield node.children[-1]
+        return
+    for c in node.child_nodes():
+        yield from functions(c)
+
+
+def targets(varlist: ASTNode) -> List[str]:
+    """Return the plain names assigned by a varlist."""
+    return [v.children[0].value for v in varlist.child_nodes()
+            if isinstance(v.children[0], Token)]
+
+
+def params(body: ASTNode) -> List[str]:
+    return [p.value for p in ast.params(body)]
+
+
+class Function:
+    """Per-function analysis state."""
+
+    def __init__(self, locals: Set[str]):
+        self.locals = locals
+        self.free: Set[str] = set()  # read before being assigned
+        self.returns: List[State] = []
+        self.breaks: List[List[State]] = []  # one list per enclosing loop
+
+
+class DataFlow:
+    """Reaching definitions, def-use chains and liveness for a program.
+
+    Analysis follows the structured control flow of the AST: statements in
+    order, both arms of an `if`, and loops until their entry state stops
+    changing. Every function is analyzed once, where it's defined. A read
+    in a function of a name it didn't assign counts as a use of every
+    assignment of that name, since the function may be called anywhere.
+    The state is updated in place along a block and only copied where
+    control flow splits, so a block is analyzed in time linear in its
+    length. Liveness is computed the first time it's asked for.
+    """
+
+    def __init__(self, root: ASTNode):
+        self.defs: List[Def] = []
+        self.uses: Dict[ASTNode, Use] = {}
+        self.stat_defs: Dict[ASTNode, List[Def]] = {}
+        self.def_at: Dict[tuple, Def] = {}
+        # names read by some function before it assigns them
+        self.free_names: Set[str] = set()
+        self.free: Dict[ASTNode, Set[str]] = {}  # by function body
+        self.current: Optional[Function] = None
+        self.root = root.get_only(ast.BlockNode)
+        self._live: Optional[Tuple[Live, Live]] = None
+        self.function(self.root, [], top=True)
+
+    # reaching definitions
+
+    def function(self, block: ASTNode, pars: List[str], top=False) -> None:
+        outer = self.current
+        func = self.current = Function(set(pars))
+        state: State = {p: {self.define(p, block)} for p in pars}
+        state = self.block(block, state, func)
+        self.current = outer
+        self.free[block] = func.free
+        if not top:
+            self.free_names |= func.free
+        # assignments to names that aren't local to the function are seen
+        # by whoever reads them after it returns, or by the shell once the
+        # program is done (e.g. when sourced)
+        for s in func.returns + [state]:
+            for name, defs in s.items():
+                if name not in func.locals:
+                    for d in defs:
+                        if top:
+                            d.final = True
+                        else:
+                            d.escapes = True
+
+    def define(self, name: str, stat: ASTNode) -> Def:
+        """Return the definition of `name` by `stat`, which is the same
+        object each time a loop is analyzed again."""
+        key = (stat, name)
+        if key not in self.def_at:
+            d = self.def_at[key] = Def(name, stat)
+            self.defs.append(d)
+            if stat.is_a(ast.StatNode):
+                self.stat_defs.setdefault(stat, []).append(d)
+        return self.def_at[key]
+
+    def read(self, node: ASTNode, state: State) -> None:
+        for var in reads(node):
+            name = var.children[0].value
+            use = self.uses.setdefault(var, Use(name, var))
+            for d in state.get(name, {OUTSIDE}):
+                if d is OUTSIDE:
+                    if self.current:
+                        self.current.free.add(name)
+                elif d not in use.defs:
+                    d.uses.append(use)
+                    use.defs.add(d)
+        for body in functions(node):
+            self.function_body(body)
+
+    def function_body(self, body: ASTNode) -> None:
+        block = body.get_only(ast.BlockNode)
+        if block not in self.free:  # analyzed once, even inside loops
+            self.function(block, params(body))
+
+    def block(self, block: ASTNode, state: State, func: Function) -> State:
+        for c in block.child_nodes():
+            if c.is_a(ast.RetstatNode):
+                self.read(c, state)
+                func.returns.append(dict(state))
+            else:
+                state = self.stat(c, state, func)
+        return state
+
+    def assign(self, stat: ASTNode, names: List[str], state: State,
+               func: Function, local=False) -> State:
+        for name in names:
+            state[name] = {self.define(name, stat)}
+            if local:
+                func.locals.add(name)
+        return state
+
+    def loop(self, stat: ASTNode, cond: ASTNode, body: ASTNode,
+             state: State, func: Function, cond_first: bool) -> State:
+        entry = state
+        while True:
+            func.breaks.append([])
+            s = dict(entry)
+            if cond_first:
+                self.read(cond, s)
+            s = self.block(body, s, func)
+            if not cond_first:
+                self.read(cond, s)
+            breaks = func.breaks.pop()
+            new_entry = merge(entry, s)
+            if new_entry == entry:
+                break
+            entry = new_entry
+        return merge(entry if cond_first else s, *breaks)
+
+    def stat(self, stat: ASTNode, state: State, func: Function) -> State:
+        first = stat.children[0]
+        if not isinstance(first, ASTNode):
+            return state
+        if first.is_a(ast.VarlistNode):
+            self.read(stat.get_only(ast.ExplistNode), state)
+            for v in first.child_nodes():  # a[i] = ... reads a and i
+                if not isinstance(v.children[0], Token):
+                    self.read(v, state)
+            return self.assign(stat, targets(first), state, func)
+        elif first.is_a(ast.LocalAssignNode):
+            for c in first.get(ast.ExplistNode):
+                self.read(c, state)
+            names = [t.value for t in first.get_only(ast.AttnamelistNode)
+                     .children if isinstance(t, Token)]
+            return self.assign(stat, names, state, func, local=True)
+        elif first.is_a(ast.LocalFunctionNode):
+            name, body = first.children
+            state = self.assign(stat, [name.value], state, func, local=True)
+            self.function_body(body)
+            return state
+        elif first.is_a(ast.IfStmtNode):
+            self.read(first.children[0], state)
+            arms = [self.block(first.get_only(ast.BlockNode), dict(state),
+                               func)]
+            for el_if in first.get(ast.ElseifBlockNode):
+                self.read(el_if.get_only(ast.ExpNode), state)
+                arms.append(self.block(el_if.get_only(ast.BlockNode),
+                                       dict(state), func))
+            if first.has(ast.ElseBlockNode):
+                arms.append(self.block(first.get_only(ast.ElseBlockNode)
+                                       .children[0], dict(state), func))
+            else:
+                arms.append(state)
+            return merge(*arms)
+        elif first.is_a(ast.WhileNode):
+            return self.loop(stat, stat.children[1], stat.children[2],
+                             state, func, cond_first=True)
+        elif first.is_a(ast.RepeatNode):
+            return self.loop(stat, stat.children[2], stat.children[1],
+                             state, func, cond_first=False)
+        elif first.is_a(ast.DoNode):
+            return self.block(stat.children[1], state, func)
+        elif first.is_a(ast.BreakNode):
+            if func.breaks:
+                func.breaks[-1].append(dict(state))
+            return state
+        # calls, and constructs the compiler doesn't otherwise support:
+        # everything read counts, and anything they assign is kept
+        self.read(stat, state)
+        for node in stat.walk():
+            if node is not stat and node.is_a(ast.StatNode):
+                for sym in node.get_symbols():
+                    self.define(sym.name, node).escapes = True
+        return state
+
+    # liveness
+
+    @property
+    def live_in(self) -> Live:
+        """The names live before each statement, by statement."""
+        return self.live()[0]
+
+    @property
+    def live_out(self) -> Live:
+        """The names live after each statement, by statement."""
+        return self.live()[1]
+
+    def live(self) -> Tuple[Live, Live]:
+        if self._live is None:
+            self._live = ({}, {})
+            self.liveness(self.root, set())
+        return self._live
+
+    def liveness(self, block: ASTNode, live: Set[str],
+                 loop_exit: Optional[Set[str]] = None) -> Set[str]:
+        """Compute the names live before and after every statement of
+        `block`, given those live after it; return those live before."""
+        for c in reversed(block.child_nodes()):
+            self.live_out[c] = set(live)
+            if c.is_a(ast.RetstatNode):
+                live = self.names(c)
+            else:
+                live = self.live_stat(c, live, loop_exit)
+            self.live_in[c] = set(live)
+        return live
+
+    def names(self, node: ASTNode) -> Set[str]:
+        """Return the names read by `node`, including by functions it
+        defines."""
+        res = {v.children[0].value for v in reads(node)}
+        for body in functions(node):
+            res |= self.free.get(body.get_only(ast.BlockNode), set())
+        return res
+
+    def live_stat(self, stat: ASTNode, live: Set[str],
+                  loop_exit: Optional[Set[str]]) -> Set[str]:
+        first = stat.children[0]
+        if not isinstance(first, ASTNode):
+            return live
+        killed = {d.name for d in self.stat_defs.get(stat, [])}
+        if first.is_a(ast.VarlistNode):
+            res = self.names(stat.get_only(ast.ExplistNode))
+            for v in first.child_nodes():  # a[i] = ... reads a and i
+                if not isinstance(v.children[0], Token):
+                    res |= self.names(v)
+            return (live - killed) | res
+        elif first.is_a(ast.LocalAssignNode):
+            res: Set[str] = set()
+            for c in first.get(ast.ExplistNode):
+                res |= self.names(c)
+            return (live - killed) | res
+        elif first.is_a(ast.LocalFunctionNode):
+            return (live - killed) | self.names(first)
+        elif first.is_a(ast.IfStmtNode):
+            res = self.names(first.children[0])
+            res |= self.liveness(first.get_only(ast.BlockNode), live,
+                                 loop_exit)
+            for el_if in first.get(ast.ElseifBlockNode):
+                res |= self.names(el_if.get_only(ast.ExpNode))
+                res |= self.liveness(el_if.get_only(ast.BlockNode), live,
+                                     loop_exit)
+            if first.has(ast.ElseBlockNode):
+                res |= self.liveness(first.get_only(ast.ElseBlockNode)
+                                     .children[0], live, loop_exit)
+            else:
+                res |= live
+            return res
+        elif first.is_a(ast.WhileNode) or first.is_a(ast.RepeatNode):
+            cond, body = stat.children[1], stat.children[2]
+            if first.is_a(ast.RepeatNode):
+                cond, body = body, cond
+            head = live | self.names(cond)
+            while True:
+                new_head = live | self.names(cond) | \
+                    self.liveness(body, head, live)
+                if new_head == head:
+                    return head
+                head = new_head
+        elif first.is_a(ast.DoNode):
+            return self.liveness(stat.children[1], live, loop_exit)
+        elif first.is_a(ast.BreakNode):
+            return set(loop_exit) if loop_exit is not None else live
+        return live | self.names(stat)
+
+    # results
+
+    def def_use(self) -> Dict[Def, List[Use]]:
+        return {d: d.uses for d in self.defs}
+
+    def use_def(self) -> Dict[ASTNode, Set[Def]]:
+        """Return the definitions that may reach each read, by VarNode."""
+        return {node: use.defs for node, use in self.uses.items()}
+
+    def is_dead(self, d: Def) -> bool:
+        if d.uses or d.final or d.name in self.free_names:
+            return False
+        return not d.escapes or not any(u.name == d.name
+                                        for u in self.uses.values())
+
+    def dead_statements(self) -> List[ASTNode]:
+        """Return the assignments none of whose values are ever read.
+
+        Assignments whose value comes from a call are kept for the call's
+        side effects.
+        """
+        res = []
+        for stat, defs in self.stat_defs.items():
+            if not all(self.is_dead(d) for d in defs):
+                continue
+            if any(n.is_a(ast.FunctioncallNode) for n in stat.walk()) and \
+                    not stat.has(ast.LocalFunctionNode):
+                continue
+            res.append(stat)
+        return res
@@ -1,11 +1,14 @@
+from typing import Any, List, Optional
 from utils.ast_base import ASTNode
 
 
 class GenerationError(Exception):
-    pass
+    kind = "error"
+    source: Optional[ASTNode] = None
 
 
 class UnknownVariableError(GenerationError):
+    kind = "unknown-variable"
     name: str
     source: ASTNode
 
@@ -17,3 +20,65 @@ class UnknownVariableError(GenerationError):
 
     def __str__(self):
         return self.msg
+
+
+class UnsupportedError(GenerationError):
+    kind = "unsupported"
+    what: str
+    source: ASTNode
+
+    def __init__(self, what, source) -> None:
+        self.what = what
+        self.source = source
+        self.msg = f"Unsupported {self.what}: {self.source.trace()}"
+        super().__init__(self.msg)
+
+    def __str__(self):
+        return self.msg
+
+
+class Diagnostic:
+    def __init__(self, kind: str, message: str, line: Optional[int] = None,
+                 column: Optional[int] = None, file: Optional[str] = None):
+        self.kind = kind
+        self.message = message
+        self.line = line
+        self.column = column
+        self.file = file
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"kind": self.kind, "message": self.message,
+                "line": self.line, "column": self.column, "file": self.file}
+
+    def __str__(self):
+        prefix = f"{self.file}:" if self.file else ""
+        if self.line is not None:
+            prefix += f"{self.line}:{self.column}:"
+        return f"{prefix} {self.message}" if prefix else self.message
+
+
+class Diagnostics:
+    """Collects errors across a whole compilation instead of stopping at the
+    first one."""
+
+    def __init__(self) -> None:
+        self.items: List[Diagnostic] = []
+        self.seen: set[tuple] = set()
+
+    def add(self, diag: Diagnostic) -> None:
+        key = (diag.kind, diag.message, diag.line, diag.column)
+        if key not in self.seen:
+            self.seen.add(key)
+            self.items.append(diag)
+
+    def report(self, err: GenerationError) -> None:
+        line = column = None
+        if err.source and (pos := err.source.position()):
+            line, column = pos
+        self.add(Diagnostic(err.kind, str(err), line, column))
+
+    def sorted(self) -> List[Diagnostic]:
+        return sorted(self.items, key=lambda d: (d.line or 0, d.column or 0))
+
+    def __bool__(self) -> bool:
+        return bool(self.items)
@@ -1,3 +1,6 @@
+# The grammar is LALR(1), so `gen_parser.py` can turn it into the standalone
+# parser in `lua_parser.py`; regenerate that after editing it. Where Lua's
+# own grammar is ambiguous, `f() (g)()` continues the call, as in Lua.
 LARK_GRAMMAR = """
     // Basic structure
     chunk: block
@@ -65,16 +68,39 @@ LARK_GRAMMAR = """
     var: NAME | prefixexp "[" exp "]" | prefixexp "." NAME
 
     // Done
-    namelist: NAME ("," NAME)*
+    namelist: _names
+    _names: NAME | _names "," NAME
     // Done
     explist: exp ("," exp)*
 
-    // Done
-    exp: "nil" | "false" | "true" | NUMBER | STRING | "..." | functiondef
-       | prefixexp | tableconstructor | exp binop exp | unop exp
-
-    // Done
-    prefixexp: var | functioncall | "(" exp ")"
+    // Done. Binary operators by increasing precedence, each level building
+    // an `exp` of its operands and a `binop`; `..` and `^` associate to the
+    // right.
+    ?exp: or_exp
+    ?or_exp: and_exp | or_exp or_op and_exp -> exp
+    ?and_exp: cmp_exp | and_exp and_op cmp_exp -> exp
+    ?cmp_exp: bor_exp | cmp_exp cmp_op bor_exp -> exp
+    ?bor_exp: bxor_exp | bor_exp bor_op bxor_exp -> exp
+    ?bxor_exp: band_exp | bxor_exp bxor_op band_exp -> exp
+    ?band_exp: shift_exp | band_exp band_op shift_exp -> exp
+    ?shift_exp: concat_exp | shift_exp shift_op concat_exp -> exp
+    ?concat_exp: add_exp | add_exp concat_op concat_exp -> exp
+    ?add_exp: mul_exp | add_exp add_op mul_exp -> exp
+    ?mul_exp: unary_exp | mul_exp mul_op unary_exp -> exp
+    ?unary_exp: pow_exp | unop unary_exp -> exp
+    ?pow_exp: simple_exp | simple_exp pow_op unary_exp -> exp
+    simple_exp: "nil" -> exp
+              | "false" -> exp
+              | "true" -> exp
+              | NUMBER -> exp
+              | STRING -> exp
+              | "..." -> exp
+              | functiondef -> exp
+              | prefixexp -> exp
+              | tableconstructor -> exp
+
+    // Done
+    prefixexp.2: var | functioncall | "(" exp ")"
     // Done
     functioncall: prefixexp args | prefixexp ":" NAME args
     // Done
@@ -85,7 +111,9 @@ LARK_GRAMMAR = """
     // Done
     funcbody: "(" parlist? ")" block "end"
     // Done
-    parlist: namelist ("," "...")? | "..."
+    parlist: namelist | vararg_namelist | "..."
+    // the `...` is dropped, as it's unsupported
+    vararg_namelist: _names "," "..." -> namelist
 
     // Unsupported
     tableconstructor: "{" fieldlist? "}"
@@ -95,10 +123,17 @@ LARK_GRAMMAR = """
     fieldsep: "," | ";"
 
     // Done
-    !binop: "+" | "-" | "*" | "/" | "//" | "^" | "%"
-         | "&" | "~" | "|" | ">>" | "<<" | ".."
-         | "<" | "<=" | ">" | ">=" | "==" | "~="
-         | "and" | "or"
+    !or_op: "or" -> binop
+    !and_op: "and" -> binop
+    !cmp_op: ("<" | "<=" | ">" | ">=" | "==" | "~=") -> binop
+    !bor_op: "|" -> binop
+    !bxor_op: "~" -> binop
+    !band_op: "&" -> binop
+    !shift_op: (">>" | "<<") -> binop
+    !concat_op: ".." -> binop
+    !add_op: ("+" | "-") -> binop
+    !mul_op: ("*" | "/" | "//" | "%") -> binop
+    !pow_op: "^" -> binop
 
     // Done
     !unop: "-" | "not" | "#" | "~"
@@ -0,0 +1,131 @@
+import itertools
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from . import ir
+from .ast_base import ASTNode
+
+# Defines the profiler of instrumented scripts. Counts and times are kept
+# per "name:line" key and appended to $LUA_PROFILE.<pid> when the script
+# exits. Function calls made in a subshell, e.g. to capture their output,
+# append their record right away instead, since the subshell's counts would
+# be lost with it. Guarded so modules sourced by an instrumented program
+# don't set it up twice.
+PRELUDE = """if (( ! ${+__lua_prof_file} )); then
+  zmodload zsh/datetime
+  typeset -gA __lua_prof_calls __lua_prof_time
+  __lua_prof_file=${LUA_PROFILE:-${TMPDIR:-/tmp}/lua-profile}.$$
+  function __lua_prof_record() {
+    local t=$(( EPOCHREALTIME - $2 ))
+    if (( ZSH_SUBSHELL )); then
+      print -r -- "$1"$'\\t'1$'\\t'$t >> $__lua_prof_file
+    else
+      (( __lua_prof_calls[$1]++, __lua_prof_time[$1] += t ))
+    fi
+  }
+  function __lua_prof_dump() {
+    local k
+    for k in ${(k)__lua_prof_calls}; do
+      print -r -- "$k"$'\\t'$__lua_prof_calls[$k]$'\\t'$__lua_prof_time[$k]
+    done >> $__lua_prof_file
+  }
+  trap __lua_prof_dump EXIT
+fi"""
+
+MODES = ("functions", "loops")
+
+
+def key(name: str, node: Optional[ASTNode]) -> str:
+    """Return the key a function or loop is profiled under: its Lua name
+    and the line it starts on."""
+    pos = node.position() if node else None
+    return f"{name}:{pos[0] if pos else '?'}"
+
+
+def timed(block: ir.Block, key: str, counter: Iterator[int]) -> ir.Block:
+    """Return `block` wrapped to record its run time under `key`."""
+    var = f"__lua_prof_t{next(counter)}"
+    res = ir.Block()
+    # typeset, so the start time is local to the function it's taken in
+    res.append(ir.RAW, (f"typeset {var}=$EPOCHREALTIME",))
+    cleanup = ir.Block()
+    cleanup.append(ir.RAW, (f"__lua_prof_record {key} ${var}",))
+    res.append(ir.ALWAYS, (block, cleanup))
+    return res
+
+
+def instrument(block: ir.Block, loops: bool = False) -> None:
+    """Make every function in a program's IR count its calls and time
+    them, and with `loops`, every loop too."""
+    wrap(block, loops, itertools.count(1))
+    block.insert(0, ir.RAW, (PRELUDE,))
+
+
+def anonymous(block: ir.Block, node: ASTNode, loops: bool = False
+              ) -> ir.Block:
+    """Return the body of an anonymous function, instrumented."""
+    counter = itertools.count(1)
+    wrap(block, loops, counter)
+    return timed(block, key("function", node), counter)
+
+
+def wrap(block: ir.Block, loops: bool, counter: Iterator[int]) -> None:
+    res = ir.Block()
+    for op, args, node in block:
+        for arg in args:
+            if isinstance(arg, ir.Block):
+                wrap(arg, loops, counter)
+            elif op == ir.IF and isinstance(arg, list):
+                for _, arm in arg:
+                    wrap(arm, loops, counter)
+        if op == ir.FUNCTION:
+            name, pars, body = args
+            res.append(op, (name, pars, timed(body, key(name, node),
+                                               counter)), node)
+        elif loops and op in (ir.WHILE, ir.REPEAT):
+            loop = ir.Block()
+            loop.append(op, args, node)
+            for ins in timed(loop, key(ir.OP_NAMES[op], node), counter):
+                res.append(*ins)
+        else:
+            res.append(op, args, node)
+    block.ops, block.args, block.nodes = res.ops, res.args, res.nodes
+
+
+# reporting
+
+Stats = Dict[str, List[float]]  # key -> [calls, seconds, runs]
+
+
+def aggregate(dumps: Iterable[Iterable[str]]) -> Stats:
+    """Sum the records of several profile dumps, one per run."""
+    stats: Stats = {}
+    for dump in dumps:
+        seen = set()
+        for line in dump:
+            fields = line.rstrip("\n").split("\t")
+            if len(fields) != 3:
+                continue
+            name, calls, seconds = fields
+            entry = stats.setdefault(name, [0, 0.0, 0])
+            entry[0] += int(calls)
+            entry[1] += float(seconds)
+            if name not in seen:
+                entry[2] += 1
+                seen.add(name)
+    return stats
+
+
+def table(stats: Stats, limit: Optional[int] = None) -> str:
+    """Format aggregated stats as a table, the most time first."""
+    rows: List[Tuple[str, ...]] = [("name", "line", "runs", "calls",
+                                    "total ms", "ms/call")]
+    ranked = sorted(stats.items(), key=lambda kv: kv[1][1], reverse=True)
+    for name, (calls, seconds, runs) in ranked[:limit]:
+        func, _, line = name.rpartition(":")
+        rows.append((func, line, str(int(runs)), str(int(calls)),
+                     f"{seconds * 1000:.3f}",
+                     f"{seconds * 1000 / calls:.3f}" if calls else "-"))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join(c.ljust(w) if i < 2 else c.rjust(w)
+                  for i, (c, w) in enumerate(zip(row, widths))).rstrip()
+        for row in rows)
@@ -0,0 +1,223 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Type
+from . import ast
+from .ast_base import ASTNode
+from .errors import UnsupportedError
+
+# Opcodes. Expressions are rendered to zsh words while lowering, so an
+# instruction's arguments are strings and, for control flow, nested blocks.
+RAW = 0       # (text,) emitted as is
+ASSIGN = 1    # (name, value, quoted)
+CALL = 2      # (command,)
+RETURN = 3    # (value,) or () for a bare return
+BREAK = 4     # ()
+IF = 5        # ([(condition, block), ...], else block or None)
+WHILE = 6     # (condition, block)
+REPEAT = 7    # (block, condition)
+DO = 8        # (block,)
+FUNCTION = 9  # (name, [parameter, ...], block)
+ALWAYS = 10   # (block, cleanup block), the cleanup runs even on return
+LOOP = 11     # (block,) repeated until left by return or break
+CONTINUE = 12  # (levels,) the number of enclosing loops to continue
+PARALLEL = 13  # ([(command, variable or None), ...],) run as background jobs
+
+OP_NAMES = ["raw", "assign", "call", "return", "break", "if", "while",
+            "repeat", "do", "function", "always", "loop", "continue",
+            "parallel"]
+
+
+class Block:
+    """A sequence of instructions, stored as parallel lists of opcodes,
+    arguments and the statements they were lowered from."""
+
+    __slots__ = ("ops", "args", "nodes")
+
+    def __init__(self) -> None:
+        self.ops: List[int] = []
+        self.args: List[Tuple] = []
+        self.nodes: List[Optional[ASTNode]] = []
+
+    def append(self, op: int, args: Tuple = (),
+               node: Optional[ASTNode] = None) -> None:
+        self.ops.append(op)
+        self.args.append(args)
+        self.nodes.append(node)
+
+    def insert(self, i: int, op: int, args: Tuple = (),
+               node: Optional[ASTNode] = None) -> None:
+        self.ops.insert(i, op)
+        self.args.insert(i, args)
+        self.nodes.insert(i, node)
+
+    def __len__(self) -> int:
+        return len(self.ops)
+
+    def __iter__(self) -> Iterator[Tuple[int, Tuple, Optional[ASTNode]]]:
+        return zip(self.ops, self.args, self.nodes)
+
+    def keep(self, pred: Callable[[int, Tuple, Optional[ASTNode]], bool]
+             ) -> None:
+        """Drop the instructions `pred` is false for."""
+        kept = [i for i, ins in enumerate(self) if pred(*ins)]
+        self.ops = [self.ops[i] for i in kept]
+        self.args = [self.args[i] for i in kept]
+        self.nodes = [self.nodes[i] for i in kept]
+
+    def blocks(self) -> Iterator['Block']:
+        """Yield this block and every block nested in it."""
+        yield self
+        for op, args, _ in self:
+            for arg in args:
+                if isinstance(arg, Block):
+                    yield from arg.blocks()
+                elif op == IF and isinstance(arg, list):
+                    for _, block in arg:
+                        yield from block.blocks()
+
+    def dump(self, level: int = 0) -> str:
+        """Return a readable listing of the block, for debugging."""
+        lines = []
+        for op, args, _ in self:
+            flat = [a for a in args if not isinstance(a, (Block, list))]
+            lines.append("  " * level + OP_NAMES[op] + " "
+                         + ", ".join(map(repr, flat)))
+            for arg in args:
+                if isinstance(arg, Block):
+                    lines.append(arg.dump(level + 1))
+                elif op == IF and isinstance(arg, list):
+                    for cond, block in arg:
+                        lines.append("  " * level + f"  when {cond!r}")
+                        lines.append(block.dump(level + 2))
+        return "\n".join(line for line in lines if line)
+
+
+def lower(node: ASTNode) -> Block:
+    """Lower a chunk or block node to IR."""
+    if node.is_a(ast.ChunkNode):
+        block = lower(node.get_only(ast.BlockNode))
+        # modules needed by the library functions used, see `builtins`
+        for module in sorted(node.modules):
+            block.insert(0, RAW, ("zmodload " + module,))
+        return block
+    block = Block()
+    for c in node.child_nodes():
+        if c.is_a(ast.RetstatNode):
+            lower_retstat(c, block)
+        else:
+            lower_stat(c, block)
+    return block
+
+
+def lower_retstat(node: ASTNode, block: Block) -> None:
+    if node.children:
+        block.append(RETURN, (node.children[0].gen(),), node)
+    else:
+        block.append(RETURN, (), node)
+
+
+def lower_stat(stat: ASTNode, block: Block) -> None:
+    if not stat.children:
+        return
+    first = stat.children[0]
+    lower_fn = LOWER.get(type(first))
+    if lower_fn is None:
+        # constructs without a translation keep their default rendering
+        block.append(RAW, (first.gen(),), stat)
+    else:
+        lower_fn(stat, first, block)
+
+
+def lower_semicolon(stat: ASTNode, first: ASTNode, block: Block) -> None:
+    pass
+
+
+def lower_break(stat: ASTNode, first: ASTNode, block: Block) -> None:
+    block.append(BREAK, (), stat)
+
+
+def lower_goto(stat: ASTNode, first: ASTNode, block: Block) -> None:
+    stat.report(UnsupportedError("goto", stat))
+
+
+def lower_label(stat: ASTNode, first: ASTNode, block: Block) -> None:
+    first.report(UnsupportedError("label", first))
+
+
+def lower_do(stat: ASTNode, first: ASTNode, block: Block) -> None:
+    block.append(DO, (lower(stat.children[1]),), stat)
+
+
+def lower_hoisted(stat: ASTNode, block: Block) -> None:
+    """Compute the loop's invariant command substitutions up front."""
+    for call in stat.hoisted_calls:
+        name, call.hoisted = call.hoisted, None
+        call.set_recursive('capture', True)
+        block.append(ASSIGN, (name, call.gen(), False), stat)
+        call.hoisted = name
+
+
+def lower_while(stat: ASTNode, first: ASTNode, block: Block) -> None:
+    lower_hoisted(stat, block)
+    block.append(WHILE, (stat.children[1].gen(), lower(stat.children[2])),
+                 stat)
+
+
+def lower_repeat(stat: ASTNode, first: ASTNode, block: Block) -> None:
+    lower_hoisted(stat, block)
+    body = lower(stat.children[1])
+    block.append(REPEAT, (body, stat.children[2].gen()), stat)
+
+
+def lower_varlist(stat: ASTNode, first: ASTNode, block: Block) -> None:
+    var = stat.get_only(ast.VarlistNode)
+    exp = stat.get_only(ast.ExplistNode)
+    var.set_recursive('assign', True)
+    block.append(ASSIGN, (var.gen(), exp.gen(), True), stat)
+
+
+def lower_functioncall(stat: ASTNode, first: ASTNode, block: Block) -> None:
+    block.append(CALL, (first.gen(),), stat)
+
+
+def lower_if(stat: ASTNode, first: ASTNode, block: Block) -> None:
+    arms = [(first.children[0].gen(), lower(first.get_only(ast.BlockNode)))]
+    for el_if in first.get(ast.ElseifBlockNode):
+        arms.append((el_if.get_only(ast.ExpNode).gen(),
+                     lower(el_if.get_only(ast.BlockNode))))
+    orelse = None
+    if first.has(ast.ElseBlockNode):
+        orelse = lower(first.get_only(ast.ElseBlockNode).children[0])
+    block.append(IF, (arms, orelse), stat)
+
+
+def lower_local_function(stat: ASTNode, first: ASTNode,
+                         block: Block) -> None:
+    name, body = first.children
+    pars = [p.value for p in ast.params(body)]
+    block.append(FUNCTION, (name.value, pars,
+                            lower(body.get_only(ast.BlockNode))), stat)
+
+
+def lower_local_assign(stat: ASTNode, first: ASTNode, block: Block) -> None:
+    attr = first.get_only(ast.AttnamelistNode)
+    name = attr.children[0].value
+    if first.has(ast.ExplistNode):
+        value = first.get_only(ast.ExplistNode).gen()
+    else:
+        value = '""'  # nil
+    block.append(ASSIGN, (name, value, False), stat)
+
+
+LOWER: Dict[Type[ASTNode], Callable[[ASTNode, Any, Block], None]] = {
+    ast.SemicolonNode: lower_semicolon,
+    ast.BreakNode: lower_break,
+    ast.GotoNode: lower_goto,
+    ast.LabelNode: lower_label,
+    ast.DoNode: lower_do,
+    ast.WhileNode: lower_while,
+    ast.RepeatNode: lower_repeat,
+    ast.VarlistNode: lower_varlist,
+    ast.FunctioncallNode: lower_functioncall,
+    ast.IfStmtNode: lower_if,
+    ast.LocalFunctionNode: lower_local_function,
+    ast.LocalAssignNode: lower_local_assign,
+}
@@ -1,4 +1,6 @@
+import json
 import os
+from typing import Iterable, Optional
 
 
 def is_executable_file(file_path):
@@ -9,17 +11,23 @@ def is_executable_file(file_path):
     return False
 
 
-def find_binaries_on_path():
+def path_dirs(path: Optional[str] = None) -> list[str]:
+    """Split a PATH string, defaulting to the environment's, into dirs."""
+    if path is None:
+        path = os.environ.get('PATH', '')
+    return [d for d in path.split(os.pathsep) if d]
+
+
+def find_binaries_on_path(dirs: Optional[Iterable[str]] = None):
     """Find all binaries available on the PATH."""
-    # Retrieve and split the PATH environment variable
-    path_env_var = os.environ.get('PATH', '')
-    path_dirs = path_env_var.split(os.pathsep)
+    if dirs is None:
+        dirs = path_dirs()
 
     # To store the collected binaries
     binaries = set()
 
     # Iterate through each directory in the PATH
-    for directory in path_dirs:
+    for directory in dirs:
         try:
             # List all entries in the directory
             with os.scandir(directory) as entries:
@@ -27,7 +35,7 @@ def find_binaries_on_path():
                     if entry.is_file() and is_executable_file(entry.path):
                         # Add the executable file's name to the set
                         binaries.add(entry.name)
-        except (FileNotFoundError, PermissionError):
+        except (FileNotFoundError, NotADirectoryError, PermissionError):
             # Path might contain non-existing directories
             # Ignore them and continue
             continue
@@ -35,5 +43,48 @@ def find_binaries_on_path():
     return binaries
 
 
-# Get the list of binary names
-PATH_BINS: set[str] = find_binaries_on_path()
+class PathResolver:
+    """Membership test for binaries on PATH.
+
+    By default names are resolved one at a time, the first time they are
+    asked about, by checking each PATH directory; both hits and misses are
+    remembered. With `eager`, every directory is scanned up front instead,
+    which fixes the set of known binaries for the lifetime of the resolver.
+    """
+
+    def __init__(self, path: Optional[str] = None, eager: bool = False):
+        self.dirs = path_dirs(path)
+        self.found: dict[str, bool] = {}
+        self.scanned: Optional[frozenset[str]] = None
+        if eager:
+            self.scanned = frozenset(find_binaries_on_path(self.dirs))
+
+    def __contains__(self, name: str) -> bool:
+        if self.scanned is not None:
+            return name in self.scanned
+        if (res := self.found.get(name)) is not None:
+            return res
+        res = "/" not in name and any(
+            is_executable_file(os.path.join(d, name)) for d in self.dirs)
+        self.found[name] = res
+        return res
+
+
+def write_path_snapshot(file_path: str,
+                        bins: Optional[Iterable[str]] = None) -> None:
+    """Write the binaries on PATH (or `bins`) to a JSON snapshot."""
+    if bins is None:
+        bins = find_binaries_on_path()
+    with open(file_path, "w") as f:
+        json.dump({"bins": sorted(bins)}, f, indent=0)
+        f.write("\n")
+
+
+def load_path_snapshot(file_path: str) -> frozenset[str]:
+    """Load a snapshot written by `write_path_snapshot`; raise ValueError
+    if the file isn't one."""
+    with open(file_path) as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or not isinstance(data.get("bins"), list):
+        raise ValueError("not a path snapshot, expected {\"bins\": [...]}")
+    return frozenset(data["bins"])
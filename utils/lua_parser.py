@@ -0,0 +1,3574 @@
+# Generated from utils/grammar.py by gen_parser.py
+GRAMMAR_HASH = '62940651b7d6641b3a9702eb55a680330f4c970c8c325bab053fac25e817c3b5'
+# The file was automatically generated by Lark v1.3.1
+__version__ = "1.3.1"
+
+#
+#
+#   Lark Stand-alone Generator Tool
+# ----------------------------------
+# Generates a stand-alone LALR(1) parser
+#
+# Git:    https://github.com/erezsh/lark
+# Author: Erez Shinan (erezshin@gmail.com)
+#
+#
+#    >>> LICENSE
+#
+#    This tool and its generated code use a separate license from Lark,
+#    and are subject to the terms of the Mozilla Public License, v. 2.0.
+#    If a copy of the MPL was not distributed with this
+#    file, You can obtain one at https://mozilla.org/MPL/2.0/.
+#
+#    If you wish to purchase a commercial license for this tool and its
+#    generated code, you may contact me via email or otherwise.
+#
+#    If MPL2 is incompatible with your free or open-source project,
+#    contact me and we'll work it out.
+#
+#
+
+from copy import deepcopy
+from abc import ABC, abstractmethod
+from types import ModuleType
+from typing import (
+    TypeVar, Generic, Type, Tuple, List, Dict, Iterator, Collection, Callable, Optional, FrozenSet, Any,
+    Union, Iterable, IO, TYPE_CHECKING, overload, Sequence,
+    Pattern as REPattern, ClassVar, Set, Mapping
+)
+
+
+class LarkError(Exception):
+    pass
+
+
+class ConfigurationError(LarkError, ValueError):
+    pass
+
+
+def assert_config(value, options: Collection, msg='Got %r, expected one of %s'):
+    if value not in options:
+        raise ConfigurationError(msg % (value, options))
+
+
+class GrammarError(LarkError):
+    pass
+
+
+class ParseError(LarkError):
+    pass
+
+
+class LexError(LarkError):
+    pass
+
+T = TypeVar('T')
+
+class UnexpectedInput(LarkError):
+    #--
+    line: int
+    column: int
+    pos_in_stream = None
+    state: Any
+    _terminals_by_name = None
+    interactive_parser: 'InteractiveParser'
+
+    def get_context(self, text: str, span: int=40) -> str:
+        #--
+        pos = self.pos_in_stream or 0
+        start = max(pos - span, 0)
+        end = pos + span
+        if not isinstance(text, bytes):
+            before = text[start:pos].rsplit('\n', 1)[-1]
+            after = text[pos:end].split('\n', 1)[0]
+            return before + after + '\n' + ' ' * len(before.expandtabs()) + '^\n'
+        else:
+            before = text[start:pos].rsplit(b'\n', 1)[-1]
+            after = text[pos:end].split(b'\n', 1)[0]
+            return (before + after + b'\n' + b' ' * len(before.expandtabs()) + b'^\n').decode("ascii", "backslashreplace")
+
+    def match_examples(self, parse_fn: 'Callable[[str], Tree]',
+                             examples: Union[Mapping[T, Iterable[str]], Iterable[Tuple[T, Iterable[str]]]],
+                             token_type_match_fallback: bool=False,
+                             use_accepts: bool=True
+                         ) -> Optional[T]:
+        #--
+        assert self.state is not None, "Not supported for this exception"
+
+        if isinstance(examples, Mapping):
+            examples = examples.items()
+
+        candidate = (None, False)
+        for i, (label, example) in enumerate(examples):
+            assert not isinstance(example, str), "Expecting a list"
+
+            for j, malformed in enumerate(example):
+                try:
+                    parse_fn(malformed)
+                except UnexpectedInput as ut:
+                    if ut.state == self.state:
+                        if (
+                            use_accepts
+                            and isinstance(self, UnexpectedToken)
+                            and isinstance(ut, UnexpectedToken)
+                            and ut.accepts != self.accepts
+                        ):
+                            logger.debug("Different accepts with same state[%d]: %s != %s at example [%s][%s]" %
+                                         (self.state, self.accepts, ut.accepts, i, j))
+                            continue
+                        if (
+                            isinstance(self, (UnexpectedToken, UnexpectedEOF))
+                            and isinstance(ut, (UnexpectedToken, UnexpectedEOF))
+                        ):
+                            if ut.token == self.token:  ##
+
+                                logger.debug("Exact Match at example [%s][%s]" % (i, j))
+                                return label
+
+                            if token_type_match_fallback:
+                                ##
+
+                                if (ut.token.type == self.token.type) and not candidate[-1]:
+                                    logger.debug("Token Type Fallback at example [%s][%s]" % (i, j))
+                                    candidate = label, True
+
+                        if candidate[0] is None:
+                            logger.debug("Same State match at example [%s][%s]" % (i, j))
+                            candidate = label, False
+
+        return candidate[0]
+
+    def _format_expected(self, expected):
+        if self._terminals_by_name:
+            d = self._terminals_by_name
+            expected = [d[t_name].user_repr() if t_name in d else t_name for t_name in expected]
+        return "Expected one of: \n\t* %s\n" % '\n\t* '.join(expected)
+
+
+class UnexpectedEOF(ParseError, UnexpectedInput):
+    #--
+    expected: 'List[Token]'
+
+    def __init__(self, expected, state=None, terminals_by_name=None):
+        super(UnexpectedEOF, self).__init__()
+
+        self.expected = expected
+        self.state = state
+        from .lexer import Token
+        self.token = Token("<EOF>", "")  ##
+
+        self.pos_in_stream = -1
+        self.line = -1
+        self.column = -1
+        self._terminals_by_name = terminals_by_name
+
+
+    def __str__(self):
+        message = "Unexpected end-of-input. "
+        message += self._format_expected(self.expected)
+        return message
+
+
+class UnexpectedCharacters(LexError, UnexpectedInput):
+    #--
+
+    allowed: Set[str]
+    considered_tokens: Set[Any]
+
+    def __init__(self, seq, lex_pos, line, column, allowed=None, considered_tokens=None, state=None, token_history=None,
+                 terminals_by_name=None, considered_rules=None):
+        super(UnexpectedCharacters, self).__init__()
+
+        ##
+
+        self.line = line
+        self.column = column
+        self.pos_in_stream = lex_pos
+        self.state = state
+        self._terminals_by_name = terminals_by_name
+
+        self.allowed = allowed
+        self.considered_tokens = considered_tokens
+        self.considered_rules = considered_rules
+        self.token_history = token_history
+
+        if isinstance(seq, bytes):
+            self.char = seq[lex_pos:lex_pos + 1].decode("ascii", "backslashreplace")
+        else:
+            self.char = seq[lex_pos]
+        self._context = self.get_context(seq)
+
+
+    def __str__(self):
+        message = "No terminal matches '%s' in the current parser context, at line %d col %d" % (self.char, self.line, self.column)
+        message += '\n\n' + self._context
+        if self.allowed:
+            message += self._format_expected(self.allowed)
+        if self.token_history:
+            message += '\nPrevious tokens: %s\n' % ', '.join(repr(t) for t in self.token_history)
+        return message
+
+
+class UnexpectedToken(ParseError, UnexpectedInput):
+    #--
+
+    expected: Set[str]
+    considered_rules: Set[str]
+
+    def __init__(self, token, expected, considered_rules=None, state=None, interactive_parser=None, terminals_by_name=None, token_history=None):
+        super(UnexpectedToken, self).__init__()
+
+        ##
+
+        self.line = getattr(token, 'line', '?')
+        self.column = getattr(token, 'column', '?')
+        self.pos_in_stream = getattr(token, 'start_pos', None)
+        self.state = state
+
+        self.token = token
+        self.expected = expected  ##
+
+        self._accepts = NO_VALUE
+        self.considered_rules = considered_rules
+        self.interactive_parser = interactive_parser
+        self._terminals_by_name = terminals_by_name
+        self.token_history = token_history
+
+
+    @property
+    def accepts(self) -> Set[str]:
+        if self._accepts is NO_VALUE:
+            self._accepts = self.interactive_parser and self.interactive_parser.accepts()
+        return self._accepts
+
+    def __str__(self):
+        message = ("Unexpected token %r at line %s, column %s.\n%s"
+                   % (self.token, self.line, self.column, self._format_expected(self.accepts or self.expected)))
+        if self.token_history:
+            message += "Previous tokens: %r\n" % self.token_history
+
+        return message
+
+
+
+class VisitError(LarkError):
+    #--
+
+    obj: 'Union[Tree, Token]'
+    orig_exc: Exception
+
+    def __init__(self, rule, obj, orig_exc):
+        message = 'Error trying to process rule "%s":\n\n%s' % (rule, orig_exc)
+        super(VisitError, self).__init__(message)
+
+        self.rule = rule
+        self.obj = obj
+        self.orig_exc = orig_exc
+
+
+class MissingVariableError(LarkError):
+    pass
+
+
+import sys, re
+import logging
+from dataclasses import dataclass
+from typing import Generic, AnyStr
+
+logger: logging.Logger = logging.getLogger("lark")
+logger.addHandler(logging.StreamHandler())
+##
+
+##
+
+logger.setLevel(logging.CRITICAL)
+
+
+NO_VALUE = object()
+
+T = TypeVar("T")
+
+
+def classify(seq: Iterable, key: Optional[Callable] = None, value: Optional[Callable] = None) -> Dict:
+    d: Dict[Any, Any] = {}
+    for item in seq:
+        k = key(item) if (key is not None) else item
+        v = value(item) if (value is not None) else item
+        try:
+            d[k].append(v)
+        except KeyError:
+            d[k] = [v]
+    return d
+
+
+def _deserialize(data: Any, namespace: Dict[str, Any], memo: Dict) -> Any:
+    if isinstance(data, dict):
+        if '__type__' in data:  ##
+
+            class_ = namespace[data['__type__']]
+            return class_.deserialize(data, memo)
+        elif '@' in data:
+            return memo[data['@']]
+        return {key:_deserialize(value, namespace, memo) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [_deserialize(value, namespace, memo) for value in data]
+    return data
+
+
+_T = TypeVar("_T", bound="Serialize")
+
+class Serialize:
+    #--
+
+    def memo_serialize(self, types_to_memoize: List) -> Any:
+        memo = SerializeMemoizer(types_to_memoize)
+        return self.serialize(memo), memo.serialize()
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        if memo and memo.in_types(self):
+            return {'@': memo.memoized.get(self)}
+
+        fields = getattr(self, '__serialize_fields__')
+        res = {f: _serialize(getattr(self, f), memo) for f in fields}
+        res['__type__'] = type(self).__name__
+        if hasattr(self, '_serialize'):
+            self._serialize(res, memo)
+        return res
+
+    @classmethod
+    def deserialize(cls: Type[_T], data: Dict[str, Any], memo: Dict[int, Any]) -> _T:
+        namespace = getattr(cls, '__serialize_namespace__', [])
+        namespace = {c.__name__:c for c in namespace}
+
+        fields = getattr(cls, '__serialize_fields__')
+
+        if '@' in data:
+            return memo[data['@']]
+
+        inst = cls.__new__(cls)
+        for f in fields:
+            try:
+                setattr(inst, f, _deserialize(data[f], namespace, memo))
+            except KeyError as e:
+                raise KeyError("Cannot find key for class", cls, e)
+
+        if hasattr(inst, '_deserialize'):
+            inst._deserialize()
+
+        return inst
+
+
+class SerializeMemoizer(Serialize):
+    #--
+
+    __serialize_fields__ = 'memoized',
+
+    def __init__(self, types_to_memoize: List) -> None:
+        self.types_to_memoize = tuple(types_to_memoize)
+        self.memoized = Enumerator()
+
+    def in_types(self, value: Serialize) -> bool:
+        return isinstance(value, self.types_to_memoize)
+
+    def serialize(self) -> Dict[int, Any]:  ##
+
+        return _serialize(self.memoized.reversed(), None)
+
+    @classmethod
+    def deserialize(cls, data: Dict[int, Any], namespace: Dict[str, Any], memo: Dict[Any, Any]) -> Dict[int, Any]:  ##
+
+        return _deserialize(data, namespace, memo)
+
+
+try:
+    import regex
+    _has_regex = True
+except ImportError:
+    _has_regex = False
+
+if sys.version_info >= (3, 11):
+    import re._parser as sre_parse
+    import re._constants as sre_constants
+else:
+    import sre_parse
+    import sre_constants
+
+categ_pattern = re.compile(r'\\p{[A-Za-z_]+}')
+
+def get_regexp_width(expr: str) -> Union[Tuple[int, int], List[int]]:
+    if _has_regex:
+        ##
+
+        ##
+
+        ##
+
+        regexp_final = re.sub(categ_pattern, 'A', expr)
+    else:
+        if re.search(categ_pattern, expr):
+            raise ImportError('`regex` module must be installed in order to use Unicode categories.', expr)
+        regexp_final = expr
+    try:
+        ##
+
+        return [int(x) for x in sre_parse.parse(regexp_final).getwidth()]
+    except sre_constants.error:
+        if not _has_regex:
+            raise ValueError(expr)
+        else:
+            ##
+
+            ##
+
+            c = regex.compile(regexp_final)
+            ##
+
+            ##
+
+            MAXWIDTH = getattr(sre_parse, "MAXWIDTH", sre_constants.MAXREPEAT)
+            if c.match('') is None:
+                ##
+
+                return 1, int(MAXWIDTH)
+            else:
+                return 0, int(MAXWIDTH)
+
+
+@dataclass(frozen=True)
+class TextSlice(Generic[AnyStr]):
+    #--
+    text: AnyStr
+    start: int
+    end: int
+
+    def __post_init__(self):
+        if not isinstance(self.text, (str, bytes)):
+            raise TypeError("text must be str or bytes")
+
+        if self.start < 0:
+            object.__setattr__(self, 'start', self.start + len(self.text))
+            assert self.start >=0
+
+        if self.end is None:
+            object.__setattr__(self, 'end', len(self.text))
+        elif self.end < 0:
+            object.__setattr__(self, 'end', self.end + len(self.text))
+            assert self.end <= len(self.text)
+
+    @classmethod
+    def cast_from(cls, text: 'TextOrSlice') -> 'TextSlice[AnyStr]':
+        if isinstance(text, TextSlice):
+            return text
+
+        return cls(text, 0, len(text))
+
+    def is_complete_text(self):
+        return self.start == 0 and self.end == len(self.text)
+
+    def __len__(self):
+        return self.end - self.start
+
+    def count(self, substr: AnyStr):
+        return self.text.count(substr, self.start, self.end)
+
+    def rindex(self, substr: AnyStr):
+        return self.text.rindex(substr, self.start, self.end)
+
+
+TextOrSlice = Union[AnyStr, 'TextSlice[AnyStr]']
+LarkInput = Union[AnyStr, TextSlice[AnyStr], Any]
+
+
+
+class Meta:
+
+    empty: bool
+    line: int
+    column: int
+    start_pos: int
+    end_line: int
+    end_column: int
+    end_pos: int
+    orig_expansion: 'List[TerminalDef]'
+    match_tree: bool
+
+    def __init__(self):
+        self.empty = True
+
+
+_Leaf_T = TypeVar("_Leaf_T")
+Branch = Union[_Leaf_T, 'Tree[_Leaf_T]']
+
+
+class Tree(Generic[_Leaf_T]):
+    #--
+
+    data: str
+    children: 'List[Branch[_Leaf_T]]'
+
+    def __init__(self, data: str, children: 'List[Branch[_Leaf_T]]', meta: Optional[Meta]=None) -> None:
+        self.data = data
+        self.children = children
+        self._meta = meta
+
+    @property
+    def meta(self) -> Meta:
+        if self._meta is None:
+            self._meta = Meta()
+        return self._meta
+
+    def __repr__(self):
+        return 'Tree(%r, %r)' % (self.data, self.children)
+
+    __match_args__ = ("data", "children")
+
+    def _pretty_label(self):
+        return self.data
+
+    def _pretty(self, level, indent_str):
+        yield f'{indent_str*level}{self._pretty_label()}'
+        if len(self.children) == 1 and not isinstance(self.children[0], Tree):
+            yield f'\t{self.children[0]}\n'
+        else:
+            yield '\n'
+            for n in self.children:
+                if isinstance(n, Tree):
+                    yield from n._pretty(level+1, indent_str)
+                else:
+                    yield f'{indent_str*(level+1)}{n}\n'
+
+    def pretty(self, indent_str: str='  ') -> str:
+        #--
+        return ''.join(self._pretty(0, indent_str))
+
+    def __rich__(self, parent:Optional['rich.tree.Tree']=None) -> 'rich.tree.Tree':
+        #--
+        return self._rich(parent)
+
+    def _rich(self, parent):
+        if parent:
+            tree = parent.add(f'[bold]{self.data}[/bold]')
+        else:
+            import rich.tree
+            tree = rich.tree.Tree(self.data)
+
+        for c in self.children:
+            if isinstance(c, Tree):
+                c._rich(tree)
+            else:
+                tree.add(f'[green]{c}[/green]')
+
+        return tree
+
+    def __eq__(self, other):
+        try:
+            return self.data == other.data and self.children == other.children
+        except AttributeError:
+            return False
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self) -> int:
+        return hash((self.data, tuple(self.children)))
+
+    def iter_subtrees(self) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        queue = [self]
+        subtrees = dict()
+        for subtree in queue:
+            subtrees[id(subtree)] = subtree
+            queue += [c for c in reversed(subtree.children)
+                      if isinstance(c, Tree) and id(c) not in subtrees]
+
+        del queue
+        return reversed(list(subtrees.values()))
+
+    def iter_subtrees_topdown(self):
+        #--
+        stack = [self]
+        stack_append = stack.append
+        stack_pop = stack.pop
+        while stack:
+            node = stack_pop()
+            if not isinstance(node, Tree):
+                continue
+            yield node
+            for child in reversed(node.children):
+                stack_append(child)
+
+    def find_pred(self, pred: 'Callable[[Tree[_Leaf_T]], bool]') -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return filter(pred, self.iter_subtrees())
+
+    def find_data(self, data: str) -> 'Iterator[Tree[_Leaf_T]]':
+        #--
+        return self.find_pred(lambda t: t.data == data)
+
+
+from functools import wraps, update_wrapper
+from inspect import getmembers, getmro
+
+_Return_T = TypeVar('_Return_T')
+_Return_V = TypeVar('_Return_V')
+_Leaf_T = TypeVar('_Leaf_T')
+_Leaf_U = TypeVar('_Leaf_U')
+_R = TypeVar('_R')
+_FUNC = Callable[..., _Return_T]
+_DECORATED = Union[_FUNC, type]
+
+class _DiscardType:
+    #--
+
+    def __repr__(self):
+        return "lark.visitors.Discard"
+
+Discard = _DiscardType()
+
+##
+
+
+class _Decoratable:
+    #--
+
+    @classmethod
+    def _apply_v_args(cls, visit_wrapper):
+        mro = getmro(cls)
+        assert mro[0] is cls
+        libmembers = {name for _cls in mro[1:] for name, _ in getmembers(_cls)}
+        for name, value in getmembers(cls):
+
+            ##
+
+            if name.startswith('_') or (name in libmembers and name not in cls.__dict__):
+                continue
+            if not callable(value):
+                continue
+
+            ##
+
+            if isinstance(cls.__dict__[name], _VArgsWrapper):
+                continue
+
+            setattr(cls, name, _VArgsWrapper(cls.__dict__[name], visit_wrapper))
+        return cls
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Transformer(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+    __visit_tokens__ = True   ##
+
+
+    def __init__(self,  visit_tokens: bool=True) -> None:
+        self.__visit_tokens__ = visit_tokens
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            try:
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    return f.visit_wrapper(f, tree.data, children, tree.meta)
+                else:
+                    return f(children)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(tree.data, tree, e)
+
+    def _call_userfunc_token(self, token):
+        try:
+            f = getattr(self, token.type)
+        except AttributeError:
+            return self.__default_token__(token)
+        else:
+            try:
+                return f(token)
+            except GrammarError:
+                raise
+            except Exception as e:
+                raise VisitError(token.type, token, e)
+
+    def _transform_children(self, children):
+        for c in children:
+            if isinstance(c, Tree):
+                res = self._transform_tree(c)
+            elif self.__visit_tokens__ and isinstance(c, Token):
+                res = self._call_userfunc_token(c)
+            else:
+                res = c
+
+            if res is not Discard:
+                yield res
+
+    def _transform_tree(self, tree):
+        children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree, children)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        #--
+        res = list(self._transform_children([tree]))
+        if not res:
+            return None     ##
+
+        assert len(res) == 1
+        return res[0]
+
+    def __mul__(
+            self: 'Transformer[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V,]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        #--
+        return TransformerChain(self, other)
+
+    def __default__(self, data, children, meta):
+        #--
+        return Tree(data, children, meta)
+
+    def __default_token__(self, token):
+        #--
+        return token
+
+
+def merge_transformers(base_transformer=None, **transformers_to_merge):
+    #--
+    if base_transformer is None:
+        base_transformer = Transformer()
+    for prefix, transformer in transformers_to_merge.items():
+        for method_name in dir(transformer):
+            method = getattr(transformer, method_name)
+            if not callable(method):
+                continue
+            if method_name.startswith("_") or method_name == "transform":
+                continue
+            prefixed_method = prefix + "__" + method_name
+            if hasattr(base_transformer, prefixed_method):
+                raise AttributeError("Cannot merge: method '%s' appears more than once" % prefixed_method)
+
+            setattr(base_transformer, prefixed_method, method)
+
+    return base_transformer
+
+
+class InlineTransformer(Transformer):   ##
+
+    def _call_userfunc(self, tree, new_children=None):
+        ##
+
+        children = new_children if new_children is not None else tree.children
+        try:
+            f = getattr(self, tree.data)
+        except AttributeError:
+            return self.__default__(tree.data, children, tree.meta)
+        else:
+            return f(*children)
+
+
+class TransformerChain(Generic[_Leaf_T, _Return_T]):
+
+    transformers: 'Tuple[Union[Transformer, TransformerChain], ...]'
+
+    def __init__(self, *transformers: 'Union[Transformer, TransformerChain]') -> None:
+        self.transformers = transformers
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for t in self.transformers:
+            tree = t.transform(tree)
+        return cast(_Return_T, tree)
+
+    def __mul__(
+            self: 'TransformerChain[_Leaf_T, Tree[_Leaf_U]]',
+            other: 'Union[Transformer[_Leaf_U, _Return_V], TransformerChain[_Leaf_U, _Return_V]]'
+    ) -> 'TransformerChain[_Leaf_T, _Return_V]':
+        return TransformerChain(*self.transformers + (other,))
+
+
+class Transformer_InPlace(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):           ##
+
+        return self._call_userfunc(tree)
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        for subtree in tree.iter_subtrees():
+            subtree.children = list(self._transform_children(subtree.children))
+
+        return self._transform_tree(tree)
+
+
+class Transformer_NonRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+
+    def transform(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        rev_postfix = []
+        q: List[Branch[_Leaf_T]] = [tree]
+        while q:
+            t = q.pop()
+            rev_postfix.append(t)
+            if isinstance(t, Tree):
+                q += t.children
+
+        ##
+
+        stack: List = []
+        for x in reversed(rev_postfix):
+            if isinstance(x, Tree):
+                size = len(x.children)
+                if size:
+                    args = stack[-size:]
+                    del stack[-size:]
+                else:
+                    args = []
+
+                res = self._call_userfunc(x, args)
+                if res is not Discard:
+                    stack.append(res)
+
+            elif self.__visit_tokens__ and isinstance(x, Token):
+                res = self._call_userfunc_token(x)
+                if res is not Discard:
+                    stack.append(res)
+            else:
+                stack.append(x)
+
+        result, = stack  ##
+
+        ##
+
+        ##
+
+        ##
+
+        return cast(_Return_T, result)
+
+
+class Transformer_InPlaceRecursive(Transformer[_Leaf_T, _Return_T]):
+    #--
+    def _transform_tree(self, tree):
+        tree.children = list(self._transform_children(tree.children))
+        return self._call_userfunc(tree)
+
+
+##
+
+
+class VisitorBase:
+    def _call_userfunc(self, tree):
+        return getattr(self, tree.data, self.__default__)(tree)
+
+    def __default__(self, tree):
+        #--
+        return tree
+
+    def __class_getitem__(cls, _):
+        return cls
+
+
+class Visitor(VisitorBase, ABC, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees():
+            self._call_userfunc(subtree)
+        return tree
+
+    def visit_topdown(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for subtree in tree.iter_subtrees_topdown():
+            self._call_userfunc(subtree)
+        return tree
+
+
+class Visitor_Recursive(VisitorBase, Generic[_Leaf_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit(child)
+
+        self._call_userfunc(tree)
+        return tree
+
+    def visit_topdown(self,tree: Tree[_Leaf_T]) -> Tree[_Leaf_T]:
+        #--
+        self._call_userfunc(tree)
+
+        for child in tree.children:
+            if isinstance(child, Tree):
+                self.visit_topdown(child)
+
+        return tree
+
+
+class Interpreter(_Decoratable, ABC, Generic[_Leaf_T, _Return_T]):
+    #--
+
+    def visit(self, tree: Tree[_Leaf_T]) -> _Return_T:
+        ##
+
+        ##
+
+        ##
+
+        return self._visit_tree(tree)
+
+    def _visit_tree(self, tree: Tree[_Leaf_T]):
+        f = getattr(self, tree.data)
+        wrapper = getattr(f, 'visit_wrapper', None)
+        if wrapper is not None:
+            return f.visit_wrapper(f, tree.data, tree.children, tree.meta)
+        else:
+            return f(tree)
+
+    def visit_children(self, tree: Tree[_Leaf_T]) -> List:
+        return [self._visit_tree(child) if isinstance(child, Tree) else child
+                for child in tree.children]
+
+    def __getattr__(self, name):
+        return self.__default__
+
+    def __default__(self, tree):
+        return self.visit_children(tree)
+
+
+_InterMethod = Callable[[Type[Interpreter], _Return_T], _R]
+
+def visit_children_decor(func: _InterMethod) -> _InterMethod:
+    #--
+    @wraps(func)
+    def inner(cls, tree):
+        values = cls.visit_children(tree)
+        return func(cls, values)
+    return inner
+
+##
+
+
+def _apply_v_args(obj, visit_wrapper):
+    try:
+        _apply = obj._apply_v_args
+    except AttributeError:
+        return _VArgsWrapper(obj, visit_wrapper)
+    else:
+        return _apply(visit_wrapper)
+
+
+class _VArgsWrapper:
+    #--
+    base_func: Callable
+
+    def __init__(self, func: Callable, visit_wrapper: Callable[[Callable, str, list, Any], Any]):
+        if isinstance(func, _VArgsWrapper):
+            func = func.base_func
+        self.base_func = func
+        self.visit_wrapper = visit_wrapper
+        update_wrapper(self, func)
+
+    def __call__(self, *args, **kwargs):
+        return self.base_func(*args, **kwargs)
+
+    def __get__(self, instance, owner=None):
+        try:
+            ##
+
+            ##
+
+            g = type(self.base_func).__get__
+        except AttributeError:
+            return self
+        else:
+            return _VArgsWrapper(g(self.base_func, instance, owner), self.visit_wrapper)
+
+    def __set_name__(self, owner, name):
+        try:
+            f = type(self.base_func).__set_name__
+        except AttributeError:
+            return
+        else:
+            f(self.base_func, owner, name)
+
+
+def _vargs_inline(f, _data, children, _meta):
+    return f(*children)
+def _vargs_meta_inline(f, _data, children, meta):
+    return f(meta, *children)
+def _vargs_meta(f, _data, children, meta):
+    return f(meta, children)
+def _vargs_tree(f, data, children, meta):
+    return f(Tree(data, children, meta))
+
+
+def v_args(inline: bool = False, meta: bool = False, tree: bool = False, wrapper: Optional[Callable] = None) -> Callable[[_DECORATED], _DECORATED]:
+    #--
+    if tree and (meta or inline):
+        raise ValueError("Visitor functions cannot combine 'tree' with 'meta' or 'inline'.")
+
+    func = None
+    if meta:
+        if inline:
+            func = _vargs_meta_inline
+        else:
+            func = _vargs_meta
+    elif inline:
+        func = _vargs_inline
+    elif tree:
+        func = _vargs_tree
+
+    if wrapper is not None:
+        if func is not None:
+            raise ValueError("Cannot use 'wrapper' along with 'tree', 'meta' or 'inline'.")
+        func = wrapper
+
+    def _visitor_args_dec(obj):
+        return _apply_v_args(obj, func)
+    return _visitor_args_dec
+
+
+
+TOKEN_DEFAULT_PRIORITY = 0
+
+
+class Symbol(Serialize):
+    __slots__ = ('name',)
+
+    name: str
+    is_term: ClassVar[bool] = NotImplemented
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __eq__(self, other):
+        if not isinstance(other, Symbol):
+            return NotImplemented
+        return self.is_term == other.is_term and self.name == other.name
+
+    def __ne__(self, other):
+        return not (self == other)
+
+    def __hash__(self):
+        return hash(self.name)
+
+    def __repr__(self):
+        return '%s(%r)' % (type(self).__name__, self.name)
+
+    fullrepr = property(__repr__)
+
+    def renamed(self, f):
+        return type(self)(f(self.name))
+
+
+class Terminal(Symbol):
+    __serialize_fields__ = 'name', 'filter_out'
+
+    is_term: ClassVar[bool] = True
+
+    def __init__(self, name: str, filter_out: bool = False) -> None:
+        self.name = name
+        self.filter_out = filter_out
+
+    @property
+    def fullrepr(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.filter_out)
+
+    def renamed(self, f):
+        return type(self)(f(self.name), self.filter_out)
+
+
+class NonTerminal(Symbol):
+    __serialize_fields__ = 'name',
+
+    is_term: ClassVar[bool] = False
+
+    def serialize(self, memo=None) -> Dict[str, Any]:
+        ##
+
+        ##
+
+        return {'name': str(self.name), '__type__': 'NonTerminal'}
+
+
+class RuleOptions(Serialize):
+    __serialize_fields__ = 'keep_all_tokens', 'expand1', 'priority', 'template_source', 'empty_indices'
+
+    keep_all_tokens: bool
+    expand1: bool
+    priority: Optional[int]
+    template_source: Optional[str]
+    empty_indices: Tuple[bool, ...]
+
+    def __init__(self, keep_all_tokens: bool=False, expand1: bool=False, priority: Optional[int]=None, template_source: Optional[str]=None, empty_indices: Tuple[bool, ...]=()) -> None:
+        self.keep_all_tokens = keep_all_tokens
+        self.expand1 = expand1
+        self.priority = priority
+        self.template_source = template_source
+        self.empty_indices = empty_indices
+
+    def __repr__(self):
+        return 'RuleOptions(%r, %r, %r, %r)' % (
+            self.keep_all_tokens,
+            self.expand1,
+            self.priority,
+            self.template_source
+        )
+
+
+class Rule(Serialize):
+    #--
+    __slots__ = ('origin', 'expansion', 'alias', 'options', 'order', '_hash')
+
+    __serialize_fields__ = 'origin', 'expansion', 'order', 'alias', 'options'
+    __serialize_namespace__ = Terminal, NonTerminal, RuleOptions
+
+    origin: NonTerminal
+    expansion: Sequence[Symbol]
+    order: int
+    alias: Optional[str]
+    options: RuleOptions
+    _hash: int
+
+    def __init__(self, origin: NonTerminal, expansion: Sequence[Symbol],
+                 order: int=0, alias: Optional[str]=None, options: Optional[RuleOptions]=None):
+        self.origin = origin
+        self.expansion = expansion
+        self.alias = alias
+        self.order = order
+        self.options = options or RuleOptions()
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def _deserialize(self):
+        self._hash = hash((self.origin, tuple(self.expansion)))
+
+    def __str__(self):
+        return '<%s : %s>' % (self.origin.name, ' '.join(x.name for x in self.expansion))
+
+    def __repr__(self):
+        return 'Rule(%r, %r, %r, %r)' % (self.origin, self.expansion, self.alias, self.options)
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        if not isinstance(other, Rule):
+            return False
+        return self.origin == other.origin and self.expansion == other.expansion
+
+
+
+from contextlib import suppress
+from copy import copy
+
+try:  ##
+
+    has_interegular = bool(interegular)
+except NameError:
+    has_interegular = False
+
+class Pattern(Serialize, ABC):
+    #--
+
+    value: str
+    flags: Collection[str]
+    raw: Optional[str]
+    type: ClassVar[str]
+
+    def __init__(self, value: str, flags: Collection[str] = (), raw: Optional[str] = None) -> None:
+        self.value = value
+        self.flags = frozenset(flags)
+        self.raw = raw
+
+    def __repr__(self):
+        return repr(self.to_regexp())
+
+    ##
+
+    def __hash__(self):
+        return hash((type(self), self.value, self.flags))
+
+    def __eq__(self, other):
+        return type(self) == type(other) and self.value == other.value and self.flags == other.flags
+
+    @abstractmethod
+    def to_regexp(self) -> str:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def min_width(self) -> int:
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def max_width(self) -> int:
+        raise NotImplementedError()
+
+    def _get_flags(self, value):
+        for f in self.flags:
+            value = ('(?%s:%s)' % (f, value))
+        return value
+
+
+class PatternStr(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw'
+
+    type: ClassVar[str] = "str"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(re.escape(self.value))
+
+    @property
+    def min_width(self) -> int:
+        return len(self.value)
+
+    @property
+    def max_width(self) -> int:
+        return len(self.value)
+
+
+class PatternRE(Pattern):
+    __serialize_fields__ = 'value', 'flags', 'raw', '_width'
+
+    type: ClassVar[str] = "re"
+
+    def to_regexp(self) -> str:
+        return self._get_flags(self.value)
+
+    _width = None
+    def _get_width(self):
+        if self._width is None:
+            self._width = get_regexp_width(self.to_regexp())
+        return self._width
+
+    @property
+    def min_width(self) -> int:
+        return self._get_width()[0]
+
+    @property
+    def max_width(self) -> int:
+        return self._get_width()[1]
+
+
+class TerminalDef(Serialize):
+    #--
+    __serialize_fields__ = 'name', 'pattern', 'priority'
+    __serialize_namespace__ = PatternStr, PatternRE
+
+    name: str
+    pattern: Pattern
+    priority: int
+
+    def __init__(self, name: str, pattern: Pattern, priority: int = TOKEN_DEFAULT_PRIORITY) -> None:
+        assert isinstance(pattern, Pattern), pattern
+        self.name = name
+        self.pattern = pattern
+        self.priority = priority
+
+    def __repr__(self):
+        return '%s(%r, %r)' % (type(self).__name__, self.name, self.pattern)
+
+    def user_repr(self) -> str:
+        if self.name.startswith('__'):  ##
+
+            return self.pattern.raw or self.name
+        else:
+            return self.name
+
+_T = TypeVar('_T', bound="Token")
+
+class Token(str):
+    #--
+    __slots__ = ('type', 'start_pos', 'value', 'line', 'column', 'end_line', 'end_column', 'end_pos')
+
+    __match_args__ = ('type', 'value')
+
+    type: str
+    start_pos: Optional[int]
+    value: Any
+    line: Optional[int]
+    column: Optional[int]
+    end_line: Optional[int]
+    end_column: Optional[int]
+    end_pos: Optional[int]
+
+
+    @overload
+    def __new__(
+            cls,
+            type: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':
+        ...
+
+    @overload
+    def __new__(
+            cls,
+            type_: str,
+            value: Any,
+            start_pos: Optional[int] = None,
+            line: Optional[int] = None,
+            column: Optional[int] = None,
+            end_line: Optional[int] = None,
+            end_column: Optional[int] = None,
+            end_pos: Optional[int] = None
+    ) -> 'Token':        ...
+
+    def __new__(cls, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return cls._future_new(*args, **kwargs)
+
+
+    @classmethod
+    def _future_new(cls, type, value, start_pos=None, line=None, column=None, end_line=None, end_column=None, end_pos=None):
+        inst = super(Token, cls).__new__(cls, value)
+
+        inst.type = type
+        inst.start_pos = start_pos
+        inst.value = value
+        inst.line = line
+        inst.column = column
+        inst.end_line = end_line
+        inst.end_column = end_column
+        inst.end_pos = end_pos
+        return inst
+
+    @overload
+    def update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    @overload
+    def update(self, type_: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        ...
+
+    def update(self, *args, **kwargs):
+        if "type_" in kwargs:
+            warnings.warn("`type_` is deprecated use `type` instead", DeprecationWarning)
+
+            if "type" in kwargs:
+                raise TypeError("Error: using both 'type' and the deprecated 'type_' as arguments.")
+            kwargs["type"] = kwargs.pop("type_")
+
+        return self._future_update(*args, **kwargs)
+
+    def _future_update(self, type: Optional[str] = None, value: Optional[Any] = None) -> 'Token':
+        return Token.new_borrow_pos(
+            type if type is not None else self.type,
+            value if value is not None else self.value,
+            self
+        )
+
+    @classmethod
+    def new_borrow_pos(cls: Type[_T], type_: str, value: Any, borrow_t: 'Token') -> _T:
+        return cls(type_, value, borrow_t.start_pos, borrow_t.line, borrow_t.column, borrow_t.end_line, borrow_t.end_column, borrow_t.end_pos)
+
+    def __reduce__(self):
+        return (self.__class__, (self.type, self.value, self.start_pos, self.line, self.column))
+
+    def __repr__(self):
+        return 'Token(%r, %r)' % (self.type, self.value)
+
+    def __deepcopy__(self, memo):
+        return Token(self.type, self.value, self.start_pos, self.line, self.column)
+
+    def __eq__(self, other):
+        if isinstance(other, Token) and self.type != other.type:
+            return False
+
+        return str.__eq__(self, other)
+
+    __hash__ = str.__hash__
+
+
+class LineCounter:
+    #--
+
+    __slots__ = 'char_pos', 'line', 'column', 'line_start_pos', 'newline_char'
+
+    def __init__(self, newline_char):
+        self.newline_char = newline_char
+        self.char_pos = 0
+        self.line = 1
+        self.column = 1
+        self.line_start_pos = 0
+
+    def __eq__(self, other):
+        if not isinstance(other, LineCounter):
+            return NotImplemented
+
+        return self.char_pos == other.char_pos and self.newline_char == other.newline_char
+
+    def feed(self, token: TextOrSlice, test_newline=True):
+        #--
+        if test_newline:
+            newlines = token.count(self.newline_char)
+            if newlines:
+                self.line += newlines
+                self.line_start_pos = self.char_pos + token.rindex(self.newline_char) + 1
+
+        self.char_pos += len(token)
+        self.column = self.char_pos - self.line_start_pos + 1
+
+
+class UnlessCallback:
+    def __init__(self, scanner: 'Scanner'):
+        self.scanner = scanner
+
+    def __call__(self, t: Token):
+        res = self.scanner.fullmatch(t.value)
+        if res is not None:
+            t.type = res
+        return t
+
+
+class CallChain:
+    def __init__(self, callback1, callback2, cond):
+        self.callback1 = callback1
+        self.callback2 = callback2
+        self.cond = cond
+
+    def __call__(self, t):
+        t2 = self.callback1(t)
+        return self.callback2(t) if self.cond(t2) else t2
+
+
+def _get_match(re_, regexp, s, flags):
+    m = re_.match(regexp, s, flags)
+    if m:
+        return m.group(0)
+
+def _create_unless(terminals, g_regex_flags, re_, use_bytes):
+    tokens_by_type = classify(terminals, lambda t: type(t.pattern))
+    assert len(tokens_by_type) <= 2, tokens_by_type.keys()
+    embedded_strs = set()
+    callback = {}
+    for retok in tokens_by_type.get(PatternRE, []):
+        unless = []
+        for strtok in tokens_by_type.get(PatternStr, []):
+            if strtok.priority != retok.priority:
+                continue
+            s = strtok.pattern.value
+            if s == _get_match(re_, retok.pattern.to_regexp(), s, g_regex_flags):
+                unless.append(strtok)
+                if strtok.pattern.flags <= retok.pattern.flags:
+                    embedded_strs.add(strtok)
+        if unless:
+            callback[retok.name] = UnlessCallback(Scanner(unless, g_regex_flags, re_, use_bytes=use_bytes))
+
+    new_terminals = [t for t in terminals if t not in embedded_strs]
+    return new_terminals, callback
+
+
+class Scanner:
+    def __init__(self, terminals, g_regex_flags, re_, use_bytes):
+        self.terminals = terminals
+        self.g_regex_flags = g_regex_flags
+        self.re_ = re_
+        self.use_bytes = use_bytes
+
+        self.allowed_types = {t.name for t in self.terminals}
+
+        self._mres = self._build_mres(terminals, len(terminals))
+
+    def _build_mres(self, terminals, max_size):
+        ##
+
+        ##
+
+        ##
+
+        mres = []
+        while terminals:
+            pattern = u'|'.join(u'(?P<%s>%s)' % (t.name, t.pattern.to_regexp()) for t in terminals[:max_size])
+            if self.use_bytes:
+                pattern = pattern.encode('latin-1')
+            try:
+                mre = self.re_.compile(pattern, self.g_regex_flags)
+            except AssertionError:  ##
+
+                return self._build_mres(terminals, max_size // 2)
+
+            mres.append(mre)
+            terminals = terminals[max_size:]
+        return mres
+
+    def match(self, text: TextSlice, pos):
+        for mre in self._mres:
+            m = mre.match(text.text, pos, text.end)
+            if m:
+                return m.group(0), m.lastgroup
+
+
+    def fullmatch(self, text: str) -> Optional[str]:
+        for mre in self._mres:
+            m = mre.fullmatch(text)
+            if m:
+                return m.lastgroup
+        return None
+
+def _regexp_has_newline(r: str):
+    #--
+    return '\n' in r or '\\n' in r or '\\s' in r or '[^' in r or ('(?s' in r and '.' in r)
+
+
+class LexerState:
+    #--
+
+    __slots__ = 'text', 'line_ctr', 'last_token'
+
+    text: TextSlice
+    line_ctr: LineCounter
+    last_token: Optional[Token]
+
+    def __init__(self, text: TextSlice, line_ctr: Optional[LineCounter] = None, last_token: Optional[Token]=None):
+        if isinstance(text, TextSlice):
+            if line_ctr is None:
+                line_ctr = LineCounter(b'\n' if isinstance(text.text, bytes) else '\n')
+
+                if text.start > 0:
+                    ##
+
+                    line_ctr.feed(TextSlice(text.text, 0, text.start))
+
+            if not (text.start <= line_ctr.char_pos <= text.end):
+                raise ValueError("LineCounter.char_pos is out of bounds")
+
+        self.text = text
+        self.line_ctr = line_ctr
+        self.last_token = last_token
+
+
+    def __eq__(self, other):
+        if not isinstance(other, LexerState):
+            return NotImplemented
+
+        return self.text == other.text and self.line_ctr == other.line_ctr and self.last_token == other.last_token
+
+    def __copy__(self):
+        return type(self)(self.text, copy(self.line_ctr), self.last_token)
+
+
+class LexerThread:
+    #--
+
+    def __init__(self, lexer: 'Lexer', lexer_state: Optional[LexerState]):
+        self.lexer = lexer
+        self.state = lexer_state
+
+    @classmethod
+    def from_text(cls, lexer: 'Lexer', text_or_slice: TextOrSlice) -> 'LexerThread':
+        text = TextSlice.cast_from(text_or_slice)
+        return cls(lexer, LexerState(text))
+
+    @classmethod
+    def from_custom_input(cls, lexer: 'Lexer', text: Any) -> 'LexerThread':
+        return cls(lexer, LexerState(text))
+
+    def lex(self, parser_state):
+        if self.state is None:
+            raise TypeError("Cannot lex: No text assigned to lexer state")
+        return self.lexer.lex(self.state, parser_state)
+
+    def __copy__(self):
+        return type(self)(self.lexer, copy(self.state))
+
+    _Token = Token
+
+
+_Callback = Callable[[Token], Token]
+
+class Lexer(ABC):
+    #--
+    @abstractmethod
+    def lex(self, lexer_state: LexerState, parser_state: Any) -> Iterator[Token]:
+        return NotImplemented
+
+    def make_lexer_state(self, text: str):
+        #--
+        return LexerState(TextSlice.cast_from(text))
+
+
+def _check_regex_collisions(terminal_to_regexp: Dict[TerminalDef, str], comparator, strict_mode, max_collisions_to_show=8):
+    if not comparator:
+        comparator = interegular.Comparator.from_regexes(terminal_to_regexp)
+
+    ##
+
+    ##
+
+    max_time = 2 if strict_mode else 0.2
+
+    ##
+
+    if comparator.count_marked_pairs() >= max_collisions_to_show:
+        return
+    for group in classify(terminal_to_regexp, lambda t: t.priority).values():
+        for a, b in comparator.check(group, skip_marked=True):
+            assert a.priority == b.priority
+            ##
+
+            comparator.mark(a, b)
+
+            ##
+
+            message = f"Collision between Terminals {a.name} and {b.name}. "
+            try:
+                example = comparator.get_example_overlap(a, b, max_time).format_multiline()
+            except ValueError:
+                ##
+
+                example = "No example could be found fast enough. However, the collision does still exists"
+            if strict_mode:
+                raise LexError(f"{message}\n{example}")
+            logger.warning("%s The lexer will choose between them arbitrarily.\n%s", message, example)
+            if comparator.count_marked_pairs() >= max_collisions_to_show:
+                logger.warning("Found 8 regex collisions, will not check for more.")
+                return
+
+
+class AbstractBasicLexer(Lexer):
+    terminals_by_name: Dict[str, TerminalDef]
+
+    @abstractmethod
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        ...
+
+    @abstractmethod
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        ...
+
+    def lex(self, state: LexerState, parser_state: Any) -> Iterator[Token]:
+        with suppress(EOFError):
+            while True:
+                yield self.next_token(state, parser_state)
+
+
+class BasicLexer(AbstractBasicLexer):
+    terminals: Collection[TerminalDef]
+    ignore_types: FrozenSet[str]
+    newline_types: FrozenSet[str]
+    user_callbacks: Dict[str, _Callback]
+    callback: Dict[str, _Callback]
+    re: ModuleType
+
+    def __init__(self, conf: 'LexerConf', comparator=None) -> None:
+        terminals = list(conf.terminals)
+        assert all(isinstance(t, TerminalDef) for t in terminals), terminals
+
+        self.re = conf.re_module
+
+        if not conf.skip_validation:
+            ##
+
+            terminal_to_regexp = {}
+            for t in terminals:
+                regexp = t.pattern.to_regexp()
+                try:
+                    self.re.compile(regexp, conf.g_regex_flags)
+                except self.re.error:
+                    raise LexError("Cannot compile token %s: %s" % (t.name, t.pattern))
+
+                if t.pattern.min_width == 0:
+                    raise LexError("Lexer does not allow zero-width terminals. (%s: %s)" % (t.name, t.pattern))
+                if t.pattern.type == "re":
+                    terminal_to_regexp[t] = regexp
+
+            if not (set(conf.ignore) <= {t.name for t in terminals}):
+                raise LexError("Ignore terminals are not defined: %s" % (set(conf.ignore) - {t.name for t in terminals}))
+
+            if has_interegular:
+                _check_regex_collisions(terminal_to_regexp, comparator, conf.strict)
+            elif conf.strict:
+                raise LexError("interegular must be installed for strict mode. Use `pip install 'lark[interegular]'`.")
+
+        ##
+
+        self.newline_types = frozenset(t.name for t in terminals if _regexp_has_newline(t.pattern.to_regexp()))
+        self.ignore_types = frozenset(conf.ignore)
+
+        terminals.sort(key=lambda x: (-x.priority, -x.pattern.max_width, -len(x.pattern.value), x.name))
+        self.terminals = terminals
+        self.user_callbacks = conf.callbacks
+        self.g_regex_flags = conf.g_regex_flags
+        self.use_bytes = conf.use_bytes
+        self.terminals_by_name = conf.terminals_by_name
+
+        self._scanner: Optional[Scanner] = None
+
+    def _build_scanner(self) -> Scanner:
+        terminals, self.callback = _create_unless(self.terminals, self.g_regex_flags, self.re, self.use_bytes)
+        assert all(self.callback.values())
+
+        for type_, f in self.user_callbacks.items():
+            if type_ in self.callback:
+                ##
+
+                self.callback[type_] = CallChain(self.callback[type_], f, lambda t: t.type == type_)
+            else:
+                self.callback[type_] = f
+
+        return Scanner(terminals, self.g_regex_flags, self.re, self.use_bytes)
+
+    @property
+    def scanner(self) -> Scanner:
+        if self._scanner is None:
+            self._scanner = self._build_scanner()
+        return self._scanner
+
+    def match(self, text, pos):
+        return self.scanner.match(text, pos)
+
+    def next_token(self, lex_state: LexerState, parser_state: Any = None) -> Token:
+        line_ctr = lex_state.line_ctr
+        while line_ctr.char_pos < lex_state.text.end:
+            res = self.match(lex_state.text, line_ctr.char_pos)
+            if not res:
+                allowed = self.scanner.allowed_types - self.ignore_types
+                if not allowed:
+                    allowed = {"<END-OF-FILE>"}
+                raise UnexpectedCharacters(lex_state.text.text, line_ctr.char_pos, line_ctr.line, line_ctr.column,
+                                           allowed=allowed, token_history=lex_state.last_token and [lex_state.last_token],
+                                           state=parser_state, terminals_by_name=self.terminals_by_name)
+
+            value, type_ = res
+
+            ignored = type_ in self.ignore_types
+            t = None
+            if not ignored or type_ in self.callback:
+                t = Token(type_, value, line_ctr.char_pos, line_ctr.line, line_ctr.column)
+            line_ctr.feed(value, type_ in self.newline_types)
+            if t is not None:
+                t.end_line = line_ctr.line
+                t.end_column = line_ctr.column
+                t.end_pos = line_ctr.char_pos
+                if t.type in self.callback:
+                    t = self.callback[t.type](t)
+                if not ignored:
+                    if not isinstance(t, Token):
+                        raise LexError("Callbacks must return a token (returned %r)" % t)
+                    lex_state.last_token = t
+                    return t
+
+        ##
+
+        raise EOFError(self)
+
+
+class ContextualLexer(Lexer):
+    lexers: Dict[int, AbstractBasicLexer]
+    root_lexer: AbstractBasicLexer
+
+    BasicLexer: Type[AbstractBasicLexer] = BasicLexer
+
+    def __init__(self, conf: 'LexerConf', states: Dict[int, Collection[str]], always_accept: Collection[str]=()) -> None:
+        terminals = list(conf.terminals)
+        terminals_by_name = conf.terminals_by_name
+
+        trad_conf = copy(conf)
+        trad_conf.terminals = terminals
+
+        if has_interegular and not conf.skip_validation:
+            comparator = interegular.Comparator.from_regexes({t: t.pattern.to_regexp() for t in terminals})
+        else:
+            comparator = None
+        lexer_by_tokens: Dict[FrozenSet[str], AbstractBasicLexer] = {}
+        self.lexers = {}
+        for state, accepts in states.items():
+            key = frozenset(accepts)
+            try:
+                lexer = lexer_by_tokens[key]
+            except KeyError:
+                accepts = set(accepts) | set(conf.ignore) | set(always_accept)
+                lexer_conf = copy(trad_conf)
+                lexer_conf.terminals = [terminals_by_name[n] for n in accepts if n in terminals_by_name]
+                lexer = self.BasicLexer(lexer_conf, comparator)
+                lexer_by_tokens[key] = lexer
+
+            self.lexers[state] = lexer
+
+        assert trad_conf.terminals is terminals
+        trad_conf.skip_validation = True  ##
+
+        self.root_lexer = self.BasicLexer(trad_conf, comparator)
+
+    def lex(self, lexer_state: LexerState, parser_state: 'ParserState') -> Iterator[Token]:
+        try:
+            while True:
+                lexer = self.lexers[parser_state.position]
+                yield lexer.next_token(lexer_state, parser_state)
+        except EOFError:
+            pass
+        except UnexpectedCharacters as e:
+            ##
+
+            ##
+
+            try:
+                last_token = lexer_state.last_token  ##
+
+                token = self.root_lexer.next_token(lexer_state, parser_state)
+                raise UnexpectedToken(token, e.allowed, state=parser_state, token_history=[last_token], terminals_by_name=self.root_lexer.terminals_by_name)
+            except UnexpectedCharacters:
+                raise e  ##
+
+
+
+
+_ParserArgType: 'TypeAlias' = 'Literal["earley", "lalr", "cyk", "auto"]'
+_LexerArgType: 'TypeAlias' = 'Union[Literal["auto", "basic", "contextual", "dynamic", "dynamic_complete"], Type[Lexer]]'
+_LexerCallback = Callable[[Token], Token]
+ParserCallbacks = Dict[str, Callable]
+
+class LexerConf(Serialize):
+    __serialize_fields__ = 'terminals', 'ignore', 'g_regex_flags', 'use_bytes', 'lexer_type'
+    __serialize_namespace__ = TerminalDef,
+
+    terminals: Collection[TerminalDef]
+    re_module: ModuleType
+    ignore: Collection[str]
+    postlex: 'Optional[PostLex]'
+    callbacks: Dict[str, _LexerCallback]
+    g_regex_flags: int
+    skip_validation: bool
+    use_bytes: bool
+    lexer_type: Optional[_LexerArgType]
+    strict: bool
+
+    def __init__(self, terminals: Collection[TerminalDef], re_module: ModuleType, ignore: Collection[str]=(), postlex: 'Optional[PostLex]'=None,
+                 callbacks: Optional[Dict[str, _LexerCallback]]=None, g_regex_flags: int=0, skip_validation: bool=False, use_bytes: bool=False, strict: bool=False):
+        self.terminals = terminals
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+        assert len(self.terminals) == len(self.terminals_by_name)
+        self.ignore = ignore
+        self.postlex = postlex
+        self.callbacks = callbacks or {}
+        self.g_regex_flags = g_regex_flags
+        self.re_module = re_module
+        self.skip_validation = skip_validation
+        self.use_bytes = use_bytes
+        self.strict = strict
+        self.lexer_type = None
+
+    def _deserialize(self):
+        self.terminals_by_name = {t.name: t for t in self.terminals}
+
+    def __deepcopy__(self, memo=None):
+        return type(self)(
+            deepcopy(self.terminals, memo),
+            self.re_module,
+            deepcopy(self.ignore, memo),
+            deepcopy(self.postlex, memo),
+            deepcopy(self.callbacks, memo),
+            deepcopy(self.g_regex_flags, memo),
+            deepcopy(self.skip_validation, memo),
+            deepcopy(self.use_bytes, memo),
+        )
+
+class ParserConf(Serialize):
+    __serialize_fields__ = 'rules', 'start', 'parser_type'
+
+    rules: List['Rule']
+    callbacks: ParserCallbacks
+    start: List[str]
+    parser_type: _ParserArgType
+
+    def __init__(self, rules: List['Rule'], callbacks: ParserCallbacks, start: List[str]):
+        assert isinstance(start, list)
+        self.rules = rules
+        self.callbacks = callbacks
+        self.start = start
+
+
+from functools import partial, wraps
+from itertools import product
+
+
+class ExpandSingleChild:
+    def __init__(self, node_builder):
+        self.node_builder = node_builder
+
+    def __call__(self, children):
+        if len(children) == 1:
+            return children[0]
+        else:
+            return self.node_builder(children)
+
+
+
+class PropagatePositions:
+    def __init__(self, node_builder, node_filter=None):
+        self.node_builder = node_builder
+        self.node_filter = node_filter
+
+    def __call__(self, children):
+        res = self.node_builder(children)
+
+        if isinstance(res, Tree):
+            ##
+
+            ##
+
+            ##
+
+            ##
+
+
+            res_meta = res.meta
+
+            first_meta = self._pp_get_meta(children)
+            if first_meta is not None:
+                if not hasattr(res_meta, 'line'):
+                    ##
+
+                    res_meta.line = getattr(first_meta, 'container_line', first_meta.line)
+                    res_meta.column = getattr(first_meta, 'container_column', first_meta.column)
+                    res_meta.start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+                    res_meta.empty = False
+
+                res_meta.container_line = getattr(first_meta, 'container_line', first_meta.line)
+                res_meta.container_column = getattr(first_meta, 'container_column', first_meta.column)
+                res_meta.container_start_pos = getattr(first_meta, 'container_start_pos', first_meta.start_pos)
+
+            last_meta = self._pp_get_meta(reversed(children))
+            if last_meta is not None:
+                if not hasattr(res_meta, 'end_line'):
+                    res_meta.end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                    res_meta.end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                    res_meta.end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+                    res_meta.empty = False
+
+                res_meta.container_end_line = getattr(last_meta, 'container_end_line', last_meta.end_line)
+                res_meta.container_end_column = getattr(last_meta, 'container_end_column', last_meta.end_column)
+                res_meta.container_end_pos = getattr(last_meta, 'container_end_pos', last_meta.end_pos)
+
+        return res
+
+    def _pp_get_meta(self, children):
+        for c in children:
+            if self.node_filter is not None and not self.node_filter(c):
+                continue
+            if isinstance(c, Tree):
+                if not c.meta.empty:
+                    return c.meta
+            elif isinstance(c, Token):
+                return c
+            elif hasattr(c, '__lark_meta__'):
+                return c.__lark_meta__()
+
+def make_propagate_positions(option):
+    if callable(option):
+        return partial(PropagatePositions, node_filter=option)
+    elif option is True:
+        return PropagatePositions
+    elif option is False:
+        return None
+
+    raise ConfigurationError('Invalid option for propagate_positions: %r' % option)
+
+
+class ChildFilter:
+    def __init__(self, to_include, append_none, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+        self.append_none = append_none
+
+    def __call__(self, children):
+        filtered = []
+
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                filtered += children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR(ChildFilter):
+    #--
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand, add_none in self.to_include:
+            if add_none:
+                filtered += [None] * add_none
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+
+        if self.append_none:
+            filtered += [None] * self.append_none
+
+        return self.node_builder(filtered)
+
+
+class ChildFilterLALR_NoPlaceholders(ChildFilter):
+    #--
+    def __init__(self, to_include, node_builder):
+        self.node_builder = node_builder
+        self.to_include = to_include
+
+    def __call__(self, children):
+        filtered = []
+        for i, to_expand in self.to_include:
+            if to_expand:
+                if filtered:
+                    filtered += children[i].children
+                else:   ##
+
+                    filtered = children[i].children
+            else:
+                filtered.append(children[i])
+        return self.node_builder(filtered)
+
+
+def _should_expand(sym):
+    return not sym.is_term and sym.name.startswith('_')
+
+
+def maybe_create_child_filter(expansion, keep_all_tokens, ambiguous, _empty_indices: List[bool]):
+    ##
+
+    if _empty_indices:
+        assert _empty_indices.count(False) == len(expansion)
+        s = ''.join(str(int(b)) for b in _empty_indices)
+        empty_indices = [len(ones) for ones in s.split('0')]
+        assert len(empty_indices) == len(expansion)+1, (empty_indices, len(expansion))
+    else:
+        empty_indices = [0] * (len(expansion)+1)
+
+    to_include = []
+    nones_to_add = 0
+    for i, sym in enumerate(expansion):
+        nones_to_add += empty_indices[i]
+        if keep_all_tokens or not (sym.is_term and sym.filter_out):
+            to_include.append((i, _should_expand(sym), nones_to_add))
+            nones_to_add = 0
+
+    nones_to_add += empty_indices[len(expansion)]
+
+    if _empty_indices or len(to_include) < len(expansion) or any(to_expand for i, to_expand,_ in to_include):
+        if _empty_indices or ambiguous:
+            return partial(ChildFilter if ambiguous else ChildFilterLALR, to_include, nones_to_add)
+        else:
+            ##
+
+            return partial(ChildFilterLALR_NoPlaceholders, [(i, x) for i,x,_ in to_include])
+
+
+class AmbiguousExpander:
+    #--
+    def __init__(self, to_expand, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+        self.to_expand = to_expand
+
+    def __call__(self, children):
+        def _is_ambig_tree(t):
+            return hasattr(t, 'data') and t.data == '_ambig'
+
+        ##
+
+        ##
+
+        ##
+
+        ##
+
+        ambiguous = []
+        for i, child in enumerate(children):
+            if _is_ambig_tree(child):
+                if i in self.to_expand:
+                    ambiguous.append(i)
+
+                child.expand_kids_by_data('_ambig')
+
+        if not ambiguous:
+            return self.node_builder(children)
+
+        expand = [child.children if i in ambiguous else (child,) for i, child in enumerate(children)]
+        return self.tree_class('_ambig', [self.node_builder(list(f)) for f in product(*expand)])
+
+
+def maybe_create_ambiguous_expander(tree_class, expansion, keep_all_tokens):
+    to_expand = [i for i, sym in enumerate(expansion)
+                 if keep_all_tokens or ((not (sym.is_term and sym.filter_out)) and _should_expand(sym))]
+    if to_expand:
+        return partial(AmbiguousExpander, to_expand, tree_class)
+
+
+class AmbiguousIntermediateExpander:
+    #--
+
+    def __init__(self, tree_class, node_builder):
+        self.node_builder = node_builder
+        self.tree_class = tree_class
+
+    def __call__(self, children):
+        def _is_iambig_tree(child):
+            return hasattr(child, 'data') and child.data == '_iambig'
+
+        def _collapse_iambig(children):
+            #--
+
+            ##
+
+            ##
+
+            if children and _is_iambig_tree(children[0]):
+                iambig_node = children[0]
+                result = []
+                for grandchild in iambig_node.children:
+                    collapsed = _collapse_iambig(grandchild.children)
+                    if collapsed:
+                        for child in collapsed:
+                            child.children += children[1:]
+                        result += collapsed
+                    else:
+                        new_tree = self.tree_class('_inter', grandchild.children + children[1:])
+                        result.append(new_tree)
+                return result
+
+        collapsed = _collapse_iambig(children)
+        if collapsed:
+            processed_nodes = [self.node_builder(c.children) for c in collapsed]
+            return self.tree_class('_ambig', processed_nodes)
+
+        return self.node_builder(children)
+
+
+
+def inplace_transformer(func):
+    @wraps(func)
+    def f(children):
+        ##
+
+        tree = Tree(func.__name__, children)
+        return func(tree)
+    return f
+
+
+def apply_visit_wrapper(func, name, wrapper):
+    if wrapper is _vargs_meta or wrapper is _vargs_meta_inline:
+        raise NotImplementedError("Meta args not supported for internal transformer; use YourTransformer().transform(parser.parse()) instead")
+
+    @wraps(func)
+    def f(children):
+        return wrapper(func, name, children, None)
+    return f
+
+
+class ParseTreeBuilder:
+    def __init__(self, rules, tree_class, propagate_positions=False, ambiguous=False, maybe_placeholders=False):
+        self.tree_class = tree_class
+        self.propagate_positions = propagate_positions
+        self.ambiguous = ambiguous
+        self.maybe_placeholders = maybe_placeholders
+
+        self.rule_builders = list(self._init_builders(rules))
+
+    def _init_builders(self, rules):
+        propagate_positions = make_propagate_positions(self.propagate_positions)
+
+        for rule in rules:
+            options = rule.options
+            keep_all_tokens = options.keep_all_tokens
+            expand_single_child = options.expand1
+
+            wrapper_chain = list(filter(None, [
+                (expand_single_child and not rule.alias) and ExpandSingleChild,
+                maybe_create_child_filter(rule.expansion, keep_all_tokens, self.ambiguous, options.empty_indices if self.maybe_placeholders else None),
+                propagate_positions,
+                self.ambiguous and maybe_create_ambiguous_expander(self.tree_class, rule.expansion, keep_all_tokens),
+                self.ambiguous and partial(AmbiguousIntermediateExpander, self.tree_class)
+            ]))
+
+            yield rule, wrapper_chain
+
+    def create_callback(self, transformer=None):
+        callbacks = {}
+
+        default_handler = getattr(transformer, '__default__', None)
+        if default_handler:
+            def default_callback(data, children):
+                return default_handler(data, children, None)
+        else:
+            default_callback = self.tree_class
+
+        for rule, wrapper_chain in self.rule_builders:
+
+            user_callback_name = rule.alias or rule.options.template_source or rule.origin.name
+            try:
+                f = getattr(transformer, user_callback_name)
+                wrapper = getattr(f, 'visit_wrapper', None)
+                if wrapper is not None:
+                    f = apply_visit_wrapper(f, user_callback_name, wrapper)
+                elif isinstance(transformer, Transformer_InPlace):
+                    f = inplace_transformer(f)
+            except AttributeError:
+                f = partial(default_callback, user_callback_name)
+
+            for w in wrapper_chain:
+                f = w(f)
+
+            if rule in callbacks:
+                raise GrammarError("Rule '%s' already exists" % (rule,))
+
+            callbacks[rule] = f
+
+        return callbacks
+
+
+
+class Action:
+    def __init__(self, name):
+        self.name = name
+    def __str__(self):
+        return self.name
+    def __repr__(self):
+        return str(self)
+
+Shift = Action('Shift')
+Reduce = Action('Reduce')
+
+StateT = TypeVar("StateT")
+
+class ParseTableBase(Generic[StateT]):
+    states: Dict[StateT, Dict[str, Tuple]]
+    start_states: Dict[str, StateT]
+    end_states: Dict[str, StateT]
+
+    def __init__(self, states, start_states, end_states):
+        self.states = states
+        self.start_states = start_states
+        self.end_states = end_states
+
+    def serialize(self, memo):
+        tokens = Enumerator()
+
+        states = {
+            state: {tokens.get(token): ((1, arg.serialize(memo)) if action is Reduce else (0, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in self.states.items()
+        }
+
+        return {
+            'tokens': tokens.reversed(),
+            'states': states,
+            'start_states': self.start_states,
+            'end_states': self.end_states,
+        }
+
+    @classmethod
+    def deserialize(cls, data, memo):
+        tokens = data['tokens']
+        states = {
+            state: {tokens[token]: ((Reduce, Rule.deserialize(arg, memo)) if action==1 else (Shift, arg))
+                    for token, (action, arg) in actions.items()}
+            for state, actions in data['states'].items()
+        }
+        return cls(states, data['start_states'], data['end_states'])
+
+class ParseTable(ParseTableBase['State']):
+    #--
+    pass
+
+
+class IntParseTable(ParseTableBase[int]):
+    #--
+
+    @classmethod
+    def from_ParseTable(cls, parse_table: ParseTable):
+        enum = list(parse_table.states)
+        state_to_idx: Dict['State', int] = {s:i for i,s in enumerate(enum)}
+        int_states = {}
+
+        for s, la in parse_table.states.items():
+            la = {k:(v[0], state_to_idx[v[1]]) if v[0] is Shift else v
+                  for k,v in la.items()}
+            int_states[ state_to_idx[s] ] = la
+
+
+        start_states = {start:state_to_idx[s] for start, s in parse_table.start_states.items()}
+        end_states = {start:state_to_idx[s] for start, s in parse_table.end_states.items()}
+        return cls(int_states, start_states, end_states)
+
+
+
+class ParseConf(Generic[StateT]):
+    __slots__ = 'parse_table', 'callbacks', 'start', 'start_state', 'end_state', 'states'
+
+    parse_table: ParseTableBase[StateT]
+    callbacks: ParserCallbacks
+    start: str
+
+    start_state: StateT
+    end_state: StateT
+    states: Dict[StateT, Dict[str, tuple]]
+
+    def __init__(self, parse_table: ParseTableBase[StateT], callbacks: ParserCallbacks, start: str):
+        self.parse_table = parse_table
+
+        self.start_state = self.parse_table.start_states[start]
+        self.end_state = self.parse_table.end_states[start]
+        self.states = self.parse_table.states
+
+        self.callbacks = callbacks
+        self.start = start
+
+class ParserState(Generic[StateT]):
+    __slots__ = 'parse_conf', 'lexer', 'state_stack', 'value_stack'
+
+    parse_conf: ParseConf[StateT]
+    lexer: LexerThread
+    state_stack: List[StateT]
+    value_stack: list
+
+    def __init__(self, parse_conf: ParseConf[StateT], lexer: LexerThread, state_stack=None, value_stack=None):
+        self.parse_conf = parse_conf
+        self.lexer = lexer
+        self.state_stack = state_stack or [self.parse_conf.start_state]
+        self.value_stack = value_stack or []
+
+    @property
+    def position(self) -> StateT:
+        return self.state_stack[-1]
+
+    ##
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ParserState):
+            return NotImplemented
+        return len(self.state_stack) == len(other.state_stack) and self.position == other.position
+
+    def __copy__(self):
+        return self.copy()
+
+    def copy(self, deepcopy_values=True) -> 'ParserState[StateT]':
+        return type(self)(
+            self.parse_conf,
+            self.lexer, ##
+
+            copy(self.state_stack),
+            deepcopy(self.value_stack) if deepcopy_values else copy(self.value_stack),
+        )
+
+    def feed_token(self, token: Token, is_end=False) -> Any:
+        state_stack = self.state_stack
+        value_stack = self.value_stack
+        states = self.parse_conf.states
+        end_state = self.parse_conf.end_state
+        callbacks = self.parse_conf.callbacks
+
+        while True:
+            state = state_stack[-1]
+            try:
+                action, arg = states[state][token.type]
+            except KeyError:
+                expected = {s for s in states[state].keys() if s.isupper()}
+                raise UnexpectedToken(token, expected, state=self, interactive_parser=None)
+
+            assert arg != end_state
+
+            if action is Shift:
+                ##
+
+                assert not is_end
+                state_stack.append(arg)
+                value_stack.append(token if token.type not in callbacks else callbacks[token.type](token))
+                return
+            else:
+                ##
+
+                rule = arg
+                size = len(rule.expansion)
+                if size:
+                    s = value_stack[-size:]
+                    del state_stack[-size:]
+                    del value_stack[-size:]
+                else:
+                    s = []
+
+                value = callbacks[rule](s) if callbacks else s
+
+                _action, new_state = states[state_stack[-1]][rule.origin.name]
+                assert _action is Shift
+                state_stack.append(new_state)
+                value_stack.append(value)
+
+                if is_end and state_stack[-1] == end_state:
+                    return value_stack[-1]
+
+
+class LALR_Parser(Serialize):
+    def __init__(self, parser_conf: ParserConf, debug: bool=False, strict: bool=False):
+        analysis = LALR_Analyzer(parser_conf, debug=debug, strict=strict)
+        analysis.compute_lalr()
+        callbacks = parser_conf.callbacks
+
+        self._parse_table = analysis.parse_table
+        self.parser_conf = parser_conf
+        self.parser = _Parser(analysis.parse_table, callbacks, debug)
+
+    @classmethod
+    def deserialize(cls, data, memo, callbacks, debug=False):
+        inst = cls.__new__(cls)
+        inst._parse_table = IntParseTable.deserialize(data, memo)
+        inst.parser = _Parser(inst._parse_table, callbacks, debug)
+        return inst
+
+    def serialize(self, memo: Any = None) -> Dict[str, Any]:
+        return self._parse_table.serialize(memo)
+
+    def parse_interactive(self, lexer: LexerThread, start: str):
+        return self.parser.parse(lexer, start, start_interactive=True)
+
+    def parse(self, lexer, start, on_error=None):
+        try:
+            return self.parser.parse(lexer, start)
+        except UnexpectedInput as e:
+            if on_error is None:
+                raise
+
+            while True:
+                if isinstance(e, UnexpectedCharacters):
+                    s = e.interactive_parser.lexer_thread.state
+                    p = s.line_ctr.char_pos
+
+                if not on_error(e):
+                    raise e
+
+                if isinstance(e, UnexpectedCharacters):
+                    ##
+
+                    if p == s.line_ctr.char_pos:
+                        s.line_ctr.feed(s.text.text[p:p+1])
+
+                try:
+                    return e.interactive_parser.resume_parse()
+                except UnexpectedToken as e2:
+                    if (isinstance(e, UnexpectedToken)
+                        and e.token.type == e2.token.type == '$END'
+                        and e.interactive_parser == e2.interactive_parser):
+                        ##
+
+                        raise e2
+                    e = e2
+                except UnexpectedCharacters as e2:
+                    e = e2
+
+
+class _Parser:
+    parse_table: ParseTableBase
+    callbacks: ParserCallbacks
+    debug: bool
+
+    def __init__(self, parse_table: ParseTableBase, callbacks: ParserCallbacks, debug: bool=False):
+        self.parse_table = parse_table
+        self.callbacks = callbacks
+        self.debug = debug
+
+    def parse(self, lexer: LexerThread, start: str, value_stack=None, state_stack=None, start_interactive=False):
+        parse_conf = ParseConf(self.parse_table, self.callbacks, start)
+        parser_state = ParserState(parse_conf, lexer, state_stack, value_stack)
+        if start_interactive:
+            return InteractiveParser(self, parser_state, parser_state.lexer)
+        return self.parse_from_state(parser_state)
+
+
+    def parse_from_state(self, state: ParserState, last_token: Optional[Token]=None):
+        #--
+        try:
+            token = last_token
+            for token in state.lexer.lex(state):
+                assert token is not None
+                state.feed_token(token)
+
+            end_token = Token.new_borrow_pos('$END', '', token) if token else Token('$END', '', 0, 1, 1)
+            return state.feed_token(end_token, True)
+        except UnexpectedInput as e:
+            try:
+                e.interactive_parser = InteractiveParser(self, state, state.lexer)
+            except NameError:
+                pass
+            raise e
+        except Exception as e:
+            if self.debug:
+                print("")
+                print("STATE STACK DUMP")
+                print("----------------")
+                for i, s in enumerate(state.state_stack):
+                    print('%d)' % i , s)
+                print("")
+
+            raise
+
+
+class InteractiveParser:
+    #--
+    def __init__(self, parser, parser_state: ParserState, lexer_thread: LexerThread):
+        self.parser = parser
+        self.parser_state = parser_state
+        self.lexer_thread = lexer_thread
+        self.result = None
+
+    @property
+    def lexer_state(self) -> LexerThread:
+        warnings.warn("lexer_state will be removed in subsequent releases. Use lexer_thread instead.", DeprecationWarning)
+        return self.lexer_thread
+
+    def feed_token(self, token: Token):
+        #--
+        return self.parser_state.feed_token(token, token.type == '$END')
+
+    def iter_parse(self) -> Iterator[Token]:
+        #--
+        for token in self.lexer_thread.lex(self.parser_state):
+            yield token
+            self.result = self.feed_token(token)
+
+    def exhaust_lexer(self) -> List[Token]:
+        #--
+        return list(self.iter_parse())
+
+
+    def feed_eof(self, last_token=None):
+        #--
+        eof = Token.new_borrow_pos('$END', '', last_token) if last_token is not None else self.lexer_thread._Token('$END', '', 0, 1, 1)
+        return self.feed_token(eof)
+
+
+    def __copy__(self):
+        #--
+        return self.copy()
+
+    def copy(self, deepcopy_values=True):
+        return type(self)(
+            self.parser,
+            self.parser_state.copy(deepcopy_values=deepcopy_values),
+            copy(self.lexer_thread),
+        )
+
+    def __eq__(self, other):
+        if not isinstance(other, InteractiveParser):
+            return False
+
+        return self.parser_state == other.parser_state and self.lexer_thread == other.lexer_thread
+
+    def as_immutable(self):
+        #--
+        p = copy(self)
+        return ImmutableInteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+    def pretty(self):
+        #--
+        out = ["Parser choices:"]
+        for k, v in self.choices().items():
+            out.append('\t- %s -> %r' % (k, v))
+        out.append('stack size: %s' % len(self.parser_state.state_stack))
+        return '\n'.join(out)
+
+    def choices(self):
+        #--
+        return self.parser_state.parse_conf.parse_table.states[self.parser_state.position]
+
+    def accepts(self):
+        #--
+        accepts = set()
+        conf_no_callbacks = copy(self.parser_state.parse_conf)
+        ##
+
+        ##
+
+        conf_no_callbacks.callbacks = {}
+        for t in self.choices():
+            if t.isupper(): ##
+
+                new_cursor = self.copy(deepcopy_values=False)
+                new_cursor.parser_state.parse_conf = conf_no_callbacks
+                try:
+                    new_cursor.feed_token(self.lexer_thread._Token(t, ''))
+                except UnexpectedToken:
+                    pass
+                else:
+                    accepts.add(t)
+        return accepts
+
+    def resume_parse(self):
+        #--
+        return self.parser.parse_from_state(self.parser_state, last_token=self.lexer_thread.state.last_token)
+
+
+
+class ImmutableInteractiveParser(InteractiveParser):
+    #--
+
+    result = None
+
+    def __hash__(self):
+        return hash((self.parser_state, self.lexer_thread))
+
+    def feed_token(self, token):
+        c = copy(self)
+        c.result = InteractiveParser.feed_token(c, token)
+        return c
+
+    def exhaust_lexer(self):
+        #--
+        cursor = self.as_mutable()
+        cursor.exhaust_lexer()
+        return cursor.as_immutable()
+
+    def as_mutable(self):
+        #--
+        p = copy(self)
+        return InteractiveParser(p.parser, p.parser_state, p.lexer_thread)
+
+
+
+def _wrap_lexer(lexer_class):
+    future_interface = getattr(lexer_class, '__future_interface__', 0)
+    if future_interface == 2:
+        return lexer_class
+    elif future_interface == 1:
+        class CustomLexerWrapper1(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice) and not lexer_state.text.is_complete_text():
+                    raise TypeError("Interface=1 Custom Lexer don't support TextSlice")
+                lexer_state.text = lexer_state.text
+                return self.lexer.lex(lexer_state, parser_state)
+        return CustomLexerWrapper1
+    elif future_interface == 0:
+        class CustomLexerWrapper0(Lexer):
+            def __init__(self, lexer_conf):
+                self.lexer = lexer_class(lexer_conf)
+
+            def lex(self, lexer_state, parser_state):
+                if isinstance(lexer_state.text, TextSlice):
+                    if not lexer_state.text.is_complete_text():
+                        raise TypeError("Interface=0 Custom Lexer don't support TextSlice")
+                    return self.lexer.lex(lexer_state.text.text)
+                return self.lexer.lex(lexer_state.text)
+        return CustomLexerWrapper0
+    else:
+        raise ValueError(f"Unknown __future_interface__ value {future_interface}, integer 0-2 expected")
+
+
+def _deserialize_parsing_frontend(data, memo, lexer_conf, callbacks, options):
+    parser_conf = ParserConf.deserialize(data['parser_conf'], memo)
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    parser = cls.deserialize(data['parser'], memo, callbacks, options.debug)
+    parser_conf.callbacks = callbacks
+    return ParsingFrontend(lexer_conf, parser_conf, options, parser=parser)
+
+
+_parser_creators: 'Dict[str, Callable[[LexerConf, Any, Any], Any]]' = {}
+
+
+class ParsingFrontend(Serialize):
+    __serialize_fields__ = 'lexer_conf', 'parser_conf', 'parser'
+
+    lexer_conf: LexerConf
+    parser_conf: ParserConf
+    options: Any
+
+    def __init__(self, lexer_conf: LexerConf, parser_conf: ParserConf, options, parser=None):
+        self.parser_conf = parser_conf
+        self.lexer_conf = lexer_conf
+        self.options = options
+
+        ##
+
+        if parser:  ##
+
+            self.parser = parser
+        else:
+            create_parser = _parser_creators.get(parser_conf.parser_type)
+            assert create_parser is not None, "{} is not supported in standalone mode".format(
+                    parser_conf.parser_type
+                )
+            self.parser = create_parser(lexer_conf, parser_conf, options)
+
+        ##
+
+        lexer_type = lexer_conf.lexer_type
+        self.skip_lexer = False
+        if lexer_type in ('dynamic', 'dynamic_complete'):
+            assert lexer_conf.postlex is None
+            self.skip_lexer = True
+            return
+
+        if isinstance(lexer_type, type):
+            assert issubclass(lexer_type, Lexer)
+            self.lexer = _wrap_lexer(lexer_type)(lexer_conf)
+        elif isinstance(lexer_type, str):
+            create_lexer = {
+                'basic': create_basic_lexer,
+                'contextual': create_contextual_lexer,
+            }[lexer_type]
+            self.lexer = create_lexer(lexer_conf, self.parser, lexer_conf.postlex, options)
+        else:
+            raise TypeError("Bad value for lexer_type: {lexer_type}")
+
+        if lexer_conf.postlex:
+            self.lexer = PostLexConnector(self.lexer, lexer_conf.postlex)
+
+    def _verify_start(self, start=None):
+        if start is None:
+            start_decls = self.parser_conf.start
+            if len(start_decls) > 1:
+                raise ConfigurationError("Lark initialized with more than 1 possible start rule. Must specify which start rule to parse", start_decls)
+            start ,= start_decls
+        elif start not in self.parser_conf.start:
+            raise ConfigurationError("Unknown start rule %s. Must be one of %r" % (start, self.parser_conf.start))
+        return start
+
+    def _make_lexer_thread(self, text: Optional[LarkInput]) -> Union[LarkInput, LexerThread, None]:
+        cls = (self.options and self.options._plugins.get('LexerThread')) or LexerThread
+        if self.skip_lexer:
+            return text
+        if text is None:
+            return cls(self.lexer, None)
+        if isinstance(text, (str, bytes, TextSlice)):
+            return cls.from_text(self.lexer, text)
+        return cls.from_custom_input(self.lexer, text)
+
+    def parse(self, text: Optional[LarkInput], start=None, on_error=None):
+        if self.lexer_conf.lexer_type in ("dynamic", "dynamic_complete"):
+            if isinstance(text, TextSlice) and not text.is_complete_text():
+                raise TypeError(f"Lexer {self.lexer_conf.lexer_type} does not support text slices.")
+
+        chosen_start = self._verify_start(start)
+        kw = {} if on_error is None else {'on_error': on_error}
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse(stream, chosen_start, **kw)
+
+    def parse_interactive(self, text: Optional[TextOrSlice]=None, start=None):
+        ##
+
+        ##
+
+        chosen_start = self._verify_start(start)
+        if self.parser_conf.parser_type != 'lalr':
+            raise ConfigurationError("parse_interactive() currently only works with parser='lalr' ")
+        stream = self._make_lexer_thread(text)
+        return self.parser.parse_interactive(stream, chosen_start)
+
+
+def _validate_frontend_args(parser, lexer) -> None:
+    assert_config(parser, ('lalr', 'earley', 'cyk'))
+    if not isinstance(lexer, type):     ##
+
+        expected = {
+            'lalr': ('basic', 'contextual'),
+            'earley': ('basic', 'dynamic', 'dynamic_complete'),
+            'cyk': ('basic', ),
+         }[parser]
+        assert_config(lexer, expected, 'Parser %r does not support lexer %%r, expected one of %%s' % parser)
+
+
+def _get_lexer_callbacks(transformer, terminals):
+    result = {}
+    for terminal in terminals:
+        callback = getattr(transformer, terminal.name, None)
+        if callback is not None:
+            result[terminal.name] = callback
+    return result
+
+class PostLexConnector:
+    def __init__(self, lexer, postlexer):
+        self.lexer = lexer
+        self.postlexer = postlexer
+
+    def lex(self, lexer_state, parser_state):
+        i = self.lexer.lex(lexer_state, parser_state)
+        return self.postlexer.process(i)
+
+
+
+def create_basic_lexer(lexer_conf, parser, postlex, options) -> BasicLexer:
+    cls = (options and options._plugins.get('BasicLexer')) or BasicLexer
+    return cls(lexer_conf)
+
+def create_contextual_lexer(lexer_conf: LexerConf, parser, postlex, options) -> ContextualLexer:
+    cls = (options and options._plugins.get('ContextualLexer')) or ContextualLexer
+    parse_table: ParseTableBase[int] = parser._parse_table
+    states: Dict[int, Collection[str]] = {idx:list(t.keys()) for idx, t in parse_table.states.items()}
+    always_accept: Collection[str] = postlex.always_accept if postlex else ()
+    return cls(lexer_conf, states, always_accept=always_accept)
+
+def create_lalr_parser(lexer_conf: LexerConf, parser_conf: ParserConf, options=None) -> LALR_Parser:
+    debug = options.debug if options else False
+    strict = options.strict if options else False
+    cls = (options and options._plugins.get('LALR_Parser')) or LALR_Parser
+    return cls(parser_conf, debug=debug, strict=strict)
+
+_parser_creators['lalr'] = create_lalr_parser
+
+
+
+
+class PostLex(ABC):
+    @abstractmethod
+    def process(self, stream: Iterator[Token]) -> Iterator[Token]:
+        return stream
+
+    always_accept: Iterable[str] = ()
+
+class LarkOptions(Serialize):
+    #--
+
+    start: List[str]
+    debug: bool
+    strict: bool
+    transformer: 'Optional[Transformer]'
+    propagate_positions: Union[bool, str]
+    maybe_placeholders: bool
+    cache: Union[bool, str]
+    cache_grammar: bool
+    regex: bool
+    g_regex_flags: int
+    keep_all_tokens: bool
+    tree_class: Optional[Callable[[str, List], Any]]
+    parser: _ParserArgType
+    lexer: _LexerArgType
+    ambiguity: 'Literal["auto", "resolve", "explicit", "forest"]'
+    postlex: Optional[PostLex]
+    priority: 'Optional[Literal["auto", "normal", "invert"]]'
+    lexer_callbacks: Dict[str, Callable[[Token], Token]]
+    use_bytes: bool
+    ordered_sets: bool
+    edit_terminals: Optional[Callable[[TerminalDef], TerminalDef]]
+    import_paths: 'List[Union[str, Callable[[Union[None, str, PackageResource], str], Tuple[str, str]]]]'
+    source_path: Optional[str]
+
+    OPTIONS_DOC = r"""
+    **===  General Options  ===**
+
+    start
+            The start symbol. Either a string, or a list of strings for multiple possible starts (Default: "start")
+    debug
+            Display debug information and extra warnings. Use only when debugging (Default: ``False``)
+            When used with Earley, it generates a forest graph as "sppf.png", if 'dot' is installed.
+    strict
+            Throw an exception on any potential ambiguity, including shift/reduce conflicts, and regex collisions.
+    transformer
+            Applies the transformer to every parse tree (equivalent to applying it after the parse, but faster)
+    propagate_positions
+            Propagates positional attributes into the 'meta' attribute of all tree branches.
+            Sets attributes: (line, column, end_line, end_column, start_pos, end_pos,
+                              container_line, container_column, container_end_line, container_end_column)
+            Accepts ``False``, ``True``, or a callable, which will filter which nodes to ignore when propagating.
+    maybe_placeholders
+            When ``True``, the ``[]`` operator returns ``None`` when not matched.
+            When ``False``,  ``[]`` behaves like the ``?`` operator, and returns no value at all.
+            (default= ``True``)
+    cache
+            Cache the results of the Lark grammar analysis, for x2 to x3 faster loading. LALR only for now.
+
+            - When ``False``, does nothing (default)
+            - When ``True``, caches to a temporary file in the local directory
+            - When given a string, caches to the path pointed by the string
+    cache_grammar
+            For use with ``cache`` option. When ``True``, the unanalyzed grammar is also included in the cache.
+            Useful for classes that require the ``Lark.grammar`` to be present (e.g. Reconstructor).
+            (default= ``False``)
+    regex
+            When True, uses the ``regex`` module instead of the stdlib ``re``.
+    g_regex_flags
+            Flags that are applied to all terminals (both regex and strings)
+    keep_all_tokens
+            Prevent the tree builder from automagically removing "punctuation" tokens (Default: ``False``)
+    tree_class
+            Lark will produce trees comprised of instances of this class instead of the default ``lark.Tree``.
+
+    **=== Algorithm Options ===**
+
+    parser
+            Decides which parser engine to use. Accepts "earley" or "lalr". (Default: "earley").
+            (there is also a "cyk" option for legacy)
+    lexer
+            Decides whether or not to use a lexer stage
+
+            - "auto" (default): Choose for me based on the parser
+            - "basic": Use a basic lexer
+            - "contextual": Stronger lexer (only works with parser="lalr")
+            - "dynamic": Flexible and powerful (only with parser="earley")
+            - "dynamic_complete": Same as dynamic, but tries *every* variation of tokenizing possible.
+    ambiguity
+            Decides how to handle ambiguity in the parse. Only relevant if parser="earley"
+
+            - "resolve": The parser will automatically choose the simplest derivation
+              (it chooses consistently: greedy for tokens, non-greedy for rules)
+            - "explicit": The parser will return all derivations wrapped in "_ambig" tree nodes (i.e. a forest).
+            - "forest": The parser will return the root of the shared packed parse forest.
+
+    **=== Misc. / Domain Specific Options ===**
+
+    postlex
+            Lexer post-processing (Default: ``None``) Only works with the basic and contextual lexers.
+    priority
+            How priorities should be evaluated - "auto", ``None``, "normal", "invert" (Default: "auto")
+    lexer_callbacks
+            Dictionary of callbacks for the lexer. May alter tokens during lexing. Use with caution.
+    use_bytes
+            Accept an input of type ``bytes`` instead of ``str``.
+    ordered_sets
+            Should Earley use ordered-sets to achieve stable output (~10% slower than regular sets. Default: True)
+    edit_terminals
+            A callback for editing the terminals before parse.
+    import_paths
+            A List of either paths or loader functions to specify from where grammars are imported
+    source_path
+            Override the source of from where the grammar was loaded. Useful for relative imports and unconventional grammar loading
+    **=== End of Options ===**
+    """
+    if __doc__:
+        __doc__ += OPTIONS_DOC
+
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    ##
+
+    _defaults: Dict[str, Any] = {
+        'debug': False,
+        'strict': False,
+        'keep_all_tokens': False,
+        'tree_class': None,
+        'cache': False,
+        'cache_grammar': False,
+        'postlex': None,
+        'parser': 'earley',
+        'lexer': 'auto',
+        'transformer': None,
+        'start': 'start',
+        'priority': 'auto',
+        'ambiguity': 'auto',
+        'regex': False,
+        'propagate_positions': False,
+        'lexer_callbacks': {},
+        'maybe_placeholders': True,
+        'edit_terminals': None,
+        'g_regex_flags': 0,
+        'use_bytes': False,
+        'ordered_sets': True,
+        'import_paths': [],
+        'source_path': None,
+        '_plugins': {},
+    }
+
+    def __init__(self, options_dict: Dict[str, Any]) -> None:
+        o = dict(options_dict)
+
+        options = {}
+        for name, default in self._defaults.items():
+            if name in o:
+                value = o.pop(name)
+                if isinstance(default, bool) and name not in ('cache', 'use_bytes', 'propagate_positions'):
+                    value = bool(value)
+            else:
+                value = default
+
+            options[name] = value
+
+        if isinstance(options['start'], str):
+            options['start'] = [options['start']]
+
+        self.__dict__['options'] = options
+
+
+        assert_config(self.parser, ('earley', 'lalr', 'cyk', None))
+
+        if self.parser == 'earley' and self.transformer:
+            raise ConfigurationError('Cannot specify an embedded transformer when using the Earley algorithm. '
+                             'Please use your transformer on the resulting parse tree, or use a different algorithm (i.e. LALR)')
+
+        if self.cache_grammar and not self.cache:
+            raise ConfigurationError('cache_grammar cannot be set when cache is disabled')
+
+        if o:
+            raise ConfigurationError("Unknown options: %s" % o.keys())
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__['options'][name]
+        except KeyError as e:
+            raise AttributeError(e)
+
+    def __setattr__(self, name: str, value: str) -> None:
+        assert_config(name, self.options.keys(), "%r isn't a valid option. Expected one of: %s")
+        self.options[name] = value
+
+    def serialize(self, memo = None) -> Dict[str, Any]:
+        return self.options
+
+    @classmethod
+    def deserialize(cls, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]]) -> "LarkOptions":
+        return cls(data)
+
+
+##
+
+##
+
+_LOAD_ALLOWED_OPTIONS = {'postlex', 'transformer', 'lexer_callbacks', 'use_bytes', 'debug', 'g_regex_flags', 'regex', 'propagate_positions', 'tree_class', '_plugins'}
+
+_VALID_PRIORITY_OPTIONS = ('auto', 'normal', 'invert', None)
+_VALID_AMBIGUITY_OPTIONS = ('auto', 'resolve', 'explicit', 'forest')
+
+
+_T = TypeVar('_T', bound="Lark")
+
+class Lark(Serialize):
+    #--
+
+    source_path: str
+    source_grammar: str
+    grammar: 'Grammar'
+    options: LarkOptions
+    lexer: Lexer
+    parser: 'ParsingFrontend'
+    terminals: Collection[TerminalDef]
+
+    __serialize_fields__ = ['parser', 'rules', 'options']
+
+    def __init__(self, grammar: 'Union[Grammar, str, IO[str]]', **options) -> None:
+        self.options = LarkOptions(options)
+        re_module: types.ModuleType
+
+        ##
+
+        if self.options.cache_grammar:
+            self.__serialize_fields__ = self.__serialize_fields__ + ['grammar']
+
+        ##
+
+        use_regex = self.options.regex
+        if use_regex:
+            if _has_regex:
+                re_module = regex
+            else:
+                raise ImportError('`regex` module must be installed if calling `Lark(regex=True)`.')
+        else:
+            re_module = re
+
+        ##
+
+        if self.options.source_path is None:
+            try:
+                self.source_path = grammar.name  ##
+
+            except AttributeError:
+                self.source_path = '<string>'
+        else:
+            self.source_path = self.options.source_path
+
+        ##
+
+        try:
+            read = grammar.read  ##
+
+        except AttributeError:
+            pass
+        else:
+            grammar = read()
+
+        cache_fn = None
+        cache_sha256 = None
+        if isinstance(grammar, str):
+            self.source_grammar = grammar
+            if self.options.use_bytes:
+                if not grammar.isascii():
+                    raise ConfigurationError("Grammar must be ascii only, when use_bytes=True")
+
+            if self.options.cache:
+                if self.options.parser != 'lalr':
+                    raise ConfigurationError("cache only works with parser='lalr' for now")
+
+                unhashable = ('transformer', 'postlex', 'lexer_callbacks', 'edit_terminals', '_plugins')
+                options_str = ''.join(k+str(v) for k, v in options.items() if k not in unhashable)
+                from . import __version__
+                s = grammar + options_str + __version__ + str(sys.version_info[:2])
+                cache_sha256 = sha256_digest(s)
+
+                if isinstance(self.options.cache, str):
+                    cache_fn = self.options.cache
+                else:
+                    if self.options.cache is not True:
+                        raise ConfigurationError("cache argument must be bool or str")
+
+                    try:
+                        username = getpass.getuser()
+                    except Exception:
+                        ##
+
+                        ##
+
+                        ##
+
+                        username = "unknown"
+
+
+                    cache_fn = tempfile.gettempdir() + "/.lark_%s_%s_%s_%s_%s.tmp" % (
+                        "cache_grammar" if self.options.cache_grammar else "cache", username, cache_sha256, *sys.version_info[:2])
+
+                old_options = self.options
+                try:
+                    with FS.open(cache_fn, 'rb') as f:
+                        logger.debug('Loading grammar from cache: %s', cache_fn)
+                        ##
+
+                        for name in (set(options) - _LOAD_ALLOWED_OPTIONS):
+                            del options[name]
+                        file_sha256 = f.readline().rstrip(b'\n')
+                        cached_used_files = pickle.load(f)
+                        if file_sha256 == cache_sha256.encode('utf8') and verify_used_files(cached_used_files):
+                            cached_parser_data = pickle.load(f)
+                            self._load(cached_parser_data, **options)
+                            return
+                except FileNotFoundError:
+                    ##
+
+                    pass
+                except Exception: ##
+
+                    logger.exception("Failed to load Lark from cache: %r. We will try to carry on.", cache_fn)
+
+                    ##
+
+                    ##
+
+                    self.options = old_options
+
+
+            ##
+
+            self.grammar, used_files = load_grammar(grammar, self.source_path, self.options.import_paths, self.options.keep_all_tokens)
+        else:
+            assert isinstance(grammar, Grammar)
+            self.grammar = grammar
+
+
+        if self.options.lexer == 'auto':
+            if self.options.parser == 'lalr':
+                self.options.lexer = 'contextual'
+            elif self.options.parser == 'earley':
+                if self.options.postlex is not None:
+                    logger.info("postlex can't be used with the dynamic lexer, so we use 'basic' instead. "
+                                "Consider using lalr with contextual instead of earley")
+                    self.options.lexer = 'basic'
+                else:
+                    self.options.lexer = 'dynamic'
+            elif self.options.parser == 'cyk':
+                self.options.lexer = 'basic'
+            else:
+                assert False, self.options.parser
+        lexer = self.options.lexer
+        if isinstance(lexer, type):
+            assert issubclass(lexer, Lexer)     ##
+
+        else:
+            assert_config(lexer, ('basic', 'contextual', 'dynamic', 'dynamic_complete'))
+            if self.options.postlex is not None and 'dynamic' in lexer:
+                raise ConfigurationError("Can't use postlex with a dynamic lexer. Use basic or contextual instead")
+
+        if self.options.ambiguity == 'auto':
+            if self.options.parser == 'earley':
+                self.options.ambiguity = 'resolve'
+        else:
+            assert_config(self.options.parser, ('earley', 'cyk'), "%r doesn't support disambiguation. Use one of these parsers instead: %s")
+
+        if self.options.priority == 'auto':
+            self.options.priority = 'normal'
+
+        if self.options.priority not in _VALID_PRIORITY_OPTIONS:
+            raise ConfigurationError("invalid priority option: %r. Must be one of %r" % (self.options.priority, _VALID_PRIORITY_OPTIONS))
+        if self.options.ambiguity not in _VALID_AMBIGUITY_OPTIONS:
+            raise ConfigurationError("invalid ambiguity option: %r. Must be one of %r" % (self.options.ambiguity, _VALID_AMBIGUITY_OPTIONS))
+
+        if self.options.parser is None:
+            terminals_to_keep = '*'     ##
+
+        elif self.options.postlex is not None:
+            terminals_to_keep = set(self.options.postlex.always_accept)
+        else:
+            terminals_to_keep = set()
+
+        ##
+
+        self.terminals, self.rules, self.ignore_tokens = self.grammar.compile(self.options.start, terminals_to_keep)
+
+        if self.options.edit_terminals:
+            for t in self.terminals:
+                self.options.edit_terminals(t)
+
+        self._terminals_dict = {t.name: t for t in self.terminals}
+
+        ##
+
+        if self.options.priority == 'invert':
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = -rule.options.priority
+            for term in self.terminals:
+                term.priority = -term.priority
+        ##
+
+        ##
+
+        ##
+
+        elif self.options.priority is None:
+            for rule in self.rules:
+                if rule.options.priority is not None:
+                    rule.options.priority = None
+            for term in self.terminals:
+                term.priority = 0
+
+        ##
+
+        self.lexer_conf = LexerConf(
+                self.terminals, re_module, self.ignore_tokens, self.options.postlex,
+                self.options.lexer_callbacks, self.options.g_regex_flags, use_bytes=self.options.use_bytes, strict=self.options.strict
+            )
+
+        if self.options.parser:
+            self.parser = self._build_parser()
+        elif lexer:
+            self.lexer = self._build_lexer()
+
+        if cache_fn:
+            logger.debug('Saving grammar to cache: %s', cache_fn)
+            try:
+                with FS.open(cache_fn, 'wb') as f:
+                    assert cache_sha256 is not None
+                    f.write(cache_sha256.encode('utf8') + b'\n')
+                    pickle.dump(used_files, f)
+                    self.save(f, _LOAD_ALLOWED_OPTIONS)
+            except IOError as e:
+                logger.exception("Failed to save Lark to cache: %r.", cache_fn, e)
+
+    if __doc__:
+        __doc__ += "\n\n" + LarkOptions.OPTIONS_DOC
+
+    def _build_lexer(self, dont_ignore: bool=False) -> BasicLexer:
+        lexer_conf = self.lexer_conf
+        if dont_ignore:
+            from copy import copy
+            lexer_conf = copy(lexer_conf)
+            lexer_conf.ignore = ()
+        return BasicLexer(lexer_conf)
+
+    def _prepare_callbacks(self) -> None:
+        self._callbacks = {}
+        ##
+
+        if self.options.ambiguity != 'forest':
+            self._parse_tree_builder = ParseTreeBuilder(
+                    self.rules,
+                    self.options.tree_class or Tree,
+                    self.options.propagate_positions,
+                    self.options.parser != 'lalr' and self.options.ambiguity == 'explicit',
+                    self.options.maybe_placeholders
+                )
+            self._callbacks = self._parse_tree_builder.create_callback(self.options.transformer)
+        self._callbacks.update(_get_lexer_callbacks(self.options.transformer, self.terminals))
+
+    def _build_parser(self) -> "ParsingFrontend":
+        self._prepare_callbacks()
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        parser_conf = ParserConf(self.rules, self._callbacks, self.options.start)
+        return _construct_parsing_frontend(
+            self.options.parser,
+            self.options.lexer,
+            self.lexer_conf,
+            parser_conf,
+            options=self.options
+        )
+
+    def save(self, f, exclude_options: Collection[str] = ()) -> None:
+        #--
+        if self.options.parser != 'lalr':
+            raise NotImplementedError("Lark.save() is only implemented for the LALR(1) parser.")
+        data, m = self.memo_serialize([TerminalDef, Rule])
+        if exclude_options:
+            data["options"] = {n: v for n, v in data["options"].items() if n not in exclude_options}
+        pickle.dump({'data': data, 'memo': m}, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls: Type[_T], f) -> _T:
+        #--
+        inst = cls.__new__(cls)
+        return inst._load(f)
+
+    def _deserialize_lexer_conf(self, data: Dict[str, Any], memo: Dict[int, Union[TerminalDef, Rule]], options: LarkOptions) -> LexerConf:
+        lexer_conf = LexerConf.deserialize(data['lexer_conf'], memo)
+        lexer_conf.callbacks = options.lexer_callbacks or {}
+        lexer_conf.re_module = regex if options.regex else re
+        lexer_conf.use_bytes = options.use_bytes
+        lexer_conf.g_regex_flags = options.g_regex_flags
+        lexer_conf.skip_validation = True
+        lexer_conf.postlex = options.postlex
+        return lexer_conf
+
+    def _load(self: _T, f: Any, **kwargs) -> _T:
+        if isinstance(f, dict):
+            d = f
+        else:
+            d = pickle.load(f)
+        memo_json = d['memo']
+        data = d['data']
+
+        assert memo_json
+        memo = SerializeMemoizer.deserialize(memo_json, {'Rule': Rule, 'TerminalDef': TerminalDef}, {})
+        if 'grammar' in data:
+            self.grammar = Grammar.deserialize(data['grammar'], memo)
+        options = dict(data['options'])
+        if (set(kwargs) - _LOAD_ALLOWED_OPTIONS) & set(LarkOptions._defaults):
+            raise ConfigurationError("Some options are not allowed when loading a Parser: {}"
+                             .format(set(kwargs) - _LOAD_ALLOWED_OPTIONS))
+        options.update(kwargs)
+        self.options = LarkOptions.deserialize(options, memo)
+        self.rules = [Rule.deserialize(r, memo) for r in data['rules']]
+        self.source_path = '<deserialized>'
+        _validate_frontend_args(self.options.parser, self.options.lexer)
+        self.lexer_conf = self._deserialize_lexer_conf(data['parser'], memo, self.options)
+        self.terminals = self.lexer_conf.terminals
+        self._prepare_callbacks()
+        self._terminals_dict = {t.name: t for t in self.terminals}
+        self.parser = _deserialize_parsing_frontend(
+            data['parser'],
+            memo,
+            self.lexer_conf,
+            self._callbacks,
+            self.options,  ##
+
+        )
+        return self
+
+    @classmethod
+    def _load_from_dict(cls, data, memo, **kwargs):
+        inst = cls.__new__(cls)
+        return inst._load({'data': data, 'memo': memo}, **kwargs)
+
+    @classmethod
+    def open(cls: Type[_T], grammar_filename: str, rel_to: Optional[str]=None, **options) -> _T:
+        #--
+        if rel_to:
+            basepath = os.path.dirname(rel_to)
+            grammar_filename = os.path.join(basepath, grammar_filename)
+        with open(grammar_filename, encoding='utf8') as f:
+            return cls(f, **options)
+
+    @classmethod
+    def open_from_package(cls: Type[_T], package: str, grammar_path: str, search_paths: 'Sequence[str]'=[""], **options) -> _T:
+        #--
+        package_loader = FromPackageLoader(package, search_paths)
+        full_path, text = package_loader(None, grammar_path)
+        options.setdefault('source_path', full_path)
+        options.setdefault('import_paths', [])
+        options['import_paths'].append(package_loader)
+        return cls(text, **options)
+
+    def __repr__(self):
+        return 'Lark(open(%r), parser=%r, lexer=%r, ...)' % (self.source_path, self.options.parser, self.options.lexer)
+
+
+    def lex(self, text: TextOrSlice, dont_ignore: bool=False) -> Iterator[Token]:
+        #--
+        lexer: Lexer
+        if not hasattr(self, 'lexer') or dont_ignore:
+            lexer = self._build_lexer(dont_ignore)
+        else:
+            lexer = self.lexer
+        lexer_thread = LexerThread.from_text(lexer, text)
+        stream = lexer_thread.lex(None)
+        if self.options.postlex:
+            return self.options.postlex.process(stream)
+        return stream
+
+    def get_terminal(self, name: str) -> TerminalDef:
+        #--
+        return self._terminals_dict[name]
+
+    def parse_interactive(self, text: Optional[LarkInput]=None, start: Optional[str]=None) -> 'InteractiveParser':
+        #--
+        return self.parser.parse_interactive(text, start=start)
+
+    def parse(self, text: LarkInput, start: Optional[str]=None, on_error: 'Optional[Callable[[UnexpectedInput], bool]]'=None) -> 'ParseTree':
+        #--
+        if on_error is not None and self.options.parser != 'lalr':
+            raise NotImplementedError("The on_error option is only implemented for the LALR(1) parser.")
+        return self.parser.parse(text, start=start, on_error=on_error)
+
+
+
+
+class DedentError(LarkError):
+    pass
+
+class Indenter(PostLex, ABC):
+    #--
+    paren_level: int
+    indent_level: List[int]
+
+    def __init__(self) -> None:
+        self.paren_level = 0
+        self.indent_level = [0]
+        assert self.tab_len > 0
+
+    def handle_NL(self, token: Token) -> Iterator[Token]:
+        if self.paren_level > 0:
+            return
+
+        yield token
+
+        indent_str = token.rsplit('\n', 1)[1] ##
+
+        indent = indent_str.count(' ') + indent_str.count('\t') * self.tab_len
+
+        if indent > self.indent_level[-1]:
+            self.indent_level.append(indent)
+            yield Token.new_borrow_pos(self.INDENT_type, indent_str, token)
+        else:
+            while indent < self.indent_level[-1]:
+                self.indent_level.pop()
+                yield Token.new_borrow_pos(self.DEDENT_type, indent_str, token)
+
+            if indent != self.indent_level[-1]:
+                raise DedentError('Unexpected dedent to column %s. Expected dedent to %s' % (indent, self.indent_level[-1]))
+
+    def _process(self, stream):
+        token = None
+        for token in stream:
+            if token.type == self.NL_type:
+                yield from self.handle_NL(token)
+            else:
+                yield token
+
+            if token.type in self.OPEN_PAREN_types:
+                self.paren_level += 1
+            elif token.type in self.CLOSE_PAREN_types:
+                self.paren_level -= 1
+                assert self.paren_level >= 0
+
+        while len(self.indent_level) > 1:
+            self.indent_level.pop()
+            yield Token.new_borrow_pos(self.DEDENT_type, '', token) if token else Token(self.DEDENT_type, '', 0, 0, 0, 0, 0, 0)
+
+        assert self.indent_level == [0], self.indent_level
+
+    def process(self, stream):
+        self.paren_level = 0
+        self.indent_level = [0]
+        return self._process(stream)
+
+    ##
+
+    @property
+    def always_accept(self):
+        return (self.NL_type,)
+
+    @property
+    @abstractmethod
+    def NL_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def OPEN_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def CLOSE_PAREN_types(self) -> List[str]:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def INDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def DEDENT_type(self) -> str:
+        #--
+        raise NotImplementedError()
+
+    @property
+    @abstractmethod
+    def tab_len(self) -> int:
+        #--
+        raise NotImplementedError()
+
+
+class PythonIndenter(Indenter):
+    #--
+
+    NL_type = '_NEWLINE'
+    OPEN_PAREN_types = ['LPAR', 'LSQB', 'LBRACE']
+    CLOSE_PAREN_types = ['RPAR', 'RSQB', 'RBRACE']
+    INDENT_type = '_INDENT'
+    DEDENT_type = '_DEDENT'
+    tab_len = 8
+
+
+import pickle, zlib, base64
+DATA = (
+{'parser': {'lexer_conf': {'terminals': [{'@': 0}, {'@': 1}, {'@': 2}, {'@': 3}, {'@': 4}, {'@': 5}, {'@': 6}, {'@': 7}, {'@': 8}, {'@': 9}, {'@': 10}, {'@': 11}, {'@': 12}, {'@': 13}, {'@': 14}, {'@': 15}, {'@': 16}, {'@': 17}, {'@': 18}, {'@': 19}, {'@': 20}, {'@': 21}, {'@': 22}, {'@': 23}, {'@': 24}, {'@': 25}, {'@': 26}, {'@': 27}, {'@': 28}, {'@': 29}, {'@': 30}, {'@': 31}, {'@': 32}, {'@': 33}, {'@': 34}, {'@': 35}, {'@': 36}, {'@': 37}, {'@': 38}, {'@': 39}, {'@': 40}, {'@': 41}, {'@': 42}, {'@': 43}, {'@': 44}, {'@': 45}, {'@': 46}, {'@': 47}, {'@': 48}, {'@': 49}, {'@': 50}, {'@': 51}, {'@': 52}, {'@': 53}, {'@': 54}, {'@': 55}, {'@': 56}, {'@': 57}, {'@': 58}], 'ignore': ['WS'], 'g_regex_flags': 0, 'use_bytes': False, 'lexer_type': 'contextual', '__type__': 'LexerConf'}, 'parser_conf': {'rules': [{'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}, {'@': 206}, {'@': 207}, {'@': 208}, {'@': 209}, {'@': 210}, {'@': 211}, {'@': 212}, {'@': 213}, {'@': 214}, {'@': 215}, {'@': 216}, {'@': 217}, {'@': 218}, {'@': 219}, {'@': 220}], 'start': ['chunk'], 'parser_type': 'lalr', '__type__': 'ParserConf'}, 'parser': {'tokens': {0: 'semicolon', 1: 'functioncall', 2: 'local_function', 3: 'for_range', 4: 'DO', 5: '__block_star_0', 6: 'IF', 7: 'prefixexp', 8: 'goto', 9: 'function_def', 10: 'label', 11: 'REPEAT', 12: 'break', 13: 'for_in', 14: 'RETURN', 15: 'while', 16: 'block', 17: 'LOCAL', 18: 'LPAR', 19: 'if_stmt', 20: 'retstat', 21: 'varlist', 22: 'local_assign', 23: 'FOR', 24: 'stat', 25: 'GOTO', 26: 'var', 27: 'FUNCTION', 28: 'NAME', 29: 'SEMICOLON', 30: '__ANON_0', 31: 'do', 32: 'repeat', 33: 'WHILE', 34: 'BREAK', 35: 'END', 36: 'TILDE', 37: 'concat_exp', 38: 'bor_exp', 39: 'field', 40: 'fieldlist', 41: 'or_exp', 42: 'pow_exp', 43: 'MINUS', 44: 'TRUE', 45: '__ANON_1', 46: 'shift_exp', 47: 'bxor_exp', 48: 'HASH', 49: 'NIL', 50: 'band_exp', 51: 'tableconstructor', 52: 'LBRACE', 53: 'mul_exp', 54: 'functiondef', 55: 'simple_exp', 56: 'exp', 57: 'unary_exp', 58: 'FALSE', 59: 'RBRACE', 60: 'unop', 61: 'LSQB', 62: 'NUMBER', 63: 'add_exp', 64: 'and_exp', 65: 'cmp_exp', 66: 'STRING', 67: 'NOT', 68: 'EQUAL', 69: '__ANON_4', 70: 'VBAR', 71: 'OR', 72: 'SLASH', 73: '__ANON_3', 74: '__ANON_6', 75: 'LESSTHAN', 76: 'CIRCUMFLEX', 77: '__ANON_8', 78: 'AND', 79: 'MORETHAN', 80: 'AMPERSAND', 81: 'PERCENT', 82: '__ANON_2', 83: 'COMMA', 84: 'STAR', 85: '__ANON_5', 86: 'PLUS', 87: '__ANON_9', 88: '__ANON_7', 89: 'RPAR', 90: 'RSQB', 91: 'ELSEIF', 92: 'UNTIL', 93: 'THEN', 94: '$END', 95: 'ELSE', 96: 'DOT', 97: 'COLON', 98: 'concat_op', 99: 'add_op', 100: 'explist', 101: 'parlist', 102: '_names', 103: 'vararg_namelist', 104: 'namelist', 105: 'bor_op', 106: 'mul_op', 107: 'cmp_op', 108: 'attrib', 109: 'funcbody', 110: 'chunk', 111: 'band_op', 112: 'IN', 113: 'bxor_op', 114: 'attnamelist', 115: 'pow_op', 116: 'fieldsep', 117: 'args', 118: '__if_stmt_star_1', 119: 'elseif_block', 120: 'else_block', 121: '__fieldlist_star_6', 122: '__attnamelist_star_2', 123: 'funcname', 124: 'or_op', 125: '__varlist_star_4', 126: '__funcname_star_3', 127: 'shift_op', 128: 'and_op', 129: '__explist_star_5'}, 'states': {0: {0: (0, 104), 1: (0, 134), 2: (0, 109), 3: (0, 172), 4: (0, 177), 5: (0, 140), 6: (0, 250), 7: (0, 232), 8: (0, 106), 9: (0, 18), 10: (0, 186), 11: (0, 252), 12: (0, 206), 13: (0, 225), 14: (0, 183), 15: (0, 204), 16: (0, 202), 17: (0, 105), 18: (0, 124), 19: (0, 222), 20: (0, 166), 21: (0, 4), 22: (0, 173), 23: (0, 260), 24: (0, 40), 25: (0, 59), 26: (0, 178), 27: (0, 156), 28: (0, 129), 29: (0, 190), 30: (0, 141), 31: (0, 0), 32: (0, 92), 33: (0, 30), 34: (0, 247), 35: (1, {'@': 63})}, 1: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 39: (0, 138), 40: (0, 161), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 56: (0, 151), 57: (0, 137), 58: (0, 200), 59: (0, 147), 60: (0, 191), 61: (0, 152), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 110), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 2: {35: (0, 29)}, 3: {36: (0, 142), 27: (0, 201), 38: (0, 28), 37: (0, 47), 7: (0, 117), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 1: (0, 221), 66: (0, 5), 67: (0, 139)}, 4: {68: (0, 44)}, 5: {69: (1, {'@': 150}), 29: (1, {'@': 150}), 70: (1, {'@': 150}), 59: (1, {'@': 150}), 71: (1, {'@': 150}), 72: (1, {'@': 150}), 43: (1, {'@': 150}), 36: (1, {'@': 150}), 73: (1, {'@': 150}), 74: (1, {'@': 150}), 75: (1, {'@': 150}), 76: (1, {'@': 150}), 77: (1, {'@': 150}), 78: (1, {'@': 150}), 79: (1, {'@': 150}), 80: (1, {'@': 150}), 81: (1, {'@': 150}), 82: (1, {'@': 150}), 83: (1, {'@': 150}), 84: (1, {'@': 150}), 85: (1, {'@': 150}), 86: (1, {'@': 150}), 87: (1, {'@': 150}), 88: (1, {'@': 150}), 11: (1, {'@': 150}), 6: (1, {'@': 150}), 89: (1, {'@': 150}), 14: (1, {'@': 150}), 25: (1, {'@': 150}), 90: (1, {'@': 150}), 91: (1, {'@': 150}), 17: (1, {'@': 150}), 30: (1, {'@': 150}), 18: (1, {'@': 150}), 33: (1, {'@': 150}), 23: (1, {'@': 150}), 92: (1, {'@': 150}), 27: (1, {'@': 150}), 28: (1, {'@': 150}), 93: (1, {'@': 150}), 94: (1, {'@': 150}), 4: (1, {'@': 150}), 34: (1, {'@': 150}), 35: (1, {'@': 150}), 95: (1, {'@': 150})}, 6: {18: (1, {'@': 115}), 83: (1, {'@': 115}), 68: (1, {'@': 115}), 96: (1, {'@': 115}), 97: (1, {'@': 115}), 52: (1, {'@': 115}), 66: (1, {'@': 115}), 61: (1, {'@': 115}), 69: (1, {'@': 115}), 29: (1, {'@': 115}), 70: (1, {'@': 115}), 59: (1, {'@': 115}), 71: (1, {'@': 115}), 72: (1, {'@': 115}), 43: (1, {'@': 115}), 36: (1, {'@': 115}), 86: (1, {'@': 115}), 73: (1, {'@': 115}), 74: (1, {'@': 115}), 75: (1, {'@': 115}), 76: (1, {'@': 115}), 77: (1, {'@': 115}), 78: (1, {'@': 115}), 79: (1, {'@': 115}), 81: (1, {'@': 115}), 82: (1, {'@': 115}), 84: (1, {'@': 115}), 85: (1, {'@': 115}), 80: (1, {'@': 115}), 87: (1, {'@': 115}), 88: (1, {'@': 115}), 11: (1, {'@': 115}), 6: (1, {'@': 115}), 89: (1, {'@': 115}), 14: (1, {'@': 115}), 25: (1, {'@': 115}), 90: (1, {'@': 115}), 91: (1, {'@': 115}), 30: (1, {'@': 115}), 34: (1, {'@': 115}), 35: (1, {'@': 115}), 33: (1, {'@': 115}), 92: (1, {'@': 115}), 27: (1, {'@': 115}), 28: (1, {'@': 115}), 93: (1, {'@': 115}), 94: (1, {'@': 115}), 4: (1, {'@': 115}), 17: (1, {'@': 115}), 23: (1, {'@': 115}), 95: (1, {'@': 115})}, 7: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 56: (0, 246), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 8: {89: (0, 113)}, 9: {28: (0, 238)}, 10: {86: (0, 150), 77: (0, 81), 43: (0, 71), 98: (0, 251), 99: (0, 180), 69: (1, {'@': 136}), 29: (1, {'@': 136}), 70: (1, {'@': 136}), 59: (1, {'@': 136}), 71: (1, {'@': 136}), 36: (1, {'@': 136}), 73: (1, {'@': 136}), 74: (1, {'@': 136}), 75: (1, {'@': 136}), 78: (1, {'@': 136}), 79: (1, {'@': 136}), 82: (1, {'@': 136}), 83: (1, {'@': 136}), 85: (1, {'@': 136}), 80: (1, {'@': 136}), 88: (1, {'@': 136}), 11: (1, {'@': 136}), 6: (1, {'@': 136}), 89: (1, {'@': 136}), 14: (1, {'@': 136}), 25: (1, {'@': 136}), 90: (1, {'@': 136}), 91: (1, {'@': 136}), 34: (1, {'@': 136}), 30: (1, {'@': 136}), 18: (1, {'@': 136}), 35: (1, {'@': 136}), 33: (1, {'@': 136}), 92: (1, {'@': 136}), 27: (1, {'@': 136}), 28: (1, {'@': 136}), 93: (1, {'@': 136}), 94: (1, {'@': 136}), 4: (1, {'@': 136}), 17: (1, {'@': 136}), 23: (1, {'@': 136}), 95: (1, {'@': 136})}, 11: {29: (0, 125), 35: (1, {'@': 103}), 94: (1, {'@': 103}), 91: (1, {'@': 103}), 95: (1, {'@': 103}), 92: (1, {'@': 103})}, 12: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 56: (0, 239), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 100: (0, 43), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 13: {0: (0, 104), 1: (0, 134), 2: (0, 109), 3: (0, 172), 4: (0, 177), 5: (0, 140), 6: (0, 250), 7: (0, 232), 8: (0, 106), 9: (0, 18), 10: (0, 186), 11: (0, 252), 12: (0, 206), 13: (0, 225), 14: (0, 183), 15: (0, 204), 17: (0, 105), 18: (0, 124), 19: (0, 222), 20: (0, 166), 21: (0, 4), 22: (0, 173), 23: (0, 260), 24: (0, 40), 25: (0, 59), 26: (0, 178), 27: (0, 156), 28: (0, 129), 29: (0, 190), 30: (0, 141), 31: (0, 0), 32: (0, 92), 33: (0, 30), 34: (0, 247), 16: (0, 24), 35: (1, {'@': 63})}, 14: {18: (1, {'@': 92}), 27: (1, {'@': 92}), 29: (1, {'@': 92}), 28: (1, {'@': 92}), 11: (1, {'@': 92}), 6: (1, {'@': 92}), 35: (1, {'@': 92}), 4: (1, {'@': 92}), 33: (1, {'@': 92}), 17: (1, {'@': 92}), 14: (1, {'@': 92}), 23: (1, {'@': 92}), 34: (1, {'@': 92}), 25: (1, {'@': 92}), 30: (1, {'@': 92}), 94: (1, {'@': 92}), 91: (1, {'@': 92}), 95: (1, {'@': 92}), 92: (1, {'@': 92})}, 15: {27: (1, {'@': 183}), 18: (1, {'@': 183}), 62: (1, {'@': 183}), 28: (1, {'@': 183}), 67: (1, {'@': 183}), 52: (1, {'@': 183}), 45: (1, {'@': 183}), 43: (1, {'@': 183}), 36: (1, {'@': 183}), 44: (1, {'@': 183}), 58: (1, {'@': 183}), 49: (1, {'@': 183}), 48: (1, {'@': 183}), 66: (1, {'@': 183})}, 16: {0: (0, 104), 1: (0, 134), 2: (0, 109), 3: (0, 172), 4: (0, 177), 5: (0, 140), 6: (0, 250), 7: (0, 232), 8: (0, 106), 9: (0, 18), 10: (0, 186), 11: (0, 252), 12: (0, 206), 13: (0, 225), 14: (0, 183), 15: (0, 204), 17: (0, 105), 18: (0, 124), 19: (0, 222), 20: (0, 166), 21: (0, 4), 22: (0, 173), 23: (0, 260), 24: (0, 40), 25: (0, 59), 26: (0, 178), 27: (0, 156), 28: (0, 129), 29: (0, 190), 30: (0, 141), 31: (0, 0), 32: (0, 92), 33: (0, 30), 34: (0, 247), 16: (0, 2), 35: (1, {'@': 63})}, 17: {0: (0, 104), 1: (0, 134), 2: (0, 109), 3: (0, 172), 4: (0, 177), 5: (0, 140), 6: (0, 250), 7: (0, 232), 8: (0, 106), 9: (0, 18), 10: (0, 186), 11: (0, 252), 12: (0, 206), 13: (0, 225), 14: (0, 183), 15: (0, 204), 17: (0, 105), 18: (0, 124), 19: (0, 222), 20: (0, 166), 21: (0, 4), 22: (0, 173), 23: (0, 260), 24: (0, 40), 25: (0, 59), 26: (0, 178), 27: (0, 156), 28: (0, 129), 29: (0, 190), 30: (0, 141), 31: (0, 0), 32: (0, 92), 33: (0, 30), 16: (0, 145), 34: (0, 247), 35: (1, {'@': 63})}, 18: {18: (1, {'@': 76}), 27: (1, {'@': 76}), 29: (1, {'@': 76}), 28: (1, {'@': 76}), 11: (1, {'@': 76}), 6: (1, {'@': 76}), 35: (1, {'@': 76}), 4: (1, {'@': 76}), 33: (1, {'@': 76}), 17: (1, {'@': 76}), 14: (1, {'@': 76}), 23: (1, {'@': 76}), 34: (1, {'@': 76}), 25: (1, {'@': 76}), 30: (1, {'@': 76}), 94: (1, {'@': 76}), 91: (1, {'@': 76}), 95: (1, {'@': 76}), 92: (1, {'@': 76})}, 19: {69: (1, {'@': 148}), 29: (1, {'@': 148}), 70: (1, {'@': 148}), 59: (1, {'@': 148}), 71: (1, {'@': 148}), 72: (1, {'@': 148}), 43: (1, {'@': 148}), 36: (1, {'@': 148}), 73: (1, {'@': 148}), 74: (1, {'@': 148}), 75: (1, {'@': 148}), 76: (1, {'@': 148}), 77: (1, {'@': 148}), 78: (1, {'@': 148}), 79: (1, {'@': 148}), 80: (1, {'@': 148}), 81: (1, {'@': 148}), 82: (1, {'@': 148}), 83: (1, {'@': 148}), 84: (1, {'@': 148}), 85: (1, {'@': 148}), 86: (1, {'@': 148}), 87: (1, {'@': 148}), 88: (1, {'@': 148}), 11: (1, {'@': 148}), 6: (1, {'@': 148}), 89: (1, {'@': 148}), 14: (1, {'@': 148}), 25: (1, {'@': 148}), 90: (1, {'@': 148}), 91: (1, {'@': 148}), 17: (1, {'@': 148}), 30: (1, {'@': 148}), 18: (1, {'@': 148}), 33: (1, {'@': 148}), 23: (1, {'@': 148}), 92: (1, {'@': 148}), 27: (1, {'@': 148}), 28: (1, {'@': 148}), 93: (1, {'@': 148}), 94: (1, {'@': 148}), 4: (1, {'@': 148}), 34: (1, {'@': 148}), 35: (1, {'@': 148}), 95: (1, {'@': 148})}, 20: {4: (0, 16)}, 21: {101: (0, 25), 45: (0, 46), 102: (0, 179), 28: (0, 114), 103: (0, 218), 89: (0, 17), 104: (0, 97)}, 22: {18: (1, {'@': 70}), 27: (1, {'@': 70}), 29: (1, {'@': 70}), 28: (1, {'@': 70}), 11: (1, {'@': 70}), 6: (1, {'@': 70}), 35: (1, {'@': 70}), 4: (1, {'@': 70}), 33: (1, {'@': 70}), 17: (1, {'@': 70}), 14: (1, {'@': 70}), 23: (1, {'@': 70}), 34: (1, {'@': 70}), 25: (1, {'@': 70}), 30: (1, {'@': 70}), 94: (1, {'@': 70}), 91: (1, {'@': 70}), 95: (1, {'@': 70}), 92: (1, {'@': 70})}, 23: {35: (0, 212)}, 24: {35: (0, 108)}, 25: {89: (0, 171)}, 26: {90: (0, 32)}, 27: {69: (1, {'@': 135}), 29: (1, {'@': 135}), 70: (1, {'@': 135}), 59: (1, {'@': 135}), 71: (1, {'@': 135}), 36: (1, {'@': 135}), 73: (1, {'@': 135}), 74: (1, {'@': 135}), 75: (1, {'@': 135}), 78: (1, {'@': 135}), 79: (1, {'@': 135}), 82: (1, {'@': 135}), 83: (1, {'@': 135}), 85: (1, {'@': 135}), 80: (1, {'@': 135}), 88: (1, {'@': 135}), 11: (1, {'@': 135}), 6: (1, {'@': 135}), 89: (1, {'@': 135}), 14: (1, {'@': 135}), 25: (1, {'@': 135}), 90: (1, {'@': 135}), 91: (1, {'@': 135}), 34: (1, {'@': 135}), 30: (1, {'@': 135}), 18: (1, {'@': 135}), 35: (1, {'@': 135}), 33: (1, {'@': 135}), 92: (1, {'@': 135}), 27: (1, {'@': 135}), 28: (1, {'@': 135}), 93: (1, {'@': 135}), 94: (1, {'@': 135}), 4: (1, {'@': 135}), 17: (1, {'@': 135}), 23: (1, {'@': 135}), 95: (1, {'@': 135})}, 28: {70: (0, 66), 105: (0, 42), 69: (1, {'@': 127}), 79: (1, {'@': 127}), 29: (1, {'@': 127}), 59: (1, {'@': 127}), 71: (1, {'@': 127}), 82: (1, {'@': 127}), 83: (1, {'@': 127}), 85: (1, {'@': 127}), 73: (1, {'@': 127}), 75: (1, {'@': 127}), 78: (1, {'@': 127}), 18: (1, {'@': 127}), 11: (1, {'@': 127}), 6: (1, {'@': 127}), 89: (1, {'@': 127}), 33: (1, {'@': 127}), 14: (1, {'@': 127}), 23: (1, {'@': 127}), 92: (1, {'@': 127}), 25: (1, {'@': 127}), 91: (1, {'@': 127}), 27: (1, {'@': 127}), 28: (1, {'@': 127}), 94: (1, {'@': 127}), 4: (1, {'@': 127}), 17: (1, {'@': 127}), 35: (1, {'@': 127}), 34: (1, {'@': 127}), 95: (1, {'@': 127}), 30: (1, {'@': 127}), 90: (1, {'@': 127}), 93: (1, {'@': 127})}, 29: {18: (1, {'@': 91}), 27: (1, {'@': 91}), 29: (1, {'@': 91}), 28: (1, {'@': 91}), 11: (1, {'@': 91}), 6: (1, {'@': 91}), 35: (1, {'@': 91}), 4: (1, {'@': 91}), 33: (1, {'@': 91}), 17: (1, {'@': 91}), 14: (1, {'@': 91}), 23: (1, {'@': 91}), 34: (1, {'@': 91}), 25: (1, {'@': 91}), 30: (1, {'@': 91}), 94: (1, {'@': 91}), 91: (1, {'@': 91}), 95: (1, {'@': 91}), 92: (1, {'@': 91})}, 30: {27: (1, {'@': 83}), 18: (1, {'@': 83}), 62: (1, {'@': 83}), 28: (1, {'@': 83}), 67: (1, {'@': 83}), 52: (1, {'@': 83}), 45: (1, {'@': 83}), 43: (1, {'@': 83}), 36: (1, {'@': 83}), 44: (1, {'@': 83}), 58: (1, {'@': 83}), 49: (1, {'@': 83}), 48: (1, {'@': 83}), 66: (1, {'@': 83})}, 31: {72: (0, 54), 106: (0, 131), 81: (0, 90), 84: (0, 144), 87: (0, 128), 69: (1, {'@': 139}), 29: (1, {'@': 139}), 70: (1, {'@': 139}), 59: (1, {'@': 139}), 71: (1, {'@': 139}), 43: (1, {'@': 139}), 36: (1, {'@': 139}), 73: (1, {'@': 139}), 74: (1, {'@': 139}), 75: (1, {'@': 139}), 77: (1, {'@': 139}), 78: (1, {'@': 139}), 79: (1, {'@': 139}), 80: (1, {'@': 139}), 82: (1, {'@': 139}), 83: (1, {'@': 139}), 85: (1, {'@': 139}), 86: (1, {'@': 139}), 88: (1, {'@': 139}), 11: (1, {'@': 139}), 6: (1, {'@': 139}), 89: (1, {'@': 139}), 14: (1, {'@': 139}), 25: (1, {'@': 139}), 90: (1, {'@': 139}), 91: (1, {'@': 139}), 17: (1, {'@': 139}), 30: (1, {'@': 139}), 18: (1, {'@': 139}), 33: (1, {'@': 139}), 23: (1, {'@': 139}), 92: (1, {'@': 139}), 27: (1, {'@': 139}), 28: (1, {'@': 139}), 93: (1, {'@': 139}), 94: (1, {'@': 139}), 4: (1, {'@': 139}), 34: (1, {'@': 139}), 35: (1, {'@': 139}), 95: (1, {'@': 139})}, 32: {68: (0, 209)}, 33: {18: (1, {'@': 107})}, 34: {69: (1, {'@': 152}), 29: (1, {'@': 152}), 70: (1, {'@': 152}), 59: (1, {'@': 152}), 71: (1, {'@': 152}), 72: (1, {'@': 152}), 43: (1, {'@': 152}), 36: (1, {'@': 152}), 73: (1, {'@': 152}), 74: (1, {'@': 152}), 75: (1, {'@': 152}), 76: (1, {'@': 152}), 77: (1, {'@': 152}), 78: (1, {'@': 152}), 79: (1, {'@': 152}), 80: (1, {'@': 152}), 81: (1, {'@': 152}), 82: (1, {'@': 152}), 83: (1, {'@': 152}), 84: (1, {'@': 152}), 85: (1, {'@': 152}), 86: (1, {'@': 152}), 87: (1, {'@': 152}), 88: (1, {'@': 152}), 11: (1, {'@': 152}), 6: (1, {'@': 152}), 89: (1, {'@': 152}), 14: (1, {'@': 152}), 25: (1, {'@': 152}), 90: (1, {'@': 152}), 91: (1, {'@': 152}), 17: (1, {'@': 152}), 30: (1, {'@': 152}), 18: (1, {'@': 152}), 33: (1, {'@': 152}), 23: (1, {'@': 152}), 92: (1, {'@': 152}), 27: (1, {'@': 152}), 28: (1, {'@': 152}), 93: (1, {'@': 152}), 94: (1, {'@': 152}), 4: (1, {'@': 152}), 34: (1, {'@': 152}), 35: (1, {'@': 152}), 95: (1, {'@': 152})}, 35: {28: (0, 240)}, 36: {27: (1, {'@': 185}), 18: (1, {'@': 185}), 62: (1, {'@': 185}), 28: (1, {'@': 185}), 67: (1, {'@': 185}), 52: (1, {'@': 185}), 45: (1, {'@': 185}), 43: (1, {'@': 185}), 36: (1, {'@': 185}), 44: (1, {'@': 185}), 58: (1, {'@': 185}), 49: (1, {'@': 185}), 48: (1, {'@': 185}), 66: (1, {'@': 185})}, 37: {83: (0, 49), 68: (1, {'@': 111})}, 38: {30: (0, 101)}, 39: {27: (1, {'@': 180}), 18: (1, {'@': 180}), 62: (1, {'@': 180}), 28: (1, {'@': 180}), 59: (1, {'@': 180}), 67: (1, {'@': 180}), 52: (1, {'@': 180}), 45: (1, {'@': 180}), 43: (1, {'@': 180}), 36: (1, {'@': 180}), 61: (1, {'@': 180}), 44: (1, {'@': 180}), 58: (1, {'@': 180}), 49: (1, {'@': 180}), 48: (1, {'@': 180}), 66: (1, {'@': 180})}, 40: {18: (1, {'@': 207}), 27: (1, {'@': 207}), 29: (1, {'@': 207}), 28: (1, {'@': 207}), 11: (1, {'@': 207}), 6: (1, {'@': 207}), 35: (1, {'@': 207}), 4: (1, {'@': 207}), 33: (1, {'@': 207}), 17: (1, {'@': 207}), 14: (1, {'@': 207}), 23: (1, {'@': 207}), 34: (1, {'@': 207}), 25: (1, {'@': 207}), 30: (1, {'@': 207}), 94: (1, {'@': 207}), 91: (1, {'@': 207}), 95: (1, {'@': 207}), 92: (1, {'@': 207})}, 41: {28: (0, 6)}, 42: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 103), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 1: (0, 221), 66: (0, 5), 67: (0, 139)}, 43: {18: (1, {'@': 96}), 27: (1, {'@': 96}), 29: (1, {'@': 96}), 28: (1, {'@': 96}), 11: (1, {'@': 96}), 6: (1, {'@': 96}), 35: (1, {'@': 96}), 4: (1, {'@': 96}), 33: (1, {'@': 96}), 17: (1, {'@': 96}), 14: (1, {'@': 96}), 23: (1, {'@': 96}), 34: (1, {'@': 96}), 25: (1, {'@': 96}), 30: (1, {'@': 96}), 94: (1, {'@': 96}), 91: (1, {'@': 96}), 95: (1, {'@': 96}), 92: (1, {'@': 96})}, 44: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 56: (0, 239), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 100: (0, 214), 66: (0, 5), 67: (0, 139)}, 45: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 64: (0, 261), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 46: {89: (1, {'@': 169})}, 47: {69: (1, {'@': 134}), 29: (1, {'@': 134}), 70: (1, {'@': 134}), 59: (1, {'@': 134}), 71: (1, {'@': 134}), 36: (1, {'@': 134}), 73: (1, {'@': 134}), 74: (1, {'@': 134}), 75: (1, {'@': 134}), 78: (1, {'@': 134}), 79: (1, {'@': 134}), 82: (1, {'@': 134}), 83: (1, {'@': 134}), 85: (1, {'@': 134}), 80: (1, {'@': 134}), 88: (1, {'@': 134}), 11: (1, {'@': 134}), 6: (1, {'@': 134}), 89: (1, {'@': 134}), 14: (1, {'@': 134}), 25: (1, {'@': 134}), 90: (1, {'@': 134}), 91: (1, {'@': 134}), 34: (1, {'@': 134}), 30: (1, {'@': 134}), 18: (1, {'@': 134}), 35: (1, {'@': 134}), 33: (1, {'@': 134}), 92: (1, {'@': 134}), 27: (1, {'@': 134}), 28: (1, {'@': 134}), 93: (1, {'@': 134}), 94: (1, {'@': 134}), 4: (1, {'@': 134}), 17: (1, {'@': 134}), 23: (1, {'@': 134}), 95: (1, {'@': 134})}, 48: {82: (0, 36), 75: (0, 168), 107: (0, 3), 79: (0, 100), 73: (0, 62), 69: (0, 169), 85: (0, 67), 29: (1, {'@': 124}), 83: (1, {'@': 124}), 59: (1, {'@': 124}), 71: (1, {'@': 124}), 78: (1, {'@': 124}), 18: (1, {'@': 124}), 11: (1, {'@': 124}), 6: (1, {'@': 124}), 35: (1, {'@': 124}), 89: (1, {'@': 124}), 33: (1, {'@': 124}), 14: (1, {'@': 124}), 92: (1, {'@': 124}), 25: (1, {'@': 124}), 91: (1, {'@': 124}), 27: (1, {'@': 124}), 28: (1, {'@': 124}), 94: (1, {'@': 124}), 4: (1, {'@': 124}), 17: (1, {'@': 124}), 23: (1, {'@': 124}), 34: (1, {'@': 124}), 95: (1, {'@': 124}), 30: (1, {'@': 124}), 90: (1, {'@': 124}), 93: (1, {'@': 124})}, 49: {26: (0, 87), 7: (0, 232), 28: (0, 129), 18: (0, 124), 1: (0, 221)}, 50: {4: (0, 13)}, 51: {18: (1, {'@': 159}), 29: (1, {'@': 159}), 11: (1, {'@': 159}), 6: (1, {'@': 159}), 52: (1, {'@': 159}), 33: (1, {'@': 159}), 14: (1, {'@': 159}), 23: (1, {'@': 159}), 25: (1, {'@': 159}), 27: (1, {'@': 159}), 28: (1, {'@': 159}), 97: (1, {'@': 159}), 61: (1, {'@': 159}), 4: (1, {'@': 159}), 96: (1, {'@': 159}), 17: (1, {'@': 159}), 35: (1, {'@': 159}), 34: (1, {'@': 159}), 66: (1, {'@': 159}), 30: (1, {'@': 159}), 69: (1, {'@': 159}), 70: (1, {'@': 159}), 59: (1, {'@': 159}), 71: (1, {'@': 159}), 72: (1, {'@': 159}), 43: (1, {'@': 159}), 36: (1, {'@': 159}), 86: (1, {'@': 159}), 73: (1, {'@': 159}), 74: (1, {'@': 159}), 75: (1, {'@': 159}), 76: (1, {'@': 159}), 77: (1, {'@': 159}), 78: (1, {'@': 159}), 79: (1, {'@': 159}), 81: (1, {'@': 159}), 82: (1, {'@': 159}), 83: (1, {'@': 159}), 84: (1, {'@': 159}), 85: (1, {'@': 159}), 80: (1, {'@': 159}), 87: (1, {'@': 159}), 88: (1, {'@': 159}), 89: (1, {'@': 159}), 90: (1, {'@': 159}), 91: (1, {'@': 159}), 92: (1, {'@': 159}), 93: (1, {'@': 159}), 94: (1, {'@': 159}), 95: (1, {'@': 159})}, 52: {89: (1, {'@': 170})}, 53: {108: (0, 155), 75: (0, 259), 18: (1, {'@': 101}), 29: (1, {'@': 101}), 11: (1, {'@': 101}), 6: (1, {'@': 101}), 68: (1, {'@': 101}), 33: (1, {'@': 101}), 14: (1, {'@': 101}), 23: (1, {'@': 101}), 92: (1, {'@': 101}), 25: (1, {'@': 101}), 91: (1, {'@': 101}), 27: (1, {'@': 101}), 28: (1, {'@': 101}), 94: (1, {'@': 101}), 4: (1, {'@': 101}), 83: (1, {'@': 101}), 17: (1, {'@': 101}), 34: (1, {'@': 101}), 35: (1, {'@': 101}), 95: (1, {'@': 101}), 30: (1, {'@': 101})}, 54: {27: (1, {'@': 199}), 18: (1, {'@': 199}), 62: (1, {'@': 199}), 28: (1, {'@': 199}), 67: (1, {'@': 199}), 52: (1, {'@': 199}), 45: (1, {'@': 199}), 43: (1, {'@': 199}), 36: (1, {'@': 199}), 44: (1, {'@': 199}), 58: (1, {'@': 199}), 49: (1, {'@': 199}), 48: (1, {'@': 199}), 66: (1, {'@': 199})}, 55: {18: (1, {'@': 213}), 97: (1, {'@': 213}), 96: (1, {'@': 213})}, 56: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 56: (0, 164), 66: (0, 5), 67: (0, 139)}, 57: {4: (0, 102), 83: (0, 215)}, 58: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 56: (0, 121), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 59: {28: (1, {'@': 81})}, 60: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 48: (0, 229), 49: (0, 84), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 50: (0, 82), 28: (0, 129), 1: (0, 221), 66: (0, 5), 67: (0, 139)}, 61: {72: (0, 54), 106: (0, 131), 81: (0, 90), 84: (0, 144), 87: (0, 128), 69: (1, {'@': 138}), 29: (1, {'@': 138}), 70: (1, {'@': 138}), 59: (1, {'@': 138}), 71: (1, {'@': 138}), 43: (1, {'@': 138}), 36: (1, {'@': 138}), 73: (1, {'@': 138}), 74: (1, {'@': 138}), 75: (1, {'@': 138}), 77: (1, {'@': 138}), 78: (1, {'@': 138}), 79: (1, {'@': 138}), 80: (1, {'@': 138}), 82: (1, {'@': 138}), 83: (1, {'@': 138}), 85: (1, {'@': 138}), 86: (1, {'@': 138}), 88: (1, {'@': 138}), 11: (1, {'@': 138}), 6: (1, {'@': 138}), 89: (1, {'@': 138}), 14: (1, {'@': 138}), 25: (1, {'@': 138}), 90: (1, {'@': 138}), 91: (1, {'@': 138}), 17: (1, {'@': 138}), 30: (1, {'@': 138}), 18: (1, {'@': 138}), 33: (1, {'@': 138}), 23: (1, {'@': 138}), 92: (1, {'@': 138}), 27: (1, {'@': 138}), 28: (1, {'@': 138}), 93: (1, {'@': 138}), 94: (1, {'@': 138}), 4: (1, {'@': 138}), 34: (1, {'@': 138}), 35: (1, {'@': 138}), 95: (1, {'@': 138})}, 62: {27: (1, {'@': 187}), 18: (1, {'@': 187}), 62: (1, {'@': 187}), 28: (1, {'@': 187}), 67: (1, {'@': 187}), 52: (1, {'@': 187}), 45: (1, {'@': 187}), 43: (1, {'@': 187}), 36: (1, {'@': 187}), 44: (1, {'@': 187}), 58: (1, {'@': 187}), 49: (1, {'@': 187}), 48: (1, {'@': 187}), 66: (1, {'@': 187})}, 63: {109: (0, 248), 18: (0, 21)}, 64: {29: (1, {'@': 217}), 11: (1, {'@': 217}), 6: (1, {'@': 217}), 89: (1, {'@': 217}), 14: (1, {'@': 217}), 25: (1, {'@': 217}), 91: (1, {'@': 217}), 83: (1, {'@': 217}), 34: (1, {'@': 217}), 35: (1, {'@': 217}), 18: (1, {'@': 217}), 30: (1, {'@': 217}), 33: (1, {'@': 217}), 92: (1, {'@': 217}), 27: (1, {'@': 217}), 28: (1, {'@': 217}), 94: (1, {'@': 217}), 4: (1, {'@': 217}), 17: (1, {'@': 217}), 23: (1, {'@': 217}), 95: (1, {'@': 217})}, 65: {0: (0, 104), 1: (0, 134), 2: (0, 109), 3: (0, 172), 4: (0, 177), 5: (0, 140), 6: (0, 250), 7: (0, 232), 8: (0, 106), 110: (0, 99), 10: (0, 186), 16: (0, 194), 9: (0, 18), 11: (0, 252), 12: (0, 206), 13: (0, 225), 14: (0, 183), 15: (0, 204), 17: (0, 105), 18: (0, 124), 19: (0, 222), 20: (0, 166), 21: (0, 4), 22: (0, 173), 23: (0, 260), 24: (0, 40), 25: (0, 59), 26: (0, 178), 27: (0, 156), 28: (0, 129), 29: (0, 190), 30: (0, 141), 31: (0, 0), 32: (0, 92), 33: (0, 30), 34: (0, 247), 94: (1, {'@': 63})}, 66: {27: (1, {'@': 190}), 18: (1, {'@': 190}), 62: (1, {'@': 190}), 28: (1, {'@': 190}), 67: (1, {'@': 190}), 52: (1, {'@': 190}), 45: (1, {'@': 190}), 43: (1, {'@': 190}), 36: (1, {'@': 190}), 44: (1, {'@': 190}), 58: (1, {'@': 190}), 49: (1, {'@': 190}), 48: (1, {'@': 190}), 66: (1, {'@': 190})}, 67: {27: (1, {'@': 189}), 18: (1, {'@': 189}), 62: (1, {'@': 189}), 28: (1, {'@': 189}), 67: (1, {'@': 189}), 52: (1, {'@': 189}), 45: (1, {'@': 189}), 43: (1, {'@': 189}), 36: (1, {'@': 189}), 44: (1, {'@': 189}), 58: (1, {'@': 189}), 49: (1, {'@': 189}), 48: (1, {'@': 189}), 66: (1, {'@': 189})}, 68: {18: (1, {'@': 208}), 27: (1, {'@': 208}), 29: (1, {'@': 208}), 28: (1, {'@': 208}), 11: (1, {'@': 208}), 6: (1, {'@': 208}), 35: (1, {'@': 208}), 4: (1, {'@': 208}), 33: (1, {'@': 208}), 17: (1, {'@': 208}), 14: (1, {'@': 208}), 23: (1, {'@': 208}), 34: (1, {'@': 208}), 25: (1, {'@': 208}), 30: (1, {'@': 208}), 94: (1, {'@': 208}), 91: (1, {'@': 208}), 95: (1, {'@': 208}), 92: (1, {'@': 208})}, 69: {0: (0, 104), 1: (0, 134), 2: (0, 109), 3: (0, 172), 4: (0, 177), 5: (0, 140), 6: (0, 250), 7: (0, 232), 8: (0, 106), 16: (0, 94), 9: (0, 18), 10: (0, 186), 11: (0, 252), 12: (0, 206), 13: (0, 225), 14: (0, 183), 15: (0, 204), 17: (0, 105), 18: (0, 124), 19: (0, 222), 20: (0, 166), 21: (0, 4), 22: (0, 173), 23: (0, 260), 24: (0, 40), 25: (0, 59), 26: (0, 178), 27: (0, 156), 28: (0, 129), 29: (0, 190), 30: (0, 141), 31: (0, 0), 32: (0, 92), 33: (0, 30), 34: (0, 247), 91: (1, {'@': 63}), 35: (1, {'@': 63}), 95: (1, {'@': 63})}, 70: {6: (1, {'@': 162}), 59: (1, {'@': 162}), 72: (1, {'@': 162}), 74: (1, {'@': 162}), 90: (1, {'@': 162}), 77: (1, {'@': 162}), 91: (1, {'@': 162}), 97: (1, {'@': 162}), 83: (1, {'@': 162}), 96: (1, {'@': 162}), 86: (1, {'@': 162}), 30: (1, {'@': 162}), 70: (1, {'@': 162}), 92: (1, {'@': 162}), 27: (1, {'@': 162}), 93: (1, {'@': 162}), 94: (1, {'@': 162}), 4: (1, {'@': 162}), 23: (1, {'@': 162}), 87: (1, {'@': 162}), 95: (1, {'@': 162}), 69: (1, {'@': 162}), 29: (1, {'@': 162}), 11: (1, {'@': 162}), 52: (1, {'@': 162}), 89: (1, {'@': 162}), 36: (1, {'@': 162}), 73: (1, {'@': 162}), 14: (1, {'@': 162}), 25: (1, {'@': 162}), 82: (1, {'@': 162}), 80: (1, {'@': 162}), 88: (1, {'@': 162}), 66: (1, {'@': 162}), 34: (1, {'@': 162}), 18: (1, {'@': 162}), 71: (1, {'@': 162}), 43: (1, {'@': 162}), 33: (1, {'@': 162}), 75: (1, {'@': 162}), 76: (1, {'@': 162}), 78: (1, {'@': 162}), 79: (1, {'@': 162}), 28: (1, {'@': 162}), 61: (1, {'@': 162}), 81: (1, {'@': 162}), 84: (1, {'@': 162}), 85: (1, {'@': 162}), 17: (1, {'@': 162}), 35: (1, {'@': 162})}, 71: {27: (1, {'@': 197}), 18: (1, {'@': 197}), 62: (1, {'@': 197}), 28: (1, {'@': 197}), 67: (1, {'@': 197}), 52: (1, {'@': 197}), 45: (1, {'@': 197}), 43: (1, {'@': 197}), 36: (1, {'@': 197}), 44: (1, {'@': 197}), 58: (1, {'@': 197}), 49: (1, {'@': 197}), 48: (1, {'@': 197}), 66: (1, {'@': 197})}, 72: {18: (1, {'@': 155}), 97: (1, {'@': 155}), 52: (1, {'@': 155}), 61: (1, {'@': 155}), 96: (1, {'@': 155}), 66: (1, {'@': 155}), 83: (1, {'@': 215}), 68: (1, {'@': 215})}, 73: {18: (1, {'@': 100}), 29: (1, {'@': 100}), 11: (1, {'@': 100}), 6: (1, {'@': 100}), 68: (1, {'@': 100}), 33: (1, {'@': 100}), 14: (1, {'@': 100}), 23: (1, {'@': 100}), 92: (1, {'@': 100}), 25: (1, {'@': 100}), 91: (1, {'@': 100}), 27: (1, {'@': 100}), 28: (1, {'@': 100}), 94: (1, {'@': 100}), 4: (1, {'@': 100}), 83: (1, {'@': 100}), 17: (1, {'@': 100}), 34: (1, {'@': 100}), 35: (1, {'@': 100}), 95: (1, {'@': 100}), 30: (1, {'@': 100})}, 74: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 89: (0, 136), 56: (0, 239), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 100: (0, 220), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 75: {18: (0, 21), 109: (0, 79)}, 76: {29: (1, {'@': 219}), 83: (1, {'@': 219}), 59: (1, {'@': 219})}, 77: {18: (1, {'@': 71}), 27: (1, {'@': 71}), 29: (1, {'@': 71}), 28: (1, {'@': 71}), 11: (1, {'@': 71}), 6: (1, {'@': 71}), 35: (1, {'@': 71}), 4: (1, {'@': 71}), 33: (1, {'@': 71}), 17: (1, {'@': 71}), 14: (1, {'@': 71}), 23: (1, {'@': 71}), 34: (1, {'@': 71}), 25: (1, {'@': 71}), 30: (1, {'@': 71}), 94: (1, {'@': 71}), 91: (1, {'@': 71}), 95: (1, {'@': 71}), 92: (1, {'@': 71})}, 78: {27: (1, {'@': 182}), 18: (1, {'@': 182}), 62: (1, {'@': 182}), 28: (1, {'@': 182}), 67: (1, {'@': 182}), 52: (1, {'@': 182}), 45: (1, {'@': 182}), 43: (1, {'@': 182}), 36: (1, {'@': 182}), 44: (1, {'@': 182}), 58: (1, {'@': 182}), 49: (1, {'@': 182}), 48: (1, {'@': 182}), 66: (1, {'@': 182})}, 79: {18: (1, {'@': 95}), 27: (1, {'@': 95}), 29: (1, {'@': 95}), 28: (1, {'@': 95}), 11: (1, {'@': 95}), 6: (1, {'@': 95}), 35: (1, {'@': 95}), 4: (1, {'@': 95}), 33: (1, {'@': 95}), 17: (1, {'@': 95}), 14: (1, {'@': 95}), 23: (1, {'@': 95}), 34: (1, {'@': 95}), 25: (1, {'@': 95}), 30: (1, {'@': 95}), 94: (1, {'@': 95}), 91: (1, {'@': 95}), 95: (1, {'@': 95}), 92: (1, {'@': 95})}, 80: {18: (1, {'@': 212}), 29: (1, {'@': 212}), 11: (1, {'@': 212}), 6: (1, {'@': 212}), 68: (1, {'@': 212}), 33: (1, {'@': 212}), 14: (1, {'@': 212}), 23: (1, {'@': 212}), 92: (1, {'@': 212}), 25: (1, {'@': 212}), 91: (1, {'@': 212}), 27: (1, {'@': 212}), 28: (1, {'@': 212}), 94: (1, {'@': 212}), 4: (1, {'@': 212}), 83: (1, {'@': 212}), 17: (1, {'@': 212}), 34: (1, {'@': 212}), 35: (1, {'@': 212}), 95: (1, {'@': 212}), 30: (1, {'@': 212})}, 81: {27: (1, {'@': 195}), 18: (1, {'@': 195}), 62: (1, {'@': 195}), 28: (1, {'@': 195}), 67: (1, {'@': 195}), 52: (1, {'@': 195}), 45: (1, {'@': 195}), 43: (1, {'@': 195}), 36: (1, {'@': 195}), 44: (1, {'@': 195}), 58: (1, {'@': 195}), 49: (1, {'@': 195}), 48: (1, {'@': 195}), 66: (1, {'@': 195})}, 82: {80: (0, 96), 111: (0, 107), 69: (1, {'@': 131}), 79: (1, {'@': 131}), 29: (1, {'@': 131}), 70: (1, {'@': 131}), 59: (1, {'@': 131}), 71: (1, {'@': 131}), 36: (1, {'@': 131}), 82: (1, {'@': 131}), 83: (1, {'@': 131}), 85: (1, {'@': 131}), 73: (1, {'@': 131}), 75: (1, {'@': 131}), 78: (1, {'@': 131}), 11: (1, {'@': 131}), 6: (1, {'@': 131}), 89: (1, {'@': 131}), 14: (1, {'@': 131}), 25: (1, {'@': 131}), 90: (1, {'@': 131}), 91: (1, {'@': 131}), 34: (1, {'@': 131}), 30: (1, {'@': 131}), 18: (1, {'@': 131}), 35: (1, {'@': 131}), 33: (1, {'@': 131}), 92: (1, {'@': 131}), 27: (1, {'@': 131}), 28: (1, {'@': 131}), 93: (1, {'@': 131}), 94: (1, {'@': 131}), 4: (1, {'@': 131}), 17: (1, {'@': 131}), 23: (1, {'@': 131}), 95: (1, {'@': 131})}, 83: {68: (0, 210), 112: (1, {'@': 117}), 83: (1, {'@': 117})}, 84: {69: (1, {'@': 146}), 29: (1, {'@': 146}), 70: (1, {'@': 146}), 59: (1, {'@': 146}), 71: (1, {'@': 146}), 72: (1, {'@': 146}), 43: (1, {'@': 146}), 36: (1, {'@': 146}), 73: (1, {'@': 146}), 74: (1, {'@': 146}), 75: (1, {'@': 146}), 76: (1, {'@': 146}), 77: (1, {'@': 146}), 78: (1, {'@': 146}), 79: (1, {'@': 146}), 80: (1, {'@': 146}), 81: (1, {'@': 146}), 82: (1, {'@': 146}), 83: (1, {'@': 146}), 84: (1, {'@': 146}), 85: (1, {'@': 146}), 86: (1, {'@': 146}), 87: (1, {'@': 146}), 88: (1, {'@': 146}), 11: (1, {'@': 146}), 6: (1, {'@': 146}), 89: (1, {'@': 146}), 14: (1, {'@': 146}), 25: (1, {'@': 146}), 90: (1, {'@': 146}), 91: (1, {'@': 146}), 17: (1, {'@': 146}), 30: (1, {'@': 146}), 18: (1, {'@': 146}), 33: (1, {'@': 146}), 23: (1, {'@': 146}), 92: (1, {'@': 146}), 27: (1, {'@': 146}), 28: (1, {'@': 146}), 93: (1, {'@': 146}), 94: (1, {'@': 146}), 4: (1, {'@': 146}), 34: (1, {'@': 146}), 35: (1, {'@': 146}), 95: (1, {'@': 146})}, 85: {18: (1, {'@': 69}), 27: (1, {'@': 69}), 29: (1, {'@': 69}), 28: (1, {'@': 69}), 11: (1, {'@': 69}), 6: (1, {'@': 69}), 35: (1, {'@': 69}), 4: (1, {'@': 69}), 33: (1, {'@': 69}), 17: (1, {'@': 69}), 14: (1, {'@': 69}), 23: (1, {'@': 69}), 34: (1, {'@': 69}), 25: (1, {'@': 69}), 30: (1, {'@': 69}), 94: (1, {'@': 69}), 91: (1, {'@': 69}), 95: (1, {'@': 69}), 92: (1, {'@': 69})}, 86: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 56: (0, 151), 57: (0, 137), 58: (0, 200), 60: (0, 191), 61: (0, 152), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 110), 64: (0, 233), 1: (0, 221), 39: (0, 76), 65: (0, 48), 66: (0, 5), 67: (0, 139), 59: (1, {'@': 175})}, 87: {18: (1, {'@': 155}), 97: (1, {'@': 155}), 52: (1, {'@': 155}), 61: (1, {'@': 155}), 96: (1, {'@': 155}), 66: (1, {'@': 155}), 83: (1, {'@': 216}), 68: (1, {'@': 216})}, 88: {0: (0, 104), 1: (0, 134), 2: (0, 109), 3: (0, 172), 4: (0, 177), 5: (0, 140), 6: (0, 250), 7: (0, 232), 16: (0, 122), 8: (0, 106), 9: (0, 18), 10: (0, 186), 11: (0, 252), 12: (0, 206), 13: (0, 225), 14: (0, 183), 15: (0, 204), 17: (0, 105), 18: (0, 124), 19: (0, 222), 20: (0, 166), 21: (0, 4), 22: (0, 173), 23: (0, 260), 24: (0, 40), 25: (0, 59), 26: (0, 178), 27: (0, 156), 28: (0, 129), 29: (0, 190), 30: (0, 141), 31: (0, 0), 32: (0, 92), 33: (0, 30), 34: (0, 247), 91: (1, {'@': 63}), 35: (1, {'@': 63}), 95: (1, {'@': 63})}, 89: {27: (1, {'@': 193}), 18: (1, {'@': 193}), 62: (1, {'@': 193}), 28: (1, {'@': 193}), 67: (1, {'@': 193}), 52: (1, {'@': 193}), 45: (1, {'@': 193}), 43: (1, {'@': 193}), 36: (1, {'@': 193}), 44: (1, {'@': 193}), 58: (1, {'@': 193}), 49: (1, {'@': 193}), 48: (1, {'@': 193}), 66: (1, {'@': 193})}, 90: {27: (1, {'@': 201}), 18: (1, {'@': 201}), 62: (1, {'@': 201}), 28: (1, {'@': 201}), 67: (1, {'@': 201}), 52: (1, {'@': 201}), 45: (1, {'@': 201}), 43: (1, {'@': 201}), 36: (1, {'@': 201}), 44: (1, {'@': 201}), 58: (1, {'@': 201}), 49: (1, {'@': 201}), 48: (1, {'@': 201}), 66: (1, {'@': 201})}, 91: {18: (1, {'@': 85}), 27: (1, {'@': 85}), 29: (1, {'@': 85}), 28: (1, {'@': 85}), 11: (1, {'@': 85}), 6: (1, {'@': 85}), 35: (1, {'@': 85}), 4: (1, {'@': 85}), 33: (1, {'@': 85}), 17: (1, {'@': 85}), 14: (1, {'@': 85}), 23: (1, {'@': 85}), 34: (1, {'@': 85}), 25: (1, {'@': 85}), 30: (1, {'@': 85}), 94: (1, {'@': 85}), 91: (1, {'@': 85}), 95: (1, {'@': 85}), 92: (1, {'@': 85})}, 92: {0: (0, 104), 1: (0, 134), 2: (0, 109), 3: (0, 172), 4: (0, 177), 5: (0, 140), 6: (0, 250), 7: (0, 232), 8: (0, 106), 9: (0, 18), 10: (0, 186), 11: (0, 252), 12: (0, 206), 13: (0, 225), 14: (0, 183), 15: (0, 204), 17: (0, 105), 18: (0, 124), 16: (0, 192), 19: (0, 222), 20: (0, 166), 21: (0, 4), 22: (0, 173), 23: (0, 260), 24: (0, 40), 25: (0, 59), 26: (0, 178), 27: (0, 156), 28: (0, 129), 29: (0, 190), 30: (0, 141), 31: (0, 0), 32: (0, 92), 33: (0, 30), 34: (0, 247), 92: (1, {'@': 63})}, 93: {113: (0, 60), 36: (0, 208), 69: (1, {'@': 128}), 79: (1, {'@': 128}), 29: (1, {'@': 128}), 70: (1, {'@': 128}), 59: (1, {'@': 128}), 71: (1, {'@': 128}), 82: (1, {'@': 128}), 83: (1, {'@': 128}), 85: (1, {'@': 128}), 73: (1, {'@': 128}), 75: (1, {'@': 128}), 78: (1, {'@': 128}), 11: (1, {'@': 128}), 6: (1, {'@': 128}), 89: (1, {'@': 128}), 14: (1, {'@': 128}), 25: (1, {'@': 128}), 90: (1, {'@': 128}), 91: (1, {'@': 128}), 17: (1, {'@': 128}), 30: (1, {'@': 128}), 18: (1, {'@': 128}), 33: (1, {'@': 128}), 23: (1, {'@': 128}), 92: (1, {'@': 128}), 27: (1, {'@': 128}), 28: (1, {'@': 128}), 93: (1, {'@': 128}), 94: (1, {'@': 128}), 4: (1, {'@': 128}), 34: (1, {'@': 128}), 35: (1, {'@': 128}), 95: (1, {'@': 128})}, 94: {91: (1, {'@': 89}), 35: (1, {'@': 89}), 95: (1, {'@': 89})}, 95: {36: (0, 142), 27: (0, 201), 7: (0, 117), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 48: (0, 229), 49: (0, 84), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 1: (0, 221), 37: (0, 27), 66: (0, 5), 67: (0, 139)}, 96: {27: (1, {'@': 192}), 18: (1, {'@': 192}), 62: (1, {'@': 192}), 28: (1, {'@': 192}), 67: (1, {'@': 192}), 52: (1, {'@': 192}), 45: (1, {'@': 192}), 43: (1, {'@': 192}), 36: (1, {'@': 192}), 44: (1, {'@': 192}), 58: (1, {'@': 192}), 49: (1, {'@': 192}), 48: (1, {'@': 192}), 66: (1, {'@': 192})}, 97: {89: (1, {'@': 167})}, 98: {29: (1, {'@': 220}), 83: (1, {'@': 220}), 59: (1, {'@': 220})}, 99: {}, 100: {27: (1, {'@': 186}), 18: (1, {'@': 186}), 62: (1, {'@': 186}), 28: (1, {'@': 186}), 67: (1, {'@': 186}), 52: (1, {'@': 186}), 45: (1, {'@': 186}), 43: (1, {'@': 186}), 36: (1, {'@': 186}), 44: (1, {'@': 186}), 58: (1, {'@': 186}), 49: (1, {'@': 186}), 48: (1, {'@': 186}), 66: (1, {'@': 186})}, 101: {18: (1, {'@': 106}), 27: (1, {'@': 106}), 29: (1, {'@': 106}), 28: (1, {'@': 106}), 11: (1, {'@': 106}), 6: (1, {'@': 106}), 35: (1, {'@': 106}), 4: (1, {'@': 106}), 33: (1, {'@': 106}), 17: (1, {'@': 106}), 14: (1, {'@': 106}), 23: (1, {'@': 106}), 34: (1, {'@': 106}), 25: (1, {'@': 106}), 30: (1, {'@': 106}), 94: (1, {'@': 106}), 91: (1, {'@': 106}), 95: (1, {'@': 106}), 92: (1, {'@': 106})}, 102: {0: (0, 104), 1: (0, 134), 2: (0, 109), 3: (0, 172), 4: (0, 177), 5: (0, 140), 6: (0, 250), 7: (0, 232), 8: (0, 106), 9: (0, 18), 10: (0, 186), 16: (0, 236), 11: (0, 252), 12: (0, 206), 13: (0, 225), 14: (0, 183), 15: (0, 204), 17: (0, 105), 18: (0, 124), 19: (0, 222), 20: (0, 166), 21: (0, 4), 22: (0, 173), 23: (0, 260), 24: (0, 40), 25: (0, 59), 26: (0, 178), 27: (0, 156), 28: (0, 129), 29: (0, 190), 30: (0, 141), 31: (0, 0), 32: (0, 92), 33: (0, 30), 34: (0, 247), 35: (1, {'@': 63})}, 103: {36: (0, 208), 113: (0, 60), 69: (1, {'@': 129}), 79: (1, {'@': 129}), 29: (1, {'@': 129}), 70: (1, {'@': 129}), 59: (1, {'@': 129}), 71: (1, {'@': 129}), 82: (1, {'@': 129}), 83: (1, {'@': 129}), 85: (1, {'@': 129}), 73: (1, {'@': 129}), 75: (1, {'@': 129}), 78: (1, {'@': 129}), 11: (1, {'@': 129}), 6: (1, {'@': 129}), 89: (1, {'@': 129}), 14: (1, {'@': 129}), 25: (1, {'@': 129}), 90: (1, {'@': 129}), 91: (1, {'@': 129}), 17: (1, {'@': 129}), 30: (1, {'@': 129}), 18: (1, {'@': 129}), 33: (1, {'@': 129}), 23: (1, {'@': 129}), 92: (1, {'@': 129}), 27: (1, {'@': 129}), 28: (1, {'@': 129}), 93: (1, {'@': 129}), 94: (1, {'@': 129}), 4: (1, {'@': 129}), 34: (1, {'@': 129}), 35: (1, {'@': 129}), 95: (1, {'@': 129})}, 104: {18: (1, {'@': 64}), 27: (1, {'@': 64}), 29: (1, {'@': 64}), 28: (1, {'@': 64}), 11: (1, {'@': 64}), 6: (1, {'@': 64}), 35: (1, {'@': 64}), 4: (1, {'@': 64}), 33: (1, {'@': 64}), 17: (1, {'@': 64}), 14: (1, {'@': 64}), 23: (1, {'@': 64}), 34: (1, {'@': 64}), 25: (1, {'@': 64}), 30: (1, {'@': 64}), 94: (1, {'@': 64}), 91: (1, {'@': 64}), 95: (1, {'@': 64}), 92: (1, {'@': 64})}, 105: {114: (0, 188), 28: (0, 53), 27: (0, 216)}, 106: {28: (0, 85)}, 107: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 48: (0, 229), 49: (0, 84), 46: (0, 187), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 1: (0, 221), 66: (0, 5), 67: (0, 139)}, 108: {18: (1, {'@': 93}), 27: (1, {'@': 93}), 29: (1, {'@': 93}), 28: (1, {'@': 93}), 11: (1, {'@': 93}), 6: (1, {'@': 93}), 35: (1, {'@': 93}), 4: (1, {'@': 93}), 33: (1, {'@': 93}), 17: (1, {'@': 93}), 14: (1, {'@': 93}), 23: (1, {'@': 93}), 34: (1, {'@': 93}), 25: (1, {'@': 93}), 30: (1, {'@': 93}), 94: (1, {'@': 93}), 91: (1, {'@': 93}), 95: (1, {'@': 93}), 92: (1, {'@': 93})}, 109: {18: (1, {'@': 77}), 27: (1, {'@': 77}), 29: (1, {'@': 77}), 28: (1, {'@': 77}), 11: (1, {'@': 77}), 6: (1, {'@': 77}), 35: (1, {'@': 77}), 4: (1, {'@': 77}), 33: (1, {'@': 77}), 17: (1, {'@': 77}), 14: (1, {'@': 77}), 23: (1, {'@': 77}), 34: (1, {'@': 77}), 25: (1, {'@': 77}), 30: (1, {'@': 77}), 94: (1, {'@': 77}), 91: (1, {'@': 77}), 95: (1, {'@': 77}), 92: (1, {'@': 77})}, 110: {68: (0, 234), 18: (1, {'@': 113}), 69: (1, {'@': 113}), 29: (1, {'@': 113}), 70: (1, {'@': 113}), 59: (1, {'@': 113}), 52: (1, {'@': 113}), 71: (1, {'@': 113}), 72: (1, {'@': 113}), 43: (1, {'@': 113}), 36: (1, {'@': 113}), 86: (1, {'@': 113}), 73: (1, {'@': 113}), 74: (1, {'@': 113}), 75: (1, {'@': 113}), 76: (1, {'@': 113}), 77: (1, {'@': 113}), 78: (1, {'@': 113}), 79: (1, {'@': 113}), 97: (1, {'@': 113}), 61: (1, {'@': 113}), 81: (1, {'@': 113}), 82: (1, {'@': 113}), 83: (1, {'@': 113}), 96: (1, {'@': 113}), 84: (1, {'@': 113}), 85: (1, {'@': 113}), 80: (1, {'@': 113}), 87: (1, {'@': 113}), 88: (1, {'@': 113}), 66: (1, {'@': 113})}, 111: {76: (0, 135), 115: (0, 112), 69: (1, {'@': 144}), 29: (1, {'@': 144}), 70: (1, {'@': 144}), 59: (1, {'@': 144}), 71: (1, {'@': 144}), 72: (1, {'@': 144}), 43: (1, {'@': 144}), 36: (1, {'@': 144}), 86: (1, {'@': 144}), 73: (1, {'@': 144}), 74: (1, {'@': 144}), 75: (1, {'@': 144}), 77: (1, {'@': 144}), 78: (1, {'@': 144}), 79: (1, {'@': 144}), 81: (1, {'@': 144}), 82: (1, {'@': 144}), 83: (1, {'@': 144}), 84: (1, {'@': 144}), 85: (1, {'@': 144}), 80: (1, {'@': 144}), 87: (1, {'@': 144}), 88: (1, {'@': 144}), 11: (1, {'@': 144}), 6: (1, {'@': 144}), 89: (1, {'@': 144}), 14: (1, {'@': 144}), 25: (1, {'@': 144}), 90: (1, {'@': 144}), 91: (1, {'@': 144}), 34: (1, {'@': 144}), 30: (1, {'@': 144}), 18: (1, {'@': 144}), 35: (1, {'@': 144}), 33: (1, {'@': 144}), 92: (1, {'@': 144}), 27: (1, {'@': 144}), 28: (1, {'@': 144}), 93: (1, {'@': 144}), 94: (1, {'@': 144}), 4: (1, {'@': 144}), 17: (1, {'@': 144}), 23: (1, {'@': 144}), 95: (1, {'@': 144})}, 112: {36: (0, 142), 27: (0, 201), 7: (0, 117), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 48: (0, 229), 49: (0, 84), 51: (0, 207), 18: (0, 124), 52: (0, 1), 54: (0, 34), 55: (0, 111), 58: (0, 200), 60: (0, 191), 62: (0, 226), 26: (0, 167), 28: (0, 129), 1: (0, 221), 66: (0, 5), 57: (0, 256), 67: (0, 139)}, 113: {18: (1, {'@': 157}), 97: (1, {'@': 157}), 52: (1, {'@': 157}), 61: (1, {'@': 157}), 96: (1, {'@': 157}), 66: (1, {'@': 157}), 69: (1, {'@': 157}), 29: (1, {'@': 157}), 70: (1, {'@': 157}), 59: (1, {'@': 157}), 71: (1, {'@': 157}), 72: (1, {'@': 157}), 43: (1, {'@': 157}), 36: (1, {'@': 157}), 86: (1, {'@': 157}), 73: (1, {'@': 157}), 74: (1, {'@': 157}), 75: (1, {'@': 157}), 76: (1, {'@': 157}), 77: (1, {'@': 157}), 78: (1, {'@': 157}), 79: (1, {'@': 157}), 81: (1, {'@': 157}), 82: (1, {'@': 157}), 83: (1, {'@': 157}), 84: (1, {'@': 157}), 85: (1, {'@': 157}), 80: (1, {'@': 157}), 87: (1, {'@': 157}), 88: (1, {'@': 157}), 11: (1, {'@': 157}), 6: (1, {'@': 157}), 89: (1, {'@': 157}), 14: (1, {'@': 157}), 25: (1, {'@': 157}), 90: (1, {'@': 157}), 91: (1, {'@': 157}), 30: (1, {'@': 157}), 34: (1, {'@': 157}), 35: (1, {'@': 157}), 33: (1, {'@': 157}), 92: (1, {'@': 157}), 27: (1, {'@': 157}), 28: (1, {'@': 157}), 93: (1, {'@': 157}), 94: (1, {'@': 157}), 4: (1, {'@': 157}), 17: (1, {'@': 157}), 23: (1, {'@': 157}), 95: (1, {'@': 157})}, 114: {83: (1, {'@': 117}), 89: (1, {'@': 117})}, 115: {29: (0, 118), 83: (0, 39), 116: (0, 154), 59: (1, {'@': 174})}, 116: {18: (1, {'@': 114}), 83: (1, {'@': 114}), 68: (1, {'@': 114}), 96: (1, {'@': 114}), 97: (1, {'@': 114}), 52: (1, {'@': 114}), 66: (1, {'@': 114}), 61: (1, {'@': 114}), 69: (1, {'@': 114}), 29: (1, {'@': 114}), 70: (1, {'@': 114}), 59: (1, {'@': 114}), 71: (1, {'@': 114}), 72: (1, {'@': 114}), 43: (1, {'@': 114}), 36: (1, {'@': 114}), 86: (1, {'@': 114}), 73: (1, {'@': 114}), 74: (1, {'@': 114}), 75: (1, {'@': 114}), 76: (1, {'@': 114}), 77: (1, {'@': 114}), 78: (1, {'@': 114}), 79: (1, {'@': 114}), 81: (1, {'@': 114}), 82: (1, {'@': 114}), 84: (1, {'@': 114}), 85: (1, {'@': 114}), 80: (1, {'@': 114}), 87: (1, {'@': 114}), 88: (1, {'@': 114}), 11: (1, {'@': 114}), 6: (1, {'@': 114}), 89: (1, {'@': 114}), 14: (1, {'@': 114}), 25: (1, {'@': 114}), 90: (1, {'@': 114}), 91: (1, {'@': 114}), 30: (1, {'@': 114}), 34: (1, {'@': 114}), 35: (1, {'@': 114}), 33: (1, {'@': 114}), 92: (1, {'@': 114}), 27: (1, {'@': 114}), 28: (1, {'@': 114}), 93: (1, {'@': 114}), 94: (1, {'@': 114}), 4: (1, {'@': 114}), 17: (1, {'@': 114}), 23: (1, {'@': 114}), 95: (1, {'@': 114})}, 117: {18: (0, 74), 117: (0, 241), 52: (0, 1), 61: (0, 58), 96: (0, 41), 51: (0, 70), 97: (0, 35), 66: (0, 235), 69: (1, {'@': 153}), 29: (1, {'@': 153}), 70: (1, {'@': 153}), 59: (1, {'@': 153}), 71: (1, {'@': 153}), 72: (1, {'@': 153}), 43: (1, {'@': 153}), 36: (1, {'@': 153}), 73: (1, {'@': 153}), 74: (1, {'@': 153}), 75: (1, {'@': 153}), 76: (1, {'@': 153}), 77: (1, {'@': 153}), 78: (1, {'@': 153}), 79: (1, {'@': 153}), 80: (1, {'@': 153}), 81: (1, {'@': 153}), 82: (1, {'@': 153}), 83: (1, {'@': 153}), 84: (1, {'@': 153}), 85: (1, {'@': 153}), 86: (1, {'@': 153}), 87: (1, {'@': 153}), 88: (1, {'@': 153}), 11: (1, {'@': 153}), 6: (1, {'@': 153}), 89: (1, {'@': 153}), 14: (1, {'@': 153}), 25: (1, {'@': 153}), 90: (1, {'@': 153}), 91: (1, {'@': 153}), 17: (1, {'@': 153}), 30: (1, {'@': 153}), 33: (1, {'@': 153}), 23: (1, {'@': 153}), 92: (1, {'@': 153}), 27: (1, {'@': 153}), 28: (1, {'@': 153}), 93: (1, {'@': 153}), 94: (1, {'@': 153}), 4: (1, {'@': 153}), 34: (1, {'@': 153}), 35: (1, {'@': 153}), 95: (1, {'@': 153})}, 118: {27: (1, {'@': 181}), 18: (1, {'@': 181}), 62: (1, {'@': 181}), 28: (1, {'@': 181}), 59: (1, {'@': 181}), 67: (1, {'@': 181}), 52: (1, {'@': 181}), 45: (1, {'@': 181}), 43: (1, {'@': 181}), 36: (1, {'@': 181}), 61: (1, {'@': 181}), 44: (1, {'@': 181}), 58: (1, {'@': 181}), 49: (1, {'@': 181}), 48: (1, {'@': 181}), 66: (1, {'@': 181})}, 119: {69: (1, {'@': 171}), 29: (1, {'@': 171}), 70: (1, {'@': 171}), 59: (1, {'@': 171}), 71: (1, {'@': 171}), 72: (1, {'@': 171}), 43: (1, {'@': 171}), 36: (1, {'@': 171}), 73: (1, {'@': 171}), 74: (1, {'@': 171}), 75: (1, {'@': 171}), 76: (1, {'@': 171}), 77: (1, {'@': 171}), 78: (1, {'@': 171}), 79: (1, {'@': 171}), 80: (1, {'@': 171}), 81: (1, {'@': 171}), 82: (1, {'@': 171}), 83: (1, {'@': 171}), 84: (1, {'@': 171}), 85: (1, {'@': 171}), 86: (1, {'@': 171}), 87: (1, {'@': 171}), 88: (1, {'@': 171}), 11: (1, {'@': 171}), 6: (1, {'@': 171}), 89: (1, {'@': 171}), 14: (1, {'@': 171}), 25: (1, {'@': 171}), 90: (1, {'@': 171}), 91: (1, {'@': 171}), 17: (1, {'@': 171}), 30: (1, {'@': 171}), 18: (1, {'@': 171}), 33: (1, {'@': 171}), 23: (1, {'@': 171}), 92: (1, {'@': 171}), 27: (1, {'@': 171}), 28: (1, {'@': 171}), 93: (1, {'@': 171}), 94: (1, {'@': 171}), 4: (1, {'@': 171}), 34: (1, {'@': 171}), 35: (1, {'@': 171}), 95: (1, {'@': 171}), 52: (1, {'@': 171}), 97: (1, {'@': 171}), 96: (1, {'@': 171}), 66: (1, {'@': 171}), 61: (1, {'@': 171})}, 120: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 1: (0, 221), 65: (0, 185), 66: (0, 5), 67: (0, 139)}, 121: {90: (0, 116)}, 122: {118: (0, 163), 95: (0, 182), 119: (0, 224), 35: (0, 146), 91: (0, 196), 120: (0, 23)}, 123: {28: (0, 257)}, 124: {36: (0, 142), 27: (0, 201), 56: (0, 8), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 125: {35: (1, {'@': 102}), 94: (1, {'@': 102}), 91: (1, {'@': 102}), 95: (1, {'@': 102}), 92: (1, {'@': 102})}, 126: {97: (0, 189), 96: (0, 127), 18: (1, {'@': 108})}, 127: {28: (0, 231)}, 128: {27: (1, {'@': 200}), 18: (1, {'@': 200}), 62: (1, {'@': 200}), 28: (1, {'@': 200}), 67: (1, {'@': 200}), 52: (1, {'@': 200}), 45: (1, {'@': 200}), 43: (1, {'@': 200}), 36: (1, {'@': 200}), 44: (1, {'@': 200}), 58: (1, {'@': 200}), 49: (1, {'@': 200}), 48: (1, {'@': 200}), 66: (1, {'@': 200})}, 129: {18: (1, {'@': 113}), 83: (1, {'@': 113}), 68: (1, {'@': 113}), 96: (1, {'@': 113}), 97: (1, {'@': 113}), 52: (1, {'@': 113}), 66: (1, {'@': 113}), 61: (1, {'@': 113}), 69: (1, {'@': 113}), 29: (1, {'@': 113}), 11: (1, {'@': 113}), 6: (1, {'@': 113}), 59: (1, {'@': 113}), 89: (1, {'@': 113}), 72: (1, {'@': 113}), 36: (1, {'@': 113}), 73: (1, {'@': 113}), 14: (1, {'@': 113}), 74: (1, {'@': 113}), 25: (1, {'@': 113}), 77: (1, {'@': 113}), 90: (1, {'@': 113}), 91: (1, {'@': 113}), 82: (1, {'@': 113}), 86: (1, {'@': 113}), 80: (1, {'@': 113}), 88: (1, {'@': 113}), 30: (1, {'@': 113}), 34: (1, {'@': 113}), 35: (1, {'@': 113}), 70: (1, {'@': 113}), 71: (1, {'@': 113}), 43: (1, {'@': 113}), 33: (1, {'@': 113}), 75: (1, {'@': 113}), 92: (1, {'@': 113}), 76: (1, {'@': 113}), 78: (1, {'@': 113}), 27: (1, {'@': 113}), 79: (1, {'@': 113}), 28: (1, {'@': 113}), 93: (1, {'@': 113}), 94: (1, {'@': 113}), 4: (1, {'@': 113}), 81: (1, {'@': 113}), 84: (1, {'@': 113}), 85: (1, {'@': 113}), 17: (1, {'@': 113}), 23: (1, {'@': 113}), 87: (1, {'@': 113}), 95: (1, {'@': 113})}, 130: {7: (0, 232), 26: (0, 72), 28: (0, 129), 18: (0, 124), 1: (0, 221)}, 131: {36: (0, 142), 27: (0, 201), 7: (0, 117), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 48: (0, 229), 49: (0, 84), 51: (0, 207), 18: (0, 124), 52: (0, 1), 54: (0, 34), 55: (0, 111), 58: (0, 200), 60: (0, 191), 62: (0, 226), 26: (0, 167), 28: (0, 129), 1: (0, 221), 57: (0, 153), 66: (0, 5), 67: (0, 139)}, 132: {83: (0, 197)}, 133: {29: (1, {'@': 165}), 11: (1, {'@': 165}), 6: (1, {'@': 165}), 14: (1, {'@': 165}), 25: (1, {'@': 165}), 91: (1, {'@': 165}), 34: (1, {'@': 165}), 30: (1, {'@': 165}), 18: (1, {'@': 165}), 33: (1, {'@': 165}), 23: (1, {'@': 165}), 92: (1, {'@': 165}), 27: (1, {'@': 165}), 28: (1, {'@': 165}), 94: (1, {'@': 165}), 4: (1, {'@': 165}), 17: (1, {'@': 165}), 35: (1, {'@': 165}), 95: (1, {'@': 165}), 59: (1, {'@': 165}), 72: (1, {'@': 165}), 74: (1, {'@': 165}), 90: (1, {'@': 165}), 77: (1, {'@': 165}), 83: (1, {'@': 165}), 86: (1, {'@': 165}), 70: (1, {'@': 165}), 93: (1, {'@': 165}), 87: (1, {'@': 165}), 69: (1, {'@': 165}), 89: (1, {'@': 165}), 36: (1, {'@': 165}), 73: (1, {'@': 165}), 82: (1, {'@': 165}), 80: (1, {'@': 165}), 88: (1, {'@': 165}), 71: (1, {'@': 165}), 43: (1, {'@': 165}), 75: (1, {'@': 165}), 76: (1, {'@': 165}), 78: (1, {'@': 165}), 79: (1, {'@': 165}), 81: (1, {'@': 165}), 84: (1, {'@': 165}), 85: (1, {'@': 165})}, 134: {18: (1, {'@': 156}), 97: (1, {'@': 156}), 52: (1, {'@': 156}), 61: (1, {'@': 156}), 96: (1, {'@': 156}), 66: (1, {'@': 156}), 27: (1, {'@': 66}), 29: (1, {'@': 66}), 28: (1, {'@': 66}), 11: (1, {'@': 66}), 6: (1, {'@': 66}), 35: (1, {'@': 66}), 4: (1, {'@': 66}), 33: (1, {'@': 66}), 17: (1, {'@': 66}), 14: (1, {'@': 66}), 23: (1, {'@': 66}), 34: (1, {'@': 66}), 25: (1, {'@': 66}), 30: (1, {'@': 66}), 94: (1, {'@': 66}), 91: (1, {'@': 66}), 95: (1, {'@': 66}), 92: (1, {'@': 66})}, 135: {27: (1, {'@': 202}), 18: (1, {'@': 202}), 62: (1, {'@': 202}), 28: (1, {'@': 202}), 67: (1, {'@': 202}), 52: (1, {'@': 202}), 45: (1, {'@': 202}), 43: (1, {'@': 202}), 36: (1, {'@': 202}), 44: (1, {'@': 202}), 58: (1, {'@': 202}), 49: (1, {'@': 202}), 48: (1, {'@': 202}), 66: (1, {'@': 202})}, 136: {6: (1, {'@': 161}), 59: (1, {'@': 161}), 72: (1, {'@': 161}), 74: (1, {'@': 161}), 90: (1, {'@': 161}), 77: (1, {'@': 161}), 91: (1, {'@': 161}), 97: (1, {'@': 161}), 83: (1, {'@': 161}), 96: (1, {'@': 161}), 86: (1, {'@': 161}), 30: (1, {'@': 161}), 70: (1, {'@': 161}), 92: (1, {'@': 161}), 27: (1, {'@': 161}), 93: (1, {'@': 161}), 94: (1, {'@': 161}), 4: (1, {'@': 161}), 23: (1, {'@': 161}), 87: (1, {'@': 161}), 95: (1, {'@': 161}), 69: (1, {'@': 161}), 29: (1, {'@': 161}), 11: (1, {'@': 161}), 52: (1, {'@': 161}), 89: (1, {'@': 161}), 36: (1, {'@': 161}), 73: (1, {'@': 161}), 14: (1, {'@': 161}), 25: (1, {'@': 161}), 82: (1, {'@': 161}), 80: (1, {'@': 161}), 88: (1, {'@': 161}), 66: (1, {'@': 161}), 34: (1, {'@': 161}), 18: (1, {'@': 161}), 71: (1, {'@': 161}), 43: (1, {'@': 161}), 33: (1, {'@': 161}), 75: (1, {'@': 161}), 76: (1, {'@': 161}), 78: (1, {'@': 161}), 79: (1, {'@': 161}), 28: (1, {'@': 161}), 61: (1, {'@': 161}), 81: (1, {'@': 161}), 84: (1, {'@': 161}), 85: (1, {'@': 161}), 17: (1, {'@': 161}), 35: (1, {'@': 161})}, 137: {69: (1, {'@': 140}), 29: (1, {'@': 140}), 70: (1, {'@': 140}), 59: (1, {'@': 140}), 71: (1, {'@': 140}), 72: (1, {'@': 140}), 43: (1, {'@': 140}), 36: (1, {'@': 140}), 86: (1, {'@': 140}), 73: (1, {'@': 140}), 74: (1, {'@': 140}), 75: (1, {'@': 140}), 77: (1, {'@': 140}), 78: (1, {'@': 140}), 79: (1, {'@': 140}), 81: (1, {'@': 140}), 82: (1, {'@': 140}), 83: (1, {'@': 140}), 84: (1, {'@': 140}), 85: (1, {'@': 140}), 80: (1, {'@': 140}), 87: (1, {'@': 140}), 88: (1, {'@': 140}), 11: (1, {'@': 140}), 6: (1, {'@': 140}), 89: (1, {'@': 140}), 14: (1, {'@': 140}), 25: (1, {'@': 140}), 90: (1, {'@': 140}), 91: (1, {'@': 140}), 34: (1, {'@': 140}), 30: (1, {'@': 140}), 18: (1, {'@': 140}), 35: (1, {'@': 140}), 33: (1, {'@': 140}), 92: (1, {'@': 140}), 27: (1, {'@': 140}), 28: (1, {'@': 140}), 93: (1, {'@': 140}), 94: (1, {'@': 140}), 4: (1, {'@': 140}), 17: (1, {'@': 140}), 23: (1, {'@': 140}), 95: (1, {'@': 140})}, 138: {116: (0, 86), 121: (0, 115), 29: (0, 118), 83: (0, 39), 59: (1, {'@': 176})}, 139: {27: (1, {'@': 204}), 18: (1, {'@': 204}), 62: (1, {'@': 204}), 28: (1, {'@': 204}), 67: (1, {'@': 204}), 52: (1, {'@': 204}), 45: (1, {'@': 204}), 43: (1, {'@': 204}), 36: (1, {'@': 204}), 44: (1, {'@': 204}), 58: (1, {'@': 204}), 49: (1, {'@': 204}), 48: (1, {'@': 204}), 66: (1, {'@': 204})}, 140: {0: (0, 104), 1: (0, 134), 2: (0, 109), 3: (0, 172), 4: (0, 177), 6: (0, 250), 7: (0, 232), 8: (0, 106), 9: (0, 18), 10: (0, 186), 24: (0, 68), 11: (0, 252), 12: (0, 206), 13: (0, 225), 14: (0, 183), 15: (0, 204), 17: (0, 105), 18: (0, 124), 19: (0, 222), 22: (0, 173), 21: (0, 4), 23: (0, 260), 25: (0, 59), 26: (0, 178), 27: (0, 156), 28: (0, 129), 29: (0, 190), 30: (0, 141), 31: (0, 0), 32: (0, 92), 33: (0, 30), 34: (0, 247), 20: (0, 199), 35: (1, {'@': 61}), 94: (1, {'@': 61}), 91: (1, {'@': 61}), 95: (1, {'@': 61}), 92: (1, {'@': 61})}, 141: {28: (0, 38)}, 142: {27: (1, {'@': 206}), 18: (1, {'@': 206}), 62: (1, {'@': 206}), 28: (1, {'@': 206}), 67: (1, {'@': 206}), 52: (1, {'@': 206}), 45: (1, {'@': 206}), 43: (1, {'@': 206}), 36: (1, {'@': 206}), 44: (1, {'@': 206}), 58: (1, {'@': 206}), 49: (1, {'@': 206}), 48: (1, {'@': 206}), 66: (1, {'@': 206})}, 143: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 56: (0, 239), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 100: (0, 50), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 144: {27: (1, {'@': 198}), 18: (1, {'@': 198}), 62: (1, {'@': 198}), 28: (1, {'@': 198}), 67: (1, {'@': 198}), 52: (1, {'@': 198}), 45: (1, {'@': 198}), 43: (1, {'@': 198}), 36: (1, {'@': 198}), 44: (1, {'@': 198}), 58: (1, {'@': 198}), 49: (1, {'@': 198}), 48: (1, {'@': 198}), 66: (1, {'@': 198})}, 145: {35: (0, 181)}, 146: {18: (1, {'@': 88}), 27: (1, {'@': 88}), 29: (1, {'@': 88}), 28: (1, {'@': 88}), 11: (1, {'@': 88}), 6: (1, {'@': 88}), 35: (1, {'@': 88}), 4: (1, {'@': 88}), 33: (1, {'@': 88}), 17: (1, {'@': 88}), 14: (1, {'@': 88}), 23: (1, {'@': 88}), 34: (1, {'@': 88}), 25: (1, {'@': 88}), 30: (1, {'@': 88}), 94: (1, {'@': 88}), 91: (1, {'@': 88}), 95: (1, {'@': 88}), 92: (1, {'@': 88})}, 147: {69: (1, {'@': 172}), 29: (1, {'@': 172}), 70: (1, {'@': 172}), 59: (1, {'@': 172}), 71: (1, {'@': 172}), 72: (1, {'@': 172}), 43: (1, {'@': 172}), 36: (1, {'@': 172}), 73: (1, {'@': 172}), 74: (1, {'@': 172}), 75: (1, {'@': 172}), 76: (1, {'@': 172}), 77: (1, {'@': 172}), 78: (1, {'@': 172}), 79: (1, {'@': 172}), 80: (1, {'@': 172}), 81: (1, {'@': 172}), 82: (1, {'@': 172}), 83: (1, {'@': 172}), 84: (1, {'@': 172}), 85: (1, {'@': 172}), 86: (1, {'@': 172}), 87: (1, {'@': 172}), 88: (1, {'@': 172}), 11: (1, {'@': 172}), 6: (1, {'@': 172}), 89: (1, {'@': 172}), 14: (1, {'@': 172}), 25: (1, {'@': 172}), 90: (1, {'@': 172}), 91: (1, {'@': 172}), 17: (1, {'@': 172}), 30: (1, {'@': 172}), 18: (1, {'@': 172}), 33: (1, {'@': 172}), 23: (1, {'@': 172}), 92: (1, {'@': 172}), 27: (1, {'@': 172}), 28: (1, {'@': 172}), 93: (1, {'@': 172}), 94: (1, {'@': 172}), 4: (1, {'@': 172}), 34: (1, {'@': 172}), 35: (1, {'@': 172}), 95: (1, {'@': 172}), 52: (1, {'@': 172}), 97: (1, {'@': 172}), 96: (1, {'@': 172}), 66: (1, {'@': 172}), 61: (1, {'@': 172})}, 148: {83: (1, {'@': 118}), 89: (1, {'@': 118}), 112: (1, {'@': 118})}, 149: {93: (0, 69)}, 150: {27: (1, {'@': 196}), 18: (1, {'@': 196}), 62: (1, {'@': 196}), 28: (1, {'@': 196}), 67: (1, {'@': 196}), 52: (1, {'@': 196}), 45: (1, {'@': 196}), 43: (1, {'@': 196}), 36: (1, {'@': 196}), 44: (1, {'@': 196}), 58: (1, {'@': 196}), 49: (1, {'@': 196}), 48: (1, {'@': 196}), 66: (1, {'@': 196})}, 151: {29: (1, {'@': 179}), 83: (1, {'@': 179}), 59: (1, {'@': 179})}, 152: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 56: (0, 26), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 153: {69: (1, {'@': 141}), 29: (1, {'@': 141}), 70: (1, {'@': 141}), 59: (1, {'@': 141}), 71: (1, {'@': 141}), 72: (1, {'@': 141}), 43: (1, {'@': 141}), 36: (1, {'@': 141}), 86: (1, {'@': 141}), 73: (1, {'@': 141}), 74: (1, {'@': 141}), 75: (1, {'@': 141}), 77: (1, {'@': 141}), 78: (1, {'@': 141}), 79: (1, {'@': 141}), 81: (1, {'@': 141}), 82: (1, {'@': 141}), 83: (1, {'@': 141}), 84: (1, {'@': 141}), 85: (1, {'@': 141}), 80: (1, {'@': 141}), 87: (1, {'@': 141}), 88: (1, {'@': 141}), 11: (1, {'@': 141}), 6: (1, {'@': 141}), 89: (1, {'@': 141}), 14: (1, {'@': 141}), 25: (1, {'@': 141}), 90: (1, {'@': 141}), 91: (1, {'@': 141}), 34: (1, {'@': 141}), 30: (1, {'@': 141}), 18: (1, {'@': 141}), 35: (1, {'@': 141}), 33: (1, {'@': 141}), 92: (1, {'@': 141}), 27: (1, {'@': 141}), 28: (1, {'@': 141}), 93: (1, {'@': 141}), 94: (1, {'@': 141}), 4: (1, {'@': 141}), 17: (1, {'@': 141}), 23: (1, {'@': 141}), 95: (1, {'@': 141})}, 154: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 39: (0, 98), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 56: (0, 151), 57: (0, 137), 58: (0, 200), 60: (0, 191), 61: (0, 152), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 110), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139), 59: (1, {'@': 173})}, 155: {122: (0, 242), 83: (0, 123), 29: (1, {'@': 99}), 11: (1, {'@': 99}), 6: (1, {'@': 99}), 14: (1, {'@': 99}), 25: (1, {'@': 99}), 91: (1, {'@': 99}), 34: (1, {'@': 99}), 30: (1, {'@': 99}), 18: (1, {'@': 99}), 35: (1, {'@': 99}), 68: (1, {'@': 99}), 33: (1, {'@': 99}), 92: (1, {'@': 99}), 27: (1, {'@': 99}), 28: (1, {'@': 99}), 94: (1, {'@': 99}), 4: (1, {'@': 99}), 17: (1, {'@': 99}), 23: (1, {'@': 99}), 95: (1, {'@': 99})}, 156: {28: (0, 184), 123: (0, 63)}, 157: {124: (0, 45), 71: (0, 78), 29: (1, {'@': 121}), 83: (1, {'@': 121}), 59: (1, {'@': 121}), 18: (1, {'@': 121}), 11: (1, {'@': 121}), 6: (1, {'@': 121}), 89: (1, {'@': 121}), 33: (1, {'@': 121}), 14: (1, {'@': 121}), 23: (1, {'@': 121}), 92: (1, {'@': 121}), 25: (1, {'@': 121}), 91: (1, {'@': 121}), 27: (1, {'@': 121}), 28: (1, {'@': 121}), 94: (1, {'@': 121}), 4: (1, {'@': 121}), 17: (1, {'@': 121}), 34: (1, {'@': 121}), 35: (1, {'@': 121}), 95: (1, {'@': 121}), 30: (1, {'@': 121}), 90: (1, {'@': 121}), 93: (1, {'@': 121})}, 158: {27: (1, {'@': 194}), 18: (1, {'@': 194}), 62: (1, {'@': 194}), 28: (1, {'@': 194}), 67: (1, {'@': 194}), 52: (1, {'@': 194}), 45: (1, {'@': 194}), 43: (1, {'@': 194}), 36: (1, {'@': 194}), 44: (1, {'@': 194}), 58: (1, {'@': 194}), 49: (1, {'@': 194}), 48: (1, {'@': 194}), 66: (1, {'@': 194})}, 159: {79: (0, 73)}, 160: {80: (0, 96), 111: (0, 107), 69: (1, {'@': 130}), 79: (1, {'@': 130}), 29: (1, {'@': 130}), 70: (1, {'@': 130}), 59: (1, {'@': 130}), 71: (1, {'@': 130}), 36: (1, {'@': 130}), 82: (1, {'@': 130}), 83: (1, {'@': 130}), 85: (1, {'@': 130}), 73: (1, {'@': 130}), 75: (1, {'@': 130}), 78: (1, {'@': 130}), 11: (1, {'@': 130}), 6: (1, {'@': 130}), 89: (1, {'@': 130}), 14: (1, {'@': 130}), 25: (1, {'@': 130}), 90: (1, {'@': 130}), 91: (1, {'@': 130}), 34: (1, {'@': 130}), 30: (1, {'@': 130}), 18: (1, {'@': 130}), 35: (1, {'@': 130}), 33: (1, {'@': 130}), 92: (1, {'@': 130}), 27: (1, {'@': 130}), 28: (1, {'@': 130}), 93: (1, {'@': 130}), 94: (1, {'@': 130}), 4: (1, {'@': 130}), 17: (1, {'@': 130}), 23: (1, {'@': 130}), 95: (1, {'@': 130})}, 161: {59: (0, 119)}, 162: {28: (0, 230)}, 163: {119: (0, 217), 95: (0, 182), 91: (0, 196), 120: (0, 193), 35: (0, 262)}, 164: {18: (1, {'@': 72}), 27: (1, {'@': 72}), 29: (1, {'@': 72}), 28: (1, {'@': 72}), 11: (1, {'@': 72}), 6: (1, {'@': 72}), 35: (1, {'@': 72}), 4: (1, {'@': 72}), 33: (1, {'@': 72}), 17: (1, {'@': 72}), 14: (1, {'@': 72}), 23: (1, {'@': 72}), 34: (1, {'@': 72}), 25: (1, {'@': 72}), 30: (1, {'@': 72}), 94: (1, {'@': 72}), 91: (1, {'@': 72}), 95: (1, {'@': 72}), 92: (1, {'@': 72})}, 165: {28: (0, 148), 45: (0, 52)}, 166: {35: (1, {'@': 62}), 94: (1, {'@': 62}), 91: (1, {'@': 62}), 95: (1, {'@': 62}), 92: (1, {'@': 62})}, 167: {18: (1, {'@': 155}), 69: (1, {'@': 155}), 29: (1, {'@': 155}), 70: (1, {'@': 155}), 59: (1, {'@': 155}), 52: (1, {'@': 155}), 71: (1, {'@': 155}), 72: (1, {'@': 155}), 43: (1, {'@': 155}), 36: (1, {'@': 155}), 86: (1, {'@': 155}), 73: (1, {'@': 155}), 74: (1, {'@': 155}), 75: (1, {'@': 155}), 76: (1, {'@': 155}), 77: (1, {'@': 155}), 78: (1, {'@': 155}), 79: (1, {'@': 155}), 97: (1, {'@': 155}), 61: (1, {'@': 155}), 81: (1, {'@': 155}), 82: (1, {'@': 155}), 83: (1, {'@': 155}), 96: (1, {'@': 155}), 84: (1, {'@': 155}), 85: (1, {'@': 155}), 80: (1, {'@': 155}), 87: (1, {'@': 155}), 88: (1, {'@': 155}), 66: (1, {'@': 155}), 11: (1, {'@': 155}), 6: (1, {'@': 155}), 89: (1, {'@': 155}), 14: (1, {'@': 155}), 25: (1, {'@': 155}), 90: (1, {'@': 155}), 91: (1, {'@': 155}), 30: (1, {'@': 155}), 34: (1, {'@': 155}), 35: (1, {'@': 155}), 33: (1, {'@': 155}), 92: (1, {'@': 155}), 27: (1, {'@': 155}), 28: (1, {'@': 155}), 93: (1, {'@': 155}), 94: (1, {'@': 155}), 4: (1, {'@': 155}), 17: (1, {'@': 155}), 23: (1, {'@': 155}), 95: (1, {'@': 155})}, 168: {27: (1, {'@': 184}), 18: (1, {'@': 184}), 62: (1, {'@': 184}), 28: (1, {'@': 184}), 67: (1, {'@': 184}), 52: (1, {'@': 184}), 45: (1, {'@': 184}), 43: (1, {'@': 184}), 36: (1, {'@': 184}), 44: (1, {'@': 184}), 58: (1, {'@': 184}), 49: (1, {'@': 184}), 48: (1, {'@': 184}), 66: (1, {'@': 184})}, 169: {27: (1, {'@': 188}), 18: (1, {'@': 188}), 62: (1, {'@': 188}), 28: (1, {'@': 188}), 67: (1, {'@': 188}), 52: (1, {'@': 188}), 45: (1, {'@': 188}), 43: (1, {'@': 188}), 36: (1, {'@': 188}), 44: (1, {'@': 188}), 58: (1, {'@': 188}), 49: (1, {'@': 188}), 48: (1, {'@': 188}), 66: (1, {'@': 188})}, 170: {69: (1, {'@': 164}), 29: (1, {'@': 164}), 70: (1, {'@': 164}), 59: (1, {'@': 164}), 71: (1, {'@': 164}), 72: (1, {'@': 164}), 43: (1, {'@': 164}), 36: (1, {'@': 164}), 73: (1, {'@': 164}), 74: (1, {'@': 164}), 75: (1, {'@': 164}), 76: (1, {'@': 164}), 77: (1, {'@': 164}), 78: (1, {'@': 164}), 79: (1, {'@': 164}), 80: (1, {'@': 164}), 81: (1, {'@': 164}), 82: (1, {'@': 164}), 83: (1, {'@': 164}), 84: (1, {'@': 164}), 85: (1, {'@': 164}), 86: (1, {'@': 164}), 87: (1, {'@': 164}), 88: (1, {'@': 164}), 11: (1, {'@': 164}), 6: (1, {'@': 164}), 89: (1, {'@': 164}), 14: (1, {'@': 164}), 25: (1, {'@': 164}), 90: (1, {'@': 164}), 91: (1, {'@': 164}), 17: (1, {'@': 164}), 30: (1, {'@': 164}), 18: (1, {'@': 164}), 33: (1, {'@': 164}), 23: (1, {'@': 164}), 92: (1, {'@': 164}), 27: (1, {'@': 164}), 28: (1, {'@': 164}), 93: (1, {'@': 164}), 94: (1, {'@': 164}), 4: (1, {'@': 164}), 34: (1, {'@': 164}), 35: (1, {'@': 164}), 95: (1, {'@': 164})}, 171: {0: (0, 104), 1: (0, 134), 2: (0, 109), 3: (0, 172), 4: (0, 177), 5: (0, 140), 6: (0, 250), 7: (0, 232), 8: (0, 106), 9: (0, 18), 10: (0, 186), 11: (0, 252), 12: (0, 206), 13: (0, 225), 14: (0, 183), 15: (0, 204), 17: (0, 105), 18: (0, 124), 19: (0, 222), 20: (0, 166), 21: (0, 4), 22: (0, 173), 23: (0, 260), 24: (0, 40), 25: (0, 59), 26: (0, 178), 27: (0, 156), 28: (0, 129), 29: (0, 190), 30: (0, 141), 16: (0, 263), 31: (0, 0), 32: (0, 92), 33: (0, 30), 34: (0, 247), 35: (1, {'@': 63})}, 172: {18: (1, {'@': 74}), 27: (1, {'@': 74}), 29: (1, {'@': 74}), 28: (1, {'@': 74}), 11: (1, {'@': 74}), 6: (1, {'@': 74}), 35: (1, {'@': 74}), 4: (1, {'@': 74}), 33: (1, {'@': 74}), 17: (1, {'@': 74}), 14: (1, {'@': 74}), 23: (1, {'@': 74}), 34: (1, {'@': 74}), 25: (1, {'@': 74}), 30: (1, {'@': 74}), 94: (1, {'@': 74}), 91: (1, {'@': 74}), 95: (1, {'@': 74}), 92: (1, {'@': 74})}, 173: {18: (1, {'@': 78}), 27: (1, {'@': 78}), 29: (1, {'@': 78}), 28: (1, {'@': 78}), 11: (1, {'@': 78}), 6: (1, {'@': 78}), 35: (1, {'@': 78}), 4: (1, {'@': 78}), 33: (1, {'@': 78}), 17: (1, {'@': 78}), 14: (1, {'@': 78}), 23: (1, {'@': 78}), 34: (1, {'@': 78}), 25: (1, {'@': 78}), 30: (1, {'@': 78}), 94: (1, {'@': 78}), 91: (1, {'@': 78}), 95: (1, {'@': 78}), 92: (1, {'@': 78})}, 174: {35: (1, {'@': 90})}, 175: {27: (1, {'@': 203}), 18: (1, {'@': 203}), 62: (1, {'@': 203}), 28: (1, {'@': 203}), 67: (1, {'@': 203}), 52: (1, {'@': 203}), 45: (1, {'@': 203}), 43: (1, {'@': 203}), 36: (1, {'@': 203}), 44: (1, {'@': 203}), 58: (1, {'@': 203}), 49: (1, {'@': 203}), 48: (1, {'@': 203}), 66: (1, {'@': 203})}, 176: {29: (1, {'@': 178}), 83: (1, {'@': 178}), 59: (1, {'@': 178})}, 177: {18: (1, {'@': 82}), 27: (1, {'@': 82}), 29: (1, {'@': 82}), 28: (1, {'@': 82}), 11: (1, {'@': 82}), 6: (1, {'@': 82}), 35: (1, {'@': 82}), 4: (1, {'@': 82}), 33: (1, {'@': 82}), 17: (1, {'@': 82}), 14: (1, {'@': 82}), 23: (1, {'@': 82}), 34: (1, {'@': 82}), 25: (1, {'@': 82}), 30: (1, {'@': 82})}, 178: {83: (0, 130), 125: (0, 37), 18: (1, {'@': 155}), 97: (1, {'@': 155}), 52: (1, {'@': 155}), 61: (1, {'@': 155}), 96: (1, {'@': 155}), 66: (1, {'@': 155}), 68: (1, {'@': 112})}, 179: {83: (0, 165), 89: (1, {'@': 116})}, 180: {36: (0, 142), 27: (0, 201), 7: (0, 117), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 48: (0, 229), 49: (0, 84), 51: (0, 207), 53: (0, 31), 18: (0, 124), 52: (0, 1), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 26: (0, 167), 28: (0, 129), 1: (0, 221), 66: (0, 5), 67: (0, 139)}, 181: {29: (1, {'@': 166}), 11: (1, {'@': 166}), 6: (1, {'@': 166}), 14: (1, {'@': 166}), 25: (1, {'@': 166}), 91: (1, {'@': 166}), 34: (1, {'@': 166}), 30: (1, {'@': 166}), 18: (1, {'@': 166}), 33: (1, {'@': 166}), 23: (1, {'@': 166}), 92: (1, {'@': 166}), 27: (1, {'@': 166}), 28: (1, {'@': 166}), 94: (1, {'@': 166}), 4: (1, {'@': 166}), 17: (1, {'@': 166}), 35: (1, {'@': 166}), 95: (1, {'@': 166}), 59: (1, {'@': 166}), 72: (1, {'@': 166}), 74: (1, {'@': 166}), 90: (1, {'@': 166}), 77: (1, {'@': 166}), 83: (1, {'@': 166}), 86: (1, {'@': 166}), 70: (1, {'@': 166}), 93: (1, {'@': 166}), 87: (1, {'@': 166}), 69: (1, {'@': 166}), 89: (1, {'@': 166}), 36: (1, {'@': 166}), 73: (1, {'@': 166}), 82: (1, {'@': 166}), 80: (1, {'@': 166}), 88: (1, {'@': 166}), 71: (1, {'@': 166}), 43: (1, {'@': 166}), 75: (1, {'@': 166}), 76: (1, {'@': 166}), 78: (1, {'@': 166}), 79: (1, {'@': 166}), 81: (1, {'@': 166}), 84: (1, {'@': 166}), 85: (1, {'@': 166})}, 182: {0: (0, 104), 1: (0, 134), 2: (0, 109), 3: (0, 172), 4: (0, 177), 5: (0, 140), 6: (0, 250), 7: (0, 232), 8: (0, 106), 9: (0, 18), 10: (0, 186), 11: (0, 252), 12: (0, 206), 13: (0, 225), 14: (0, 183), 15: (0, 204), 17: (0, 105), 18: (0, 124), 19: (0, 222), 20: (0, 166), 21: (0, 4), 22: (0, 173), 23: (0, 260), 16: (0, 174), 24: (0, 40), 25: (0, 59), 26: (0, 178), 27: (0, 156), 28: (0, 129), 29: (0, 190), 30: (0, 141), 31: (0, 0), 32: (0, 92), 33: (0, 30), 34: (0, 247), 35: (1, {'@': 63})}, 183: {36: (0, 142), 29: (0, 227), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 56: (0, 239), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 100: (0, 11), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139), 35: (1, {'@': 105}), 94: (1, {'@': 105}), 91: (1, {'@': 105}), 95: (1, {'@': 105}), 92: (1, {'@': 105})}, 184: {126: (0, 126), 97: (0, 162), 96: (0, 211), 18: (1, {'@': 110})}, 185: {82: (0, 36), 75: (0, 168), 107: (0, 3), 79: (0, 100), 73: (0, 62), 69: (0, 169), 85: (0, 67), 29: (1, {'@': 125}), 83: (1, {'@': 125}), 59: (1, {'@': 125}), 71: (1, {'@': 125}), 78: (1, {'@': 125}), 18: (1, {'@': 125}), 11: (1, {'@': 125}), 6: (1, {'@': 125}), 35: (1, {'@': 125}), 89: (1, {'@': 125}), 33: (1, {'@': 125}), 14: (1, {'@': 125}), 92: (1, {'@': 125}), 25: (1, {'@': 125}), 91: (1, {'@': 125}), 27: (1, {'@': 125}), 28: (1, {'@': 125}), 94: (1, {'@': 125}), 4: (1, {'@': 125}), 17: (1, {'@': 125}), 23: (1, {'@': 125}), 34: (1, {'@': 125}), 95: (1, {'@': 125}), 30: (1, {'@': 125}), 90: (1, {'@': 125}), 93: (1, {'@': 125})}, 186: {18: (1, {'@': 67}), 27: (1, {'@': 67}), 29: (1, {'@': 67}), 28: (1, {'@': 67}), 11: (1, {'@': 67}), 6: (1, {'@': 67}), 35: (1, {'@': 67}), 4: (1, {'@': 67}), 33: (1, {'@': 67}), 17: (1, {'@': 67}), 14: (1, {'@': 67}), 23: (1, {'@': 67}), 34: (1, {'@': 67}), 25: (1, {'@': 67}), 30: (1, {'@': 67}), 94: (1, {'@': 67}), 91: (1, {'@': 67}), 95: (1, {'@': 67}), 92: (1, {'@': 67})}, 187: {127: (0, 95), 74: (0, 89), 88: (0, 158), 69: (1, {'@': 133}), 79: (1, {'@': 133}), 29: (1, {'@': 133}), 70: (1, {'@': 133}), 59: (1, {'@': 133}), 71: (1, {'@': 133}), 36: (1, {'@': 133}), 82: (1, {'@': 133}), 83: (1, {'@': 133}), 85: (1, {'@': 133}), 73: (1, {'@': 133}), 80: (1, {'@': 133}), 75: (1, {'@': 133}), 78: (1, {'@': 133}), 11: (1, {'@': 133}), 6: (1, {'@': 133}), 89: (1, {'@': 133}), 14: (1, {'@': 133}), 25: (1, {'@': 133}), 90: (1, {'@': 133}), 91: (1, {'@': 133}), 17: (1, {'@': 133}), 30: (1, {'@': 133}), 18: (1, {'@': 133}), 33: (1, {'@': 133}), 23: (1, {'@': 133}), 92: (1, {'@': 133}), 27: (1, {'@': 133}), 28: (1, {'@': 133}), 93: (1, {'@': 133}), 94: (1, {'@': 133}), 4: (1, {'@': 133}), 34: (1, {'@': 133}), 35: (1, {'@': 133}), 95: (1, {'@': 133})}, 188: {68: (0, 12), 18: (1, {'@': 97}), 27: (1, {'@': 97}), 29: (1, {'@': 97}), 28: (1, {'@': 97}), 11: (1, {'@': 97}), 6: (1, {'@': 97}), 35: (1, {'@': 97}), 4: (1, {'@': 97}), 33: (1, {'@': 97}), 17: (1, {'@': 97}), 14: (1, {'@': 97}), 23: (1, {'@': 97}), 34: (1, {'@': 97}), 25: (1, {'@': 97}), 30: (1, {'@': 97}), 94: (1, {'@': 97}), 91: (1, {'@': 97}), 95: (1, {'@': 97}), 92: (1, {'@': 97})}, 189: {28: (0, 33)}, 190: {18: (1, {'@': 79}), 27: (1, {'@': 79}), 29: (1, {'@': 79}), 28: (1, {'@': 79}), 11: (1, {'@': 79}), 6: (1, {'@': 79}), 35: (1, {'@': 79}), 4: (1, {'@': 79}), 33: (1, {'@': 79}), 17: (1, {'@': 79}), 14: (1, {'@': 79}), 23: (1, {'@': 79}), 34: (1, {'@': 79}), 25: (1, {'@': 79}), 30: (1, {'@': 79}), 94: (1, {'@': 79}), 91: (1, {'@': 79}), 95: (1, {'@': 79}), 92: (1, {'@': 79})}, 191: {36: (0, 142), 27: (0, 201), 7: (0, 117), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 57: (0, 237), 48: (0, 229), 49: (0, 84), 51: (0, 207), 18: (0, 124), 52: (0, 1), 54: (0, 34), 55: (0, 111), 58: (0, 200), 60: (0, 191), 62: (0, 226), 26: (0, 167), 28: (0, 129), 1: (0, 221), 66: (0, 5), 67: (0, 139)}, 192: {92: (0, 56)}, 193: {35: (0, 91)}, 194: {94: (1, {'@': 59})}, 195: {105: (0, 42), 70: (0, 66), 69: (1, {'@': 126}), 79: (1, {'@': 126}), 29: (1, {'@': 126}), 59: (1, {'@': 126}), 71: (1, {'@': 126}), 82: (1, {'@': 126}), 83: (1, {'@': 126}), 85: (1, {'@': 126}), 73: (1, {'@': 126}), 75: (1, {'@': 126}), 78: (1, {'@': 126}), 18: (1, {'@': 126}), 11: (1, {'@': 126}), 6: (1, {'@': 126}), 89: (1, {'@': 126}), 33: (1, {'@': 126}), 14: (1, {'@': 126}), 23: (1, {'@': 126}), 92: (1, {'@': 126}), 25: (1, {'@': 126}), 91: (1, {'@': 126}), 27: (1, {'@': 126}), 28: (1, {'@': 126}), 94: (1, {'@': 126}), 4: (1, {'@': 126}), 17: (1, {'@': 126}), 35: (1, {'@': 126}), 34: (1, {'@': 126}), 95: (1, {'@': 126}), 30: (1, {'@': 126}), 90: (1, {'@': 126}), 93: (1, {'@': 126})}, 196: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 56: (0, 149), 67: (0, 139)}, 197: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 56: (0, 57), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 198: {29: (1, {'@': 177}), 83: (1, {'@': 177}), 59: (1, {'@': 177})}, 199: {35: (1, {'@': 60}), 94: (1, {'@': 60}), 91: (1, {'@': 60}), 95: (1, {'@': 60}), 92: (1, {'@': 60})}, 200: {69: (1, {'@': 147}), 29: (1, {'@': 147}), 70: (1, {'@': 147}), 59: (1, {'@': 147}), 71: (1, {'@': 147}), 72: (1, {'@': 147}), 43: (1, {'@': 147}), 36: (1, {'@': 147}), 73: (1, {'@': 147}), 74: (1, {'@': 147}), 75: (1, {'@': 147}), 76: (1, {'@': 147}), 77: (1, {'@': 147}), 78: (1, {'@': 147}), 79: (1, {'@': 147}), 80: (1, {'@': 147}), 81: (1, {'@': 147}), 82: (1, {'@': 147}), 83: (1, {'@': 147}), 84: (1, {'@': 147}), 85: (1, {'@': 147}), 86: (1, {'@': 147}), 87: (1, {'@': 147}), 88: (1, {'@': 147}), 11: (1, {'@': 147}), 6: (1, {'@': 147}), 89: (1, {'@': 147}), 14: (1, {'@': 147}), 25: (1, {'@': 147}), 90: (1, {'@': 147}), 91: (1, {'@': 147}), 17: (1, {'@': 147}), 30: (1, {'@': 147}), 18: (1, {'@': 147}), 33: (1, {'@': 147}), 23: (1, {'@': 147}), 92: (1, {'@': 147}), 27: (1, {'@': 147}), 28: (1, {'@': 147}), 93: (1, {'@': 147}), 94: (1, {'@': 147}), 4: (1, {'@': 147}), 34: (1, {'@': 147}), 35: (1, {'@': 147}), 95: (1, {'@': 147})}, 201: {18: (0, 21), 109: (0, 170)}, 202: {35: (0, 22)}, 203: {83: (0, 7), 29: (1, {'@': 119}), 11: (1, {'@': 119}), 6: (1, {'@': 119}), 14: (1, {'@': 119}), 25: (1, {'@': 119}), 91: (1, {'@': 119}), 34: (1, {'@': 119}), 35: (1, {'@': 119}), 18: (1, {'@': 119}), 30: (1, {'@': 119}), 33: (1, {'@': 119}), 92: (1, {'@': 119}), 27: (1, {'@': 119}), 28: (1, {'@': 119}), 94: (1, {'@': 119}), 4: (1, {'@': 119}), 17: (1, {'@': 119}), 23: (1, {'@': 119}), 95: (1, {'@': 119}), 89: (1, {'@': 119})}, 204: {36: (0, 142), 56: (0, 245), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 205: {35: (0, 77)}, 206: {18: (1, {'@': 68}), 27: (1, {'@': 68}), 29: (1, {'@': 68}), 28: (1, {'@': 68}), 11: (1, {'@': 68}), 6: (1, {'@': 68}), 35: (1, {'@': 68}), 4: (1, {'@': 68}), 33: (1, {'@': 68}), 17: (1, {'@': 68}), 14: (1, {'@': 68}), 23: (1, {'@': 68}), 34: (1, {'@': 68}), 25: (1, {'@': 68}), 30: (1, {'@': 68}), 94: (1, {'@': 68}), 91: (1, {'@': 68}), 95: (1, {'@': 68}), 92: (1, {'@': 68})}, 207: {69: (1, {'@': 154}), 29: (1, {'@': 154}), 70: (1, {'@': 154}), 59: (1, {'@': 154}), 71: (1, {'@': 154}), 72: (1, {'@': 154}), 43: (1, {'@': 154}), 36: (1, {'@': 154}), 73: (1, {'@': 154}), 74: (1, {'@': 154}), 75: (1, {'@': 154}), 76: (1, {'@': 154}), 77: (1, {'@': 154}), 78: (1, {'@': 154}), 79: (1, {'@': 154}), 80: (1, {'@': 154}), 81: (1, {'@': 154}), 82: (1, {'@': 154}), 83: (1, {'@': 154}), 84: (1, {'@': 154}), 85: (1, {'@': 154}), 86: (1, {'@': 154}), 87: (1, {'@': 154}), 88: (1, {'@': 154}), 11: (1, {'@': 154}), 6: (1, {'@': 154}), 89: (1, {'@': 154}), 14: (1, {'@': 154}), 25: (1, {'@': 154}), 90: (1, {'@': 154}), 91: (1, {'@': 154}), 17: (1, {'@': 154}), 30: (1, {'@': 154}), 18: (1, {'@': 154}), 33: (1, {'@': 154}), 23: (1, {'@': 154}), 92: (1, {'@': 154}), 27: (1, {'@': 154}), 28: (1, {'@': 154}), 93: (1, {'@': 154}), 94: (1, {'@': 154}), 4: (1, {'@': 154}), 34: (1, {'@': 154}), 35: (1, {'@': 154}), 95: (1, {'@': 154})}, 208: {27: (1, {'@': 191}), 18: (1, {'@': 191}), 62: (1, {'@': 191}), 28: (1, {'@': 191}), 67: (1, {'@': 191}), 52: (1, {'@': 191}), 45: (1, {'@': 191}), 43: (1, {'@': 191}), 36: (1, {'@': 191}), 44: (1, {'@': 191}), 58: (1, {'@': 191}), 49: (1, {'@': 191}), 48: (1, {'@': 191}), 66: (1, {'@': 191})}, 209: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 56: (0, 198), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 210: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 56: (0, 132), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 211: {28: (0, 55)}, 212: {18: (1, {'@': 87}), 27: (1, {'@': 87}), 29: (1, {'@': 87}), 28: (1, {'@': 87}), 11: (1, {'@': 87}), 6: (1, {'@': 87}), 35: (1, {'@': 87}), 4: (1, {'@': 87}), 33: (1, {'@': 87}), 17: (1, {'@': 87}), 14: (1, {'@': 87}), 23: (1, {'@': 87}), 34: (1, {'@': 87}), 25: (1, {'@': 87}), 30: (1, {'@': 87}), 94: (1, {'@': 87}), 91: (1, {'@': 87}), 95: (1, {'@': 87}), 92: (1, {'@': 87})}, 213: {112: (0, 143)}, 214: {18: (1, {'@': 65}), 27: (1, {'@': 65}), 29: (1, {'@': 65}), 28: (1, {'@': 65}), 11: (1, {'@': 65}), 6: (1, {'@': 65}), 35: (1, {'@': 65}), 4: (1, {'@': 65}), 33: (1, {'@': 65}), 17: (1, {'@': 65}), 14: (1, {'@': 65}), 23: (1, {'@': 65}), 34: (1, {'@': 65}), 25: (1, {'@': 65}), 30: (1, {'@': 65}), 94: (1, {'@': 65}), 91: (1, {'@': 65}), 95: (1, {'@': 65}), 92: (1, {'@': 65})}, 215: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 56: (0, 20), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 216: {28: (0, 75)}, 217: {91: (1, {'@': 210}), 35: (1, {'@': 210}), 95: (1, {'@': 210})}, 218: {89: (1, {'@': 168})}, 219: {69: (1, {'@': 137}), 29: (1, {'@': 137}), 70: (1, {'@': 137}), 59: (1, {'@': 137}), 71: (1, {'@': 137}), 36: (1, {'@': 137}), 73: (1, {'@': 137}), 74: (1, {'@': 137}), 75: (1, {'@': 137}), 78: (1, {'@': 137}), 79: (1, {'@': 137}), 82: (1, {'@': 137}), 83: (1, {'@': 137}), 85: (1, {'@': 137}), 80: (1, {'@': 137}), 88: (1, {'@': 137}), 11: (1, {'@': 137}), 6: (1, {'@': 137}), 89: (1, {'@': 137}), 14: (1, {'@': 137}), 25: (1, {'@': 137}), 90: (1, {'@': 137}), 91: (1, {'@': 137}), 34: (1, {'@': 137}), 30: (1, {'@': 137}), 18: (1, {'@': 137}), 35: (1, {'@': 137}), 33: (1, {'@': 137}), 92: (1, {'@': 137}), 27: (1, {'@': 137}), 28: (1, {'@': 137}), 93: (1, {'@': 137}), 94: (1, {'@': 137}), 4: (1, {'@': 137}), 17: (1, {'@': 137}), 23: (1, {'@': 137}), 95: (1, {'@': 137})}, 220: {89: (0, 223)}, 221: {18: (1, {'@': 156}), 69: (1, {'@': 156}), 29: (1, {'@': 156}), 70: (1, {'@': 156}), 59: (1, {'@': 156}), 52: (1, {'@': 156}), 71: (1, {'@': 156}), 72: (1, {'@': 156}), 43: (1, {'@': 156}), 36: (1, {'@': 156}), 86: (1, {'@': 156}), 73: (1, {'@': 156}), 74: (1, {'@': 156}), 75: (1, {'@': 156}), 76: (1, {'@': 156}), 77: (1, {'@': 156}), 78: (1, {'@': 156}), 79: (1, {'@': 156}), 97: (1, {'@': 156}), 61: (1, {'@': 156}), 81: (1, {'@': 156}), 82: (1, {'@': 156}), 83: (1, {'@': 156}), 96: (1, {'@': 156}), 84: (1, {'@': 156}), 85: (1, {'@': 156}), 80: (1, {'@': 156}), 87: (1, {'@': 156}), 88: (1, {'@': 156}), 66: (1, {'@': 156}), 11: (1, {'@': 156}), 6: (1, {'@': 156}), 89: (1, {'@': 156}), 14: (1, {'@': 156}), 25: (1, {'@': 156}), 90: (1, {'@': 156}), 91: (1, {'@': 156}), 30: (1, {'@': 156}), 34: (1, {'@': 156}), 35: (1, {'@': 156}), 33: (1, {'@': 156}), 92: (1, {'@': 156}), 27: (1, {'@': 156}), 28: (1, {'@': 156}), 93: (1, {'@': 156}), 94: (1, {'@': 156}), 4: (1, {'@': 156}), 17: (1, {'@': 156}), 23: (1, {'@': 156}), 95: (1, {'@': 156})}, 222: {18: (1, {'@': 73}), 27: (1, {'@': 73}), 29: (1, {'@': 73}), 28: (1, {'@': 73}), 11: (1, {'@': 73}), 6: (1, {'@': 73}), 35: (1, {'@': 73}), 4: (1, {'@': 73}), 33: (1, {'@': 73}), 17: (1, {'@': 73}), 14: (1, {'@': 73}), 23: (1, {'@': 73}), 34: (1, {'@': 73}), 25: (1, {'@': 73}), 30: (1, {'@': 73}), 94: (1, {'@': 73}), 91: (1, {'@': 73}), 95: (1, {'@': 73}), 92: (1, {'@': 73})}, 223: {6: (1, {'@': 160}), 59: (1, {'@': 160}), 72: (1, {'@': 160}), 74: (1, {'@': 160}), 90: (1, {'@': 160}), 77: (1, {'@': 160}), 91: (1, {'@': 160}), 97: (1, {'@': 160}), 83: (1, {'@': 160}), 96: (1, {'@': 160}), 86: (1, {'@': 160}), 30: (1, {'@': 160}), 70: (1, {'@': 160}), 92: (1, {'@': 160}), 27: (1, {'@': 160}), 93: (1, {'@': 160}), 94: (1, {'@': 160}), 4: (1, {'@': 160}), 23: (1, {'@': 160}), 87: (1, {'@': 160}), 95: (1, {'@': 160}), 69: (1, {'@': 160}), 29: (1, {'@': 160}), 11: (1, {'@': 160}), 52: (1, {'@': 160}), 89: (1, {'@': 160}), 36: (1, {'@': 160}), 73: (1, {'@': 160}), 14: (1, {'@': 160}), 25: (1, {'@': 160}), 82: (1, {'@': 160}), 80: (1, {'@': 160}), 88: (1, {'@': 160}), 66: (1, {'@': 160}), 34: (1, {'@': 160}), 18: (1, {'@': 160}), 71: (1, {'@': 160}), 43: (1, {'@': 160}), 33: (1, {'@': 160}), 75: (1, {'@': 160}), 76: (1, {'@': 160}), 78: (1, {'@': 160}), 79: (1, {'@': 160}), 28: (1, {'@': 160}), 61: (1, {'@': 160}), 81: (1, {'@': 160}), 84: (1, {'@': 160}), 85: (1, {'@': 160}), 17: (1, {'@': 160}), 35: (1, {'@': 160})}, 224: {91: (1, {'@': 209}), 35: (1, {'@': 209}), 95: (1, {'@': 209})}, 225: {18: (1, {'@': 75}), 27: (1, {'@': 75}), 29: (1, {'@': 75}), 28: (1, {'@': 75}), 11: (1, {'@': 75}), 6: (1, {'@': 75}), 35: (1, {'@': 75}), 4: (1, {'@': 75}), 33: (1, {'@': 75}), 17: (1, {'@': 75}), 14: (1, {'@': 75}), 23: (1, {'@': 75}), 34: (1, {'@': 75}), 25: (1, {'@': 75}), 30: (1, {'@': 75}), 94: (1, {'@': 75}), 91: (1, {'@': 75}), 95: (1, {'@': 75}), 92: (1, {'@': 75})}, 226: {69: (1, {'@': 149}), 29: (1, {'@': 149}), 70: (1, {'@': 149}), 59: (1, {'@': 149}), 71: (1, {'@': 149}), 72: (1, {'@': 149}), 43: (1, {'@': 149}), 36: (1, {'@': 149}), 73: (1, {'@': 149}), 74: (1, {'@': 149}), 75: (1, {'@': 149}), 76: (1, {'@': 149}), 77: (1, {'@': 149}), 78: (1, {'@': 149}), 79: (1, {'@': 149}), 80: (1, {'@': 149}), 81: (1, {'@': 149}), 82: (1, {'@': 149}), 83: (1, {'@': 149}), 84: (1, {'@': 149}), 85: (1, {'@': 149}), 86: (1, {'@': 149}), 87: (1, {'@': 149}), 88: (1, {'@': 149}), 11: (1, {'@': 149}), 6: (1, {'@': 149}), 89: (1, {'@': 149}), 14: (1, {'@': 149}), 25: (1, {'@': 149}), 90: (1, {'@': 149}), 91: (1, {'@': 149}), 17: (1, {'@': 149}), 30: (1, {'@': 149}), 18: (1, {'@': 149}), 33: (1, {'@': 149}), 23: (1, {'@': 149}), 92: (1, {'@': 149}), 27: (1, {'@': 149}), 28: (1, {'@': 149}), 93: (1, {'@': 149}), 94: (1, {'@': 149}), 4: (1, {'@': 149}), 34: (1, {'@': 149}), 35: (1, {'@': 149}), 95: (1, {'@': 149})}, 227: {35: (1, {'@': 104}), 94: (1, {'@': 104}), 91: (1, {'@': 104}), 95: (1, {'@': 104}), 92: (1, {'@': 104})}, 228: {18: (1, {'@': 211}), 29: (1, {'@': 211}), 11: (1, {'@': 211}), 6: (1, {'@': 211}), 68: (1, {'@': 211}), 33: (1, {'@': 211}), 14: (1, {'@': 211}), 23: (1, {'@': 211}), 92: (1, {'@': 211}), 25: (1, {'@': 211}), 91: (1, {'@': 211}), 27: (1, {'@': 211}), 28: (1, {'@': 211}), 94: (1, {'@': 211}), 4: (1, {'@': 211}), 83: (1, {'@': 211}), 17: (1, {'@': 211}), 34: (1, {'@': 211}), 35: (1, {'@': 211}), 95: (1, {'@': 211}), 30: (1, {'@': 211})}, 229: {27: (1, {'@': 205}), 18: (1, {'@': 205}), 62: (1, {'@': 205}), 28: (1, {'@': 205}), 67: (1, {'@': 205}), 52: (1, {'@': 205}), 45: (1, {'@': 205}), 43: (1, {'@': 205}), 36: (1, {'@': 205}), 44: (1, {'@': 205}), 58: (1, {'@': 205}), 49: (1, {'@': 205}), 48: (1, {'@': 205}), 66: (1, {'@': 205})}, 230: {18: (1, {'@': 109})}, 231: {18: (1, {'@': 214}), 97: (1, {'@': 214}), 96: (1, {'@': 214})}, 232: {18: (0, 74), 117: (0, 241), 52: (0, 1), 61: (0, 58), 96: (0, 41), 51: (0, 70), 97: (0, 35), 66: (0, 235)}, 233: {128: (0, 120), 78: (0, 15), 29: (1, {'@': 122}), 83: (1, {'@': 122}), 71: (1, {'@': 122}), 59: (1, {'@': 122}), 18: (1, {'@': 122}), 11: (1, {'@': 122}), 6: (1, {'@': 122}), 89: (1, {'@': 122}), 33: (1, {'@': 122}), 14: (1, {'@': 122}), 92: (1, {'@': 122}), 25: (1, {'@': 122}), 91: (1, {'@': 122}), 27: (1, {'@': 122}), 28: (1, {'@': 122}), 94: (1, {'@': 122}), 30: (1, {'@': 122}), 4: (1, {'@': 122}), 17: (1, {'@': 122}), 23: (1, {'@': 122}), 34: (1, {'@': 122}), 95: (1, {'@': 122}), 35: (1, {'@': 122}), 90: (1, {'@': 122}), 93: (1, {'@': 122})}, 234: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 56: (0, 176), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 235: {6: (1, {'@': 163}), 59: (1, {'@': 163}), 72: (1, {'@': 163}), 74: (1, {'@': 163}), 90: (1, {'@': 163}), 77: (1, {'@': 163}), 91: (1, {'@': 163}), 97: (1, {'@': 163}), 83: (1, {'@': 163}), 96: (1, {'@': 163}), 86: (1, {'@': 163}), 30: (1, {'@': 163}), 70: (1, {'@': 163}), 92: (1, {'@': 163}), 27: (1, {'@': 163}), 93: (1, {'@': 163}), 94: (1, {'@': 163}), 4: (1, {'@': 163}), 23: (1, {'@': 163}), 87: (1, {'@': 163}), 95: (1, {'@': 163}), 69: (1, {'@': 163}), 29: (1, {'@': 163}), 11: (1, {'@': 163}), 52: (1, {'@': 163}), 89: (1, {'@': 163}), 36: (1, {'@': 163}), 73: (1, {'@': 163}), 14: (1, {'@': 163}), 25: (1, {'@': 163}), 82: (1, {'@': 163}), 80: (1, {'@': 163}), 88: (1, {'@': 163}), 66: (1, {'@': 163}), 34: (1, {'@': 163}), 18: (1, {'@': 163}), 71: (1, {'@': 163}), 43: (1, {'@': 163}), 33: (1, {'@': 163}), 75: (1, {'@': 163}), 76: (1, {'@': 163}), 78: (1, {'@': 163}), 79: (1, {'@': 163}), 28: (1, {'@': 163}), 61: (1, {'@': 163}), 81: (1, {'@': 163}), 84: (1, {'@': 163}), 85: (1, {'@': 163}), 17: (1, {'@': 163}), 35: (1, {'@': 163})}, 236: {35: (0, 14)}, 237: {69: (1, {'@': 143}), 29: (1, {'@': 143}), 70: (1, {'@': 143}), 59: (1, {'@': 143}), 71: (1, {'@': 143}), 72: (1, {'@': 143}), 43: (1, {'@': 143}), 36: (1, {'@': 143}), 86: (1, {'@': 143}), 73: (1, {'@': 143}), 74: (1, {'@': 143}), 75: (1, {'@': 143}), 77: (1, {'@': 143}), 78: (1, {'@': 143}), 79: (1, {'@': 143}), 81: (1, {'@': 143}), 82: (1, {'@': 143}), 83: (1, {'@': 143}), 84: (1, {'@': 143}), 85: (1, {'@': 143}), 80: (1, {'@': 143}), 87: (1, {'@': 143}), 88: (1, {'@': 143}), 11: (1, {'@': 143}), 6: (1, {'@': 143}), 89: (1, {'@': 143}), 14: (1, {'@': 143}), 25: (1, {'@': 143}), 90: (1, {'@': 143}), 91: (1, {'@': 143}), 34: (1, {'@': 143}), 30: (1, {'@': 143}), 18: (1, {'@': 143}), 35: (1, {'@': 143}), 33: (1, {'@': 143}), 92: (1, {'@': 143}), 27: (1, {'@': 143}), 28: (1, {'@': 143}), 93: (1, {'@': 143}), 94: (1, {'@': 143}), 4: (1, {'@': 143}), 17: (1, {'@': 143}), 23: (1, {'@': 143}), 95: (1, {'@': 143})}, 238: {75: (0, 259), 108: (0, 80), 18: (1, {'@': 101}), 29: (1, {'@': 101}), 11: (1, {'@': 101}), 6: (1, {'@': 101}), 68: (1, {'@': 101}), 33: (1, {'@': 101}), 14: (1, {'@': 101}), 23: (1, {'@': 101}), 92: (1, {'@': 101}), 25: (1, {'@': 101}), 91: (1, {'@': 101}), 27: (1, {'@': 101}), 28: (1, {'@': 101}), 94: (1, {'@': 101}), 4: (1, {'@': 101}), 83: (1, {'@': 101}), 17: (1, {'@': 101}), 34: (1, {'@': 101}), 35: (1, {'@': 101}), 95: (1, {'@': 101}), 30: (1, {'@': 101})}, 239: {83: (0, 255), 129: (0, 203), 29: (1, {'@': 120}), 11: (1, {'@': 120}), 6: (1, {'@': 120}), 14: (1, {'@': 120}), 25: (1, {'@': 120}), 91: (1, {'@': 120}), 34: (1, {'@': 120}), 35: (1, {'@': 120}), 18: (1, {'@': 120}), 30: (1, {'@': 120}), 33: (1, {'@': 120}), 92: (1, {'@': 120}), 27: (1, {'@': 120}), 28: (1, {'@': 120}), 94: (1, {'@': 120}), 4: (1, {'@': 120}), 17: (1, {'@': 120}), 23: (1, {'@': 120}), 95: (1, {'@': 120}), 89: (1, {'@': 120})}, 240: {18: (0, 74), 52: (0, 1), 117: (0, 51), 51: (0, 70), 66: (0, 235)}, 241: {18: (1, {'@': 158}), 29: (1, {'@': 158}), 11: (1, {'@': 158}), 6: (1, {'@': 158}), 52: (1, {'@': 158}), 33: (1, {'@': 158}), 14: (1, {'@': 158}), 23: (1, {'@': 158}), 25: (1, {'@': 158}), 27: (1, {'@': 158}), 28: (1, {'@': 158}), 97: (1, {'@': 158}), 61: (1, {'@': 158}), 4: (1, {'@': 158}), 96: (1, {'@': 158}), 17: (1, {'@': 158}), 35: (1, {'@': 158}), 34: (1, {'@': 158}), 66: (1, {'@': 158}), 30: (1, {'@': 158}), 69: (1, {'@': 158}), 70: (1, {'@': 158}), 59: (1, {'@': 158}), 71: (1, {'@': 158}), 72: (1, {'@': 158}), 43: (1, {'@': 158}), 36: (1, {'@': 158}), 86: (1, {'@': 158}), 73: (1, {'@': 158}), 74: (1, {'@': 158}), 75: (1, {'@': 158}), 76: (1, {'@': 158}), 77: (1, {'@': 158}), 78: (1, {'@': 158}), 79: (1, {'@': 158}), 81: (1, {'@': 158}), 82: (1, {'@': 158}), 83: (1, {'@': 158}), 84: (1, {'@': 158}), 85: (1, {'@': 158}), 80: (1, {'@': 158}), 87: (1, {'@': 158}), 88: (1, {'@': 158}), 89: (1, {'@': 158}), 90: (1, {'@': 158}), 91: (1, {'@': 158}), 92: (1, {'@': 158}), 93: (1, {'@': 158}), 94: (1, {'@': 158}), 95: (1, {'@': 158})}, 242: {83: (0, 9), 29: (1, {'@': 98}), 11: (1, {'@': 98}), 6: (1, {'@': 98}), 14: (1, {'@': 98}), 25: (1, {'@': 98}), 91: (1, {'@': 98}), 34: (1, {'@': 98}), 30: (1, {'@': 98}), 18: (1, {'@': 98}), 35: (1, {'@': 98}), 68: (1, {'@': 98}), 33: (1, {'@': 98}), 92: (1, {'@': 98}), 27: (1, {'@': 98}), 28: (1, {'@': 98}), 94: (1, {'@': 98}), 4: (1, {'@': 98}), 17: (1, {'@': 98}), 23: (1, {'@': 98}), 95: (1, {'@': 98})}, 243: {93: (0, 88)}, 244: {0: (0, 104), 1: (0, 134), 2: (0, 109), 3: (0, 172), 4: (0, 177), 5: (0, 140), 6: (0, 250), 7: (0, 232), 8: (0, 106), 9: (0, 18), 10: (0, 186), 11: (0, 252), 12: (0, 206), 13: (0, 225), 14: (0, 183), 15: (0, 204), 17: (0, 105), 18: (0, 124), 16: (0, 205), 19: (0, 222), 20: (0, 166), 21: (0, 4), 22: (0, 173), 23: (0, 260), 24: (0, 40), 25: (0, 59), 26: (0, 178), 27: (0, 156), 28: (0, 129), 29: (0, 190), 30: (0, 141), 31: (0, 0), 32: (0, 92), 33: (0, 30), 34: (0, 247), 35: (1, {'@': 63})}, 245: {4: (0, 244)}, 246: {29: (1, {'@': 218}), 11: (1, {'@': 218}), 6: (1, {'@': 218}), 89: (1, {'@': 218}), 14: (1, {'@': 218}), 25: (1, {'@': 218}), 91: (1, {'@': 218}), 83: (1, {'@': 218}), 34: (1, {'@': 218}), 35: (1, {'@': 218}), 18: (1, {'@': 218}), 30: (1, {'@': 218}), 33: (1, {'@': 218}), 92: (1, {'@': 218}), 27: (1, {'@': 218}), 28: (1, {'@': 218}), 94: (1, {'@': 218}), 4: (1, {'@': 218}), 17: (1, {'@': 218}), 23: (1, {'@': 218}), 95: (1, {'@': 218})}, 247: {18: (1, {'@': 80}), 27: (1, {'@': 80}), 29: (1, {'@': 80}), 28: (1, {'@': 80}), 11: (1, {'@': 80}), 6: (1, {'@': 80}), 35: (1, {'@': 80}), 4: (1, {'@': 80}), 33: (1, {'@': 80}), 17: (1, {'@': 80}), 14: (1, {'@': 80}), 23: (1, {'@': 80}), 34: (1, {'@': 80}), 25: (1, {'@': 80}), 30: (1, {'@': 80}), 94: (1, {'@': 80}), 91: (1, {'@': 80}), 95: (1, {'@': 80}), 92: (1, {'@': 80})}, 248: {18: (1, {'@': 94}), 27: (1, {'@': 94}), 29: (1, {'@': 94}), 28: (1, {'@': 94}), 11: (1, {'@': 94}), 6: (1, {'@': 94}), 35: (1, {'@': 94}), 4: (1, {'@': 94}), 33: (1, {'@': 94}), 17: (1, {'@': 94}), 14: (1, {'@': 94}), 23: (1, {'@': 94}), 34: (1, {'@': 94}), 25: (1, {'@': 94}), 30: (1, {'@': 94}), 94: (1, {'@': 94}), 91: (1, {'@': 94}), 95: (1, {'@': 94}), 92: (1, {'@': 94})}, 249: {69: (1, {'@': 142}), 29: (1, {'@': 142}), 70: (1, {'@': 142}), 59: (1, {'@': 142}), 71: (1, {'@': 142}), 72: (1, {'@': 142}), 43: (1, {'@': 142}), 36: (1, {'@': 142}), 86: (1, {'@': 142}), 73: (1, {'@': 142}), 74: (1, {'@': 142}), 75: (1, {'@': 142}), 77: (1, {'@': 142}), 78: (1, {'@': 142}), 79: (1, {'@': 142}), 81: (1, {'@': 142}), 82: (1, {'@': 142}), 83: (1, {'@': 142}), 84: (1, {'@': 142}), 85: (1, {'@': 142}), 80: (1, {'@': 142}), 87: (1, {'@': 142}), 88: (1, {'@': 142}), 11: (1, {'@': 142}), 6: (1, {'@': 142}), 89: (1, {'@': 142}), 14: (1, {'@': 142}), 25: (1, {'@': 142}), 90: (1, {'@': 142}), 91: (1, {'@': 142}), 34: (1, {'@': 142}), 30: (1, {'@': 142}), 18: (1, {'@': 142}), 35: (1, {'@': 142}), 33: (1, {'@': 142}), 92: (1, {'@': 142}), 27: (1, {'@': 142}), 28: (1, {'@': 142}), 93: (1, {'@': 142}), 94: (1, {'@': 142}), 4: (1, {'@': 142}), 17: (1, {'@': 142}), 23: (1, {'@': 142}), 95: (1, {'@': 142})}, 250: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 56: (0, 243), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 67: (0, 139)}, 251: {36: (0, 142), 27: (0, 201), 37: (0, 219), 7: (0, 117), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 48: (0, 229), 49: (0, 84), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 1: (0, 221), 66: (0, 5), 67: (0, 139)}, 252: {18: (1, {'@': 84}), 27: (1, {'@': 84}), 29: (1, {'@': 84}), 28: (1, {'@': 84}), 92: (1, {'@': 84}), 11: (1, {'@': 84}), 6: (1, {'@': 84}), 4: (1, {'@': 84}), 33: (1, {'@': 84}), 17: (1, {'@': 84}), 14: (1, {'@': 84}), 23: (1, {'@': 84}), 34: (1, {'@': 84}), 25: (1, {'@': 84}), 30: (1, {'@': 84})}, 253: {83: (0, 254), 112: (1, {'@': 116})}, 254: {28: (0, 148)}, 255: {36: (0, 142), 27: (0, 201), 37: (0, 47), 7: (0, 117), 38: (0, 195), 41: (0, 157), 42: (0, 249), 43: (0, 175), 44: (0, 19), 45: (0, 258), 46: (0, 264), 47: (0, 93), 48: (0, 229), 49: (0, 84), 50: (0, 160), 51: (0, 207), 18: (0, 124), 52: (0, 1), 53: (0, 61), 54: (0, 34), 55: (0, 111), 57: (0, 137), 58: (0, 200), 60: (0, 191), 62: (0, 226), 63: (0, 10), 26: (0, 167), 28: (0, 129), 64: (0, 233), 1: (0, 221), 65: (0, 48), 66: (0, 5), 56: (0, 64), 67: (0, 139)}, 256: {69: (1, {'@': 145}), 29: (1, {'@': 145}), 70: (1, {'@': 145}), 59: (1, {'@': 145}), 71: (1, {'@': 145}), 72: (1, {'@': 145}), 43: (1, {'@': 145}), 36: (1, {'@': 145}), 86: (1, {'@': 145}), 73: (1, {'@': 145}), 74: (1, {'@': 145}), 75: (1, {'@': 145}), 77: (1, {'@': 145}), 78: (1, {'@': 145}), 79: (1, {'@': 145}), 81: (1, {'@': 145}), 82: (1, {'@': 145}), 83: (1, {'@': 145}), 84: (1, {'@': 145}), 85: (1, {'@': 145}), 80: (1, {'@': 145}), 87: (1, {'@': 145}), 88: (1, {'@': 145}), 11: (1, {'@': 145}), 6: (1, {'@': 145}), 89: (1, {'@': 145}), 14: (1, {'@': 145}), 25: (1, {'@': 145}), 90: (1, {'@': 145}), 91: (1, {'@': 145}), 34: (1, {'@': 145}), 30: (1, {'@': 145}), 18: (1, {'@': 145}), 35: (1, {'@': 145}), 33: (1, {'@': 145}), 92: (1, {'@': 145}), 27: (1, {'@': 145}), 28: (1, {'@': 145}), 93: (1, {'@': 145}), 94: (1, {'@': 145}), 4: (1, {'@': 145}), 17: (1, {'@': 145}), 23: (1, {'@': 145}), 95: (1, {'@': 145})}, 257: {75: (0, 259), 108: (0, 228), 18: (1, {'@': 101}), 29: (1, {'@': 101}), 11: (1, {'@': 101}), 6: (1, {'@': 101}), 68: (1, {'@': 101}), 33: (1, {'@': 101}), 14: (1, {'@': 101}), 23: (1, {'@': 101}), 92: (1, {'@': 101}), 25: (1, {'@': 101}), 91: (1, {'@': 101}), 27: (1, {'@': 101}), 28: (1, {'@': 101}), 94: (1, {'@': 101}), 4: (1, {'@': 101}), 83: (1, {'@': 101}), 17: (1, {'@': 101}), 34: (1, {'@': 101}), 35: (1, {'@': 101}), 95: (1, {'@': 101}), 30: (1, {'@': 101})}, 258: {69: (1, {'@': 151}), 29: (1, {'@': 151}), 70: (1, {'@': 151}), 59: (1, {'@': 151}), 71: (1, {'@': 151}), 72: (1, {'@': 151}), 43: (1, {'@': 151}), 36: (1, {'@': 151}), 73: (1, {'@': 151}), 74: (1, {'@': 151}), 75: (1, {'@': 151}), 76: (1, {'@': 151}), 77: (1, {'@': 151}), 78: (1, {'@': 151}), 79: (1, {'@': 151}), 80: (1, {'@': 151}), 81: (1, {'@': 151}), 82: (1, {'@': 151}), 83: (1, {'@': 151}), 84: (1, {'@': 151}), 85: (1, {'@': 151}), 86: (1, {'@': 151}), 87: (1, {'@': 151}), 88: (1, {'@': 151}), 11: (1, {'@': 151}), 6: (1, {'@': 151}), 89: (1, {'@': 151}), 14: (1, {'@': 151}), 25: (1, {'@': 151}), 90: (1, {'@': 151}), 91: (1, {'@': 151}), 17: (1, {'@': 151}), 30: (1, {'@': 151}), 18: (1, {'@': 151}), 33: (1, {'@': 151}), 23: (1, {'@': 151}), 92: (1, {'@': 151}), 27: (1, {'@': 151}), 28: (1, {'@': 151}), 93: (1, {'@': 151}), 94: (1, {'@': 151}), 4: (1, {'@': 151}), 34: (1, {'@': 151}), 35: (1, {'@': 151}), 95: (1, {'@': 151})}, 259: {28: (0, 159)}, 260: {28: (0, 83), 102: (0, 253), 104: (0, 213)}, 261: {128: (0, 120), 78: (0, 15), 29: (1, {'@': 123}), 83: (1, {'@': 123}), 71: (1, {'@': 123}), 59: (1, {'@': 123}), 18: (1, {'@': 123}), 11: (1, {'@': 123}), 6: (1, {'@': 123}), 89: (1, {'@': 123}), 33: (1, {'@': 123}), 14: (1, {'@': 123}), 92: (1, {'@': 123}), 25: (1, {'@': 123}), 91: (1, {'@': 123}), 27: (1, {'@': 123}), 28: (1, {'@': 123}), 94: (1, {'@': 123}), 30: (1, {'@': 123}), 4: (1, {'@': 123}), 17: (1, {'@': 123}), 23: (1, {'@': 123}), 34: (1, {'@': 123}), 95: (1, {'@': 123}), 35: (1, {'@': 123}), 90: (1, {'@': 123}), 93: (1, {'@': 123})}, 262: {18: (1, {'@': 86}), 27: (1, {'@': 86}), 29: (1, {'@': 86}), 28: (1, {'@': 86}), 11: (1, {'@': 86}), 6: (1, {'@': 86}), 35: (1, {'@': 86}), 4: (1, {'@': 86}), 33: (1, {'@': 86}), 17: (1, {'@': 86}), 14: (1, {'@': 86}), 23: (1, {'@': 86}), 34: (1, {'@': 86}), 25: (1, {'@': 86}), 30: (1, {'@': 86}), 94: (1, {'@': 86}), 91: (1, {'@': 86}), 95: (1, {'@': 86}), 92: (1, {'@': 86})}, 263: {35: (0, 133)}, 264: {127: (0, 95), 74: (0, 89), 88: (0, 158), 69: (1, {'@': 132}), 79: (1, {'@': 132}), 29: (1, {'@': 132}), 70: (1, {'@': 132}), 59: (1, {'@': 132}), 71: (1, {'@': 132}), 36: (1, {'@': 132}), 82: (1, {'@': 132}), 83: (1, {'@': 132}), 85: (1, {'@': 132}), 73: (1, {'@': 132}), 80: (1, {'@': 132}), 75: (1, {'@': 132}), 78: (1, {'@': 132}), 11: (1, {'@': 132}), 6: (1, {'@': 132}), 89: (1, {'@': 132}), 14: (1, {'@': 132}), 25: (1, {'@': 132}), 90: (1, {'@': 132}), 91: (1, {'@': 132}), 17: (1, {'@': 132}), 30: (1, {'@': 132}), 18: (1, {'@': 132}), 33: (1, {'@': 132}), 23: (1, {'@': 132}), 92: (1, {'@': 132}), 27: (1, {'@': 132}), 28: (1, {'@': 132}), 93: (1, {'@': 132}), 94: (1, {'@': 132}), 4: (1, {'@': 132}), 34: (1, {'@': 132}), 35: (1, {'@': 132}), 95: (1, {'@': 132})}}, 'start_states': {'chunk': 65}, 'end_states': {'chunk': 99}}, '__type__': 'ParsingFrontend'}, 'rules': [{'@': 59}, {'@': 60}, {'@': 61}, {'@': 62}, {'@': 63}, {'@': 64}, {'@': 65}, {'@': 66}, {'@': 67}, {'@': 68}, {'@': 69}, {'@': 70}, {'@': 71}, {'@': 72}, {'@': 73}, {'@': 74}, {'@': 75}, {'@': 76}, {'@': 77}, {'@': 78}, {'@': 79}, {'@': 80}, {'@': 81}, {'@': 82}, {'@': 83}, {'@': 84}, {'@': 85}, {'@': 86}, {'@': 87}, {'@': 88}, {'@': 89}, {'@': 90}, {'@': 91}, {'@': 92}, {'@': 93}, {'@': 94}, {'@': 95}, {'@': 96}, {'@': 97}, {'@': 98}, {'@': 99}, {'@': 100}, {'@': 101}, {'@': 102}, {'@': 103}, {'@': 104}, {'@': 105}, {'@': 106}, {'@': 107}, {'@': 108}, {'@': 109}, {'@': 110}, {'@': 111}, {'@': 112}, {'@': 113}, {'@': 114}, {'@': 115}, {'@': 116}, {'@': 117}, {'@': 118}, {'@': 119}, {'@': 120}, {'@': 121}, {'@': 122}, {'@': 123}, {'@': 124}, {'@': 125}, {'@': 126}, {'@': 127}, {'@': 128}, {'@': 129}, {'@': 130}, {'@': 131}, {'@': 132}, {'@': 133}, {'@': 134}, {'@': 135}, {'@': 136}, {'@': 137}, {'@': 138}, {'@': 139}, {'@': 140}, {'@': 141}, {'@': 142}, {'@': 143}, {'@': 144}, {'@': 145}, {'@': 146}, {'@': 147}, {'@': 148}, {'@': 149}, {'@': 150}, {'@': 151}, {'@': 152}, {'@': 153}, {'@': 154}, {'@': 155}, {'@': 156}, {'@': 157}, {'@': 158}, {'@': 159}, {'@': 160}, {'@': 161}, {'@': 162}, {'@': 163}, {'@': 164}, {'@': 165}, {'@': 166}, {'@': 167}, {'@': 168}, {'@': 169}, {'@': 170}, {'@': 171}, {'@': 172}, {'@': 173}, {'@': 174}, {'@': 175}, {'@': 176}, {'@': 177}, {'@': 178}, {'@': 179}, {'@': 180}, {'@': 181}, {'@': 182}, {'@': 183}, {'@': 184}, {'@': 185}, {'@': 186}, {'@': 187}, {'@': 188}, {'@': 189}, {'@': 190}, {'@': 191}, {'@': 192}, {'@': 193}, {'@': 194}, {'@': 195}, {'@': 196}, {'@': 197}, {'@': 198}, {'@': 199}, {'@': 200}, {'@': 201}, {'@': 202}, {'@': 203}, {'@': 204}, {'@': 205}, {'@': 206}, {'@': 207}, {'@': 208}, {'@': 209}, {'@': 210}, {'@': 211}, {'@': 212}, {'@': 213}, {'@': 214}, {'@': 215}, {'@': 216}, {'@': 217}, {'@': 218}, {'@': 219}, {'@': 220}], 'options': {'debug': False, 'strict': False, 'keep_all_tokens': False, 'tree_class': None, 'cache': False, 'cache_grammar': False, 'postlex': None, 'parser': 'lalr', 'lexer': 'contextual', 'transformer': None, 'start': ['chunk'], 'priority': 'normal', 'ambiguity': 'auto', 'regex': False, 'propagate_positions': False, 'lexer_callbacks': {}, 'maybe_placeholders': True, 'edit_terminals': None, 'g_regex_flags': 0, 'use_bytes': False, 'ordered_sets': True, 'import_paths': [], 'source_path': None, '_plugins': {}}, '__type__': 'Lark'}
+)
+MEMO = (
+{0: {'name': 'NUMBER', 'pattern': {'value': '(?:(?:\\+|\\-))?(?:(?:(?:[0-9])+(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+|(?:(?:[0-9])+\\.(?:(?:[0-9])+)?|\\.(?:[0-9])+)(?:(?:e|E)(?:(?:\\+|\\-))?(?:[0-9])+)?)|(?:[0-9])+)', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 1: {'name': 'STRING', 'pattern': {'value': '".*?(?<!\\\\)(\\\\\\\\)*?"', 'flags': [], 'raw': None, '_width': [2, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 2: {'name': 'WS', 'pattern': {'value': '(?:[ \t\x0c\r\n])+', 'flags': [], 'raw': None, '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 3: {'name': 'NAME', 'pattern': {'value': '[a-zA-Z_][a-zA-Z0-9_]*', 'flags': [], 'raw': '/[a-zA-Z_][a-zA-Z0-9_]*/', '_width': [1, 18446744073709551616], '__type__': 'PatternRE'}, 'priority': 0, '__type__': 'TerminalDef'}, 4: {'name': 'EQUAL', 'pattern': {'value': '=', 'flags': [], 'raw': '"="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 5: {'name': 'END', 'pattern': {'value': 'end', 'flags': [], 'raw': '"end"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 6: {'name': 'DO', 'pattern': {'value': 'do', 'flags': [], 'raw': '"do"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 7: {'name': 'UNTIL', 'pattern': {'value': 'until', 'flags': [], 'raw': '"until"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 8: {'name': 'SEMICOLON', 'pattern': {'value': ';', 'flags': [], 'raw': '";"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 9: {'name': 'BREAK', 'pattern': {'value': 'break', 'flags': [], 'raw': '"break"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 10: {'name': 'GOTO', 'pattern': {'value': 'goto', 'flags': [], 'raw': '"goto"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 11: {'name': 'WHILE', 'pattern': {'value': 'while', 'flags': [], 'raw': '"while"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 12: {'name': 'REPEAT', 'pattern': {'value': 'repeat', 'flags': [], 'raw': '"repeat"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 13: {'name': 'IF', 'pattern': {'value': 'if', 'flags': [], 'raw': '"if"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 14: {'name': 'THEN', 'pattern': {'value': 'then', 'flags': [], 'raw': '"then"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 15: {'name': 'ELSEIF', 'pattern': {'value': 'elseif', 'flags': [], 'raw': '"elseif"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 16: {'name': 'ELSE', 'pattern': {'value': 'else', 'flags': [], 'raw': '"else"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 17: {'name': 'COMMA', 'pattern': {'value': ',', 'flags': [], 'raw': '","', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 18: {'name': 'FOR', 'pattern': {'value': 'for', 'flags': [], 'raw': '"for"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 19: {'name': 'IN', 'pattern': {'value': 'in', 'flags': [], 'raw': '"in"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 20: {'name': 'FUNCTION', 'pattern': {'value': 'function', 'flags': [], 'raw': '"function"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 21: {'name': 'LOCAL', 'pattern': {'value': 'local', 'flags': [], 'raw': '"local"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 22: {'name': 'LESSTHAN', 'pattern': {'value': '<', 'flags': [], 'raw': '"<"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 23: {'name': 'MORETHAN', 'pattern': {'value': '>', 'flags': [], 'raw': '">"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 24: {'name': 'RETURN', 'pattern': {'value': 'return', 'flags': [], 'raw': '"return"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 25: {'name': '__ANON_0', 'pattern': {'value': '::', 'flags': [], 'raw': '"::"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 26: {'name': 'DOT', 'pattern': {'value': '.', 'flags': [], 'raw': '"."', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 27: {'name': 'COLON', 'pattern': {'value': ':', 'flags': [], 'raw': '":"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 28: {'name': 'LSQB', 'pattern': {'value': '[', 'flags': [], 'raw': '"["', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 29: {'name': 'RSQB', 'pattern': {'value': ']', 'flags': [], 'raw': '"]"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 30: {'name': 'NIL', 'pattern': {'value': 'nil', 'flags': [], 'raw': '"nil"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 31: {'name': 'FALSE', 'pattern': {'value': 'false', 'flags': [], 'raw': '"false"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 32: {'name': 'TRUE', 'pattern': {'value': 'true', 'flags': [], 'raw': '"true"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 33: {'name': '__ANON_1', 'pattern': {'value': '...', 'flags': [], 'raw': '"..."', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 34: {'name': 'LPAR', 'pattern': {'value': '(', 'flags': [], 'raw': '"("', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 35: {'name': 'RPAR', 'pattern': {'value': ')', 'flags': [], 'raw': '")"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 36: {'name': 'LBRACE', 'pattern': {'value': '{', 'flags': [], 'raw': '"{"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 37: {'name': 'RBRACE', 'pattern': {'value': '}', 'flags': [], 'raw': '"}"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 38: {'name': 'OR', 'pattern': {'value': 'or', 'flags': [], 'raw': '"or"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 39: {'name': 'AND', 'pattern': {'value': 'and', 'flags': [], 'raw': '"and"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 40: {'name': '__ANON_2', 'pattern': {'value': '<=', 'flags': [], 'raw': '"<="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 41: {'name': '__ANON_3', 'pattern': {'value': '>=', 'flags': [], 'raw': '">="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 42: {'name': '__ANON_4', 'pattern': {'value': '==', 'flags': [], 'raw': '"=="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 43: {'name': '__ANON_5', 'pattern': {'value': '~=', 'flags': [], 'raw': '"~="', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 44: {'name': 'VBAR', 'pattern': {'value': '|', 'flags': [], 'raw': '"|"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 45: {'name': 'TILDE', 'pattern': {'value': '~', 'flags': [], 'raw': '"~"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 46: {'name': 'AMPERSAND', 'pattern': {'value': '&', 'flags': [], 'raw': '"&"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 47: {'name': '__ANON_6', 'pattern': {'value': '>>', 'flags': [], 'raw': '">>"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 48: {'name': '__ANON_7', 'pattern': {'value': '<<', 'flags': [], 'raw': '"<<"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 49: {'name': '__ANON_8', 'pattern': {'value': '..', 'flags': [], 'raw': '".."', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 50: {'name': 'PLUS', 'pattern': {'value': '+', 'flags': [], 'raw': '"+"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 51: {'name': 'MINUS', 'pattern': {'value': '-', 'flags': [], 'raw': '"-"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 52: {'name': 'STAR', 'pattern': {'value': '*', 'flags': [], 'raw': '"*"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 53: {'name': 'SLASH', 'pattern': {'value': '/', 'flags': [], 'raw': '"/"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 54: {'name': '__ANON_9', 'pattern': {'value': '//', 'flags': [], 'raw': '"//"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 55: {'name': 'PERCENT', 'pattern': {'value': '%', 'flags': [], 'raw': '"%"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 56: {'name': 'CIRCUMFLEX', 'pattern': {'value': '^', 'flags': [], 'raw': '"^"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 57: {'name': 'NOT', 'pattern': {'value': 'not', 'flags': [], 'raw': '"not"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 58: {'name': 'HASH', 'pattern': {'value': '#', 'flags': [], 'raw': '"#"', '__type__': 'PatternStr'}, 'priority': 0, '__type__': 'TerminalDef'}, 59: {'origin': {'name': 'chunk', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'block', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 60: {'origin': {'name': 'block', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__block_star_0', '__type__': 'NonTerminal'}, {'name': 'retstat', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 61: {'origin': {'name': 'block', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__block_star_0', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 62: {'origin': {'name': 'block', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'retstat', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 63: {'origin': {'name': 'block', '__type__': 'NonTerminal'}, 'expansion': [], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 64: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'semicolon', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 65: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'varlist', '__type__': 'NonTerminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'explist', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 66: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'functioncall', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 67: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'label', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 68: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'break', '__type__': 'NonTerminal'}], 'order': 4, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 69: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'goto', '__type__': 'NonTerminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 70: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'do', '__type__': 'NonTerminal'}, {'name': 'block', '__type__': 'NonTerminal'}, {'name': 'END', 'filter_out': True, '__type__': 'Terminal'}], 'order': 6, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 71: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'while', '__type__': 'NonTerminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'DO', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'block', '__type__': 'NonTerminal'}, {'name': 'END', 'filter_out': True, '__type__': 'Terminal'}], 'order': 7, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 72: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'repeat', '__type__': 'NonTerminal'}, {'name': 'block', '__type__': 'NonTerminal'}, {'name': 'UNTIL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}], 'order': 8, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 73: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'if_stmt', '__type__': 'NonTerminal'}], 'order': 9, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 74: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'for_range', '__type__': 'NonTerminal'}], 'order': 10, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 75: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'for_in', '__type__': 'NonTerminal'}], 'order': 11, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 76: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'function_def', '__type__': 'NonTerminal'}], 'order': 12, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 77: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'local_function', '__type__': 'NonTerminal'}], 'order': 13, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 78: {'origin': {'name': 'stat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'local_assign', '__type__': 'NonTerminal'}], 'order': 14, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 79: {'origin': {'name': 'semicolon', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 80: {'origin': {'name': 'break', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'BREAK', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 81: {'origin': {'name': 'goto', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'GOTO', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 82: {'origin': {'name': 'do', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DO', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 83: {'origin': {'name': 'while', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'WHILE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 84: {'origin': {'name': 'repeat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'REPEAT', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 85: {'origin': {'name': 'if_stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'block', '__type__': 'NonTerminal'}, {'name': '__if_stmt_star_1', '__type__': 'NonTerminal'}, {'name': 'else_block', '__type__': 'NonTerminal'}, {'name': 'END', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 86: {'origin': {'name': 'if_stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'block', '__type__': 'NonTerminal'}, {'name': '__if_stmt_star_1', '__type__': 'NonTerminal'}, {'name': 'END', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 87: {'origin': {'name': 'if_stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'block', '__type__': 'NonTerminal'}, {'name': 'else_block', '__type__': 'NonTerminal'}, {'name': 'END', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 88: {'origin': {'name': 'if_stmt', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'IF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'block', '__type__': 'NonTerminal'}, {'name': 'END', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 89: {'origin': {'name': 'elseif_block', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ELSEIF', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'THEN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'block', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 90: {'origin': {'name': 'else_block', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'ELSE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'block', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 91: {'origin': {'name': 'for_range', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'DO', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'block', '__type__': 'NonTerminal'}, {'name': 'END', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 92: {'origin': {'name': 'for_range', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'DO', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'block', '__type__': 'NonTerminal'}, {'name': 'END', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 93: {'origin': {'name': 'for_in', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FOR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'namelist', '__type__': 'NonTerminal'}, {'name': 'IN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'explist', '__type__': 'NonTerminal'}, {'name': 'DO', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'block', '__type__': 'NonTerminal'}, {'name': 'END', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 94: {'origin': {'name': 'function_def', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FUNCTION', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'funcname', '__type__': 'NonTerminal'}, {'name': 'funcbody', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 95: {'origin': {'name': 'local_function', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LOCAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'FUNCTION', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'funcbody', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 96: {'origin': {'name': 'local_assign', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LOCAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'attnamelist', '__type__': 'NonTerminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'explist', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 97: {'origin': {'name': 'local_assign', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LOCAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'attnamelist', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 98: {'origin': {'name': 'attnamelist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'attrib', '__type__': 'NonTerminal'}, {'name': '__attnamelist_star_2', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 99: {'origin': {'name': 'attnamelist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'attrib', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 100: {'origin': {'name': 'attrib', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LESSTHAN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'MORETHAN', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 101: {'origin': {'name': 'attrib', '__type__': 'NonTerminal'}, 'expansion': [], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 102: {'origin': {'name': 'retstat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'RETURN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'explist', '__type__': 'NonTerminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 103: {'origin': {'name': 'retstat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'RETURN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'explist', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 104: {'origin': {'name': 'retstat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'RETURN', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 105: {'origin': {'name': 'retstat', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'RETURN', 'filter_out': True, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 106: {'origin': {'name': 'label', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__ANON_0', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 107: {'origin': {'name': 'funcname', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__funcname_star_3', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 108: {'origin': {'name': 'funcname', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': '__funcname_star_3', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 109: {'origin': {'name': 'funcname', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 110: {'origin': {'name': 'funcname', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 111: {'origin': {'name': 'varlist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'var', '__type__': 'NonTerminal'}, {'name': '__varlist_star_4', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 112: {'origin': {'name': 'varlist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'var', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 113: {'origin': {'name': 'var', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 114: {'origin': {'name': 'var', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'prefixexp', '__type__': 'NonTerminal'}, {'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 115: {'origin': {'name': 'var', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'prefixexp', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 116: {'origin': {'name': 'namelist', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_names', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 117: {'origin': {'name': '_names', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 118: {'origin': {'name': '_names', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_names', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 119: {'origin': {'name': 'explist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'exp', '__type__': 'NonTerminal'}, {'name': '__explist_star_5', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 120: {'origin': {'name': 'explist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 121: {'origin': {'name': 'exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'or_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 122: {'origin': {'name': 'or_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'and_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 123: {'origin': {'name': 'or_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'or_exp', '__type__': 'NonTerminal'}, {'name': 'or_op', '__type__': 'NonTerminal'}, {'name': 'and_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 124: {'origin': {'name': 'and_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'cmp_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 125: {'origin': {'name': 'and_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'and_exp', '__type__': 'NonTerminal'}, {'name': 'and_op', '__type__': 'NonTerminal'}, {'name': 'cmp_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 126: {'origin': {'name': 'cmp_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bor_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 127: {'origin': {'name': 'cmp_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'cmp_exp', '__type__': 'NonTerminal'}, {'name': 'cmp_op', '__type__': 'NonTerminal'}, {'name': 'bor_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 128: {'origin': {'name': 'bor_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bxor_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 129: {'origin': {'name': 'bor_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bor_exp', '__type__': 'NonTerminal'}, {'name': 'bor_op', '__type__': 'NonTerminal'}, {'name': 'bxor_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 130: {'origin': {'name': 'bxor_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'band_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 131: {'origin': {'name': 'bxor_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'bxor_exp', '__type__': 'NonTerminal'}, {'name': 'bxor_op', '__type__': 'NonTerminal'}, {'name': 'band_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 132: {'origin': {'name': 'band_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'shift_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 133: {'origin': {'name': 'band_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'band_exp', '__type__': 'NonTerminal'}, {'name': 'band_op', '__type__': 'NonTerminal'}, {'name': 'shift_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 134: {'origin': {'name': 'shift_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'concat_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 135: {'origin': {'name': 'shift_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'shift_exp', '__type__': 'NonTerminal'}, {'name': 'shift_op', '__type__': 'NonTerminal'}, {'name': 'concat_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 136: {'origin': {'name': 'concat_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'add_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 137: {'origin': {'name': 'concat_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'add_exp', '__type__': 'NonTerminal'}, {'name': 'concat_op', '__type__': 'NonTerminal'}, {'name': 'concat_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 138: {'origin': {'name': 'add_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'mul_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 139: {'origin': {'name': 'add_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'add_exp', '__type__': 'NonTerminal'}, {'name': 'add_op', '__type__': 'NonTerminal'}, {'name': 'mul_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 140: {'origin': {'name': 'mul_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unary_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 141: {'origin': {'name': 'mul_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'mul_exp', '__type__': 'NonTerminal'}, {'name': 'mul_op', '__type__': 'NonTerminal'}, {'name': 'unary_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 142: {'origin': {'name': 'unary_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'pow_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 143: {'origin': {'name': 'unary_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'unop', '__type__': 'NonTerminal'}, {'name': 'unary_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 144: {'origin': {'name': 'pow_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'simple_exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 145: {'origin': {'name': 'pow_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'simple_exp', '__type__': 'NonTerminal'}, {'name': 'pow_op', '__type__': 'NonTerminal'}, {'name': 'unary_exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': True, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 146: {'origin': {'name': 'simple_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NIL', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 147: {'origin': {'name': 'simple_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FALSE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 148: {'origin': {'name': 'simple_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TRUE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 149: {'origin': {'name': 'simple_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NUMBER', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 150: {'origin': {'name': 'simple_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 151: {'origin': {'name': 'simple_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_1', 'filter_out': True, '__type__': 'Terminal'}], 'order': 5, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 152: {'origin': {'name': 'simple_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'functiondef', '__type__': 'NonTerminal'}], 'order': 6, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 153: {'origin': {'name': 'simple_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'prefixexp', '__type__': 'NonTerminal'}], 'order': 7, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 154: {'origin': {'name': 'simple_exp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tableconstructor', '__type__': 'NonTerminal'}], 'order': 8, 'alias': 'exp', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 155: {'origin': {'name': 'prefixexp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'var', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': 2, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 156: {'origin': {'name': 'prefixexp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'functioncall', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': 2, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 157: {'origin': {'name': 'prefixexp', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': 2, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 158: {'origin': {'name': 'functioncall', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'prefixexp', '__type__': 'NonTerminal'}, {'name': 'args', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 159: {'origin': {'name': 'functioncall', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'prefixexp', '__type__': 'NonTerminal'}, {'name': 'COLON', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'args', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 160: {'origin': {'name': 'args', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'explist', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 161: {'origin': {'name': 'args', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 162: {'origin': {'name': 'args', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'tableconstructor', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 163: {'origin': {'name': 'args', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STRING', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 164: {'origin': {'name': 'functiondef', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'FUNCTION', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'funcbody', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 165: {'origin': {'name': 'funcbody', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'parlist', '__type__': 'NonTerminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'block', '__type__': 'NonTerminal'}, {'name': 'END', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 166: {'origin': {'name': 'funcbody', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RPAR', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'block', '__type__': 'NonTerminal'}, {'name': 'END', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 167: {'origin': {'name': 'parlist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'namelist', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 168: {'origin': {'name': 'parlist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'vararg_namelist', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 169: {'origin': {'name': 'parlist', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_1', 'filter_out': True, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 170: {'origin': {'name': 'vararg_namelist', '__type__': 'NonTerminal'}, 'expansion': [{'name': '_names', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': '__ANON_1', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': 'namelist', 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 171: {'origin': {'name': 'tableconstructor', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'fieldlist', '__type__': 'NonTerminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 172: {'origin': {'name': 'tableconstructor', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LBRACE', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'RBRACE', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 173: {'origin': {'name': 'fieldlist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'field', '__type__': 'NonTerminal'}, {'name': '__fieldlist_star_6', '__type__': 'NonTerminal'}, {'name': 'fieldsep', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 174: {'origin': {'name': 'fieldlist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'field', '__type__': 'NonTerminal'}, {'name': '__fieldlist_star_6', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 175: {'origin': {'name': 'fieldlist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'field', '__type__': 'NonTerminal'}, {'name': 'fieldsep', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 176: {'origin': {'name': 'fieldlist', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'field', '__type__': 'NonTerminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 177: {'origin': {'name': 'field', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}, {'name': 'RSQB', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 178: {'origin': {'name': 'field', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'EQUAL', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 179: {'origin': {'name': 'field', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'exp', '__type__': 'NonTerminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 180: {'origin': {'name': 'fieldsep', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 181: {'origin': {'name': 'fieldsep', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SEMICOLON', 'filter_out': True, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 182: {'origin': {'name': 'or_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'OR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 183: {'origin': {'name': 'and_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'AND', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 184: {'origin': {'name': 'cmp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'LESSTHAN', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 185: {'origin': {'name': 'cmp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_2', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 186: {'origin': {'name': 'cmp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MORETHAN', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 187: {'origin': {'name': 'cmp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_3', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 188: {'origin': {'name': 'cmp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_4', 'filter_out': False, '__type__': 'Terminal'}], 'order': 4, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 189: {'origin': {'name': 'cmp_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_5', 'filter_out': False, '__type__': 'Terminal'}], 'order': 5, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 190: {'origin': {'name': 'bor_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'VBAR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 191: {'origin': {'name': 'bxor_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TILDE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 192: {'origin': {'name': 'band_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'AMPERSAND', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 193: {'origin': {'name': 'shift_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_6', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 194: {'origin': {'name': 'shift_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_7', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 195: {'origin': {'name': 'concat_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_8', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 196: {'origin': {'name': 'add_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PLUS', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 197: {'origin': {'name': 'add_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MINUS', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 198: {'origin': {'name': 'mul_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'STAR', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 199: {'origin': {'name': 'mul_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'SLASH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 200: {'origin': {'name': 'mul_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__ANON_9', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 201: {'origin': {'name': 'mul_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'PERCENT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 202: {'origin': {'name': 'pow_op', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'CIRCUMFLEX', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': 'binop', 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 203: {'origin': {'name': 'unop', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'MINUS', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 204: {'origin': {'name': 'unop', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'NOT', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 205: {'origin': {'name': 'unop', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'HASH', 'filter_out': False, '__type__': 'Terminal'}], 'order': 2, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 206: {'origin': {'name': 'unop', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'TILDE', 'filter_out': False, '__type__': 'Terminal'}], 'order': 3, 'alias': None, 'options': {'keep_all_tokens': True, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 207: {'origin': {'name': '__block_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'stat', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 208: {'origin': {'name': '__block_star_0', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__block_star_0', '__type__': 'NonTerminal'}, {'name': 'stat', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 209: {'origin': {'name': '__if_stmt_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'elseif_block', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 210: {'origin': {'name': '__if_stmt_star_1', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__if_stmt_star_1', '__type__': 'NonTerminal'}, {'name': 'elseif_block', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 211: {'origin': {'name': '__attnamelist_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'attrib', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 212: {'origin': {'name': '__attnamelist_star_2', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__attnamelist_star_2', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}, {'name': 'attrib', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 213: {'origin': {'name': '__funcname_star_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 214: {'origin': {'name': '__funcname_star_3', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__funcname_star_3', '__type__': 'NonTerminal'}, {'name': 'DOT', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'NAME', 'filter_out': False, '__type__': 'Terminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 215: {'origin': {'name': '__varlist_star_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'var', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 216: {'origin': {'name': '__varlist_star_4', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__varlist_star_4', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'var', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 217: {'origin': {'name': '__explist_star_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 218: {'origin': {'name': '__explist_star_5', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__explist_star_5', '__type__': 'NonTerminal'}, {'name': 'COMMA', 'filter_out': True, '__type__': 'Terminal'}, {'name': 'exp', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 219: {'origin': {'name': '__fieldlist_star_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': 'fieldsep', '__type__': 'NonTerminal'}, {'name': 'field', '__type__': 'NonTerminal'}], 'order': 0, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}, 220: {'origin': {'name': '__fieldlist_star_6', '__type__': 'NonTerminal'}, 'expansion': [{'name': '__fieldlist_star_6', '__type__': 'NonTerminal'}, {'name': 'fieldsep', '__type__': 'NonTerminal'}, {'name': 'field', '__type__': 'NonTerminal'}], 'order': 1, 'alias': None, 'options': {'keep_all_tokens': False, 'expand1': False, 'priority': None, 'template_source': None, 'empty_indices': (), '__type__': 'RuleOptions'}, '__type__': 'Rule'}}
+)
+Shift = 0
+Reduce = 1
+def Lark_StandAlone(**kwargs):
+  return Lark._load_from_dict(DATA, MEMO, **kwargs)
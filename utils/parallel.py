@@ -0,0 +1,134 @@
+from typing import List, Optional, Set, Tuple
+from . import ast, dataflow, ir
+from .ast_base import ASTNode
+
+# Sets up the directory background jobs write their output to, removed
+# when the shell exits. Guarded like the profiler's prelude.
+PRELUDE = """if (( ! ${+__lua_par_dir} )); then
+  zmodload zsh/mapfile
+  __lua_par_dir=$(mktemp -d)
+  function __lua_par_cleanup() { rm -rf -- $__lua_par_dir }
+  zshexit_functions+=(__lua_par_cleanup)
+  function __lua_par_status() { return $1 }
+fi"""
+
+# commands zsh runs itself even if there's a binary of the same name, so
+# running them as jobs would only cost a fork, or, like cd, change nothing
+SHELL_BUILTINS = frozenset({
+    "cd", "echo", "eval", "exec", "exit", "export", "false", "kill", "print",
+    "printf", "pwd", "read", "set", "source", "test", "true", "wait",
+})
+
+# (command, variable its output is assigned to, if any)
+Job = Tuple[str, Optional[str]]
+
+
+def binary_call(node: ASTNode) -> Optional[ASTNode]:
+    """Return `node` if it's a call to a binary on PATH whose arguments
+    don't call functions of the program, which could read or assign
+    anything."""
+    if not isinstance(node, ast.FunctioncallNode) or not node.children:
+        return None
+    if node.builtin() or not node.callee_is_binary() \
+            or node.callee() in SHELL_BUILTINS or node.hoisted:
+        return None
+    for n in node.children[-1].walk():
+        if n.is_a(ast.FunctiondefNode) or (
+                n.is_a(ast.FunctioncallNode) and not n.builtin()
+                and not n.callee_is_binary()):
+            return None
+    return node
+
+
+def job(op: int, args: Tuple, stat: Optional[ASTNode]) -> Optional[Job]:
+    """Return the job an instruction can run as, if it runs a binary: as
+    a statement, or to assign its output to a single name."""
+    if stat is None or not stat.is_a(ast.StatNode):
+        return None
+    first = stat.children[0]
+    if op == ir.CALL and binary_call(first):
+        return (args[0], None)
+    if op != ir.ASSIGN:
+        return None
+    if first.is_a(ast.VarlistNode):
+        targets = first.children
+        explist = stat.get_only(ast.ExplistNode)
+    elif first.is_a(ast.LocalAssignNode) and first.has(ast.ExplistNode):
+        targets = [t for t in first.get_only(ast.AttnamelistNode).children
+                   if not isinstance(t, ASTNode)]
+        explist = first.get_only(ast.ExplistNode)
+    else:
+        return None
+    if len(targets) != 1 or len(explist.children) != 1:
+        return None
+    exp = explist.children[0]
+    if len(exp.children) != 1 or \
+            not isinstance(exp.children[0], ast.PrefixexpNode):
+        return None
+    call = binary_call(exp.children[0].children[0])
+    if call is None:
+        return None
+    call.capture = False  # the job writes the output to a file instead
+    command = call.gen()
+    call.capture = True
+    return (command, args[0])
+
+
+class Run:
+    """Consecutive jobs none of which reads or assigns what another one
+    assigns."""
+
+    def __init__(self) -> None:
+        self.jobs: List[Job] = []
+        self.instructions: List[Tuple[int, Tuple, ASTNode]] = []
+        self.reads: Set[str] = set()
+        self.writes: Set[str] = set()
+
+    def fits(self, reads: Set[str], writes: Set[str]) -> bool:
+        return not (reads & self.writes or writes & (self.reads | self.writes))
+
+    def add(self, job: Job, instruction: Tuple[int, Tuple, ASTNode],
+            reads: Set[str], writes: Set[str]) -> None:
+        self.jobs.append(job)
+        self.instructions.append(instruction)
+        self.reads |= reads
+        self.writes |= writes
+
+
+def parallelize(block: ir.Block, flow: dataflow.DataFlow) -> bool:
+    """Run the independent binaries called by consecutive statements of
+    `block` and the blocks in it as background jobs; return whether any
+    were found."""
+    found = False
+    for b in list(block.blocks()):
+        res = ir.Block()
+        run = Run()
+        for op, args, node in b:
+            j = job(op, args, node)
+            if j is None:
+                found |= flush(run, res)
+                run = Run()
+                res.append(op, args, node)
+                continue
+            assert node is not None
+            reads = {v.children[0].value for v in dataflow.reads(node)}
+            writes = {d.name for d in flow.stat_defs.get(node, [])}
+            if not run.fits(reads, writes):
+                found |= flush(run, res)
+                run = Run()
+            run.add(j, (op, args, node), reads, writes)
+        found |= flush(run, res)
+        b.ops, b.args, b.nodes = res.ops, res.args, res.nodes
+    if found:
+        block.insert(0, ir.RAW, (PRELUDE,))
+    return found
+
+
+def flush(run: Run, block: ir.Block) -> bool:
+    """Append a run to `block`, as jobs if there's more than one."""
+    if len(run.jobs) < 2:
+        for instruction in run.instructions:
+            block.append(*instruction)
+        return False
+    block.append(ir.PARALLEL, (run.jobs,), run.instructions[0][2])
+    return True
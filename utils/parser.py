@@ -1,5 +1,27 @@
-import lark
-from . import grammar
+import threading
+from .lua_parser import (  # noqa: F401
+    LarkError, Lark_StandAlone, Token, Tree, UnexpectedCharacters,
+    UnexpectedInput, UnexpectedToken)
 
 
-PARSER = lark.Lark(grammar.LARK_GRAMMAR, start="chunk")
+# The parser is generated from `grammar.py` by `gen_parser.py`, so lark
+# isn't needed at run time; it's still only built once something is parsed.
+_PARSER = None
+_PARSER_LOCK = threading.Lock()
+
+
+def get_parser():
+    """Return the shared parser, building it on first use."""
+    global _PARSER
+    if _PARSER is None:
+        with _PARSER_LOCK:
+            if _PARSER is None:
+                _PARSER = Lark_StandAlone()
+    return _PARSER
+
+
+def __getattr__(name):
+    # keep `parser.PARSER` working without building it at import time
+    if name == "PARSER":
+        return get_parser()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,233 @@
+import time
+from typing import Callable, Iterable, List, Optional, Tuple
+from . import ast, dataflow, ir, parallel
+from .ast_base import ASTNode
+from .parser import Token
+from .symbols import Symbol
+
+
+class Unit:
+    """What the passes of one compilation work on and share."""
+
+    def __init__(self, root: ASTNode, exports: List[Symbol],
+                 keep_exports: bool = False):
+        self.root = root
+        # symbols defined at the top level, kept if `keep_exports`
+        self.exports = exports
+        self.keep_exports = keep_exports
+        self.ir: Optional[ir.Block] = None
+        self.timings: List[Tuple[str, float]] = []
+        self._flow: Optional[dataflow.DataFlow] = None
+
+    @property
+    def flow(self) -> dataflow.DataFlow:
+        """Dataflow facts of the AST, computed when a pass first asks."""
+        if self._flow is None:
+            self._flow = dataflow.DataFlow(self.root)
+        return self._flow
+
+    def timed(self, name: str, f: Callable[[], None]) -> None:
+        start = time.perf_counter()
+        f()
+        self.timings.append((name, time.perf_counter() - start))
+
+
+class Pass:
+    def __init__(self, name: str, level: Optional[int], stage: str,
+                 run: Callable[[Unit], None]):
+        self.name = name
+        # the lowest -O level running the pass, None if it only runs when
+        # asked for by name
+        self.level = level
+        self.stage = stage  # "ast" before lowering, "ir" after
+        self.run = run
+
+
+def licm(unit: Unit) -> None:
+    """Hoist the invariant command substitutions of loops, see
+    `StatNode.invariants`."""
+    for node in unit.root.walk():
+        if node.is_a(ast.StatNode) and node.children and (
+                node.children[0].is_a(ast.WhileNode)
+                or node.children[0].is_a(ast.RepeatNode)):
+            node.hoisted_calls = tuple(node.invariants())
+
+
+def const_prop(unit: Unit) -> None:
+    """Replace reads of a name by the number it's known to hold.
+
+    A read qualifies when its only reaching definition assigns a number
+    literal and no function assigns the name behind the reader's back.
+    The read is dropped from the definition's uses, so the assignment can
+    go too once nothing else reads it.
+    """
+    flow = unit.flow
+    escaping = {d.name for d in flow.defs if d.escapes}
+    for node, use in flow.uses.items():
+        if len(use.defs) != 1 or use.name in escaping:
+            continue
+        d = next(iter(use.defs))
+        if not d.stat.is_a(ast.StatNode):
+            continue  # a parameter
+        value = literal(d.stat)
+        if value is None:
+            continue
+        node.constant = value
+        d.uses.remove(use)
+
+
+def literal(stat: ASTNode) -> Optional[str]:
+    """Return the number a single-name assignment stores, if a literal."""
+    first = stat.children[0]
+    if first.is_a(ast.VarlistNode):
+        explist = stat.get_only(ast.ExplistNode)
+    elif first.is_a(ast.LocalAssignNode) and first.has(ast.ExplistNode):
+        explist = first.get_only(ast.ExplistNode)
+    else:
+        return None
+    if len(explist.children) != 1:
+        return None
+    tok = explist.children[0].children[0]
+    if isinstance(tok, Token) and tok.type == "NUMBER":
+        return tok.value
+    return None
+
+
+def dse(unit: Unit) -> None:
+    """Drop assignments whose value is never read."""
+    dead = set(unit.flow.dead_statements())
+    if unit.keep_exports:
+        exports = {id(sym) for sym in unit.exports}
+        dead = {stat for stat in dead
+                if not any(id(sym) in exports for sym in stat.get_symbols())}
+    if not dead:
+        return
+    assert unit.ir is not None
+    for block in list(unit.ir.blocks()):
+        block.keep(lambda op, args, node: node not in dead)
+
+
+def tail_calls(unit: Unit) -> None:
+    """Turn functions returning calls to themselves into loops.
+
+    `return f(...)` sets the arguments as the new positional parameters
+    and starts the body over, instead of running f in a subshell one
+    level deeper. The call must resolve to the function's own symbol, so
+    a local shadowing its name isn't mistaken for it.
+    """
+    assert unit.ir is not None
+    # innermost first: rewriting a function copies its body, so functions
+    # nested in it must be done by then or the copy would miss them
+    for block in reversed(list(unit.ir.blocks())):
+        for i, (op, args, node) in enumerate(block):
+            if op != ir.FUNCTION:
+                continue
+            name, pars, body = args
+            func = node.children[0]
+            looped = TailCalls(name, pars, func)
+            loop_body = looped.rewrite(body, 0)
+            if not looped.found:
+                continue
+            if not loop_body.ops or \
+                    loop_body.ops[-1] not in (ir.CONTINUE, ir.RETURN):
+                loop_body.append(ir.RETURN, ())  # fell off the end
+            new_body = ir.Block()
+            new_body.append(ir.LOOP, (loop_body,), node)
+            block.args[i] = (name, pars, new_body)
+
+
+class TailCalls:
+    """Rewrites the body of one function for `tail_calls`."""
+
+    def __init__(self, name: str, pars: List[str], func: ASTNode):
+        self.name = name
+        self.pars = pars
+        self.func = func
+        self.found = False
+
+    def self_call(self, ret: ASTNode) -> Optional[ASTNode]:
+        """Return the call if `ret` returns a call to the function."""
+        if not ret.children or len(ret.children[0].children) != 1:
+            return None
+        exp = ret.children[0].children[0]
+        if len(exp.children) != 1 or \
+                not isinstance(exp.children[0], ast.PrefixexpNode):
+            return None
+        call = exp.children[0].children[0]
+        if not isinstance(call, ast.FunctioncallNode) or \
+                call.callee() != self.name:
+            return None
+        sym = call.lookup(self.name)
+        return call if sym is not None and sym.source is self.func else None
+
+    def rewrite(self, block: ir.Block, loops: int) -> ir.Block:
+        """Return `block` with its tail calls replaced, `loops` being the
+        number of loops of the function enclosing it."""
+        res = ir.Block()
+        for op, args, node in block:
+            if op == ir.RETURN:
+                if (call := self.self_call(node)) is not None:
+                    self.found = True
+                    words = call.children[1].gen()
+                    res.append(ir.RAW, ("set -- " + words,), node)
+                    for i, par in enumerate(self.pars):
+                        res.append(ir.ASSIGN, (par, f"${i + 1}", False), node)
+                    res.append(ir.CONTINUE, (loops + 1,), node)
+                    continue
+                res.append(op, args, node)
+                if args:  # the body is a loop now, so leave it
+                    res.append(ir.RETURN, (), node)
+            elif op == ir.IF:
+                arms, orelse = args
+                arms = [(cond, self.rewrite(b, loops)) for cond, b in arms]
+                if orelse is not None:
+                    orelse = self.rewrite(orelse, loops)
+                res.append(op, (arms, orelse), node)
+            elif op == ir.DO:
+                res.append(op, (self.rewrite(args[0], loops),), node)
+            elif op == ir.WHILE:
+                res.append(op, (args[0], self.rewrite(args[1], loops + 1)),
+                           node)
+            elif op == ir.REPEAT:
+                res.append(op, (self.rewrite(args[0], loops + 1), args[1]),
+                           node)
+            else:
+                res.append(op, args, node)
+        return res
+
+
+def parallelize(unit: Unit) -> None:
+    """Run independent commands as background jobs, see `parallel`."""
+    assert unit.ir is not None
+    parallel.parallelize(unit.ir, unit.flow)
+
+
+PASSES = [
+    Pass("const-prop", 2, "ast", const_prop),
+    Pass("licm", 1, "ast", licm),
+    Pass("dse", 1, "ir", dse),
+    Pass("tail-calls", 1, "ir", tail_calls),
+    Pass("parallelize", None, "ir", parallelize),
+]
+
+
+class PassManager:
+    """Runs the passes enabled at an optimization level, in order, timing
+    each.
+
+    -O0 runs none, -O1 the cheap ones that drop, move or restructure code
+    without changing what it computes, and -O2 everything. Passes named in
+    `enable` run regardless of the level.
+    """
+
+    def __init__(self, level: int = 1, passes: Optional[List[Pass]] = None,
+                 enable: Iterable[str] = ()):
+        self.level = level
+        self.passes = [p for p in (PASSES if passes is None else passes)
+                       if (p.level is not None and p.level <= level)
+                       or p.name in enable]
+
+    def run(self, unit: Unit, stage: str) -> None:
+        for p in self.passes:
+            if p.stage == stage:
+                unit.timed(p.name, lambda: p.run(unit))
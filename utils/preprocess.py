@@ -0,0 +1,122 @@
+import re
+from typing import Iterator, List, Tuple, Union
+
+
+KEYWORDS = {
+    "and", "break", "do", "else", "elseif", "end", "false", "for",
+    "function", "goto", "if", "in", "local", "nil", "not", "or", "repeat",
+    "return", "then", "true", "until", "while",
+}
+
+# keywords that open a block closed by `end` or `until`; `while` and `for`
+# open theirs early so the header's expressions aren't split, and the `do`
+# that follows doesn't open another one
+OPENERS = {"function", "if", "repeat", "while", "for"}
+CLOSERS = {"end", "until"}
+
+STATEMENT_STARTS = {"break", "do", "for", "function", "goto", "if", "local",
+                    "repeat", "return", "while", "name", "label"}
+
+# tokens after which an expression (and therefore possibly a statement)
+# is complete, or, for a label, a statement
+ENDS_EXPRESSION = {"end", "true", "false", "nil", "...", "break", ")", "]",
+                   "}", "label"}
+
+TOKEN = re.compile(r"""
+      (?P<comment>--\[(?P<ceq>=*)\[.*?\](?P=ceq)\]|--[^\n]*)
+    | (?P<long>\[(?P<leq>=*)\[.*?\](?P=leq)\])
+    | (?P<string>"(?:\\.|[^"\\\n])*"|'(?:\\.|[^'\\\n])*')
+    | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+    | (?P<number>0[xX][0-9a-fA-F.]+(?:[pP][+-]?[0-9]+)?
+                 |[0-9][0-9.]*(?:[eE][+-]?[0-9]+)?)
+    | (?P<label>::\s*[A-Za-z_][A-Za-z0-9_]*\s*::)
+    | (?P<space>\s+)
+    | (?P<symbol>\.\.\.|::|.)
+""", re.VERBOSE | re.DOTALL)
+# the same, for scanning bytes such as a memory-mapped file
+TOKEN_BYTES = re.compile(TOKEN.pattern.encode(), re.VERBOSE | re.DOTALL)
+
+Source = Union[str, bytes, memoryview]  # or anything else `re` can scan
+
+
+class Piece:
+    """A slice of the source holding one top-level statement."""
+
+    def __init__(self, text: str, start: int):
+        self.text = text
+        self.start = start
+
+    def __str__(self) -> str:
+        return self.text
+
+
+def tokens(text: Source) -> Iterator[re.Match]:
+    """Yield a rough Lua token stream, skipping whitespace and comments."""
+    pattern = TOKEN if isinstance(text, str) else TOKEN_BYTES
+    for m in pattern.finditer(text):
+        if m.lastgroup not in ("space", "comment", "ceq"):
+            yield m
+
+
+def split_statements(text: str) -> List[Piece]:
+    """Split source text at top-level statement boundaries.
+
+    This only tracks block keywords and brackets, not the full grammar, so
+    it is meant for error recovery and chunking rather than parsing: each
+    piece is a candidate statement that can be handed to the parser alone.
+    """
+    return [Piece(text[start:end], start)
+            for start, end in statement_spans(text)]
+
+
+def statement_spans(text: Source) -> Iterator[Tuple[int, int]]:
+    """Yield the (start, end) offsets of the pieces `split_statements`
+    returns, lazily; `text` may also be bytes, e.g. a memory-mapped file.
+
+    The spans cover the text from its first statement on, each piece
+    keeping the whitespace and comments that follow it.
+    """
+    depth = 0
+    headers = 0  # `while`/`for` headers still waiting for their `do`
+    start = None
+    prev = None  # the previous token: a keyword/symbol, "name" or "value"
+    for m in tokens(text):
+        kind = m.lastgroup
+        value = m.group()
+        if not isinstance(value, str):
+            value = value.decode("latin-1")  # only compared to ASCII
+        if kind == "name" and value not in KEYWORDS:
+            tok = "name"
+        elif kind in ("string", "long", "number"):
+            tok = "value"
+        elif kind == "label":
+            tok = "label"
+        else:
+            tok = value
+        if start is None:
+            start = m.start()
+        elif (depth == 0 and tok in STATEMENT_STARTS
+                and (prev in ("name", "value") or prev in ENDS_EXPRESSION)):
+            yield start, m.start()
+            start = m.start()
+        if tok in ("while", "for"):
+            headers += 1
+        if tok == "do" and headers:
+            headers -= 1
+        elif tok in OPENERS or tok in ("do", "(", "[", "{"):
+            depth += 1
+        elif tok in CLOSERS or tok in (")", "]", "}"):
+            depth = max(depth - 1, 0)
+        prev = tok
+        if depth == 0 and tok == ";":
+            yield start, m.end()
+            start = None
+            prev = None
+    if start is not None:
+        yield start, len(text)
+
+
+def blank(text: str) -> str:
+    """Replace text with spaces, keeping newlines so positions still line
+    up with the original source."""
+    return re.sub(r"[^\n]", " ", text)
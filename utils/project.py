@@ -0,0 +1,236 @@
+import hashlib
+import json
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional
+from .compiler import Compiler, Options
+from .errors import Diagnostic
+from .parser import LarkError, Token, Tree
+
+logger = logging.getLogger()
+
+CACHE_FILE = ".build-cache.json"
+
+# Defines `require` for the entry script: each module is sourced into the
+# running shell once, from the directory the entry script lives in.
+REQUIRE_PRELUDE = """__lua_modules=${0:A:h}
+typeset -gA __lua_loaded
+function require() {
+  (( ${+__lua_loaded[$1]} )) && return
+  __lua_loaded[$1]=1
+  source "$__lua_modules/${1//.//}.zsh"
+}"""
+
+
+def digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def find_requires(tree: Tree) -> List[str]:
+    """Return the module names passed to `require("...")` calls."""
+    found = []
+    for call in tree.find_data("functioncall"):
+        if len(call.children) != 2:
+            continue
+        prefix, args = call.children
+        var = prefix.children[0]
+        if not (isinstance(var, Tree) and var.data == "var"
+                and var.children[0] == "require"):
+            continue
+        # args is either a bare STRING or "(" explist ")"
+        arg = args.children[0] if args.children else None
+        if isinstance(arg, Tree) and len(arg.children) == 1:
+            arg = arg.children[0].children[0]  # explist -> exp -> STRING
+        if isinstance(arg, Token) and arg.type == "STRING":
+            found.append(arg.value[1:-1])
+    return found
+
+
+def module_path(root: str, name: str) -> Optional[str]:
+    """Resolve a module name the way Lua's default `package.path` does."""
+    base = os.path.join(root, *name.split("."))
+    for candidate in (base + ".lua", os.path.join(base, "init.lua")):
+        if os.path.isfile(candidate):
+            return candidate
+    return None
+
+
+def compile_module(options: Options, source: str, externs: Dict[str, str],
+                   keep_exports: bool) -> Dict[str, Any]:
+    """Worker entry point; returns plain data so it can cross processes."""
+    result = Compiler(options).compile(source, externs, keep_exports)
+    return {"output": result.output, "exports": result.exports,
+            "errors": [e.to_dict() for e in result.errors]}
+
+
+class Module:
+    def __init__(self, name: str, path: str):
+        self.name = name
+        self.path = path
+        self.source = ""
+        self.hash = ""
+        self.requires: List[str] = []
+        self.exports: Dict[str, str] = {}
+        self.interface = ""  # hash of the dependencies' exports
+        self.errors: List[Diagnostic] = []
+
+
+class Project:
+    """Compiles a Lua program split into modules joined by `require`.
+
+    Modules are compiled after the modules they require, in parallel where
+    the dependency graph allows it. The exports of every module are kept in
+    a cache next to the output, and a module is only recompiled when its
+    source or the exports of its dependencies change.
+    """
+
+    def __init__(self, entry: str, out_dir: str,
+                 options: Optional[Options] = None,
+                 jobs: Optional[int] = None):
+        self.root = os.path.dirname(os.path.abspath(entry))
+        self.entry = os.path.splitext(os.path.basename(entry))[0]
+        self.out_dir = out_dir
+        self.options = options or Options()
+        self.jobs = jobs
+        self.modules: Dict[str, Module] = {}
+        self.errors: List[Diagnostic] = []
+        self.compiled: List[str] = []
+        self.skipped: List[str] = []
+        self.cache: Dict[str, Any] = self.load_cache()
+
+    def load_cache(self) -> Dict[str, Any]:
+        try:
+            with open(os.path.join(self.out_dir, CACHE_FILE)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save_cache(self) -> None:
+        cache = {m.name: {"hash": m.hash, "requires": m.requires,
+                          "exports": m.exports, "interface": m.interface}
+                 for m in self.modules.values() if not m.errors}
+        with open(os.path.join(self.out_dir, CACHE_FILE), "w") as f:
+            json.dump(cache, f, indent=1, sort_keys=True)
+
+    def output_path(self, name: str) -> str:
+        return os.path.join(self.out_dir, *name.split(".")) + ".zsh"
+
+    def load(self, name: str, path: str) -> Module:
+        """Read a module and find what it requires, parsing only if the
+        cache doesn't know this source already."""
+        mod = Module(name, path)
+        try:
+            with open(path) as f:
+                mod.source = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            mod.errors.append(Diagnostic(
+                "module",
+                f"Could not read {path}: {getattr(e, 'strerror', None) or e}"))
+            return mod
+        mod.hash = digest(mod.source)
+        cached = self.cache.get(name)
+        if cached and cached["hash"] == mod.hash:
+            mod.requires = cached["requires"]
+            return mod
+        try:
+            tree = Compiler(self.options).parse(mod.source)
+            mod.requires = find_requires(tree)
+        except LarkError:
+            pass  # reported when the module is compiled
+        return mod
+
+    def discover(self) -> None:
+        """Load every module reachable from the entry point."""
+        pending = [(self.entry, os.path.join(self.root, self.entry + ".lua"))]
+        while pending:
+            name, path = pending.pop()
+            if name in self.modules:
+                continue
+            mod = self.modules[name] = self.load(name, path)
+            for dep in mod.requires:
+                if dep in self.modules:
+                    continue
+                if (dep_path := module_path(self.root, dep)) is None:
+                    mod.errors.append(Diagnostic(
+                        "module", f"Module '{dep}' not found"))
+                    continue
+                pending.append((dep, dep_path))
+
+    def levels(self) -> List[List[Module]]:
+        """Group modules so that each only requires modules of earlier
+        groups; modules within a group are independent of each other."""
+        remaining = {name: {d for d in mod.requires if d in self.modules}
+                     for name, mod in self.modules.items()}
+        levels = []
+        while remaining:
+            ready = sorted(n for n, deps in remaining.items() if not deps)
+            if not ready:
+                cycle = ", ".join(sorted(remaining))
+                self.errors.append(Diagnostic(
+                    "module", f"Circular require between: {cycle}"))
+                break
+            levels.append([self.modules[n] for n in ready])
+            for n in ready:
+                del remaining[n]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return levels
+
+    def externs(self, mod: Module) -> Dict[str, str]:
+        externs = {"require": "function"}
+        for dep in mod.requires:
+            if dep in self.modules:
+                externs.update(self.modules[dep].exports)
+        return externs
+
+    def up_to_date(self, mod: Module) -> bool:
+        cached = self.cache.get(mod.name)
+        return (cached is not None and cached["hash"] == mod.hash
+                and cached["interface"] == mod.interface
+                and os.path.isfile(self.output_path(mod.name)))
+
+    def write(self, mod: Module, output: str) -> None:
+        path = self.output_path(mod.name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if mod.name == self.entry:
+            output = REQUIRE_PRELUDE + "\n" + output
+        with open(path, "w") as f:
+            f.write(output + "\n")
+
+    def build(self) -> bool:
+        """Compile every out-of-date module; return whether all succeeded."""
+        os.makedirs(self.out_dir, exist_ok=True)
+        self.discover()
+        with ProcessPoolExecutor(self.jobs) as pool:
+            for level in self.levels():
+                todo = []
+                for mod in level:
+                    if mod.errors or any(self.modules[d].errors
+                                         for d in mod.requires
+                                         if d in self.modules):
+                        continue
+                    externs = self.externs(mod)
+                    mod.interface = digest(json.dumps(externs,
+                                                      sort_keys=True))
+                    if self.up_to_date(mod):
+                        mod.exports = self.cache[mod.name]["exports"]
+                        self.skipped.append(mod.name)
+                        continue
+                    todo.append((mod, pool.submit(
+                        compile_module, self.options, mod.source, externs,
+                        mod.name != self.entry)))
+                for mod, future in todo:
+                    res = future.result()
+                    mod.errors = [Diagnostic(**e) for e in res["errors"]]
+                    if mod.errors:
+                        continue
+                    mod.exports = res["exports"]
+                    self.write(mod, res["output"])
+                    self.compiled.append(mod.name)
+        for mod in self.modules.values():
+            for err in mod.errors:
+                err.file = mod.path
+                self.errors.append(err)
+        self.save_cache()
+        return not self.errors
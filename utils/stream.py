@@ -0,0 +1,96 @@
+import contextlib
+import mmap
+import os
+import shutil
+import sys
+import tempfile
+from typing import Dict, Iterator, List, Optional, TextIO, Tuple
+from .compiler import Compiler, Options
+from .errors import Diagnostic
+from .preprocess import Source, statement_spans
+
+# statements are compiled in batches of about this many bytes: enough that
+# the parser isn't started once per statement, small enough to keep its
+# memory use, which grows faster than its input, low
+CHUNK_SIZE = 16 * 1024
+
+
+@contextlib.contextmanager
+def mapped(path: str) -> Iterator[Source]:
+    """Memory-map a source file, or standard input if `path` is "-".
+
+    Standard input is copied to a temporary file first, since splitting
+    needs to look ahead and a pipe can't be mapped.
+    """
+    with contextlib.ExitStack() as stack:
+        if path == "-":
+            f = stack.enter_context(tempfile.TemporaryFile())
+            shutil.copyfileobj(sys.stdin.buffer, f)
+            f.flush()
+        else:
+            f = stack.enter_context(open(path, "rb"))
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # empty files can't be mapped
+            return
+        yield stack.enter_context(
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+def chunks(source: Source,
+           size: int = CHUNK_SIZE) -> Iterator[Tuple[int, int]]:
+    """Yield consecutive (start, end) ranges of `source`, each holding
+    whole top-level statements and, unless a single statement is larger,
+    at most about `size` bytes."""
+    start = end = 0
+    for _, stop in statement_spans(source):
+        if stop - start > size and end > start:
+            yield start, end
+            start = end
+        end = stop
+    if end > start:
+        yield start, end
+
+
+def shift(err: Diagnostic, line: int, column: int) -> Diagnostic:
+    """Move a diagnostic for a chunk to its place in the whole source,
+    the chunk starting after `line` lines and `column` characters."""
+    if err.line is not None:
+        if err.line == 1 and err.column is not None:
+            err.column += column
+        err.line += line
+    return err
+
+
+def compile_stream(source: Source, out: TextIO,
+                   options: Optional[Options] = None,
+                   chunk_size: int = CHUNK_SIZE) -> List[Diagnostic]:
+    """Compile `source` chunk by chunk, writing each chunk's output to
+    `out` as soon as it's compiled; return the errors of all chunks.
+
+    Only the names and types of the top-level symbols defined so far are
+    carried from one chunk to the next, so memory use depends on the
+    size of a chunk rather than of the source. Top-level definitions are
+    always kept, since a later chunk may read them. Chunks with errors
+    produce no output.
+    """
+    compiler = Compiler(options)
+    symbols: Dict[str, str] = {}
+    errors: List[Diagnostic] = []
+    line = column = 0  # where the current chunk starts
+    for start, end in chunks(source, chunk_size):
+        text = source[start:end]
+        if not isinstance(text, str):
+            text = bytes(text).decode()
+        result = compiler.compile(text, symbols, keep_exports=True)
+        if result.ok:
+            symbols.update(result.exports)
+            if result.output:
+                out.write(result.output + "\n")
+        else:
+            errors += [shift(e, line, column) for e in result.errors]
+        if (nl := text.rfind("\n")) >= 0:
+            line += text.count("\n")
+            column = len(text) - nl - 1
+        else:
+            column += len(text)
+    return errors
@@ -1,6 +1,5 @@
 import logging
-from .lib import PATH_BINS
-from typing import Any
+from typing import Any, Iterable, Optional
 
 logger = logging.getLogger()
 
@@ -10,8 +9,6 @@ class Symbol:
         self.name: str = name
         self.type: str = type
         self.is_initialized = False
-        self.used = False
-        self.used_at: Any = None
         self.source: Any = None
         self.scope_level: int = 0  # Useful for optimization later
         self.first_reference = None  # Line number/position
@@ -19,20 +16,30 @@ class Symbol:
     def init(self):
         self.is_initialized = True
 
-    def use(self, at=None):
-        if at != self.source:
-            self.used = True
-            self.used_at = at
-
     def __str__(self) -> str:
         return f"{self.name}: {self.type}"
 
 
-PATH_BIN_SYMS: dict[str, 'Symbol'] = {}
-for name in PATH_BINS:
-    res = Symbol(name, "function")
-    res.is_initialized = True
-    PATH_BIN_SYMS[name] = res
+class ExternalSymbols:
+    """Symbols for binaries on PATH, created on demand per compilation.
+
+    Every compilation gets its own instance, so marking a binary as used in
+    one program never leaks into another.
+    """
+
+    def __init__(self, bins: Iterable[str]):
+        self.bins = bins
+        self.symbols: dict[str, Symbol] = {}
+
+    def get(self, name: str) -> Optional[Symbol]:
+        if name in self.symbols:
+            return self.symbols[name]
+        if name not in self.bins:
+            return None
+        res = Symbol(name, "function")
+        res.is_initialized = True
+        self.symbols[name] = res
+        return res
 
 
 class SymbolTable:
@@ -43,21 +50,30 @@ class SymbolTable:
         self.children = []  # Useful for analysis
         self.sequential: bool = False  # if this is a sequential symbol table,
         # i.e. can lookup in previous nodes
+        # only set on the root table of a compilation
+        self.externals: Optional[ExternalSymbols] = None
 
     def lookup(self, name):
-        # Look in current scope
-        if name in self.symbols:
-            return self.symbols[name]
-        # if sequential symbol table, check previous node for definition.
-        if self.sequential and self.node.prev:
-            if res := self.node.prev.lookup(name):
-                return res
-        # Look in parent scope if it exists
-        if self.parent:
-            if res := self.parent.lookup(name):
-                return res
+        # iterative, since a long block chains thousands of statements
+        table = self
+        while True:
+            # Look in current scope; if sequential symbol table, check
+            # previous nodes for definition too
+            scope = table
+            while True:
+                if name in scope.symbols:
+                    return scope.symbols[name]
+                if not (scope.sequential and scope.node.prev):
+                    break
+                scope = scope.node.prev.symbol_table
+            # Look in parent scope if it exists
+            if not table.parent:
+                break
+            table = table.parent
         # if nothing found, check if this is a binary on PATH
-        return PATH_BIN_SYMS.get(name, None)
+        if table.externals:
+            return table.externals.get(name)
+        return None
 
     def insert(self, symbols: list['Symbol']):
         for sym in symbols: